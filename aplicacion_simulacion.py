@@ -1,10 +1,10 @@
+import queue
+import random
 import sys
 import config
 
-from game.juego_de_la_vida import JuegoDeLaVida 
-from game.vecindad.vecindad_moore import VecindadMoore 
-from game.frontera.frontera_ciclica import CondicionFronteraCiclica
-from game.lattice.lattice_2d import Lattice2d 
+from ensamblador import construir_automata
+from game.instrumentacion.medidor_fases import MEDIDOR_GLOBAL
 from view.pygame_view import PygameView
 
 class AplicacionSimulacion:
@@ -33,21 +33,48 @@ class AplicacionSimulacion:
         self.dimensiones_lattice = dimensiones_lattice
         self.juego_terminado = False # Bandera de estado para indicar el cierre de la ventana
         self.vista = None            # La Vista se inicializa en 'init_vista()' dentro del hilo.
+        self.medidor = MEDIDOR_GLOBAL
+        if config.INSTRUMENTACION:
+            self.medidor.activar()
 
-        # 1. Componentes del Modelo 
-        condicion_frontera = CondicionFronteraCiclica() 
-        estrategia_vecindad = VecindadMoore() 
-        lattice = Lattice2d() 
-        
-        # 2. Inicializar el Autómata (Modelo)
-        # Se inyectan las implementaciones concretas en la clase abstracta AutomataCelular
-        self.automata = JuegoDeLaVida(
+        # Semilla del estado inicial: si no se fija, se sortea y se informa para
+        # poder repetir la ejecución.
+        self.semilla = config.SEMILLA if config.SEMILLA is not None else random.randrange(2 ** 32)
+        print(f"Semilla: {self.semilla}")
+
+        # Ensamblaje del Modelo: se inyectan las implementaciones concretas
+        # en la clase abstracta AutomataCelular (ver ensamblador.py).
+        self.automata = construir_automata(
+            self.dimensiones_lattice,
             config.OCCUPANCY, 
-            estrategia_vecindad,
-            condicion_frontera,
-            lattice, 
-            self.dimensiones_lattice 
+            config.MOTOR,
+            semilla=self.semilla,
+            procesos=config.PROCESOS,
+            regla=config.REGLA,
+            vecindad=config.VECINDAD,
+            radio=config.RADIO_VECINDAD,
+            frontera=config.FRONTERA
         )
+        if config.ARCHIVO_ESTADISTICAS:
+            # Se cierra (volcando las filas pendientes) con 'automata.cerrar()'.
+            self.automata.activar_estadisticas(config.ARCHIVO_ESTADISTICAS, config.REGIONES_ESTADISTICAS)
+        if config.MEMORIA_REPETICION:
+            try:
+                self.automata.activar_repeticion(config.MEMORIA_REPETICION * 1024 * 1024,
+                                                 config.CLAVES_REPETICION_CADA)
+            except ImportError:
+                print("Repetición desactivada: requiere numpy.")
+
+        # Órdenes de repetición de la Vista; se aplican en el hilo del Modelo.
+        self.comandos = queue.SimpleQueue()
+        self.pausado = False
+        
+        # Servidor de estado opcional: publica cada generación a visores remotos.
+        self.generacion = 0
+        self.servidor = None
+        if config.SERVIDOR_ESTADO:
+            from red.servidor_estado import crear_servidor
+            self.servidor = crear_servidor(config.SERVIDOR_ESTADO, self.dimensiones_lattice).iniciar()
 
     def init_vista(self):
         """
@@ -61,7 +88,11 @@ class AplicacionSimulacion:
             config.VERSION, 
             config.CELL_DIMENSIONS, 
             config.FRAMERATE, 
-            config.COLORS
+            config.COLORS,
+            meter=self.medidor,
+            show_overlay=config.MOSTRAR_METRICAS,
+            max_window=config.VENTANA_MAXIMA,
+            lod_mode=config.AGREGACION_BLOQUES
         )
         # Inicializa la pantalla de Pygame con las dimensiones calculadas.
         self.vista.init(self.dimensiones_lattice)
@@ -70,7 +101,9 @@ class AplicacionSimulacion:
         """
         Ejecuta un único paso (tick) del bucle principal de la simulación.
 
-        Este método es llamado repetidamente por el hilo de ejecución (EjecutorSimulacion).
+        Modo en serie (tick, entrada, avance y dibujado en el mismo hilo). El
+        EjecutorSimulacion usa en su lugar el pipeline productor/consumidor
+        basado en 'avanzar_modelo()', 'procesar_entrada()' y 'dibujar()'.
         """
         # 1. Controla la velocidad de la simulación.
         self.vista.tick()
@@ -78,14 +111,175 @@ class AplicacionSimulacion:
         # 2. Procesa la entrada del usuario (ej., evento QUIT).
         if self.vista.handle_input():
             self.juego_terminado = True
+        for comando in self.vista.take_commands():
+            self.comandos.put(comando)
         
         # 3. Lógica de avance (solo si el juego no ha terminado).
         if not self.juego_terminado:
-            # Pide al Modelo (Autómata) que avance una generación.
-            self.automata.avanzar_generacion()
+            # Aplica las órdenes de repetición y, si no está en pausa, avanza una generación.
+            if not self.aplicar_comandos() and self.pausado:
+                return
+            if not self.pausado:
+                self.automata.avanzar_generacion()
+                self._sincronizar_generacion(1)
+                self.seguir_poblacion()
             
             # Obtiene el estado actual del Modelo.
             estado_actual = self.automata.obtener_lattice().obtener_estado()
             
             # Pide a la Vista que dibuje el nuevo estado.
             self.vista.draw_board(estado_actual)
+
+    def avanzar_modelo(self):
+        """
+        Avanza el Modelo una generación y devuelve una instantánea inmutable.
+        
+        Lo llama el hilo productor (HiloModelo); no toca la Vista. Antes aplica
+        las órdenes de repetición pendientes; en pausa solo devuelve estado si
+        alguna orden lo cambió.
+        
+        Returns:
+            El estado de la nueva generación, seguro para leerse desde otro hilo,
+            o None si está en pausa y no hay nada nuevo que dibujar.
+        """
+        cambiado = self.aplicar_comandos()
+        if self.pausado:
+            if not cambiado:
+                return None
+        else:
+            with self.medidor.fase("avanzar_generacion"):
+                self.automata.avanzar_generacion()
+            self._sincronizar_generacion(1)
+            self.seguir_poblacion()
+        if self.servidor is not None:
+            with self.medidor.fase("publicacion"):
+                self.publicar_estado()
+        with self.medidor.fase("instantanea"):
+            lattice = self.automata.obtener_lattice()
+            if hasattr(lattice, "establecer_region_instantanea") and self.vista is not None:
+                # Lattice mapeado: la instantánea solo copia la zona visible.
+                lattice.establecer_region_instantanea(self.vista.visible_region())
+            return lattice.obtener_instantanea()
+
+    def seguir_poblacion(self):
+        """
+        Recentra la ventana de un Lattice disperso si alguna célula viva quedó fuera (ver config.SEGUIR_POBLACION).
+
+        Si las células vivas no caben en la ventana, se centra en la caja que las contiene.
+        """
+        lattice = self.automata.obtener_lattice()
+        if not config.SEGUIR_POBLACION or not hasattr(lattice, "caja_envolvente"):
+            return
+        caja = lattice.caja_envolvente()
+        if caja is None:
+            return
+        x_min, y_min, x_max, y_max = caja
+        (ox, oy), (X_MAX, Y_MAX) = lattice.obtener_origen(), lattice.obtener_dimensiones()
+        if ox <= x_min and x_max < ox + X_MAX and oy <= y_min and y_max < oy + Y_MAX:
+            return
+        lattice.mover_ventana(((x_min + x_max + 1 - X_MAX) // 2, (y_min + y_max + 1 - Y_MAX) // 2))
+
+    def aplicar_comandos(self) -> bool:
+        """
+        Aplica las órdenes de repetición recibidas de la Vista (ver PygameView.take_commands).
+
+        "pause" alterna la pausa; "step" (n generaciones, negativo hacia atrás) y
+        "oldest" se mueven por el historial y dejan la simulación en pausa;
+        "present" vuelve a la última generación grabada. Avanzar desde el
+        presente simula generaciones nuevas, y reanudar desde el pasado empieza
+        una nueva rama. Sin historial activo solo se puede pausar y avanzar.
+
+        Returns:
+            True si alguna orden cambió el estado del Modelo.
+        """
+        repeticion = self.automata.repeticion
+        cambiado = False
+        while True:
+            try:
+                orden, pasos = self.comandos.get_nowait()
+            except queue.Empty:
+                return cambiado
+            if orden == "pause":
+                self.pausado = not self.pausado
+                continue
+            if orden != "present":
+                self.pausado = True
+            if repeticion is None:
+                if orden == "step" and pasos > 0:
+                    self.automata.avanzar_generaciones(pasos)
+                    self._sincronizar_generacion(pasos)
+                    cambiado = True
+                continue
+            anterior = repeticion.generacion
+            if orden == "step" and pasos < 0:
+                repeticion.retroceder(-pasos)
+            elif orden == "step" and repeticion.en_presente:
+                self.automata.avanzar_generaciones(pasos)
+            elif orden == "step":
+                repeticion.avanzar(pasos)
+            elif orden == "oldest":
+                repeticion.ir_a(repeticion.generaciones_retenidas()[0])
+            elif orden == "present":
+                repeticion.volver_al_presente()
+            self._sincronizar_generacion(0)
+            cambiado = cambiado or repeticion.generacion != anterior
+
+    def _sincronizar_generacion(self, avanzadas: int):
+        """
+        Actualiza el contador de generaciones (el del historial, si está activo).
+        """
+        if self.automata.repeticion is not None:
+            self.generacion = self.automata.repeticion.generacion
+        else:
+            self.generacion += avanzadas
+
+    def publicar_estado(self):
+        """
+        Publica el estado empaquetado de la generación actual en el servidor de estado.
+        """
+        from game.persistencia.instantanea_binaria import palabras_de_lattice
+        self.servidor.publicar(palabras_de_lattice(self.automata.obtener_lattice()), self.generacion)
+
+    def cerrar_servidor(self):
+        """
+        Detiene el servidor de estado (si está activo) e informa de sus estadísticas.
+        """
+        if self.servidor is not None:
+            estadisticas = self.servidor.estadisticas()
+            self.servidor.detener()
+            print(f"Servidor de estado: {estadisticas['bytes_por_generacion']:.0f} bytes/generación | "
+                  f"Cuadros saltados: {estadisticas['cuadros_saltados']}")
+
+    def procesar_entrada(self) -> bool:
+        """
+        Controla la velocidad de dibujado y procesa la entrada del usuario.
+        
+        Returns:
+            True si el usuario pidió cerrar la ventana.
+        """
+        self.vista.tick()
+        if self.vista.handle_input():
+            self.juego_terminado = True
+            return self.juego_terminado
+        for comando in self.vista.take_commands():
+            self.comandos.put(comando)
+        if self.vista.redraw_pending:
+            # El visor se movió: se redibuja la última instantánea sin esperar a una generación nueva.
+            self.vista.redraw()
+        return self.juego_terminado
+
+    def dibujar(self, instantanea):
+        """
+        Pide a la Vista que dibuje una instantánea del Modelo.
+        
+        Args:
+            instantanea: El estado (inmutable) a dibujar.
+        """
+        self.vista.draw_board(instantanea)
+
+    def exportar_metricas(self):
+        """
+        Guarda el resumen de la instrumentación en config.ARCHIVO_METRICAS (si está configurado).
+        """
+        if config.ARCHIVO_METRICAS and self.medidor.resumen():
+            self.medidor.guardar(config.ARCHIVO_METRICAS, {"motor": config.MOTOR})
@@ -0,0 +1,155 @@
+"""
+Prueba de carga del ServidorEstado.
+
+Simula un autómata con el motor 'bits' y publica cada generación mientras un
+proceso hijo mantiene N clientes asyncio conectados (algunos de ellos lentos,
+que esperan un tiempo fijo tras cada mensaje). Para cada número de clientes se
+informa de los bytes por generación, las generaciones por segundo del Modelo,
+los cuadros recibidos por cliente y los cuadros saltados por contrapresión.
+
+Los resultados se escriben como JSON Lines, igual que en suite_rendimiento.py.
+
+USO:
+    python benchmarks/carga_servidor.py [--clientes 1 4 16 64] [--tamano 1024] [--lentos 0.25]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import Dict, List, Any
+
+# Permite ejecutar el script desde cualquier directorio.
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+CLIENTES = (1, 4, 16, 64)
+
+# Espera tras cada mensaje de un cliente lento (en segundos).
+ESPERA_CLIENTE_LENTO = 0.02
+
+async def _cliente(direccion: Any, lento: bool, resultados: List[Dict[str, Any]]):
+    """
+    Recibe generaciones hasta que el servidor cierra la conexión.
+    """
+    from red.cliente_estado import ClienteEstado
+    cliente = ClienteEstado()
+    if isinstance(direccion, str):
+        await cliente.conectar(ruta_unix=direccion)
+    else:
+        await cliente.conectar(direccion[1], host=direccion[0])
+    recibidas = 0
+    try:
+        while True:
+            await cliente.recibir()
+            recibidas += 1
+            if lento:
+                await asyncio.sleep(ESPERA_CLIENTE_LENTO)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        await cliente.cerrar()
+    resultados.append({"lento": lento, "recibidas": recibidas, "bytes": cliente.bytes_recibidos})
+
+def _ejecutar_clientes(direccion: Any, clientes: int, lentos: int, listos, cola):
+    """
+    Proceso hijo: conecta los clientes y devuelve sus resultados por la cola.
+    """
+    async def principal():
+        resultados: List[Dict[str, Any]] = []
+        tareas = [asyncio.create_task(_cliente(direccion, i < lentos, resultados)) for i in range(clientes)]
+        await asyncio.sleep(0.2)
+        listos.set()
+        await asyncio.gather(*tareas)
+        return resultados
+    cola.put(asyncio.run(principal()))
+
+def medir(clientes: int, opciones: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Simula 'opciones.generaciones' generaciones con 'clientes' visores conectados.
+
+    Returns:
+        Un diccionario con las métricas del caso.
+    """
+    from ensamblador import construir_automata
+    from red.servidor_estado import ServidorEstado
+    from game.persistencia.instantanea_binaria import palabras_de_lattice
+
+    dimensiones = (opciones.tamano, opciones.tamano)
+    automata = construir_automata(dimensiones, opciones.ocupacion, "bits", semilla=opciones.semilla)
+    servidor = ServidorEstado(dimensiones, ruta_unix=opciones.unix).iniciar()
+    lentos = int(clientes * opciones.lentos)
+
+    contexto = multiprocessing.get_context("spawn")
+    listos, cola = contexto.Event(), contexto.Queue()
+    hijo = contexto.Process(target=_ejecutar_clientes, args=(servidor.direccion, clientes, lentos, listos, cola))
+    hijo.start()
+    listos.wait()
+    try:
+        lattice = automata.obtener_lattice()
+        inicio = time.perf_counter()
+        for generacion in range(1, opciones.generaciones + 1):
+            automata.avanzar_generacion()
+            servidor.publicar(palabras_de_lattice(lattice), generacion)
+        tiempo = time.perf_counter() - inicio
+        # Deja que los clientes reciban lo pendiente antes de cerrar.
+        time.sleep(0.5)
+        estadisticas = servidor.estadisticas()
+    finally:
+        servidor.detener()
+        automata.cerrar()
+    resultados = cola.get()
+    hijo.join()
+
+    rapidos = [r["recibidas"] for r in resultados if not r["lento"]]
+    lentos_recibidas = [r["recibidas"] for r in resultados if r["lento"]]
+    return {
+        "clientes": clientes,
+        "clientes_lentos": lentos,
+        "tamano": opciones.tamano,
+        "generaciones": opciones.generaciones,
+        "generaciones_por_s": opciones.generaciones / tiempo,
+        "generaciones_difundidas": estadisticas["generaciones"],
+        "bytes_por_generacion": estadisticas["bytes_por_generacion"],
+        "bytes_claves": estadisticas["bytes_claves"],
+        "cuadros_saltados": estadisticas["cuadros_saltados"],
+        "generaciones_omitidas": estadisticas["generaciones_omitidas"],
+        "recibidas_min_rapidos": min(rapidos) if rapidos else None,
+        "recibidas_min_lentos": min(lentos_recibidas) if lentos_recibidas else None,
+    }
+
+def main(argumentos: list):
+    """
+    Punto de entrada: mide cada número de clientes y escribe los resultados.
+    """
+    analizador = argparse.ArgumentParser(description="Prueba de carga del servidor de estado.")
+    analizador.add_argument("--salida", default="resultados_servidor.jsonl")
+    analizador.add_argument("--clientes", type=int, nargs="+", default=list(CLIENTES))
+    analizador.add_argument("--tamano", type=int, default=1024)
+    analizador.add_argument("--ocupacion", type=float, default=0.2)
+    analizador.add_argument("--semilla", type=int, default=1)
+    analizador.add_argument("--generaciones", type=int, default=300)
+    analizador.add_argument("--lentos", type=float, default=0.25,
+                            help="Fracción de clientes lentos.")
+    analizador.add_argument("--unix", default=None,
+                            help="Usa un socket Unix en esta ruta en lugar de TCP.")
+    opciones = analizador.parse_args(argumentos)
+
+    with open(opciones.salida, "w", encoding="utf-8") as archivo:
+        for clientes in opciones.clientes:
+            if opciones.unix and os.path.exists(opciones.unix):
+                os.remove(opciones.unix)
+            resultado = medir(clientes, opciones)
+            archivo.write(json.dumps(resultado, sort_keys=True) + "\n")
+            print(f"Clientes: {clientes:>3} | Generaciones/s: {resultado['generaciones_por_s']:.1f} | "
+                  f"Difundidas: {resultado['generaciones_difundidas']} | "
+                  f"Bytes/generación: {resultado['bytes_por_generacion']:.0f} | "
+                  f"Saltados: {resultado['cuadros_saltados']} | "
+                  f"Omitidas: {resultado['generaciones_omitidas']}")
+    print(f"Resultados guardados en: {opciones.salida}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,301 @@
+"""
+Suite de rendimiento del Juego de la Vida.
+
+Mide 'avanzar_generacion' (para cada motor), 'inicializar' (para cada Lattice)
+y 'PygameView.draw_board' (sobre un dispositivo SDL ficticio, sin pantalla)
+barriendo tamaños de Lattice, ocupaciones y semillas. Cada caso se ejecuta en
+un proceso nuevo para que el pico de memoria (RSS) sea el del propio caso.
+
+Los resultados se escriben como JSON Lines (una línea por caso, claves
+ordenadas), de modo que dos archivos de commits distintos se pueden comparar
+con 'diff' o con la opción --comparar.
+
+USO:
+    python benchmarks/suite_rendimiento.py [--salida resultados.jsonl] [--tamanos 64 256 ...]
+    python benchmarks/suite_rendimiento.py --comparar base.jsonl nuevo.jsonl
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import resource
+import subprocess
+import sys
+import time
+from typing import Dict, List, Any
+
+# Permite ejecutar el script desde cualquier directorio.
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+TAMANOS = (64, 256, 1024, 4096)
+OCUPACIONES = (0.1, 0.2, 0.5)
+SEMILLAS = (1, 2)
+MOTORES_POR_DEFECTO = ("diccionario", "incremental", "vectorizado", "bits")
+LATTICES = ("Lattice2d", "LatticeNumpy", "LatticeBits")
+
+# Los casos con estructuras de Python por célula se limitan a este número de
+# células (a partir de ahí cada generación tarda decenas de segundos).
+MAX_CELDAS_PYTHON = 1024 * 1024
+
+# Ancho máximo (en píxeles) de la superficie ficticia del caso de dibujo.
+MAX_PIXELES_VISTA = 4096
+
+# Segundos entre comprobaciones de que el proceso de un caso sigue vivo mientras
+# se espera su resultado (un hijo terminado por falta de memoria no escribe nada).
+ESPERA_RESULTADO_S = 1.0
+
+def _pico_rss_kb() -> int:
+    """
+    Devuelve el pico de memoria residente del proceso actual en KB.
+    """
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS informa en bytes; Linux en KB.
+    return pico // 1024 if sys.platform == "darwin" else pico
+
+def _medir_generaciones(caso: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Mide las generaciones por segundo de un motor (se ejecuta en un proceso hijo).
+
+    También registra el arranque: el tiempo de 'construir_automata' (inicialización
+    del Lattice incluida) y lo que crece el pico de RSS durante ese ensamblaje.
+    """
+    from ensamblador import construir_automata
+    dimensiones = (caso["tamano"], caso["tamano"])
+    pico_previo = _pico_rss_kb()
+    inicio = time.perf_counter()
+    automata = construir_automata(dimensiones, caso["ocupacion"], caso["motor"], semilla=caso["semilla"])
+    tiempo_inicio = time.perf_counter() - inicio
+    memoria_inicio = _pico_rss_kb() - pico_previo
+    try:
+        # Se repite hasta superar el tiempo mínimo (al menos una generación).
+        generaciones = 0
+        inicio = time.perf_counter()
+        while True:
+            automata.avanzar_generacion()
+            generaciones += 1
+            tiempo = time.perf_counter() - inicio
+            if tiempo >= caso["tiempo_minimo"] or generaciones >= caso["max_generaciones"]:
+                break
+    finally:
+        automata.cerrar()
+    return {
+        "generaciones": generaciones,
+        "tiempo_s": tiempo,
+        "generaciones_por_s": generaciones / tiempo,
+        "celdas_por_s": dimensiones[0] * dimensiones[1] * generaciones / tiempo,
+        "tiempo_inicio_s": tiempo_inicio,
+        "memoria_inicio_kb": memoria_inicio,
+    }
+
+def _medir_inicializacion(caso: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Mide el tiempo de 'inicializar' de un Lattice (se ejecuta en un proceso hijo).
+
+    Todos los Lattices usan el mismo GeneradorAleatorio sembrado. Además del tiempo
+    se registra cuánto crece el pico de RSS durante la inicialización.
+    """
+    from game.inicializacion.generador_aleatorio import GeneradorAleatorio
+    if caso["lattice"] == "LatticeNumpy":
+        from game.lattice.lattice_numpy import LatticeNumpy as Clase
+    elif caso["lattice"] == "LatticeBits":
+        from game.lattice.lattice_bits import LatticeBits as Clase
+    else:
+        from game.lattice.lattice_2d import Lattice2d as Clase
+    lattice = Clase(caso["semilla"], GeneradorAleatorio(caso["semilla"]))
+    pico_previo = _pico_rss_kb()
+    inicio = time.perf_counter()
+    lattice.inicializar((caso["tamano"], caso["tamano"]), caso["ocupacion"])
+    tiempo = time.perf_counter() - inicio
+    return {
+        "tiempo_s": tiempo,
+        "celdas_por_s": caso["tamano"] ** 2 / tiempo,
+        "memoria_inicializacion_kb": _pico_rss_kb() - pico_previo,
+    }
+
+def _medir_dibujo(caso: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Mide los cuadros por segundo de 'draw_board' sobre SDL ficticio (proceso hijo).
+
+    Los cuadros alternan entre dos generaciones consecutivas precalculadas: con
+    un tablero que no cambia, el dibujado por regiones sucias solo compararía
+    el estado y no dibujaría nada.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    import config
+    from ensamblador import construir_automata
+    from view.pygame_view import PygameView
+    tamano = caso["tamano"]
+    automata = construir_automata((tamano, tamano), caso["ocupacion"], "diccionario", semilla=caso["semilla"])
+    try:
+        estados = [dict(automata.obtener_lattice().obtener_estado())]
+        automata.avanzar_generacion()
+        estados.append(dict(automata.obtener_lattice().obtener_estado()))
+    finally:
+        automata.cerrar()
+    cambiadas = sum(1 for celula, valor in estados[0].items() if estados[1][celula] != valor)
+    lado = max(1, min(config.CELL_DIMENSIONS[0], MAX_PIXELES_VISTA // tamano))
+    vista = PygameView(config.TITLE, config.VERSION, (lado, lado), config.FRAMERATE, config.COLORS,
+                       max_window=config.VENTANA_MAXIMA)
+    vista.init((tamano, tamano))
+    cuadros = 0
+    inicio = time.perf_counter()
+    while True:
+        vista.draw_board(estados[cuadros % 2])
+        cuadros += 1
+        tiempo = time.perf_counter() - inicio
+        if tiempo >= caso["tiempo_minimo"] or cuadros >= caso["max_generaciones"]:
+            break
+    return {
+        "cuadros": cuadros,
+        "tiempo_s": tiempo,
+        "cuadros_por_s": cuadros / tiempo,
+        "celdas_por_s": tamano * tamano * cuadros / tiempo,
+        "fraccion_cambiada": cambiadas / (tamano * tamano),
+        "pixeles_por_celda": lado,
+    }
+
+_MEDIDORES = {
+    "avanzar_generacion": _medir_generaciones,
+    "inicializar": _medir_inicializacion,
+    "draw_board": _medir_dibujo,
+}
+
+def _ejecutar_en_hijo(caso: Dict[str, Any], cola):
+    """
+    Punto de entrada del proceso hijo: mide el caso y devuelve el resultado por la cola.
+    """
+    try:
+        resultado = _MEDIDORES[caso["operacion"]](caso)
+        resultado["pico_rss_kb"] = _pico_rss_kb()
+    except Exception as error:  # El fallo de un caso no debe detener la suite.
+        resultado = {"error": f"{type(error).__name__}: {error}"}
+    cola.put(resultado)
+
+def ejecutar_caso(caso: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Ejecuta un caso en un proceso nuevo ('spawn') y devuelve el registro completo.
+    
+    Args:
+        caso: Descripción del caso (operación, tamaño, ocupación, semilla, ...).
+        
+    Returns:
+        El caso combinado con sus métricas (o con un error si el proceso murió
+        sin devolver resultado, por ejemplo por falta de memoria).
+    """
+    contexto = multiprocessing.get_context("spawn")
+    cola = contexto.Queue()
+    proceso = contexto.Process(target=_ejecutar_en_hijo, args=(caso, cola))
+    proceso.start()
+    resultado = None
+    while resultado is None:
+        vivo = proceso.is_alive()
+        try:
+            resultado = cola.get(timeout=ESPERA_RESULTADO_S)
+        except queue.Empty:
+            # Solo se da por perdido si ya estaba muerto antes de esta última espera.
+            if not vivo:
+                proceso.join()
+                resultado = {"error": f"El proceso del caso terminó sin resultado "
+                                      f"(código de salida {proceso.exitcode})."}
+    proceso.join()
+    registro = dict(caso)
+    registro.update(resultado)
+    return registro
+
+def generar_casos(opciones: argparse.Namespace) -> List[Dict[str, Any]]:
+    """
+    Genera la lista de casos del barrido a partir de las opciones.
+    """
+    casos = []
+    comunes = {"tiempo_minimo": opciones.tiempo_minimo, "max_generaciones": opciones.max_generaciones}
+    for tamano in opciones.tamanos:
+        for ocupacion in opciones.ocupaciones:
+            for semilla in opciones.semillas:
+                base = dict(comunes, tamano=tamano, ocupacion=ocupacion, semilla=semilla)
+                en_python = tamano * tamano <= opciones.max_celdas_python
+                for motor in opciones.motores:
+                    if motor in ("diccionario", "incremental", "hashlife") and not en_python:
+                        continue
+                    casos.append(dict(base, operacion="avanzar_generacion", motor=motor))
+                for lattice in LATTICES:
+                    if lattice == "Lattice2d" and not en_python:
+                        continue
+                    casos.append(dict(base, operacion="inicializar", lattice=lattice))
+                if opciones.dibujo and en_python:
+                    casos.append(dict(base, operacion="draw_board"))
+    return casos
+
+def _identificar_entorno() -> Dict[str, Any]:
+    """
+    Devuelve los datos del entorno (commit, Python, plataforma) para cada registro.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "desconocido"
+    return {"commit": commit, "python": platform.python_version(), "plataforma": platform.platform()}
+
+def _clave(registro: Dict[str, Any]) -> tuple:
+    """
+    Clave que identifica un caso independientemente de sus métricas.
+    """
+    return tuple(registro.get(campo) for campo in
+                 ("operacion", "motor", "lattice", "tamano", "ocupacion", "semilla"))
+
+def comparar(ruta_base: str, ruta_nueva: str):
+    """
+    Imprime la razón nuevo/base de la métrica principal de cada caso común.
+    """
+    def cargar(ruta):
+        with open(ruta, encoding="utf-8") as archivo:
+            return {_clave(r): r for r in map(json.loads, archivo) if "error" not in r}
+    base, nueva = cargar(ruta_base), cargar(ruta_nueva)
+    for clave in sorted(set(base) & set(nueva), key=str):
+        metrica = "celdas_por_s"
+        razon = nueva[clave][metrica] / base[clave][metrica]
+        descripcion = " ".join(str(c) for c in clave if c is not None)
+        print(f"{descripcion:<50} {razon:8.2f}x")
+
+def main(argumentos: list):
+    """
+    Punto de entrada de la suite.
+    """
+    analizador = argparse.ArgumentParser(description="Suite de rendimiento del Juego de la Vida.")
+    analizador.add_argument("--salida", default="resultados_rendimiento.jsonl")
+    analizador.add_argument("--tamanos", type=int, nargs="+", default=list(TAMANOS))
+    analizador.add_argument("--ocupaciones", type=float, nargs="+", default=list(OCUPACIONES))
+    analizador.add_argument("--semillas", type=int, nargs="+", default=list(SEMILLAS))
+    analizador.add_argument("--motores", nargs="+", default=list(MOTORES_POR_DEFECTO))
+    analizador.add_argument("--tiempo-minimo", type=float, default=0.5,
+                            help="Segundos mínimos de medición por caso.")
+    analizador.add_argument("--max-generaciones", type=int, default=1000)
+    analizador.add_argument("--max-celdas-python", type=int, default=MAX_CELDAS_PYTHON,
+                            help="Límite de células para los casos con estructuras de Python por célula.")
+    analizador.add_argument("--sin-dibujo", dest="dibujo", action="store_false",
+                            help="Omite los casos de PygameView.draw_board.")
+    analizador.add_argument("--comparar", nargs=2, metavar=("BASE", "NUEVO"))
+    opciones = analizador.parse_args(argumentos)
+
+    if opciones.comparar:
+        comparar(*opciones.comparar)
+        return
+
+    entorno = _identificar_entorno()
+    casos = generar_casos(opciones)
+    with open(opciones.salida, "w", encoding="utf-8") as archivo:
+        for indice, caso in enumerate(casos, 1):
+            registro = ejecutar_caso(caso)
+            registro.update(entorno)
+            archivo.write(json.dumps(registro, sort_keys=True) + "\n")
+            archivo.flush()
+            metrica = registro.get("celdas_por_s")
+            resumen = f"{metrica:.3e} células/s" if metrica else registro.get("error", "")
+            print(f"[{indice}/{len(casos)}] {' '.join(str(c) for c in _clave(registro) if c is not None)}: {resumen}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -7,15 +7,98 @@ VERSION = "2.2"
 # Dimensiones de cada celda (en píxeles) para el dibujado en Pygame
 CELL_DIMENSIONS = (8, 8)
 
+# Tamaño máximo de la ventana (en píxeles). Los tableros mayores se recorren con el visor:
+# flechas o arrastrar con el ratón para desplazarse, +/- o la rueda para el zoom, Inicio
+# para ver el tablero entero.
+VENTANA_MAXIMA = (1280, 960)
+
+# Con menos de un píxel por célula, cada píxel resume un bloque de células:
+# "max" (vivo si hay alguna viva) o "density" (fracción de vivas). La tecla L las alterna.
+AGREGACION_BLOQUES = "max"
+
 # Tasa de cuadros por segundo (FPS) de la simulación.
 # Controla la velocidad de la evolución del juego.
 FRAMERATE = 20
 
+# Tasa objetivo del Modelo en generaciones por segundo. El Modelo avanza en su propio hilo,
+# independiente de los FPS de dibujado; 20 mantiene la velocidad de evolución de siempre.
+# None (opcional) lo deja avanzar tan rápido como sea posible, para medir o tableros grandes.
+GENERACIONES_POR_SEGUNDO = 20
+
+# Capacidad de la cola de instantáneas entre el hilo del Modelo y el de la Vista.
+TAMANO_COLA_CUADROS = 2
+
 # Probabilidad inicial de Ocupación:
 # Representa la fracción (0.0 a 1.0) de células que estarán VIVAS (1) 
 # al inicio del juego (al generarse el tablero aleatorio).
 OCCUPANCY = 0.20
 
+# Semilla del estado inicial aleatorio (None = se sortea una y se muestra al iniciar,
+# para poder repetir la ejecución).
+SEMILLA = None
+
+# Motor de simulación:
+# "diccionario": JuegoDeLaVida sobre LatticeDobleBuffer (implementación de referencia).
+# "vectorizado": JuegoDeLaVidaVectorizado sobre LatticeNumpy (requiere numpy).
+# "bits": JuegoDeLaVidaBits sobre LatticeBits, 64 células por palabra (requiere numpy).
+# "paralelo": JuegoDeLaVidaParalelo, franjas en memoria compartida y pool de procesos (requiere numpy).
+# "hashlife": JuegoDeLaVidaHashLife (árbol cuaternario memorizado; dimensiones potencia de dos).
+# "incremental": JuegoDeLaVida sobre Lattice2d reevaluando solo las células activas.
+# "regla" / "regla_vectorizada": AutomataReglaGenerica con REGLA sobre LatticeDobleBuffer / LatticeNumpy.
+# "disperso": JuegoDeLaVidaDisperso sobre LatticeDisperso (solo células vivas, plano ilimitado;
+#             el tablero es una ventana sobre el plano).
+# "mapeado": JuegoDeLaVidaMapeado sobre LatticeMapeado (estado en disco, recorrido por franjas;
+#            para tableros mayores que la memoria).
+MOTOR = "diccionario"
+
+# Motor "disperso": si alguna célula viva sale de la ventana, la ventana se recentra sobre la
+# caja que las contiene a todas, para que la Vista las siga mostrando (False = ventana fija).
+SEGUIR_POBLACION = True
+
+# Regla de los motores "regla", "regla_vectorizada" y "disperso", en notación B/S o B/S/C.
+# Ej.: "B3/S23" (Conway), "B36/S23" (HighLife), "B3678/S34678" (Día y Noche), "B2/S/C3" (Brian).
+REGLA = "B3/S23"
+
+# Vecindad de los motores "regla" y "regla_vectorizada": "moore", "von_neumann" o "hexagonal",
+# con radio RADIO_VECINDAD. Una REGLA en notación "Larger than Life" (ej., "R5,C0,M1,S34..58,B34..45,NM")
+# fija su propia vecindad y radio. Con radios grandes, el conteo en bloque no depende del radio.
+VECINDAD = "moore"
+RADIO_VECINDAD = 1
+
+# Condición de Frontera: "ciclica" (toroide), "muerta" (rodeado de células siempre muertas),
+# "reflectiva" (espejo en cada borde) o "ilimitada" (solo motor "disperso").
+# None = la del motor ("ilimitada" para "disperso", "ciclica" para el resto).
+# "bits" y "mapeado" necesitan que sea cíclica en el eje y; "hashlife", cíclica.
+FRONTERA = None
+
+# Número de procesos del motor "paralelo" (None = todos los núcleos disponibles).
+PROCESOS = None
+
+# Instrumentación por fases (conteo/marcado, aplicación, dibujado, espera del reloj, entrada).
+# Desactivada no tiene coste apreciable. MOSTRAR_METRICAS muestra el panel al iniciar (F3 lo alterna).
+# ARCHIVO_METRICAS: al terminar se guarda el resumen en JSON Lines (o Prometheus si acaba en ".prom").
+INSTRUMENTACION = False
+MOSTRAR_METRICAS = False
+ARCHIVO_METRICAS = None
+
+# Estadísticas por generación calculadas por el propio motor (None = desactivadas): un
+# archivo CSV con población, nacimientos, muertes, caja de las células vivas y densidad
+# por regiones (rejilla de REGIONES_ESTADISTICAS filas x columnas), escrito por lotes.
+ARCHIVO_ESTADISTICAS = None
+REGIONES_ESTADISTICAS = (8, 8)
+
+# Historial de repetición (None = desactivado, igual que los ciclos y las estadísticas, porque
+# cada generación calcula su delta): megabytes máximos (ej., 256) para los deltas de cada
+# generación y los cuadros clave (uno como mucho cada CLAVES_REPETICION_CADA generaciones).
+# Espacio pausa (también sin historial), "," y "." retroceden o avanzan una generación, "[" y "]"
+# cincuenta, Retroceso va a la generación más antigua guardada y Fin vuelve al presente (requiere numpy).
+MEMORIA_REPETICION = None
+CLAVES_REPETICION_CADA = 64
+
+# Servidor de estado para visores remotos (None = desactivado): un puerto en localhost
+# (ej., "8765") o "unix:RUTA". Cada generación se publica como delta comprimido.
+SERVIDOR_ESTADO = None
+
 # Colores usados para representar los estados de las células
 # 0: Muerta (Negro) | 1: Viva (Amarillo/Blanco)
 COLORS = {0: (0, 0, 0), 1: (200, 200, 100)}
\ No newline at end of file
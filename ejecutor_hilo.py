@@ -1,11 +1,139 @@
+import queue
 import threading
 import time
+from typing import Optional
 from aplicacion_simulacion import AplicacionSimulacion
 
 # Bandera de control global para la ejecución de la simulación.
 # Es usada para detener el bucle del hilo de forma controlada.
 SIMULACION_ACTIVA = True
 
+# Segundos que espera el hilo del Modelo entre consultas mientras la simulación está en pausa.
+ESPERA_PAUSA = 0.01
+
+class MedidorTasa:
+    """
+    Clase MedidorTasa:
+    
+    Cuenta eventos (generaciones, cuadros) y calcula su tasa por segundo sobre
+    ventanas de tiempo de duración fija. Cada instancia la escribe un único hilo.
+    """
+    
+    def __init__(self, ventana: float = 1.0):
+        """
+        Constructor que inicializa el contador.
+        
+        Args:
+            ventana: Duración (en segundos) de cada ventana de medición.
+        """
+        self.ventana = ventana
+        self.total = 0
+        self._en_ventana = 0
+        self._inicio_ventana = time.perf_counter()
+        self._tasa = 0.0
+        
+    def registrar(self):
+        """
+        Registra un evento y recalcula la tasa al cerrarse la ventana.
+        """
+        self.total += 1
+        self._en_ventana += 1
+        ahora = time.perf_counter()
+        transcurrido = ahora - self._inicio_ventana
+        if transcurrido >= self.ventana:
+            self._tasa = self._en_ventana / transcurrido
+            self._en_ventana = 0
+            self._inicio_ventana = ahora
+            
+    def tasa(self) -> float:
+        """
+        Devuelve la tasa (eventos por segundo) de la última ventana completa.
+        """
+        return self._tasa
+
+class HiloModelo(threading.Thread):
+    """
+    Clase HiloModelo:
+    
+    Productor del pipeline. Avanza el Modelo tan rápido como puede (o hasta una
+    tasa objetivo) y publica instantáneas inmutables en una cola acotada. Si la
+    cola está llena descarta la instantánea más antigua: el Modelo nunca espera
+    a la Vista. En pausa (la aplicación no devuelve instantánea) espera
+    ESPERA_PAUSA segundos entre consultas.
+
+    Si el Modelo lanza una excepción, el hilo termina y la guarda en 'error'
+    para que el consumidor la vuelva a lanzar (un hilo 'daemon' moriría en silencio).
+    """
+    
+    def __init__(self, aplicacion: AplicacionSimulacion, cola: queue.Queue,
+                 generaciones_por_segundo: Optional[float] = None):
+        """
+        Constructor que recibe la aplicación y la cola donde publicar.
+        
+        Args:
+            aplicacion: La instancia de AplicacionSimulacion con el Modelo.
+            cola: La cola acotada de instantáneas compartida con el consumidor.
+            generaciones_por_segundo: Tasa objetivo (None = sin límite).
+        """
+        threading.Thread.__init__(self)
+        self.aplicacion = aplicacion
+        self.cola = cola
+        self.generaciones_por_segundo = generaciones_por_segundo
+        self.generaciones = MedidorTasa()
+        self.descartadas = 0     # Instantáneas descartadas por cola llena
+        self.error: Optional[BaseException] = None  # Excepción que detuvo el hilo
+        self._detener = threading.Event()
+        self.daemon = True
+        
+    def detener(self):
+        """
+        Pide al hilo que termine tras la generación en curso.
+        """
+        self._detener.set()
+
+    def run(self):
+        """
+        Ejecuta el bucle productor y guarda la excepción que lo detenga (ver 'error').
+        """
+        try:
+            self._producir()
+        except BaseException as error:
+            self.error = error
+
+    def _producir(self):
+        """
+        Bucle productor: avanzar, publicar y (opcionalmente) esperar a la tasa objetivo.
+        """
+        periodo = 1.0 / self.generaciones_por_segundo if self.generaciones_por_segundo else 0.0
+        siguiente = time.perf_counter()
+        while not self._detener.is_set():
+            instantanea = self.aplicacion.avanzar_modelo()
+            if instantanea is None:
+                # En pausa: no hay generación nueva que publicar.
+                self._detener.wait(ESPERA_PAUSA)
+                siguiente = time.perf_counter()
+                continue
+            self.generaciones.registrar()
+            
+            # Publicación no bloqueante: si la cola está llena se descarta la más antigua.
+            try:
+                self.cola.put_nowait(instantanea)
+            except queue.Full:
+                try:
+                    self.cola.get_nowait()
+                    self.descartadas += 1
+                except queue.Empty:
+                    pass
+                self.cola.put_nowait(instantanea)
+                
+            if periodo:
+                siguiente += periodo
+                espera = siguiente - time.perf_counter()
+                if espera > 0:
+                    self._detener.wait(espera)
+                else:
+                    siguiente = time.perf_counter()
+
 class EjecutorSimulacion(threading.Thread):
     """
     Clase EjecutorSimulacion: 
@@ -13,27 +141,71 @@ class EjecutorSimulacion(threading.Thread):
     Hereda de threading.Thread para ejecutar la aplicación de forma asíncrona.
     Encapsula el bucle de la simulación en un hilo secundario, separando la 
     responsabilidad de la concurrencia.
+    
+    La simulación se organiza como un pipeline productor/consumidor: un
+    HiloModelo avanza el Modelo y publica instantáneas en una cola acotada, y
+    este hilo (el de la Vista) dibuja siempre la más reciente, descartando las
+    obsoletas. Así un dibujado lento no frena al Modelo ni viceversa. Si el
+    HiloModelo falla, la simulación se detiene y su excepción se vuelve a lanzar.
     """
     
-    def __init__(self, aplicacion: AplicacionSimulacion):
+    def __init__(self, aplicacion: AplicacionSimulacion, tamano_cola: int = 2,
+                 generaciones_por_segundo: Optional[float] = None):
         """
         Constructor que recibe y almacena la instancia de la aplicación a ejecutar.
         
         Args:
             aplicacion: La instancia de AplicacionSimulacion que contiene 
                         el Modelo (Autómata) y la Vista (Pygame).
+            tamano_cola: Capacidad de la cola de instantáneas entre Modelo y Vista.
+            generaciones_por_segundo: Tasa objetivo del Modelo (None = sin límite).
         """
         threading.Thread.__init__(self)
         self.aplicacion = aplicacion
+        self.cola = queue.Queue(maxsize=max(1, tamano_cola))
+        self.hilo_modelo = HiloModelo(aplicacion, self.cola, generaciones_por_segundo)
+        self.cuadros = MedidorTasa()
+        self.obsoletas = 0       # Instantáneas descartadas por la Vista por no ser la última
         
         # El hilo 'daemon' permite que el programa principal termine automáticamente
         # cuando todos los hilos no-daemon (el principal) hayan finalizado.
         self.daemon = True 
 
+    def contadores(self) -> dict:
+        """
+        Devuelve los contadores de rendimiento del pipeline.
+        
+        Returns:
+            Un diccionario con generaciones/s simuladas, FPS dibujados y cuadros descartados.
+        """
+        return {
+            "generaciones_por_s": self.hilo_modelo.generaciones.tasa(),
+            "cuadros_por_s": self.cuadros.tasa(),
+            "generaciones": self.hilo_modelo.generaciones.total,
+            "cuadros": self.cuadros.total,
+            "cuadros_descartados": self.hilo_modelo.descartadas + self.obsoletas,
+        }
+
+    def _tomar_mas_reciente(self):
+        """
+        Vacía la cola y devuelve la instantánea más reciente (o None si no hay nuevas).
+        """
+        instantanea = None
+        recibidas = 0
+        while True:
+            try:
+                instantanea = self.cola.get_nowait()
+                recibidas += 1
+            except queue.Empty:
+                break
+        if recibidas > 1:
+            self.obsoletas += recibidas - 1
+        return instantanea
+
     def run(self):
         """
         Método de ejecución principal del hilo. 
-        Contiene el bucle de la simulación del Autómata Celular.
+        Contiene el bucle de dibujado (consumidor) del Autómata Celular.
         """
         global SIMULACION_ACTIVA
         
@@ -44,13 +216,36 @@ class EjecutorSimulacion(threading.Thread):
         # Inicializa la Vista (Pygame.init(), pantalla, etc.)
         self.aplicacion.init_vista() 
         
+        # Arranca el productor: el Modelo avanza en su propio hilo.
+        self.hilo_modelo.start()
+        
         # Bucle principal de la simulación, controlado por la bandera global.
         while SIMULACION_ACTIVA:
-            # Ejecuta un solo paso: maneja input, avanza la generación y redibuja.
-            self.aplicacion.tick_y_avanzar()
-            
+            # Controla los FPS y procesa la entrada.
             # Condición de salida: si la vista recibe un evento QUIT, establece la bandera.
-            if self.aplicacion.juego_terminado: 
+            if self.aplicacion.procesar_entrada():
                 SIMULACION_ACTIVA = False
-                
-        print("Simulación terminada.")
\ No newline at end of file
+                break
+            
+            # Dibuja solo la instantánea más reciente (si hay una nueva).
+            instantanea = self._tomar_mas_reciente()
+            if instantanea is not None:
+                self.aplicacion.dibujar(instantanea)
+                self.cuadros.registrar()
+            elif self.hilo_modelo.error is not None:
+                # El Modelo falló: ya no habrá instantáneas nuevas.
+                SIMULACION_ACTIVA = False
+                break
+        
+        self.hilo_modelo.detener()
+        self.hilo_modelo.join()
+        self.aplicacion.automata.cerrar()
+        self.aplicacion.cerrar_servidor()
+        self.aplicacion.exportar_metricas()
+        
+        contadores = self.contadores()
+        print(f"Generaciones: {contadores['generaciones']} | Cuadros: {contadores['cuadros']} | "
+              f"Cuadros descartados: {contadores['cuadros_descartados']}")
+        print("Simulación terminada.")
+        if self.hilo_modelo.error is not None:
+            raise RuntimeError("El hilo del Modelo terminó por una excepción.") from self.hilo_modelo.error
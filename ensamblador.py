@@ -0,0 +1,196 @@
+from functools import partial
+from typing import Tuple, Optional, Any
+
+from game.automata_celular import AutomataCelular
+from game.juego_de_la_vida import JuegoDeLaVida 
+from game.vecindad.vecindad_moore import VecindadMoore 
+from game.frontera.frontera_ciclica import CondicionFronteraCiclica
+from game.lattice.lattice_2d import Lattice2d 
+from game.lattice.lattice_doble_buffer import LatticeDobleBuffer
+from game.reglas.regla_transicion import ReglaTransicion, CONWAY
+from game.reglas.regla_larger_than_life import ReglaLargerThanLife, es_regla_larger_than_life
+
+# Motores disponibles (ver config.MOTOR).
+MOTORES = ("diccionario", "incremental", "vectorizado", "bits", "paralelo", "hashlife",
+           "regla", "regla_vectorizada", "disperso", "mapeado")
+
+# Vecindades disponibles (ver config.VECINDAD) y motores que aceptan cualquiera de ellas.
+VECINDADES = ("moore", "von_neumann", "hexagonal")
+MOTORES_CON_VECINDAD = ("regla", "regla_vectorizada")
+
+# Condiciones de frontera disponibles (ver config.FRONTERA). "ilimitada" solo con el motor "disperso".
+FRONTERAS = ("ciclica", "muerta", "reflectiva", "ilimitada")
+
+def construir_frontera(nombre: str = "ciclica"):
+    """
+    Crea la Condición de Frontera indicada.
+    
+    Args:
+        nombre: Uno de FRONTERAS.
+        
+    Returns:
+        La ICondicionFrontera correspondiente.
+        
+    Raises:
+        ValueError: Si la frontera no es conocida.
+    """
+    if nombre == "ciclica":
+        return CondicionFronteraCiclica()
+    if nombre == "muerta":
+        from game.frontera.frontera_muerta import CondicionFronteraMuerta
+        return CondicionFronteraMuerta()
+    if nombre == "reflectiva":
+        from game.frontera.frontera_reflectiva import CondicionFronteraReflectiva
+        return CondicionFronteraReflectiva()
+    if nombre == "ilimitada":
+        from game.frontera.frontera_ilimitada import CondicionFronteraIlimitada
+        return CondicionFronteraIlimitada()
+    raise ValueError(f"Frontera desconocida: {nombre!r}. Opciones: {', '.join(FRONTERAS)}.")
+
+def construir_vecindad(nombre: str = "moore", radio: int = 1, incluir_centro: bool = False):
+    """
+    Crea la Estrategia de Vecindad indicada.
+    
+    Args:
+        nombre: Uno de VECINDADES.
+        radio: El radio de la vecindad (1 = vecinas inmediatas).
+        incluir_centro: Si la célula central cuenta como su propia vecina.
+        
+    Returns:
+        La IEstrategiaVecindad (VecindadMoore para Moore de radio 1 sin centro).
+        
+    Raises:
+        ValueError: Si la vecindad no es conocida o el radio no es válido.
+    """
+    if nombre == "moore" and radio == 1 and not incluir_centro:
+        return VecindadMoore()
+    if nombre == "moore":
+        from game.vecindad.vecindad_moore_radio import VecindadMooreRadio
+        return VecindadMooreRadio(radio, incluir_centro)
+    if nombre == "von_neumann":
+        from game.vecindad.vecindad_von_neumann import VecindadVonNeumann
+        return VecindadVonNeumann(radio, incluir_centro)
+    if nombre == "hexagonal":
+        from game.vecindad.vecindad_hexagonal import VecindadHexagonal
+        return VecindadHexagonal(radio, incluir_centro)
+    raise ValueError(f"Vecindad desconocida: {nombre!r}. Opciones: {', '.join(VECINDADES)}.")
+
+def construir_automata(dimensiones: Tuple[int, int], ocupacion: float, motor: str = "diccionario",
+                       semilla: Optional[int] = None, procesos: Optional[int] = None,
+                       regla: str = CONWAY, generador: Optional[Any] = None,
+                       archivo_mapeo: Optional[str] = None, vecindad: str = "moore",
+                       radio: int = 1, frontera: Optional[str] = None) -> AutomataCelular:
+    """
+    Crea e inyecta las implementaciones concretas del Modelo para el motor indicado.
+    
+    Es el único punto del programa que conoce las clases concretas; tanto la
+    aplicación gráfica (AplicacionSimulacion) como el ejecutor sin interfaz
+    (simulacion_headless.py) comparten este ensamblaje. No importa Pygame.
+    
+    Args:
+        dimensiones: Tamaño (X_MAX, Y_MAX) del Lattice.
+        ocupacion: Probabilidad inicial de que una célula esté viva.
+        motor: Nombre del motor de simulación (uno de MOTORES).
+        semilla: Semilla del estado inicial aleatorio (None = no reproducible).
+        procesos: Número de procesos del motor "paralelo" (None = todos los núcleos).
+        regla: Regla en notación B/S o B/S/C para los motores "regla" y "regla_vectorizada"
+               (solo B/S para "disperso"). Estos dos motores aceptan también la notación
+               "Larger than Life" (ej., "R5,C0,M1,S34..58,B34..45,NM"), que fija la vecindad.
+        generador: Generador del estado inicial (IGeneradorEstadoInicial); None = aleatorio con 'semilla'.
+        archivo_mapeo: Archivo del estado del motor "mapeado" (None = archivos temporales).
+        vecindad: Vecindad de los motores "regla" y "regla_vectorizada" (uno de VECINDADES).
+        radio: Radio de esa vecindad.
+        frontera: Condición de Frontera (uno de FRONTERAS; None = "ilimitada" para
+                  "disperso" y "ciclica" para el resto). Los motores "bits" y "mapeado"
+                  exigen que sea cíclica en el eje y, y "hashlife" en ambos ejes.
+        
+    Returns:
+        El Autómata Celular listo para avanzar generaciones.
+        
+    Raises:
+        ValueError: Si el motor no es conocido, la regla no es válida o el motor
+                    no admite la vecindad o la frontera pedidas.
+    """
+    # 1. Componentes del Modelo 
+    if frontera is None:
+        frontera = "ilimitada" if motor == "disperso" else "ciclica"
+    if frontera == "ilimitada" and motor != "disperso":
+        raise ValueError("La frontera ilimitada solo está disponible con el motor 'disperso'.")
+    condicion_frontera = construir_frontera(frontera)
+    incluir_centro = False
+    regla_ltl = ReglaLargerThanLife.desde_cadena(regla) if es_regla_larger_than_life(regla) else None
+    if regla_ltl is not None:
+        # La notación LtL describe también la vecindad; el resto es una regla totalista.
+        vecindad, radio, incluir_centro = regla_ltl.vecindad, regla_ltl.radio, regla_ltl.incluir_centro
+    if (vecindad, radio, incluir_centro) != ("moore", 1, False) and motor not in MOTORES_CON_VECINDAD:
+        raise ValueError(f"El motor {motor!r} solo admite la vecindad de Moore de radio 1; "
+                         f"use {' o '.join(MOTORES_CON_VECINDAD)}.")
+    estrategia_vecindad = construir_vecindad(vecindad, radio, incluir_centro)
+    
+    def compilar_regla() -> ReglaTransicion:
+        return regla_ltl.regla if regla_ltl is not None else ReglaTransicion.desde_cadena(regla)
+    
+    # Un mismo generador para todos los motores: con la misma semilla, todos parten
+    # del mismo tablero. Sin NumPy, Lattice2d recurre a su propio sorteo con 'random'.
+    if generador is None:
+        try:
+            from game.inicializacion.generador_aleatorio import GeneradorAleatorio
+            generador = GeneradorAleatorio(semilla)
+        except ImportError:
+            generador = None
+    
+    # Selección del motor (el resto del ensamblaje es idéntico).
+    # Las importaciones son diferidas: NumPy solo es necesario para algunos motores.
+    if motor == "vectorizado":
+        from game.juego_de_la_vida_vectorizado import JuegoDeLaVidaVectorizado
+        from game.lattice.lattice_numpy import LatticeNumpy
+        clase_automata, lattice = JuegoDeLaVidaVectorizado, LatticeNumpy(semilla, generador)
+    elif motor == "bits":
+        from game.juego_de_la_vida_bits import JuegoDeLaVidaBits
+        from game.lattice.lattice_bits import LatticeBits
+        clase_automata, lattice = JuegoDeLaVidaBits, LatticeBits(semilla, generador)
+    elif motor == "mapeado":
+        from game.juego_de_la_vida_mapeado import JuegoDeLaVidaMapeado
+        from game.lattice.lattice_mapeado import LatticeMapeado
+        clase_automata = JuegoDeLaVidaMapeado
+        lattice = LatticeMapeado(archivo_mapeo, semilla, generador)
+    elif motor == "paralelo":
+        from game.juego_de_la_vida_paralelo import JuegoDeLaVidaParalelo
+        from game.lattice.lattice_numpy import LatticeNumpy
+        clase_automata = partial(JuegoDeLaVidaParalelo, procesos=procesos)
+        lattice = LatticeNumpy(semilla, generador)
+    elif motor == "hashlife":
+        from game.juego_de_la_vida_hashlife import JuegoDeLaVidaHashLife
+        clase_automata, lattice = JuegoDeLaVidaHashLife, Lattice2d(semilla, generador)
+    elif motor == "regla":
+        from game.automata_regla_generica import AutomataReglaGenerica
+        clase_automata = partial(AutomataReglaGenerica, regla=compilar_regla())
+        lattice = LatticeDobleBuffer(semilla, generador)
+    elif motor == "regla_vectorizada":
+        from game.automata_regla_generica import AutomataReglaGenerica
+        from game.lattice.lattice_numpy import LatticeNumpy
+        clase_automata = partial(AutomataReglaGenerica, regla=compilar_regla())
+        lattice = LatticeNumpy(semilla, generador)
+    elif motor == "disperso":
+        # Plano ilimitado por defecto: las dimensiones solo definen la ventana visible y la zona sembrada.
+        from game.juego_de_la_vida_disperso import JuegoDeLaVidaDisperso
+        from game.lattice.lattice_disperso import LatticeDisperso
+        clase_automata = partial(JuegoDeLaVidaDisperso, regla=compilar_regla())
+        lattice = LatticeDisperso(semilla, generador)
+    elif motor == "incremental":
+        clase_automata, lattice = partial(JuegoDeLaVida, incremental=True), Lattice2d(semilla, generador)
+    elif motor == "diccionario":
+        # Doble búfer: una sola pasada por generación e instantáneas sin copia.
+        clase_automata, lattice = JuegoDeLaVida, LatticeDobleBuffer(semilla, generador)
+    else:
+        raise ValueError(f"Motor desconocido: {motor!r}. Opciones: {', '.join(MOTORES)}.")
+    
+    # 2. Inicializar el Autómata (Modelo)
+    # Se inyectan las implementaciones concretas en la clase abstracta AutomataCelular
+    return clase_automata(
+        ocupacion, 
+        estrategia_vecindad,
+        condicion_frontera,
+        lattice, 
+        dimensiones 
+    )
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional, Iterable
 
 # Importaciones de Abstracciones (Interfaces) 
 from .vecindad.i_estrategia_vecindad import IEstrategiaVecindad 
 from .frontera.i_condicion_frontera import ICondicionFrontera
 from .lattice.i_lattice import ILattice 
+from .ciclos.detector_ciclos import DetectorCiclos, MAX_HISTORIAL_POR_DEFECTO
+from .estadisticas.colector_estadisticas import ColectorEstadisticas, REGIONES_POR_DEFECTO
 
 class AutomataCelular(ABC):
     """
@@ -41,6 +43,16 @@ class AutomataCelular(ABC):
         # La clase AutomataCelular NO almacena 'self.dimensiones', las obtiene de ILattice.
         self.lattice: ILattice = lattice
         self.lattice.inicializar(dimensiones, ocupacion_inicial) 
+        
+        # Detección de ciclos (desactivada por defecto: sin coste para el avance normal).
+        self.detector_ciclos: Optional[DetectorCiclos] = None
+        self.avance_rapido = False
+        
+        # Estadísticas por generación (desactivadas por defecto, igual que la detección de ciclos).
+        self.estadisticas: Optional[ColectorEstadisticas] = None
+
+        # Historial de repetición (desactivado por defecto; ver 'activar_repeticion').
+        self.repeticion: Optional[Any] = None
 
     @abstractmethod
     def avanzar_generacion(self):
@@ -51,6 +63,242 @@ class AutomataCelular(ABC):
         para definir su lógica de evolución específica.
         """
         pass
+
+    def avanzar_generaciones(self, n: int):
+        """
+        Avanza n generaciones consecutivas.
+        
+        La implementación por defecto llama n veces a 'avanzar_generacion()'; los
+        motores capaces de saltar varias generaciones a la vez la sobrescriben.
+        
+        Args:
+            n: El número de generaciones a avanzar (n >= 0).
+        """
+        for hechas in range(n):
+            # Avance rápido: dentro de un ciclo de periodo p, avanzar k*p generaciones
+            # no cambia el estado, así que solo se calculan las (n - hechas) % p restantes.
+            ciclo = self.detector_ciclos.ciclo if self.detector_ciclos is not None else None
+            if ciclo is not None and self.avance_rapido:
+                restantes = n - hechas
+                self.detector_ciclos.saltar(restantes - restantes % ciclo.periodo)
+                if self.estadisticas is not None:
+                    self.estadisticas.saltar(restantes - restantes % ciclo.periodo)
+                if self.repeticion is not None:
+                    self.repeticion.saltar(restantes - restantes % ciclo.periodo)
+                for _ in range(restantes % ciclo.periodo):
+                    self.avanzar_generacion()
+                return
+            self.avanzar_generacion()
+
+    def activar_deteccion_ciclos(self, max_historial: int = MAX_HISTORIAL_POR_DEFECTO,
+                                 avance_rapido: bool = True, generacion: int = 0) -> DetectorCiclos:
+        """
+        Activa la detección de ciclos y estados estacionarios a partir del estado actual.
+        
+        A partir de aquí cada generación actualiza un hash incremental del Lattice
+        (ver DetectorCiclos). Los ejecutores pueden consultar 'detector_ciclos.ciclo'
+        para detenerse en cuanto el tablero se estabiliza.
+        
+        Args:
+            max_historial: Número de hashes recientes conservados (periodo máximo detectable).
+            avance_rapido: Si es True, 'avanzar_generaciones()' salta los periodos
+                           completos de un ciclo ya detectado en lugar de calcularlos.
+            generacion: La generación que corresponde al estado actual.
+            
+        Returns:
+            El detector activo.
+        """
+        detector = DetectorCiclos(self.lattice.obtener_dimensiones(), max_historial)
+        detector.reiniciar(self.obtener_lattice(), generacion)
+        self.detector_ciclos = detector
+        self.avance_rapido = avance_rapido
+        return detector
+
+    def desactivar_deteccion_ciclos(self):
+        """
+        Desactiva la detección de ciclos y descarta su historial.
+        """
+        self.detector_ciclos = None
+        self.avance_rapido = False
+
+    def activar_estadisticas(self, ruta: Optional[str] = None,
+                             regiones: Tuple[int, int] = REGIONES_POR_DEFECTO,
+                             generacion: int = 0) -> ColectorEstadisticas:
+        """
+        Activa las estadísticas por generación a partir del estado actual.
+        
+        A partir de aquí el motor entrega a 'estadisticas' lo que ya calculó en
+        cada generación (ver ColectorEstadisticas), sin recorrer de nuevo el
+        Lattice. Si se da una ruta, cada generación añade una fila a un CSV que
+        se escribe por lotes.
+        
+        Args:
+            ruta: Archivo CSV de la serie temporal (None = solo la última generación en memoria).
+            regiones: Regiones (filas, columnas) de la rejilla de densidad.
+            generacion: La generación que corresponde al estado actual.
+            
+        Returns:
+            El colector activo.
+        """
+        colector = ColectorEstadisticas(self.lattice.obtener_dimensiones(), regiones,
+                                        ilimitado=self.condicion_frontera.es_ilimitada())
+        if ruta is not None:
+            from .estadisticas.escritor_estadisticas import EscritorEstadisticasCSV
+            colector.escritor = EscritorEstadisticasCSV(ruta, colector.columnas(), colector.formatos())
+        colector.reiniciar(self.obtener_lattice(), generacion)
+        self.desactivar_estadisticas()
+        self.estadisticas = colector
+        return colector
+
+    def desactivar_estadisticas(self):
+        """
+        Desactiva las estadísticas y cierra su archivo (volcando las filas pendientes).
+        """
+        if self.estadisticas is not None:
+            self.estadisticas.cerrar()
+        self.estadisticas = None
+
+    def activar_repeticion(self, memoria_maxima: Optional[int] = None,
+                           generaciones_entre_claves: Optional[int] = None,
+                           generacion: int = 0) -> Any:
+        """
+        Activa el historial de repetición a partir del estado actual.
+        
+        A partir de aquí cada generación guarda su delta (ver GrabadorRepeticion),
+        y 'repeticion' permite volver a cualquier generación retenida y seguir
+        simulando desde ella. Requiere NumPy.
+        
+        Args:
+            memoria_maxima: Bytes máximos del historial (None = el valor por defecto).
+            generaciones_entre_claves: Generaciones máximas entre cuadros clave (None = por defecto).
+            generacion: La generación que corresponde al estado actual.
+            
+        Returns:
+            El GrabadorRepeticion activo.
+        """
+        from .repeticion.grabador_repeticion import (GrabadorRepeticion, MEMORIA_MAXIMA_POR_DEFECTO,
+                                                     GENERACIONES_ENTRE_CLAVES)
+        grabador = GrabadorRepeticion(
+            self,
+            memoria_maxima if memoria_maxima is not None else MEMORIA_MAXIMA_POR_DEFECTO,
+            generaciones_entre_claves if generaciones_entre_claves is not None else GENERACIONES_ENTRE_CLAVES
+        )
+        grabador.reiniciar(self.obtener_lattice(), generacion)
+        self.repeticion = grabador
+        return grabador
+
+    def desactivar_repeticion(self):
+        """
+        Desactiva el historial de repetición y libera su memoria.
+        """
+        self.repeticion = None
+
+    # --- Notificación de cada generación a los observadores (ciclos, estadísticas, repetición) ---
+
+    def _observando(self) -> bool:
+        """
+        Indica si algún observador necesita la información de la generación.
+        
+        Los motores que solo construyen la lista de cambios para los
+        observadores la omiten cuando devuelve False.
+        """
+        return (self.detector_ciclos is not None or self.estadisticas is not None
+                or self.repeticion is not None)
+
+    def _registrar_cambios(self, cambios: Iterable[Tuple[Tuple[int, int], int, int]]):
+        """
+        Cierra la generación en los observadores con la lista de células que cambiaron.
+        """
+        if self.estadisticas is not None:
+            self.estadisticas.registrar_cambios(cambios)
+        if self.detector_ciclos is not None:
+            self.detector_ciclos.registrar_cambios(cambios)
+        if self.repeticion is not None:
+            self.repeticion.registrar_cambios(cambios)
+
+    def _registrar_arreglos(self, anterior: Any, nuevo: Any):
+        """
+        Cierra la generación en los observadores con los arreglos de dos generaciones.
+        """
+        if self.estadisticas is not None:
+            self.estadisticas.registrar_arreglos(anterior, nuevo)
+        if self.detector_ciclos is not None:
+            self.detector_ciclos.registrar_arreglos(anterior, nuevo)
+        if self.repeticion is not None:
+            self.repeticion.registrar_arreglos(anterior, nuevo)
+
+    def _registrar_palabras(self, anterior: Any, nuevo: Any):
+        """
+        Cierra la generación en los observadores con dos estados empaquetados.
+        """
+        if self.estadisticas is not None:
+            self.estadisticas.registrar_palabras(anterior, nuevo)
+        if self.detector_ciclos is not None:
+            self.detector_ciclos.registrar_palabras(anterior, nuevo)
+        if self.repeticion is not None:
+            self.repeticion.registrar_palabras(anterior, nuevo)
+
+    def _acumular_palabras(self, anterior: Any, nuevo: Any, fila_inicial: int):
+        """
+        Entrega a los observadores un bloque de filas empaquetadas, sin cerrar la generación.
+        """
+        if self.estadisticas is not None:
+            self.estadisticas.acumular_palabras(anterior, nuevo, fila_inicial)
+        if self.detector_ciclos is not None:
+            self.detector_ciclos.acumular_palabras(anterior, nuevo, fila_inicial)
+        if self.repeticion is not None:
+            self.repeticion.acumular_palabras(anterior, nuevo, fila_inicial)
+
+    def _cerrar_generacion(self):
+        """
+        Cierra en los observadores una generación entregada por bloques.
+        """
+        if self.estadisticas is not None:
+            self.estadisticas.cerrar_generacion()
+        if self.detector_ciclos is not None:
+            self.detector_ciclos.cerrar_generacion()
+        if self.repeticion is not None:
+            self.repeticion.cerrar_generacion()
+
+    def _registrar_vivas(self, vivas: Iterable[Tuple[int, int]], generaciones: int = 1):
+        """
+        Cierra un avance en los observadores con la lista de células vivas.
+        """
+        vivas = list(vivas)
+        if self.estadisticas is not None:
+            self.estadisticas.registrar_vivas(vivas, generaciones)
+        if self.detector_ciclos is not None:
+            self.detector_ciclos.registrar_vivas(vivas, generaciones)
+        if self.repeticion is not None:
+            self.repeticion.registrar_vivas(vivas, generaciones)
+
+    def lattice_modificado(self):
+        """
+        Avisa al autómata de que el estado de su Lattice se modificó desde fuera
+        (ej., al restaurar una instantánea o colocar un patrón).
+        
+        La implementación por defecto no hace nada; los motores que guardan
+        información derivada del estado (conjuntos activos, árboles, etc.) la
+        sobrescriben para descartarla (llamando también a esta implementación).
+        Si la detección de ciclos está activa, su historial se reinicia; las
+        estadísticas vuelven a medir el Lattice completo y el historial de
+        repetición vuelve a grabar desde el estado nuevo.
+        """
+        if self.detector_ciclos is not None:
+            self.detector_ciclos.reiniciar(self.obtener_lattice(), self.detector_ciclos.generacion)
+        if self.estadisticas is not None:
+            self.estadisticas.reiniciar(self.obtener_lattice(), self.estadisticas.generacion)
+        if self.repeticion is not None:
+            self.repeticion.lattice_modificado()
+
+    def cerrar(self):
+        """
+        Libera los recursos externos del autómata (procesos, memoria compartida, etc.).
+        
+        La implementación por defecto cierra el archivo de estadísticas (si lo hay);
+        los motores con recursos propios la sobrescriben (llamando también a esta).
+        """
+        self.desactivar_estadisticas()
             
     def obtener_lattice(self) -> ILattice:
         """
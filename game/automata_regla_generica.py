@@ -0,0 +1,112 @@
+from typing import Tuple
+from .automata_celular import AutomataCelular
+from .vecindad.i_estrategia_vecindad import IEstrategiaVecindad
+from .frontera.i_condicion_frontera import ICondicionFrontera
+from .lattice.i_lattice import ILattice
+from .lattice.i_lattice_arreglo import ILatticeArreglo
+from .lattice.i_lattice_doble_buffer import ILatticeDobleBuffer
+from .reglas.regla_transicion import ReglaTransicion
+
+class AutomataReglaGenerica(AutomataCelular):
+    """
+    Autómata Celular genérico gobernado por una ReglaTransicion compilada.
+
+    Ejecuta cualquier regla Life-like (B/S) o Generations (B/S/C) sin duplicar
+    el bucle de avance: la regla llega como una tabla (estado, vecinos) ->
+    estado siguiente. Funciona con cualquier ILattice; si el Lattice implementa
+    ILatticeArreglo, la generación completa se calcula con operaciones de arreglo,
+    y si implementa ILatticeDobleBuffer, en una sola pasada sobre dos búferes.
+    """
+
+    def __init__(self, ocupacion: float, estrategia_vecindad: IEstrategiaVecindad,
+                 condicion_frontera: ICondicionFrontera,
+                 lattice: ILattice,
+                 dimensiones: Tuple[int, int],
+                 regla: ReglaTransicion):
+        """
+        Constructor que recibe las abstracciones y la regla a aplicar.
+
+        Args:
+            regla: La Regla de Transición (ej., ReglaTransicion.desde_cadena("B36/S23")).
+        """
+        super().__init__(ocupacion, estrategia_vecindad, condicion_frontera, lattice, dimensiones)
+        self.regla = regla
+
+    def avanzar_generacion(self):
+        """
+        Aplica la regla a todas las células (en bloque si el Lattice lo permite).
+        """
+        if isinstance(self.lattice, ILatticeArreglo):
+            self._avanzar_arreglo()
+        elif isinstance(self.lattice, ILatticeDobleBuffer):
+            self._avanzar_doble_buffer()
+        else:
+            self._avanzar_diccionario()
+
+    def _avanzar_diccionario(self):
+        """
+        Camino genérico: una búsqueda en la tabla por célula, sin estados temporales.
+        """
+        dimensiones = self.lattice.obtener_dimensiones()
+        reticula_estado = self.lattice.obtener_estado()
+        tabla = self.regla.tabla(len(self.estrategia_vecindad.obtener_desplazamientos()))
+        contar = self.estrategia_vecindad.contar_vecinos_vivos
+
+        # Fase 1: decidir los cambios leyendo solo la generación actual.
+        cambios = []
+        for celula, estado_actual in reticula_estado.items():
+            vecinos = contar(celula, reticula_estado, dimensiones, self.condicion_frontera)
+            nuevo_estado = tabla[estado_actual][vecinos]
+            if nuevo_estado != estado_actual:
+                cambios.append((celula, estado_actual, nuevo_estado))
+
+        # Fase 2: aplicar los cambios.
+        for celula, _, nuevo_estado in cambios:
+            self.lattice.actualizar_estado(celula, nuevo_estado)
+        self._registrar_cambios(cambios)
+
+    def _avanzar_doble_buffer(self):
+        """
+        Camino con doble búfer: una sola pasada que escribe cada célula en el búfer siguiente.
+        """
+        dimensiones = self.lattice.obtener_dimensiones()
+        reticula_estado = self.lattice.obtener_estado()
+        siguiente = self.lattice.obtener_estado_siguiente()
+        tabla = self.regla.tabla(len(self.estrategia_vecindad.obtener_desplazamientos()))
+        contar = self.estrategia_vecindad.contar_vecinos_vivos
+        cambios = [] if self._observando() else None
+
+        nuevos = []
+        for celula, estado_actual in reticula_estado.items():
+            vecinos = contar(celula, reticula_estado, dimensiones, self.condicion_frontera)
+            nuevo_estado = tabla[estado_actual][vecinos]
+            nuevos.append(nuevo_estado)
+            if cambios is not None and nuevo_estado != estado_actual:
+                cambios.append((celula, estado_actual, nuevo_estado))
+
+        # Ambos búferes comparten el orden de las claves: el siguiente se rellena en C.
+        siguiente.update(zip(reticula_estado, nuevos))
+        self.lattice.intercambiar()
+        if cambios is not None:
+            self._registrar_cambios(cambios)
+
+    def _avanzar_arreglo(self):
+        """
+        Camino vectorizado: conteo en bloque (delegado en la Estrategia de Vecindad)
+        y una única indexación de la tabla.
+        """
+        # Importación diferida: NumPy solo es necesario para este camino.
+        import numpy as np
+
+        arreglo = self.lattice.obtener_arreglo()
+        desplazamientos = self.estrategia_vecindad.obtener_desplazamientos()
+
+        # Solo el estado 1 cuenta como vecino vivo (los estados 2+ están "muriendo").
+        # La estrategia construye el halo de su radio con la Condición de Frontera.
+        vivas = arreglo if self.regla.estados == 2 else (arreglo == 1).view(np.uint8)
+        conteo = self.estrategia_vecindad.contar_vecinos_arreglo(vivas, self.condicion_frontera)
+
+        tabla = self.regla.tabla_arreglo(len(desplazamientos))
+        siguiente = tabla[arreglo, conteo]
+        self.lattice.establecer_arreglo(siguiente)
+        self._registrar_arreglos(arreglo, siguiente)
@@ -0,0 +1,343 @@
+from collections import OrderedDict
+from typing import Tuple, Iterable, Optional, Any
+from ..lattice.i_lattice import ILattice
+
+# Número de hashes recientes conservados por defecto (limita el periodo detectable).
+MAX_HISTORIAL_POR_DEFECTO = 1024
+
+_MASCARA_64 = (1 << 64) - 1
+
+# Separación entre filas del índice lineal de un Lattice ilimitado (coordenadas
+# en [-2^31, 2^31) por eje sin que dos células compartan índice).
+_ZANCADA_ILIMITADA = 1 << 32
+
+# Constantes del mezclador splitmix64.
+_INCREMENTO = 0x9E3779B97F4A7C15
+_MULTIPLICADOR_1 = 0xBF58476D1CE4E5B9
+_MULTIPLICADOR_2 = 0x94D049BB133111EB
+
+
+def clave_zobrist(indice: int, estado: int, semilla: int = 0) -> int:
+    """
+    Devuelve la clave de 64 bits de una célula en un estado dado.
+
+    En lugar de guardar una tabla aleatoria por célula (inviable en tableros
+    enormes), la clave se deriva del índice lineal de la célula con el mezclador
+    splitmix64. El estado 0 no aporta nada al hash; un estado s > 0 multiplica la
+    clave por el impar 2s - 1, de modo que estados distintos dan claves distintas.
+
+    Args:
+        indice: El índice lineal de la célula (x * Y_MAX + y).
+        estado: El estado de la célula.
+        semilla: Semilla que cambia todas las claves.
+
+    Returns:
+        La clave como entero de 64 bits.
+    """
+    if estado == 0:
+        return 0
+    z = (indice + semilla + _INCREMENTO) & _MASCARA_64
+    z = ((z ^ (z >> 30)) * _MULTIPLICADOR_1) & _MASCARA_64
+    z = ((z ^ (z >> 27)) * _MULTIPLICADOR_2) & _MASCARA_64
+    z ^= z >> 31
+    return (z * (2 * estado - 1)) & _MASCARA_64
+
+
+def _claves_zobrist_arreglo(indices: Any, estados: Any, semilla: int) -> Any:
+    """
+    Versión vectorizada de 'clave_zobrist' para arreglos NumPy de índices y estados.
+    """
+    import numpy as np  # Importación diferida: solo la necesitan los Lattices en arreglo.
+    z = indices.astype(np.uint64) + np.uint64((semilla + _INCREMENTO) & _MASCARA_64)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(_MULTIPLICADOR_1)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(_MULTIPLICADOR_2)
+    z ^= z >> np.uint64(31)
+    claves = z * (np.uint64(2) * estados.astype(np.uint64) - np.uint64(1))
+    claves[estados == 0] = 0
+    return claves
+
+
+def _xor_arreglo(claves: Any) -> int:
+    """
+    Combina un arreglo de claves con XOR y devuelve un entero de Python.
+    """
+    import numpy as np
+    return int(np.bitwise_xor.reduce(claves)) if claves.size else 0
+
+
+class Ciclo:
+    """
+    Ciclo detectado: el estado de la generación 'inicio' se repite cada 'periodo' generaciones.
+
+    Un periodo de 1 corresponde a un estado estacionario (vida estática o tablero vacío).
+    """
+
+    def __init__(self, inicio: int, periodo: int):
+        self.inicio = inicio
+        self.periodo = periodo
+
+    def __eq__(self, otro: object) -> bool:
+        return isinstance(otro, Ciclo) and (self.inicio, self.periodo) == (otro.inicio, otro.periodo)
+
+    def __repr__(self) -> str:
+        return f"Ciclo(inicio={self.inicio}, periodo={self.periodo})"
+
+
+class DetectorCiclos:
+    """
+    Detector de ciclos y estados estacionarios mediante un hash incremental (Zobrist).
+
+    El hash del tablero es el XOR de las claves de todas sus células no muertas.
+    Cada generación, el motor informa solo de las células que cambiaron y el hash
+    se actualiza con dos XOR por cambio, sin recorrer el tablero completo. Los
+    hashes de las últimas 'max_historial' generaciones se guardan junto a la
+    generación en que aparecieron: si el hash actual ya estaba, el tablero entró
+    en un ciclo que empezó en esa generación.
+
+    Los hashes son de 64 bits, por lo que una colisión (un falso ciclo) es
+    posible pero extremadamente improbable.
+    """
+
+    def __init__(self, dimensiones: Tuple[int, int], max_historial: int = MAX_HISTORIAL_POR_DEFECTO,
+                 semilla: int = 0, ilimitado: bool = False):
+        """
+        Constructor que prepara un detector vacío.
+
+        Args:
+            dimensiones: La tupla (X_MAX, Y_MAX) del Lattice vigilado.
+            max_historial: Número máximo de hashes recientes (periodo máximo detectable).
+            semilla: Semilla de las claves de Zobrist.
+            ilimitado: Si es True, las células pueden estar fuera de las dimensiones
+                       (ej., LatticeDisperso) y el índice lineal no depende de Y_MAX.
+        """
+        if max_historial < 1:
+            raise ValueError("El historial debe conservar al menos un hash.")
+        self.dimensiones = dimensiones
+        # Separación entre filas del índice lineal x * zancada + y.
+        self._zancada = _ZANCADA_ILIMITADA if ilimitado else dimensiones[1]
+        self.max_historial = max_historial
+        self.semilla = semilla
+        self.hash_actual = 0
+        self.generacion = 0
+        self.ciclo: Optional[Ciclo] = None
+        self._historial: "OrderedDict[int, int]" = OrderedDict()
+
+    # --- Hash completo ---------------------------------------------------------------
+
+    def calcular_hash(self, lattice: ILattice) -> int:
+        """
+        Calcula desde cero el hash de todo el Lattice (solo al iniciar o tras saltos).
+
+        Args:
+            lattice: El Lattice a recorrer.
+
+        Returns:
+            El hash de 64 bits del estado.
+        """
+        zancada = self._zancada
+        if hasattr(lattice, "obtener_celulas_vivas"):
+            # Lattices dispersos: solo se recorren las células no muertas (coordenadas absolutas).
+            valor = 0
+            for (x, y), estado_celula in lattice.obtener_celulas_vivas().items():
+                valor ^= clave_zobrist(x * zancada + y, estado_celula, self.semilla)
+            return valor
+
+        estado = lattice.obtener_estado()
+        if hasattr(lattice, "obtener_arreglo") or hasattr(estado, "a_arreglo"):
+            import numpy as np
+            arreglo = lattice.obtener_arreglo() if hasattr(lattice, "obtener_arreglo") else estado.a_arreglo()
+            indices = np.flatnonzero(arreglo)
+            return _xor_arreglo(_claves_zobrist_arreglo(indices, arreglo.reshape(-1)[indices], self.semilla))
+
+        valor = 0
+        for (x, y), estado_celula in estado.items():
+            if estado_celula:
+                valor ^= clave_zobrist(x * zancada + y, estado_celula, self.semilla)
+        return valor
+
+    def reiniciar(self, lattice: ILattice, generacion: int = 0):
+        """
+        Olvida el historial y toma el estado actual del Lattice como punto de partida.
+
+        Args:
+            lattice: El Lattice vigilado.
+            generacion: La generación a la que corresponde su estado.
+        """
+        self.hash_actual = self.calcular_hash(lattice)
+        self.generacion = generacion
+        self.ciclo = None
+        self._historial = OrderedDict(((self.hash_actual, generacion),))
+
+    # --- Actualización incremental ----------------------------------------------------
+
+    def registrar_cambios(self, cambios: Iterable[Tuple[Tuple[int, int], int, int]]) -> Optional[Ciclo]:
+        """
+        Cierra una generación a partir de la lista de células que cambiaron.
+
+        Args:
+            cambios: Tuplas (célula, estado anterior, estado nuevo).
+
+        Returns:
+            El ciclo detectado, o None si el estado actual no se había visto.
+        """
+        zancada = self._zancada
+        semilla = self.semilla
+        valor = self.hash_actual
+        for (x, y), anterior, nuevo in cambios:
+            indice = x * zancada + y
+            valor ^= clave_zobrist(indice, anterior, semilla) ^ clave_zobrist(indice, nuevo, semilla)
+        self.hash_actual = valor
+        return self._cerrar_generacion()
+
+    def registrar_arreglos(self, anterior: Any, nuevo: Any) -> Optional[Ciclo]:
+        """
+        Cierra una generación comparando los arreglos (X_MAX, Y_MAX) de dos generaciones.
+
+        Solo se calculan las claves de las células cuyo estado difiere.
+
+        Args:
+            anterior: El estado de la generación anterior.
+            nuevo: El estado de la generación nueva.
+
+        Returns:
+            El ciclo detectado, o None si el estado actual no se había visto.
+        """
+        import numpy as np
+        anterior = anterior.reshape(-1)
+        nuevo = nuevo.reshape(-1)
+        indices = np.flatnonzero(anterior != nuevo)
+        self.hash_actual ^= (_xor_arreglo(_claves_zobrist_arreglo(indices, anterior[indices], self.semilla))
+                             ^ _xor_arreglo(_claves_zobrist_arreglo(indices, nuevo[indices], self.semilla)))
+        return self._cerrar_generacion()
+
+    def registrar_palabras(self, anterior: Any, nuevo: Any) -> Optional[Ciclo]:
+        """
+        Cierra una generación comparando dos estados empaquetados (X_MAX, W) de LatticeBits.
+
+        Solo se desempaquetan las palabras que difieren entre ambas generaciones;
+        cada bit cambiado alterna la clave de su célula (estado 0 <-> 1).
+
+        Args:
+            anterior: Las palabras de la generación anterior.
+            nuevo: Las palabras de la generación nueva.
+
+        Returns:
+            El ciclo detectado, o None si el estado actual no se había visto.
+        """
+        self.acumular_palabras(anterior, nuevo)
+        return self._cerrar_generacion()
+
+    def acumular_palabras(self, anterior: Any, nuevo: Any, fila_inicial: int = 0):
+        """
+        Aplica al hash los cambios de un bloque de filas empaquetadas, sin cerrar la generación.
+
+        Permite a los motores que recorren el tablero por franjas (ej., fuera de
+        memoria) actualizar el hash franja a franja; al terminar la generación
+        deben llamar a 'cerrar_generacion()'.
+
+        Args:
+            anterior: Las palabras (R, W) del bloque en la generación anterior.
+            nuevo: Las palabras (R, W) del bloque en la generación nueva.
+            fila_inicial: La fila x del Lattice que corresponde a la primera fila del bloque.
+        """
+        import numpy as np
+        Y_MAX = self.dimensiones[1]
+        diferencia = anterior ^ nuevo
+        filas, columnas = np.nonzero(diferencia)
+        if filas.size:
+            bits = np.unpackbits(diferencia[filas, columnas].astype("<u8").view(np.uint8)
+                                 .reshape(-1, 8), axis=1, bitorder="little")
+            palabra, bit = np.nonzero(bits)
+            y = columnas[palabra].astype(np.int64) * 64 + bit
+            x = filas[palabra].astype(np.int64) + fila_inicial
+            indices = x * Y_MAX + y
+            self.hash_actual ^= _xor_arreglo(
+                _claves_zobrist_arreglo(indices, np.ones(indices.size, dtype=np.uint8), self.semilla)
+            )
+
+    def cerrar_generacion(self) -> Optional[Ciclo]:
+        """
+        Cierra una generación cuyos cambios ya se acumularon (ver 'acumular_palabras').
+
+        Returns:
+            El ciclo detectado, o None si el estado actual no se había visto.
+        """
+        return self._cerrar_generacion()
+
+    def registrar_estado(self, lattice: ILattice, generaciones: int = 1) -> Optional[Ciclo]:
+        """
+        Cierra un avance sin lista de cambios recalculando el hash completo del Lattice.
+
+        Args:
+            lattice: El Lattice vigilado.
+            generaciones: El número de generaciones avanzadas.
+
+        Returns:
+            El ciclo detectado, o None si el estado actual no se había visto.
+        """
+        return self._registrar_hash(self.calcular_hash(lattice), generaciones)
+
+    def registrar_vivas(self, vivas: Iterable[Tuple[int, int]], generaciones: int = 1) -> Optional[Ciclo]:
+        """
+        Cierra un avance recalculando el hash a partir de la lista de células vivas.
+
+        Pensado para motores que no recorren el tablero (ej., HashLife), donde la
+        lista de células vivas es mucho más corta que el tablero completo.
+
+        Args:
+            vivas: Las coordenadas de las células en estado 1.
+            generaciones: El número de generaciones avanzadas.
+
+        Returns:
+            El ciclo detectado, o None si el estado actual no se había visto.
+        """
+        zancada = self._zancada
+        valor = 0
+        for x, y in vivas:
+            valor ^= clave_zobrist(x * zancada + y, 1, self.semilla)
+        return self._registrar_hash(valor, generaciones)
+
+    def _registrar_hash(self, valor: int, generaciones: int) -> Optional[Ciclo]:
+        """
+        Cierra un avance con un hash ya calculado.
+
+        Si el avance es de más de una generación, el historial se reinicia: con
+        muestras no consecutivas no se puede deducir el periodo exacto.
+        """
+        self.hash_actual = valor
+        if generaciones != 1:
+            self.generacion += generaciones
+            self.ciclo = None
+            self._historial = OrderedDict(((valor, self.generacion),))
+            return None
+        return self._cerrar_generacion()
+
+    def _cerrar_generacion(self) -> Optional[Ciclo]:
+        """
+        Avanza el contador de generaciones y busca el hash actual en el historial.
+        """
+        self.generacion += 1
+        vista = self._historial.get(self.hash_actual)
+        if vista is not None:
+            if self.ciclo is None:
+                self.ciclo = Ciclo(vista, self.generacion - vista)
+            return self.ciclo
+
+        self._historial[self.hash_actual] = self.generacion
+        if len(self._historial) > self.max_historial:
+            self._historial.popitem(last=False)
+        return None
+
+    def saltar(self, generaciones: int):
+        """
+        Avanza el contador sin cambiar el estado (avance rápido de un número entero de periodos).
+
+        Args:
+            generaciones: Un múltiplo del periodo del ciclo detectado.
+
+        Raises:
+            ValueError: Si no hay un ciclo detectado o el salto no es múltiplo del periodo.
+        """
+        if self.ciclo is None or generaciones % self.ciclo.periodo:
+            raise ValueError("Solo se puede saltar un número entero de periodos de un ciclo detectado.")
+        self.generacion += generaciones
@@ -0,0 +1,141 @@
+import numpy as np
+from typing import Tuple, Sequence, Union, Optional
+from .vecindad.i_estrategia_vecindad import IEstrategiaVecindad
+from .frontera.i_condicion_frontera import ICondicionFrontera
+from .lattice.lattice_numpy import LatticeNumpy
+from .reglas.regla_transicion import ReglaTransicion
+from .juego_de_la_vida_vectorizado import contar_vecinos_acolchado, aplicar_regla_conway
+
+
+class EnsambleAutomatas:
+    """
+    Ensamble de K retículas independientes del mismo tamaño avanzadas en bloque.
+
+    Las K retículas se apilan en un único arreglo uint8 (K, X_MAX, Y_MAX) y cada
+    generación de todo el ensamble se calcula con las mismas operaciones de
+    arreglo que una sola retícula, de modo que el coste fijo de Python se
+    reparte entre todos los miembros (1000 tableros pequeños cuestan casi lo
+    mismo que uno grande con el mismo número de células).
+
+    Cada miembro tiene su propia semilla y ocupación; el miembro k parte del
+    mismo estado que un LatticeNumpy(semillas[k]) inicializado con su ocupación,
+    por lo que sus resultados coinciden con los de una ejecución individual.
+    """
+
+    def __init__(self, dimensiones: Tuple[int, int],
+                 semillas: Sequence[int],
+                 ocupaciones: Union[float, Sequence[float]],
+                 estrategia_vecindad: IEstrategiaVecindad,
+                 condicion_frontera: ICondicionFrontera,
+                 regla: Optional[ReglaTransicion] = None):
+        """
+        Constructor que inicializa todos los miembros del ensamble.
+
+        Args:
+            dimensiones: Tamaño (X_MAX, Y_MAX) común a todas las retículas.
+            semillas: La semilla de cada miembro (su longitud define K).
+            ocupaciones: Ocupación inicial común, o una por miembro.
+            estrategia_vecindad: Objeto que implementa la lógica de vecindad.
+            condicion_frontera: Objeto que implementa la lógica de borde.
+            regla: La Regla de Transición (None = Conway, B3/S23).
+
+        Raises:
+            ValueError: Si el número de ocupaciones no coincide con el de semillas.
+        """
+        if isinstance(ocupaciones, (int, float)):
+            ocupaciones = [float(ocupaciones)] * len(semillas)
+        if len(ocupaciones) != len(semillas):
+            raise ValueError("Debe haber una ocupación por semilla (o una común).")
+
+        self.dimensiones = tuple(dimensiones)
+        self.semillas = list(semillas)
+        self.ocupaciones = list(ocupaciones)
+        self.estrategia_vecindad = estrategia_vecindad
+        self.condicion_frontera = condicion_frontera
+        self.regla = regla
+        self.generacion = 0
+
+        # Estado apilado (K, X_MAX, Y_MAX): cada miembro se genera con su propio generador.
+        self._estados = np.empty((len(self.semillas),) + self.dimensiones, dtype=np.uint8)
+        for k, (semilla, ocupacion) in enumerate(zip(self.semillas, self.ocupaciones)):
+            lattice = LatticeNumpy(semilla)
+            lattice.inicializar(self.dimensiones, ocupacion)
+            self._estados[k] = lattice.obtener_arreglo()
+
+        self._desplazamientos = estrategia_vecindad.obtener_desplazamientos()
+        # Ancho del halo: el radio de la vecindad (1 para Moore y von Neumann clásicas).
+        self._radio = max((max(abs(dx), abs(dy)) for dx, dy in self._desplazamientos), default=0)
+
+    def __len__(self) -> int:
+        """
+        Devuelve el número de miembros K del ensamble.
+        """
+        return self._estados.shape[0]
+
+    def avanzar_generacion(self):
+        """
+        Avanza una generación de todos los miembros con una sola pasada vectorizada.
+        """
+        estados = self._estados
+        vivas = estados if self.regla is None or self.regla.estados == 2 else (estados == 1).view(np.uint8)
+
+        # El halo (de ancho el radio) se aplica a los ejes (x, y) de todos los miembros a la vez.
+        acolchado = self.condicion_frontera.acolchar(vivas, self._radio)
+        conteo = contar_vecinos_acolchado(acolchado, self._desplazamientos, self._radio)
+
+        if self.regla is None:
+            self._estados = aplicar_regla_conway(estados, conteo)
+        else:
+            self._estados = self.regla.tabla_arreglo(len(self._desplazamientos))[estados, conteo]
+        self.generacion += 1
+
+    def poblaciones(self) -> np.ndarray:
+        """
+        Devuelve la población (células en estado 1) de cada miembro.
+
+        Returns:
+            Un arreglo de enteros de longitud K.
+        """
+        return np.count_nonzero(self._estados == 1, axis=(1, 2))
+
+    def simular(self, generaciones: int) -> np.ndarray:
+        """
+        Avanza el ensamble y registra la serie temporal de poblaciones.
+
+        Args:
+            generaciones: El número de generaciones a avanzar.
+
+        Returns:
+            Un arreglo (generaciones + 1, K): la fila 0 es la población inicial y
+            la fila g la población de cada miembro tras g generaciones.
+        """
+        serie = np.empty((generaciones + 1, len(self)), dtype=np.int64)
+        serie[0] = self.poblaciones()
+        for g in range(1, generaciones + 1):
+            self.avanzar_generacion()
+            serie[g] = self.poblaciones()
+        return serie
+
+    def obtener_estados(self) -> np.ndarray:
+        """
+        Devuelve el arreglo apilado (K, X_MAX, Y_MAX) con el estado de todos los miembros.
+
+        Returns:
+            El arreglo interno (sin copia).
+        """
+        return self._estados
+
+    def obtener_lattice(self, miembro: int) -> LatticeNumpy:
+        """
+        Devuelve una copia del estado de un miembro como LatticeNumpy independiente.
+
+        Args:
+            miembro: El índice k del miembro (0 <= k < K).
+
+        Returns:
+            Un LatticeNumpy con el estado actual del miembro.
+        """
+        lattice = LatticeNumpy(self.semillas[miembro])
+        lattice.inicializar(self.dimensiones, 0.0)
+        lattice.establecer_arreglo(self._estados[miembro].copy())
+        return lattice
@@ -0,0 +1,409 @@
+from collections import Counter
+from typing import Tuple, Iterable, Optional, List, Set, Any
+from ..lattice.i_lattice import ILattice
+
+# Rejilla de regiones por defecto para la densidad por zonas (filas x columnas).
+REGIONES_POR_DEFECTO = (8, 8)
+
+# Columnas fijas de cada fila; les siguen las densidades "densidad_i_j" de cada región.
+COLUMNAS_BASE = ("generacion", "poblacion", "nacimientos", "muertes", "x_min", "x_max", "y_min", "y_max")
+
+_BITS_POR_PALABRA = 64
+
+
+def _contar_bits(palabras: Any) -> Any:
+    """
+    Devuelve el número de bits a 1 de cada palabra uint64 (uint8 con la misma forma).
+    """
+    import numpy as np
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(palabras)
+    # NumPy < 2.0: suma de los bits de los 8 bytes de cada palabra.
+    bits = np.unpackbits(np.ascontiguousarray(palabras).view(np.uint8), axis=-1)
+    return bits.reshape(palabras.shape + (_BITS_POR_PALABRA,)).sum(axis=-1, dtype=np.uint8)
+
+
+class ColectorEstadisticas:
+    """
+    Estadísticas por generación calculadas por el motor durante su propio avance.
+
+    Igual que DetectorCiclos, el colector no recorre el Lattice: el motor le
+    entrega lo que ya tiene a mano al terminar cada generación (la lista de
+    células que cambiaron, los arreglos de las dos generaciones o las palabras
+    empaquetadas franja a franja). Con eso mantiene la población, los
+    nacimientos y las muertes, la caja que contiene las células vivas y una
+    rejilla gruesa de densidad por regiones.
+
+    En los motores por célula todo se actualiza con los cambios: cada cambio
+    cuesta O(1) y la caja solo se recalcula (sobre las filas y columnas
+    ocupadas, no sobre el tablero) cuando se vacía uno de sus bordes. En los
+    motores en arreglo son unas pocas reducciones de NumPy sobre datos que el
+    motor acaba de escribir.
+
+    Cada generación produce una fila que se entrega al escritor (ver
+    EscritorEstadisticasCSV), de modo que la memoria no depende del número de
+    generaciones. Las células en estado 1 son las vivas; un nacimiento es un
+    paso a 1 y una muerte, una salida de 1.
+    """
+
+    def __init__(self, dimensiones: Tuple[int, int], regiones: Tuple[int, int] = REGIONES_POR_DEFECTO,
+                 escritor: Optional[Any] = None, ilimitado: bool = False):
+        """
+        Constructor que prepara un colector vacío.
+
+        Args:
+            dimensiones: La tupla (X_MAX, Y_MAX) del Lattice.
+            regiones: Número máximo de regiones (filas, columnas) de la rejilla de densidad.
+            escritor: Destino de las filas (un objeto con 'agregar' y 'cerrar'); None = no se guardan.
+            ilimitado: Si es True, las células pueden estar fuera de las dimensiones
+                       (ej., LatticeDisperso); la rejilla solo cubre [0, X_MAX) x [0, Y_MAX).
+
+        Raises:
+            ValueError: Si la rejilla no tiene al menos una región por eje.
+        """
+        if regiones[0] < 1 or regiones[1] < 1:
+            raise ValueError("La rejilla de densidad necesita al menos una región por eje.")
+        X_MAX, Y_MAX = dimensiones
+        self.dimensiones = (X_MAX, Y_MAX)
+        alto = max(1, -(-X_MAX // regiones[0]))
+        ancho = max(1, -(-Y_MAX // regiones[1]))
+        self.tamano_region = (alto, ancho)
+        self.regiones = (max(1, -(-X_MAX // alto)), max(1, -(-Y_MAX // ancho)))
+        self.escritor = escritor
+        self.ilimitado = ilimitado
+
+        self.generacion = 0
+        self.poblacion = 0
+        self.nacimientos = 0
+        self.muertes = 0
+        self.caja: Optional[Tuple[int, int, int, int]] = None
+        filas_region, columnas_region = self.regiones
+        self.vivas_por_region: List[int] = [0] * (filas_region * columnas_region)
+        self._areas = [min(alto, X_MAX - i * alto) * min(ancho, Y_MAX - j * ancho)
+                       for i in range(filas_region) for j in range(columnas_region)]
+
+        # Camino por célula: células vivas por fila y por columna (solo las ocupadas).
+        self._filas: Optional[Counter] = None
+        self._columnas: Optional[Counter] = None
+        # Camino por lista de vivas: las células vivas de la última medida (ver 'registrar_vivas').
+        self._vivas: Optional[Set[Tuple[int, int]]] = None
+        # Camino en arreglo: acumuladores de la generación en curso (ver '_acumular').
+        self._bloque: Optional[dict] = None
+
+    # --- Descripción de las filas --------------------------------------------------
+
+    def columnas(self) -> List[str]:
+        """
+        Devuelve los nombres de las columnas de cada fila.
+        """
+        filas_region, columnas_region = self.regiones
+        return list(COLUMNAS_BASE) + [f"densidad_{i}_{j}" for i in range(filas_region)
+                                      for j in range(columnas_region)]
+
+    def formatos(self) -> List[str]:
+        """
+        Devuelve el formato printf de cada columna (enteros y densidades con 4 decimales).
+        """
+        return ["%d"] * len(COLUMNAS_BASE) + ["%.4f"] * len(self.vivas_por_region)
+
+    def fila(self) -> List[float]:
+        """
+        Devuelve la fila de la generación actual.
+
+        Returns:
+            Los valores de 'columnas()': nacimientos y muertes valen -1 si no se
+            conocen (avances de varias generaciones), y la caja (-1, -1, -1, -1)
+            si no hay células vivas.
+        """
+        caja = self.caja if self.caja is not None else (-1, -1, -1, -1)
+        densidades = [vivas / area for vivas, area in zip(self.vivas_por_region, self._areas)]
+        return [self.generacion, self.poblacion, self.nacimientos, self.muertes, *caja, *densidades]
+
+    def _emitir(self):
+        """
+        Entrega la fila de la generación actual al escritor.
+        """
+        if self.escritor is not None:
+            self.escritor.agregar(self.fila())
+
+    # --- Estado completo -----------------------------------------------------------
+
+    def reiniciar(self, lattice: ILattice, generacion: int = 0):
+        """
+        Mide el Lattice completo (solo al activar o tras modificarlo desde fuera).
+
+        Args:
+            lattice: El Lattice observado.
+            generacion: La generación a la que corresponde su estado.
+        """
+        self.generacion = generacion
+        self.nacimientos = self.muertes = 0
+        if hasattr(lattice, "obtener_celulas_vivas"):
+            self._medir_vivas(lattice.obtener_celulas_vivas())
+        else:
+            estado = lattice.obtener_estado()
+            if hasattr(lattice, "obtener_arreglo") or hasattr(estado, "a_arreglo"):
+                arreglo = lattice.obtener_arreglo() if hasattr(lattice, "obtener_arreglo") else estado.a_arreglo()
+                self._empezar_bloque()
+                self._acumular(arreglo == 1, 0)
+                self._cerrar_bloque(0)
+            else:
+                self._medir_vivas(celula for celula, estado_celula in estado.items() if estado_celula == 1)
+        self._emitir()
+
+    def _medir_vivas(self, vivas: Iterable[Tuple[int, int]]):
+        """
+        Recalcula todas las medidas a partir de la lista de células vivas (y la guarda).
+        """
+        vivas = self._vivas = set(vivas)
+        filas, columnas = Counter(), Counter()
+        regiones = [0] * len(self.vivas_por_region)
+        alto, ancho = self.tamano_region
+        columnas_region = self.regiones[1]
+        X_MAX, Y_MAX = self.dimensiones
+        for x, y in vivas:
+            filas[x] += 1
+            columnas[y] += 1
+            if 0 <= x < X_MAX and 0 <= y < Y_MAX:
+                regiones[(x // alto) * columnas_region + y // ancho] += 1
+        self._filas, self._columnas = filas, columnas
+        self.vivas_por_region = regiones
+        self.poblacion = sum(filas.values())
+        self.caja = (min(filas), max(filas), min(columnas), max(columnas)) if filas else None
+
+    # --- Motores por célula --------------------------------------------------------
+
+    def registrar_cambios(self, cambios: Iterable[Tuple[Tuple[int, int], int, int]]):
+        """
+        Cierra una generación a partir de la lista de células que cambiaron.
+
+        Args:
+            cambios: Tuplas (célula, estado anterior, estado nuevo).
+        """
+        self._vivas = None
+        filas, columnas = self._filas, self._columnas
+        regiones = self.vivas_por_region
+        alto, ancho = self.tamano_region
+        columnas_region = self.regiones[1]
+        X_MAX, Y_MAX = self.dimensiones
+        x_min, x_max, y_min, y_max = self.caja if self.caja is not None else (None, None, None, None)
+        nacimientos = muertes = 0
+        recalcular_caja = False
+        for (x, y), anterior, nuevo in cambios:
+            if nuevo == 1 and anterior != 1:
+                nacimientos += 1
+                signo = 1
+                filas[x] += 1
+                columnas[y] += 1
+                if x_min is None:
+                    x_min = x_max = x
+                    y_min = y_max = y
+                else:
+                    x_min, x_max = min(x_min, x), max(x_max, x)
+                    y_min, y_max = min(y_min, y), max(y_max, y)
+            elif anterior == 1 and nuevo != 1:
+                muertes += 1
+                signo = -1
+                filas[x] -= 1
+                if not filas[x]:
+                    del filas[x]
+                    recalcular_caja = recalcular_caja or x == x_min or x == x_max
+                columnas[y] -= 1
+                if not columnas[y]:
+                    del columnas[y]
+                    recalcular_caja = recalcular_caja or y == y_min or y == y_max
+            else:
+                continue
+            if 0 <= x < X_MAX and 0 <= y < Y_MAX:
+                regiones[(x // alto) * columnas_region + y // ancho] += signo
+
+        # Solo si se vació un borde de la caja se buscan los nuevos extremos.
+        if recalcular_caja:
+            self.caja = (min(filas), max(filas), min(columnas), max(columnas)) if filas else None
+        elif x_min is not None:
+            self.caja = (x_min, x_max, y_min, y_max)
+        self.poblacion += nacimientos - muertes
+        self.nacimientos, self.muertes = nacimientos, muertes
+        self.generacion += 1
+        self._emitir()
+
+    def registrar_vivas(self, vivas: Iterable[Tuple[int, int]], generaciones: int = 1):
+        """
+        Cierra un avance a partir de la lista de células vivas (ej., HashLife).
+
+        En un avance de una generación, los nacimientos y las muertes salen de
+        comparar con las células vivas de la medida anterior; en los saltos de
+        varias generaciones (o sin medida anterior) no se conocen y se escriben como -1.
+
+        Args:
+            vivas: Las coordenadas de las células en estado 1.
+            generaciones: El número de generaciones avanzadas.
+        """
+        anteriores = self._vivas
+        self._medir_vivas(vivas)
+        if generaciones == 1 and anteriores is not None:
+            self.nacimientos = len(self._vivas - anteriores)
+            self.muertes = len(anteriores - self._vivas)
+        else:
+            self.nacimientos = self.muertes = -1
+        self.generacion += generaciones
+        self._emitir()
+
+    def saltar(self, generaciones: int):
+        """
+        Avanza el contador sin escribir filas (avance rápido por periodos completos de un ciclo).
+
+        Args:
+            generaciones: El número de generaciones saltadas.
+        """
+        self.generacion += generaciones
+
+    # --- Motores en arreglo --------------------------------------------------------
+
+    def registrar_arreglos(self, anterior: Any, nuevo: Any):
+        """
+        Cierra una generación a partir de los arreglos (X_MAX, Y_MAX) de dos generaciones.
+
+        Args:
+            anterior: El estado de la generación anterior.
+            nuevo: El estado de la generación nueva.
+        """
+        import numpy as np
+        vivas = nuevo == 1
+        self._empezar_bloque()
+        self._bloque["nacimientos"] = int(np.count_nonzero(vivas & (anterior != 1)))
+        self._acumular(vivas, 0)
+        self._cerrar_bloque(1)
+
+    def registrar_palabras(self, anterior: Any, nuevo: Any):
+        """
+        Cierra una generación a partir de dos estados empaquetados (X_MAX, W) de LatticeBits.
+
+        Args:
+            anterior: Las palabras de la generación anterior.
+            nuevo: Las palabras de la generación nueva.
+        """
+        self.acumular_palabras(anterior, nuevo)
+        self.cerrar_generacion()
+
+    def acumular_palabras(self, anterior: Any, nuevo: Any, fila_inicial: int = 0):
+        """
+        Acumula un bloque de filas empaquetadas, sin cerrar la generación.
+
+        Permite a los motores que recorren el tablero por franjas (ej., fuera de
+        memoria) medir cada franja mientras la tienen en memoria; al terminar
+        la generación deben llamar a 'cerrar_generacion()'.
+
+        Args:
+            anterior: Las palabras (R, W) del bloque en la generación anterior.
+            nuevo: Las palabras (R, W) del bloque en la generación nueva.
+            fila_inicial: La fila x del Lattice que corresponde a la primera fila del bloque.
+        """
+        import numpy as np
+        if self._bloque is None:
+            self._empezar_bloque()
+        self._bloque["nacimientos"] += int(_contar_bits(nuevo & ~anterior).sum(dtype=np.int64))
+        if self.tamano_region[1] % _BITS_POR_PALABRA:
+            # Regiones que no coinciden con las palabras: se desempaquetan las filas del bloque.
+            bits = np.unpackbits(np.ascontiguousarray(nuevo, dtype="<u8").view(np.uint8),
+                                 axis=1, bitorder="little")[:, :self.dimensiones[1]]
+            self._acumular(bits.view(bool), fila_inicial)
+        else:
+            self._acumular(_contar_bits(nuevo), fila_inicial, nuevo)
+
+    def cerrar_generacion(self):
+        """
+        Cierra una generación cuyos bloques ya se acumularon (ver 'acumular_palabras').
+        """
+        self._cerrar_bloque(1)
+
+    def _empezar_bloque(self):
+        """
+        Prepara los acumuladores de una generación medida por bloques de filas.
+        """
+        import numpy as np
+        self._bloque = {
+            "nacimientos": 0,
+            "regiones": np.zeros(self.regiones, dtype=np.int64),
+            "x_min": None,
+            "x_max": None,
+            "columnas": None,
+        }
+
+    def _acumular(self, conteo: Any, fila_inicial: int, palabras: Optional[Any] = None):
+        """
+        Acumula un bloque de filas dado como conteo de células vivas por unidad de columna.
+
+        Args:
+            conteo: Arreglo (R, U): booleano por célula, o bits a 1 por palabra si se dan 'palabras'.
+            fila_inicial: La fila x del Lattice que corresponde a la primera fila del bloque.
+            palabras: Las palabras (R, W) del bloque (None = 'conteo' es por célula).
+        """
+        import numpy as np
+        bloque = self._bloque
+        filas_bloque = conteo.shape[0]
+        if filas_bloque == 0:
+            return
+        alto, ancho = self.tamano_region
+        unidad = _BITS_POR_PALABRA if palabras is not None else 1
+
+        # 1. Rejilla: se suman las filas de cada tramo de regiones (sumar filas contiguas es
+        #    la reducción más rápida) y después las columnas del resultado, que es pequeño.
+        primera = fila_inicial // alto
+        limites = np.concatenate(([0], np.arange((primera + 1) * alto - fila_inicial, filas_bloque, alto),
+                                  [filas_bloque]))
+        por_tramo = np.stack([conteo[desde:hasta].sum(axis=0, dtype=np.int32)
+                              for desde, hasta in zip(limites[:-1], limites[1:])])
+        por_region = np.add.reduceat(por_tramo, np.arange(0, conteo.shape[1], ancho // unidad), axis=1)
+        bloque["regiones"][primera:primera + len(por_tramo)] += por_region
+
+        # 2. Caja: las filas extremas solo se buscan dentro del primer y el último tramo
+        #    ocupados; las columnas ocupadas salen de las sumas por tramo (o del OR de las palabras).
+        ocupados = np.flatnonzero(por_region.any(axis=1))
+        if not ocupados.size:
+            return
+        desde, hasta = limites[ocupados[0]], limites[ocupados[0] + 1]
+        x_min = fila_inicial + int(desde) + int(np.argmax(conteo[desde:hasta].any(axis=1)))
+        desde, hasta = limites[ocupados[-1]], limites[ocupados[-1] + 1]
+        x_max = fila_inicial + int(hasta) - 1 - int(np.argmax(conteo[desde:hasta][::-1].any(axis=1)))
+        bloque["x_min"] = x_min if bloque["x_min"] is None else min(bloque["x_min"], x_min)
+        bloque["x_max"] = x_max if bloque["x_max"] is None else max(bloque["x_max"], x_max)
+        columnas = np.bitwise_or.reduce(palabras, axis=0) if palabras is not None else por_tramo.any(axis=0)
+        bloque["columnas"] = columnas if bloque["columnas"] is None else bloque["columnas"] | columnas
+
+    def _cerrar_bloque(self, generaciones: int):
+        """
+        Publica las medidas acumuladas como las de la generación actual.
+        """
+        import numpy as np
+        bloque, self._bloque = self._bloque, None
+        self._filas = self._columnas = self._vivas = None
+        poblacion_anterior = self.poblacion
+        self.vivas_por_region = bloque["regiones"].ravel().tolist()
+        self.poblacion = sum(self.vivas_por_region)
+        self.caja = None
+        columnas = bloque["columnas"]
+        if bloque["x_min"] is not None:
+            ocupadas = np.flatnonzero(columnas)
+            primera, ultima = int(ocupadas[0]), int(ocupadas[-1])
+            if columnas.dtype == bool:
+                y_min, y_max = primera, ultima
+            else:
+                # Bit más bajo de la primera palabra ocupada y más alto de la última.
+                baja, alta = int(columnas[primera]), int(columnas[ultima])
+                y_min = primera * _BITS_POR_PALABRA + (baja & -baja).bit_length() - 1
+                y_max = ultima * _BITS_POR_PALABRA + alta.bit_length() - 1
+            self.caja = (bloque["x_min"], bloque["x_max"], y_min, y_max)
+        if generaciones:
+            self.nacimientos = bloque["nacimientos"]
+            self.muertes = poblacion_anterior + self.nacimientos - self.poblacion
+        self.generacion += generaciones
+        if generaciones:
+            self._emitir()
+
+    def cerrar(self):
+        """
+        Vacía y cierra el escritor (si lo hay).
+        """
+        if self.escritor is not None:
+            self.escritor.cerrar()
@@ -0,0 +1,80 @@
+import numpy as np
+from typing import Sequence, Optional
+
+# Filas acumuladas en memoria antes de escribirlas al archivo.
+FILAS_POR_LOTE = 4096
+
+
+class EscritorEstadisticasCSV:
+    """
+    Escribe series temporales de estadísticas en un archivo CSV por lotes.
+
+    Las filas se copian en un búfer de NumPy de tamaño fijo (filas_por_lote x
+    columnas) y se vuelcan al archivo de una vez cuando el búfer se llena, así
+    que la memoria no crece con el número de generaciones y el coste por fila
+    es una copia de unos pocos valores.
+    """
+
+    def __init__(self, ruta: str, columnas: Sequence[str], formatos: Optional[Sequence[str]] = None,
+                 filas_por_lote: int = FILAS_POR_LOTE):
+        """
+        Constructor que crea el archivo y escribe la cabecera.
+
+        Args:
+            ruta: La ruta del archivo CSV (se sobrescribe si existe).
+            columnas: Los nombres de las columnas.
+            formatos: El formato printf de cada columna (None = "%.10g" para todas).
+            filas_por_lote: Filas acumuladas antes de cada escritura.
+
+        Raises:
+            ValueError: Si 'filas_por_lote' < 1 o los formatos no coinciden con las columnas.
+        """
+        if filas_por_lote < 1:
+            raise ValueError("El lote debe tener al menos una fila.")
+        formatos = list(formatos) if formatos is not None else ["%.10g"] * len(columnas)
+        if len(formatos) != len(columnas):
+            raise ValueError("Debe haber un formato por columna.")
+        self.ruta = ruta
+        self.columnas = list(columnas)
+        self.filas_escritas = 0
+        self._formatos = formatos
+        self._bufer = np.empty((filas_por_lote, len(self.columnas)), dtype=np.float64)
+        self._pendientes = 0
+        self._archivo = open(ruta, "w", newline="")
+        self._archivo.write(",".join(self.columnas) + "\n")
+
+    def agregar(self, fila: Sequence[float]):
+        """
+        Añade una fila al lote (y vuelca el lote si se llena).
+
+        Args:
+            fila: Un valor por columna.
+        """
+        self._bufer[self._pendientes] = fila
+        self._pendientes += 1
+        if self._pendientes == self._bufer.shape[0]:
+            self.volcar()
+
+    def volcar(self):
+        """
+        Escribe en el archivo las filas pendientes del lote.
+        """
+        if self._pendientes:
+            np.savetxt(self._archivo, self._bufer[:self._pendientes], fmt=self._formatos, delimiter=",")
+            self.filas_escritas += self._pendientes
+            self._pendientes = 0
+            self._archivo.flush()
+
+    def cerrar(self):
+        """
+        Vuelca las filas pendientes y cierra el archivo (idempotente).
+        """
+        if not self._archivo.closed:
+            self.volcar()
+            self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
@@ -25,4 +25,17 @@ class CondicionFronteraCiclica(ICondicionFrontera):
         # La operación módulo (%) se encarga de manejar tanto los valores
         # positivos (que se salen del límite superior) como los negativos 
         # (que se salen del límite inferior) en Python.
-        return coordenada_deseada % dimension_maxima
\ No newline at end of file
+        return coordenada_deseada % dimension_maxima
+
+    def indices_reales(self, coordenadas, dimension_maxima: int):
+        """
+        Aplica el módulo a todo el arreglo de coordenadas de una vez.
+        
+        Args:
+            coordenadas: Arreglo de NumPy con las coordenadas deseadas de un eje.
+            dimension_maxima: El tamaño del eje.
+            
+        Returns:
+            Las coordenadas reales (el módulo de NumPy también es positivo para negativos).
+        """
+        return coordenadas % dimension_maxima
@@ -0,0 +1,40 @@
+from .i_condicion_frontera import ICondicionFrontera
+
+class CondicionFronteraIlimitada(ICondicionFrontera):
+    """
+    Implementación concreta de Condición de Frontera Ilimitada (plano infinito).
+    
+    No hay bordes: las coordenadas se devuelven tal cual, aunque queden fuera de
+    [0, dimension_maxima - 1]. Solo tiene sentido con Lattices que almacenan
+    células fuera de sus dimensiones (ej., LatticeDisperso), donde las
+    dimensiones describen únicamente la ventana visible; un planeador puede
+    alejarse indefinidamente del tablero inicial.
+    """
+    
+    def obtener_coordenada_real(self, coordenada_deseada: int, dimension_maxima: int) -> int:
+        """
+        Devuelve la coordenada sin modificarla.
+        
+        Args:
+            coordenada_deseada: La coordenada propuesta por la Vecindad.
+            dimension_maxima: El tamaño de la ventana (no limita la coordenada).
+            
+        Returns:
+            La misma coordenada deseada.
+        """
+        return coordenada_deseada
+
+    def es_ilimitada(self) -> bool:
+        """
+        Indica que esta frontera no ajusta ninguna coordenada.
+        """
+        return True
+
+    def indices_reales(self, coordenadas, dimension_maxima: int):
+        """
+        Un plano sin bordes no tiene células fantasma que rellenar.
+        
+        Raises:
+            ValueError: Siempre; los motores en arreglo necesitan una frontera acotada.
+        """
+        raise ValueError("La frontera ilimitada no admite acolchado: use una frontera acotada.")
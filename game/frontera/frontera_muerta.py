@@ -0,0 +1,40 @@
+from typing import Optional
+from .i_condicion_frontera import ICondicionFrontera
+
+class CondicionFronteraMuerta(ICondicionFrontera):
+    """
+    Implementación concreta de Condición de Frontera Fija con células muertas.
+    
+    La retícula está rodeada de células fantasma que nunca viven: una célula
+    del borde tiene menos vecinas reales y nada cruza al lado opuesto (un
+    planeador que llega al borde se convierte en un bloque o desaparece).
+    """
+    
+    def obtener_coordenada_real(self, coordenada_deseada: int, dimension_maxima: int) -> Optional[int]:
+        """
+        Devuelve la coordenada si está dentro de la retícula, o None si es una célula fantasma.
+        
+        Args:
+            coordenada_deseada: La coordenada propuesta por la Vecindad.
+            dimension_maxima: El tamaño máximo del eje (ej. ancho o alto).
+            
+        Returns:
+            La misma coordenada, o None fuera de [0, dimension_maxima - 1].
+        """
+        if 0 <= coordenada_deseada < dimension_maxima:
+            return coordenada_deseada
+        return None
+
+    def indices_reales(self, coordenadas, dimension_maxima: int):
+        """
+        Marca con -1 todas las coordenadas fuera de la retícula.
+        
+        Args:
+            coordenadas: Arreglo de NumPy con las coordenadas deseadas de un eje.
+            dimension_maxima: El tamaño del eje.
+            
+        Returns:
+            Las coordenadas reales (-1 = célula fantasma muerta).
+        """
+        import numpy as np
+        return np.where((coordenadas >= 0) & (coordenadas < dimension_maxima), coordenadas, -1)
@@ -0,0 +1,43 @@
+from .i_condicion_frontera import ICondicionFrontera
+
+class CondicionFronteraReflectiva(ICondicionFrontera):
+    """
+    Implementación concreta de Condición de Frontera Reflectiva (espejo).
+    
+    El borde actúa como un espejo situado justo fuera de la última célula: la
+    célula fantasma -1 es la célula 0, la -2 es la 1, y lo mismo en el borde
+    opuesto (el modo "symmetric" de numpy.pad). Un patrón simétrico respecto
+    al borde evoluciona como si la retícula continuara reflejada.
+    """
+    
+    def obtener_coordenada_real(self, coordenada_deseada: int, dimension_maxima: int) -> int:
+        """
+        Refleja la coordenada en el borde por el que se sale.
+        
+        Las reflexiones sucesivas tienen periodo 2 * dimension_maxima, así que
+        también se resuelven halos más anchos que la propia retícula.
+        
+        Args:
+            coordenada_deseada: La coordenada propuesta por la Vecindad.
+            dimension_maxima: El tamaño máximo del eje (ej. ancho o alto).
+            
+        Returns:
+            La coordenada real reflejada dentro de [0, dimension_maxima - 1].
+        """
+        resto = coordenada_deseada % (2 * dimension_maxima)
+        return min(resto, 2 * dimension_maxima - 1 - resto)
+
+    def indices_reales(self, coordenadas, dimension_maxima: int):
+        """
+        Refleja todo el arreglo de coordenadas de una vez.
+        
+        Args:
+            coordenadas: Arreglo de NumPy con las coordenadas deseadas de un eje.
+            dimension_maxima: El tamaño del eje.
+            
+        Returns:
+            Las coordenadas reales reflejadas.
+        """
+        import numpy as np
+        resto = coordenadas % (2 * dimension_maxima)
+        return np.minimum(resto, 2 * dimension_maxima - 1 - resto)
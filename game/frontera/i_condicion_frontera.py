@@ -1,5 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Tuple, Dict, Any
+from collections import OrderedDict
+from typing import Tuple, Dict, Any, Optional
+
+# Número máximo de ejes con halo memorizados (uno por frontera, tamaño, halo y tramo).
+MAX_EJES_EN_CACHE = 64
+
+_CACHE_EJES: "OrderedDict[tuple, Any]" = OrderedDict()
 
 class ICondicionFrontera(ABC):
     """
@@ -7,10 +13,15 @@ class ICondicionFrontera(ABC):
     
     Esta interfaz es pequeña y específica, encargándose de la única
     responsabilidad de calcular coordenadas cuando se accede fuera de los límites.
+    
+    Además de la consulta por coordenada, ofrece una operación en bloque
+    ('acolchar') que rodea una retícula completa, o un tramo de ella, con
+    células fantasma según la regla del borde. Los motores vectorizados
+    trabajan sobre ese arreglo acolchado sin comprobar los bordes célula a célula.
     """
     
     @abstractmethod
-    def obtener_coordenada_real(self, coordenada_deseada: int, dimension_maxima: int) -> int:
+    def obtener_coordenada_real(self, coordenada_deseada: int, dimension_maxima: int) -> Optional[int]:
         """
         Método abstracto para calcular la coordenada que se debe usar en la retícula.
         
@@ -22,9 +33,127 @@ class ICondicionFrontera(ABC):
             dimension_maxima: El tamaño máximo del eje (ej. ancho o alto de la retícula).
             
         Returns:
-            La coordenada real dentro de los límites de la retícula.
+            La coordenada real dentro de los límites de la retícula, o None si
+            la coordenada es una célula fantasma siempre muerta (frontera fija).
             
         Raises:
             NotImplementedError: Si el método no es implementado por una subclase.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def es_ilimitada(self) -> bool:
+        """
+        Indica si la frontera deja las coordenadas sin ajustar (retícula sin bordes).
+        
+        Los motores dispersos lo consultan para omitir las llamadas a
+        'obtener_coordenada_real' cuando no pueden cambiar nada.
+        
+        Returns:
+            False por defecto (la frontera ajusta las coordenadas a la retícula).
+        """
+        return False
+
+    def indices_reales(self, coordenadas: Any, dimension_maxima: int) -> Any:
+        """
+        Versión en bloque de 'obtener_coordenada_real' para un arreglo de coordenadas.
+        
+        La implementación por defecto consulta la frontera coordenada a
+        coordenada; las subclases la sustituyen por una operación de arreglo.
+        
+        Args:
+            coordenadas: Arreglo de NumPy con las coordenadas deseadas de un eje.
+            dimension_maxima: El tamaño del eje.
+            
+        Returns:
+            Un arreglo de enteros con las coordenadas reales; -1 marca una célula
+            fantasma muerta.
+        """
+        import numpy as np
+        reales = (self.obtener_coordenada_real(int(c), dimension_maxima) for c in coordenadas)
+        return np.array([-1 if real is None else real for real in reales], dtype=np.intp)
+
+    def indices_con_halo(self, dimension_maxima: int, halo: int = 1,
+                         inicio: int = 0, fin: Optional[int] = None) -> Any:
+        """
+        Devuelve (y memoriza) los índices reales del tramo [inicio - halo, fin + halo) de un eje.
+        
+        La posición i del resultado corresponde a la coordenada deseada
+        inicio - halo + i. Las fronteras no tienen estado, por lo que la clave
+        de la caché usa su tipo.
+        
+        Args:
+            dimension_maxima: El tamaño del eje.
+            halo: El número de células fantasma a cada lado.
+            inicio: Primera coordenada del tramo (0 = desde el borde).
+            fin: Coordenada siguiente a la última del tramo (None = dimension_maxima).
+            
+        Returns:
+            Un arreglo de enteros de longitud fin - inicio + 2 * halo (-1 = fantasma muerta).
+        """
+        import numpy as np
+        fin = dimension_maxima if fin is None else fin
+        clave = (type(self), dimension_maxima, halo, inicio, fin)
+        indices = _CACHE_EJES.get(clave)
+        if indices is None:
+            indices = self.indices_reales(np.arange(inicio - halo, fin + halo, dtype=np.intp), dimension_maxima)
+            indices.setflags(write=False)
+            _CACHE_EJES[clave] = indices
+            while len(_CACHE_EJES) > MAX_EJES_EN_CACHE:
+                _CACHE_EJES.popitem(last=False)
+        else:
+            _CACHE_EJES.move_to_end(clave)
+        return indices
+
+    def acolchar_eje(self, arreglo: Any, eje: int, halo: int = 1,
+                     inicio: int = 0, fin: Optional[int] = None) -> Any:
+        """
+        Extrae el tramo [inicio, fin) de un eje rodeado de 'halo' células fantasma a cada lado.
+        
+        Dentro de la retícula las células fantasma son las vecinas reales del
+        tramo; fuera de ella las decide la frontera. Funciona también sobre
+        arreglos memory-mapped (solo se leen las filas necesarias).
+        
+        Args:
+            arreglo: Arreglo de NumPy con la retícula completa.
+            eje: El eje a acolchar.
+            halo: El número de células fantasma a cada lado.
+            inicio: Primera coordenada del tramo.
+            fin: Coordenada siguiente a la última del tramo (None = hasta el final).
+            
+        Returns:
+            Un arreglo nuevo con fin - inicio + 2 * halo posiciones en ese eje.
+        """
+        import numpy as np
+        indices = self.indices_con_halo(arreglo.shape[eje], halo, inicio, fin)
+        if indices.size == 0 or indices.min() >= 0:
+            return np.take(arreglo, indices, axis=eje)
+        # Células fantasma muertas: se toma cualquier índice válido y se ponen a cero.
+        acolchado = np.take(arreglo, np.maximum(indices, 0), axis=eje)
+        fantasmas = [slice(None)] * acolchado.ndim
+        fantasmas[eje] = indices < 0
+        acolchado[tuple(fantasmas)] = 0
+        return acolchado
+
+    def acolchar(self, arreglo: Any, halo: int = 1,
+                 filas: Optional[Tuple[int, int]] = None,
+                 columnas: Optional[Tuple[int, int]] = None) -> Any:
+        """
+        Rodea la retícula (o un bloque de ella) con 'halo' células fantasma en cada borde.
+        
+        Los dos últimos ejes del arreglo son (x, y); cualquier eje anterior se
+        procesa en bloque (ej., varias retículas apiladas). Las esquinas se
+        resuelven eje a eje, igual que 'obtener_coordenada_real' en cada coordenada.
+        
+        Args:
+            arreglo: Arreglo de NumPy con la retícula completa.
+            halo: El número de células fantasma a cada lado.
+            filas: Tramo (inicio, fin) del eje x (None = todas las filas).
+            columnas: Tramo (inicio, fin) del eje y (None = todas las columnas).
+            
+        Returns:
+            Un arreglo nuevo con el bloque acolchado.
+        """
+        inicio_x, fin_x = filas if filas is not None else (0, None)
+        inicio_y, fin_y = columnas if columnas is not None else (0, None)
+        acolchado = self.acolchar_eje(arreglo, arreglo.ndim - 2, halo, inicio_x, fin_x)
+        return self.acolchar_eje(acolchado, arreglo.ndim - 1, halo, inicio_y, fin_y)
@@ -0,0 +1,67 @@
+import numpy as np
+from typing import Tuple, Optional
+from .i_generador_estado_inicial import IGeneradorEstadoInicial
+
+# Filas de cada bloque aleatorio independiente. Cada bloque tiene su propio
+# generador derivado de (semilla, número de bloque), por lo que cualquier
+# bloque se puede generar por separado y en cualquier orden.
+FILAS_POR_BLOQUE_ALEATORIO = 256
+
+
+class GeneradorAleatorio(IGeneradorEstadoInicial):
+    """
+    Implementación concreta de IGeneradorEstadoInicial con ocupación aleatoria uniforme.
+
+    Genera los números aleatorios en bloque (float32, un bloque de filas cada
+    vez) con un generador explícito de NumPy. Sin semilla se toma una de la
+    entropía del sistema y se conserva en 'semilla', de modo que cualquier
+    ejecución se puede reproducir después.
+
+    Con la misma semilla, todos los Lattices que usan este generador
+    (Lattice2d, LatticeNumpy, LatticeBits) parten exactamente del mismo tablero.
+    """
+
+    def __init__(self, semilla: Optional[int] = None):
+        """
+        Constructor que fija la semilla del generador.
+
+        Args:
+            semilla: Semilla del generador (None = una nueva tomada de la entropía del sistema).
+        """
+        if semilla is None:
+            semilla = int(np.random.SeedSequence().entropy % (1 << 63))
+        self.semilla = semilla
+
+    def uniformes(self, inicio: int, fin: int, Y_MAX: int) -> np.ndarray:
+        """
+        Devuelve los números aleatorios uniformes [0, 1) de las filas [inicio, fin).
+
+        Args:
+            inicio: La primera fila.
+            fin: La fila siguiente a la última.
+            Y_MAX: El número de células de cada fila.
+
+        Returns:
+            Un arreglo float32 con forma (fin - inicio, Y_MAX).
+        """
+        resultado = np.empty((fin - inicio, Y_MAX), dtype=np.float32)
+        primer_bloque = inicio // FILAS_POR_BLOQUE_ALEATORIO
+        ultimo_bloque = (fin - 1) // FILAS_POR_BLOQUE_ALEATORIO
+        for bloque in range(primer_bloque, ultimo_bloque + 1):
+            base = bloque * FILAS_POR_BLOQUE_ALEATORIO
+            generador = np.random.default_rng((self.semilla, bloque))
+            valores = generador.random((FILAS_POR_BLOQUE_ALEATORIO, Y_MAX), dtype=np.float32)
+            desde = max(inicio, base)
+            hasta = min(fin, base + FILAS_POR_BLOQUE_ALEATORIO)
+            resultado[desde - inicio:hasta - inicio] = valores[desde - base:hasta - base]
+        return resultado
+
+    def generar_filas(self, inicio: int, fin: int, dimensiones: Tuple[int, int],
+                      ocupacion: float) -> np.ndarray:
+        """
+        Genera las filas [inicio, fin): cada célula vive con probabilidad 'ocupacion'.
+        """
+        Y_MAX = dimensiones[1]
+        if ocupacion <= 0 or fin <= inicio:
+            return np.zeros((max(fin - inicio, 0), Y_MAX), dtype=np.uint8)
+        return (self.uniformes(inicio, fin, Y_MAX) < ocupacion).view(np.uint8)
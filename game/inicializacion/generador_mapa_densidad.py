@@ -0,0 +1,49 @@
+import numpy as np
+from typing import Tuple, Optional, Any
+from .i_generador_estado_inicial import IGeneradorEstadoInicial
+from .generador_aleatorio import GeneradorAleatorio
+
+
+class GeneradorMapaDensidad(IGeneradorEstadoInicial):
+    """
+    Implementación concreta de IGeneradorEstadoInicial con una ocupación variable por zona.
+
+    El mapa de densidad es un arreglo 2D de probabilidades (0.0 a 1.0) de
+    cualquier tamaño; se estira sobre el Lattice (cada célula toma el valor de
+    la celda del mapa que la cubre). Usa los mismos números aleatorios que
+    GeneradorAleatorio con la misma semilla: un mapa constante igual a la
+    ocupación produce el mismo tablero.
+    """
+
+    def __init__(self, mapa: Any, semilla: Optional[int] = None):
+        """
+        Constructor que recibe el mapa y la semilla.
+
+        Args:
+            mapa: Arreglo 2D (MX, MY) de probabilidades de que cada zona esté viva.
+            semilla: Semilla de los números aleatorios (None = tomada de la entropía del sistema).
+
+        Raises:
+            ValueError: Si el mapa no es bidimensional o tiene valores fuera de [0, 1].
+        """
+        mapa = np.asarray(mapa, dtype=np.float32)
+        if mapa.ndim != 2 or mapa.size == 0:
+            raise ValueError("El mapa de densidad debe ser un arreglo 2D no vacío.")
+        if mapa.min() < 0 or mapa.max() > 1:
+            raise ValueError("Las densidades deben estar entre 0.0 y 1.0.")
+        self.mapa = mapa
+        self._aleatorio = GeneradorAleatorio(semilla)
+        self.semilla = self._aleatorio.semilla
+
+    def generar_filas(self, inicio: int, fin: int, dimensiones: Tuple[int, int],
+                      ocupacion: float) -> np.ndarray:
+        """
+        Genera las filas [inicio, fin) según el mapa (la ocupación recibida se ignora).
+        """
+        X_MAX, Y_MAX = dimensiones
+        MX, MY = self.mapa.shape
+        # Zona del mapa que cubre cada fila y cada columna del bloque.
+        zonas_x = np.arange(inicio, fin) * MX // X_MAX
+        zonas_y = np.arange(Y_MAX) * MY // Y_MAX
+        densidades = self.mapa[np.ix_(zonas_x, zonas_y)]
+        return (self._aleatorio.uniformes(inicio, fin, Y_MAX) < densidades).view(np.uint8)
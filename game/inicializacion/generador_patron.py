@@ -0,0 +1,74 @@
+import numpy as np
+from typing import Tuple, Optional
+from .i_generador_estado_inicial import IGeneradorEstadoInicial
+from ..persistencia.rle import PatronRLE
+
+
+class GeneradorPatron(IGeneradorEstadoInicial):
+    """
+    Implementación concreta de IGeneradorEstadoInicial que siembra un patrón conocido.
+
+    El patrón (ej., leído con 'cargar_rle') se coloca en 'origen' (por defecto,
+    centrado) o se repite en mosaico por todo el tablero. Opcionalmente se
+    superpone a otro generador de fondo (ej., ruido aleatorio de baja densidad).
+    """
+
+    def __init__(self, patron: PatronRLE, origen: Optional[Tuple[int, int]] = None,
+                 repetir: bool = False, fondo: Optional[IGeneradorEstadoInicial] = None):
+        """
+        Constructor que recibe el patrón y cómo colocarlo.
+
+        Args:
+            patron: El patrón a sembrar.
+            origen: Esquina superior izquierda del patrón (None = centrado).
+            repetir: Si es True, el patrón se repite en mosaico a partir del origen.
+            fondo: Generador del resto del tablero (None = todo muerto).
+        """
+        self.patron = patron
+        self.origen = origen
+        self.repetir = repetir
+        self.fondo = fondo
+
+        # Patrón como arreglo denso (ancho, alto), indexado igual que el Lattice.
+        ancho, alto = patron.dimensiones
+        self._celdas = np.zeros((max(ancho, 1), max(alto, 1)), dtype=np.uint8)
+        for (x, y), estado in patron.celulas.items():
+            self._celdas[x, y] = estado
+
+    def _origen(self, dimensiones: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Devuelve el origen del patrón (centrado si no se indicó).
+        """
+        if self.origen is not None:
+            return self.origen
+        ancho, alto = self._celdas.shape
+        return ((dimensiones[0] - ancho) // 2, (dimensiones[1] - alto) // 2)
+
+    def generar_filas(self, inicio: int, fin: int, dimensiones: Tuple[int, int],
+                      ocupacion: float) -> np.ndarray:
+        """
+        Genera las filas [inicio, fin) con el patrón sobre el fondo (la ocupación se pasa al fondo).
+        """
+        X_MAX, Y_MAX = dimensiones
+        if self.fondo is not None:
+            filas = np.array(self.fondo.generar_filas(inicio, fin, dimensiones, ocupacion), dtype=np.uint8)
+        else:
+            filas = np.zeros((fin - inicio, Y_MAX), dtype=np.uint8)
+
+        ancho, alto = self._celdas.shape
+        ox, oy = self._origen(dimensiones)
+        xs = np.arange(inicio, fin) - ox
+        ys = np.arange(Y_MAX) - oy
+        if self.repetir:
+            # Mosaico: cada célula toma la del patrón en su posición módulo el tamaño.
+            mosaico = self._celdas[np.ix_(xs % ancho, ys % alto)]
+            return np.where(mosaico != 0, mosaico, filas)
+
+        # Copia única: solo la intersección del patrón con el bloque de filas.
+        dentro_x = (xs >= 0) & (xs < ancho)
+        dentro_y = (ys >= 0) & (ys < alto)
+        if dentro_x.any() and dentro_y.any():
+            region = self._celdas[np.ix_(xs[dentro_x], ys[dentro_y])]
+            destino = filas[np.ix_(np.flatnonzero(dentro_x), np.flatnonzero(dentro_y))]
+            filas[np.ix_(np.flatnonzero(dentro_x), np.flatnonzero(dentro_y))] = np.where(region != 0, region, destino)
+        return filas
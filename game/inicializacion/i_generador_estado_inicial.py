@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Tuple, Any
+
+class IGeneradorEstadoInicial(ABC):
+    """
+    Interfaz para la generación del estado inicial de un Lattice.
+
+    Separa del almacenamiento (ILattice) la decisión de qué células empiezan
+    vivas: ocupación aleatoria, mapa de densidad, patrones, etc. El estado se
+    pide por bloques de filas [inicio, fin), de modo que los Lattices pueden
+    generarlo por partes (sin materializar nunca el tablero completo en un
+    formato intermedio) o de forma diferida, solo cuando se necesita un bloque.
+
+    Un mismo generador debe devolver siempre el mismo contenido para las mismas
+    filas, sin importar el orden ni el tamaño de los bloques pedidos.
+    """
+
+    @abstractmethod
+    def generar_filas(self, inicio: int, fin: int, dimensiones: Tuple[int, int],
+                      ocupacion: float) -> Any:
+        """
+        Genera el estado inicial de las filas x en [inicio, fin).
+
+        Args:
+            inicio: La primera fila del bloque.
+            fin: La fila siguiente a la última del bloque.
+            dimensiones: La tupla (X_MAX, Y_MAX) del Lattice completo.
+            ocupacion: La ocupación inicial pedida al Lattice (los generadores
+                       que definen su propia densidad pueden ignorarla).
+
+        Returns:
+            Un arreglo NumPy uint8 con forma (fin - inicio, Y_MAX) de estados.
+        """
+        pass
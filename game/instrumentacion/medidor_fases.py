@@ -0,0 +1,274 @@
+import json
+import threading
+import time
+from typing import Dict, List, Optional, TextIO
+
+# Sub-cubetas por potencia de dos del histograma (error relativo máximo ~1/8).
+SUBCUBETAS_POR_OCTAVA = 8
+
+# Número total de cubetas: cubre duraciones de 0 ns hasta más de 2^60 ns.
+NUMERO_CUBETAS = SUBCUBETAS_POR_OCTAVA * 62
+
+# Percentiles exportados por el resumen.
+PERCENTILES = (0.5, 0.99)
+
+
+def _indice_cubeta(nanosegundos: int) -> int:
+    """
+    Devuelve la cubeta log-lineal de una duración en nanosegundos.
+
+    Los valores menores que 2 * SUBCUBETAS_POR_OCTAVA tienen cubeta propia; a
+    partir de ahí cada potencia de dos se divide en SUBCUBETAS_POR_OCTAVA
+    cubetas iguales (los bits más significativos del valor).
+    """
+    exponente = max(0, nanosegundos.bit_length() - 4)
+    return SUBCUBETAS_POR_OCTAVA * exponente + (nanosegundos >> exponente)
+
+
+def _valor_cubeta(indice: int) -> float:
+    """
+    Devuelve el punto medio (en nanosegundos) del intervalo que cubre una cubeta.
+    """
+    exponente = max(0, indice // SUBCUBETAS_POR_OCTAVA - 1)
+    mantisa = indice - SUBCUBETAS_POR_OCTAVA * exponente
+    return (mantisa << exponente) + ((1 << exponente) - 1) / 2
+
+
+class HistogramaFase:
+    """
+    Histograma log-lineal de las duraciones de una fase.
+
+    Registrar una duración cuesta una conversión a entero y un incremento; los
+    percentiles se calculan a partir de las cubetas con un error relativo
+    acotado (~6%), sin guardar las muestras individuales.
+    """
+
+    def __init__(self):
+        """
+        Constructor que inicializa un histograma vacío.
+        """
+        self.conteo = 0
+        self.total = 0.0
+        self.maximo = 0.0
+        self._cubetas: List[int] = [0] * NUMERO_CUBETAS
+
+    def registrar(self, segundos: float):
+        """
+        Añade una duración al histograma.
+
+        Args:
+            segundos: La duración medida.
+        """
+        self.conteo += 1
+        self.total += segundos
+        if segundos > self.maximo:
+            self.maximo = segundos
+        indice = _indice_cubeta(int(segundos * 1e9))
+        self._cubetas[min(indice, NUMERO_CUBETAS - 1)] += 1
+
+    def percentil(self, fraccion: float) -> float:
+        """
+        Devuelve (aproximadamente) el percentil pedido, en segundos.
+
+        Args:
+            fraccion: El percentil como fracción (ej., 0.99).
+
+        Returns:
+            La duración del percentil, o 0.0 si el histograma está vacío.
+        """
+        if self.conteo == 0:
+            return 0.0
+        objetivo = max(1, int(fraccion * self.conteo + 0.5))
+        acumulado = 0
+        for indice, cantidad in enumerate(self._cubetas):
+            acumulado += cantidad
+            if acumulado >= objetivo:
+                return min(_valor_cubeta(indice) / 1e9, self.maximo)
+        return self.maximo
+
+    def resumen(self) -> Dict[str, float]:
+        """
+        Devuelve el conteo, el total, los percentiles y el máximo de la fase.
+        """
+        datos = {"conteo": self.conteo, "total_s": self.total}
+        for fraccion in PERCENTILES:
+            datos[f"p{round(fraccion * 100)}_s"] = self.percentil(fraccion)
+        datos["max_s"] = self.maximo
+        return datos
+
+
+class _FaseNula:
+    """
+    Contexto vacío devuelto por un medidor desactivado (no mide nada).
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        return False
+
+
+_FASE_NULA = _FaseNula()
+
+
+class _FaseMedida:
+    """
+    Contexto que mide una fase y registra su duración al salir.
+    """
+
+    __slots__ = ("_histograma", "_inicio")
+
+    def __init__(self, histograma: HistogramaFase):
+        self._histograma = histograma
+        self._inicio = 0.0
+
+    def __enter__(self):
+        self._inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *excepcion):
+        self._histograma.registrar(time.perf_counter() - self._inicio)
+        return False
+
+
+class MedidorFases:
+    """
+    Colección de histogramas por fase (conteo de vecinos, dibujado, espera del reloj, etc.).
+
+    Uso:
+        with medidor.fase("draw_board"):
+            ...
+
+    Desactivado, 'fase()' devuelve un contexto vacío compartido: el coste es
+    una comprobación de atributo por fase y generación (o cuadro), no por célula.
+    Cada fase debe medirse desde un único hilo; fases distintas pueden medirse
+    desde hilos distintos (ej., el Modelo y la Vista).
+    """
+
+    def __init__(self, activo: bool = False):
+        """
+        Constructor que inicializa el medidor.
+
+        Args:
+            activo: Si es False, las mediciones no hacen nada hasta llamar a 'activar()'.
+        """
+        self.activo = activo
+        self._histogramas: Dict[str, HistogramaFase] = {}
+        self._cerrojo = threading.Lock()
+
+    def activar(self):
+        """
+        Empieza a registrar las fases medidas.
+        """
+        self.activo = True
+
+    def desactivar(self):
+        """
+        Deja de registrar (los histogramas existentes se conservan).
+        """
+        self.activo = False
+
+    def reiniciar(self):
+        """
+        Descarta todos los histogramas.
+        """
+        with self._cerrojo:
+            self._histogramas = {}
+
+    def histograma(self, nombre: str) -> HistogramaFase:
+        """
+        Devuelve (creándolo si no existe) el histograma de una fase.
+        """
+        histograma = self._histogramas.get(nombre)
+        if histograma is None:
+            with self._cerrojo:
+                histograma = self._histogramas.setdefault(nombre, HistogramaFase())
+        return histograma
+
+    def fase(self, nombre: str):
+        """
+        Devuelve un contexto que mide la duración del bloque como la fase 'nombre'.
+
+        Args:
+            nombre: El nombre de la fase.
+
+        Returns:
+            Un gestor de contexto (vacío si el medidor está desactivado).
+        """
+        if not self.activo:
+            return _FASE_NULA
+        return _FaseMedida(self.histograma(nombre))
+
+    def registrar(self, nombre: str, segundos: float):
+        """
+        Registra directamente una duración medida por el llamador.
+        """
+        if self.activo:
+            self.histograma(nombre).registrar(segundos)
+
+    def resumen(self) -> Dict[str, Dict[str, float]]:
+        """
+        Devuelve el resumen de cada fase (conteo, total, p50, p99 y máximo).
+
+        Returns:
+            Un diccionario fase -> resumen, ordenado por nombre de fase.
+        """
+        with self._cerrojo:
+            histogramas = dict(self._histogramas)
+        return {nombre: histogramas[nombre].resumen() for nombre in sorted(histogramas)}
+
+    def exportar_jsonl(self, archivo: TextIO, etiquetas: Optional[Dict[str, object]] = None):
+        """
+        Escribe una línea JSON por fase con su resumen.
+
+        Args:
+            archivo: El archivo de texto de destino (se añade al final).
+            etiquetas: Campos adicionales incluidos en cada línea (ej., el motor).
+        """
+        marca_tiempo = time.time()
+        for nombre, datos in self.resumen().items():
+            registro = {"fase": nombre, "marca_tiempo": marca_tiempo}
+            registro.update(etiquetas or {})
+            registro.update(datos)
+            archivo.write(json.dumps(registro, sort_keys=True) + "\n")
+
+    def exportar_prometheus(self, prefijo: str = "vida_fase_segundos") -> str:
+        """
+        Devuelve el resumen en el formato de texto de exposición de Prometheus.
+
+        Args:
+            prefijo: El nombre de la métrica (tipo 'summary').
+
+        Returns:
+            El texto con los cuantiles, la suma y el conteo de cada fase.
+        """
+        lineas = [f"# HELP {prefijo} Duración de cada fase de la simulación.",
+                  f"# TYPE {prefijo} summary"]
+        for nombre, datos in self.resumen().items():
+            for fraccion in PERCENTILES:
+                valor = datos[f"p{round(fraccion * 100)}_s"]
+                lineas.append(f'{prefijo}{{fase="{nombre}",quantile="{fraccion}"}} {valor:.9g}')
+            lineas.append(f'{prefijo}_sum{{fase="{nombre}"}} {datos["total_s"]:.9g}')
+            lineas.append(f'{prefijo}_count{{fase="{nombre}"}} {datos["conteo"]}')
+        return "\n".join(lineas) + "\n"
+
+    def guardar(self, ruta: str, etiquetas: Optional[Dict[str, object]] = None):
+        """
+        Guarda el resumen en 'ruta': texto de Prometheus si termina en '.prom', JSON Lines si no.
+
+        Args:
+            ruta: La ruta del archivo de métricas.
+            etiquetas: Campos adicionales de cada línea JSON.
+        """
+        if ruta.endswith(".prom"):
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write(self.exportar_prometheus())
+        else:
+            with open(ruta, "a", encoding="utf-8") as archivo:
+                self.exportar_jsonl(archivo, etiquetas)
+
+
+# Medidor compartido por defecto (desactivado): el Modelo y la Vista lo usan
+# salvo que se les inyecte otro.
+MEDIDOR_GLOBAL = MedidorFases()
@@ -2,7 +2,9 @@ from .automata_celular import AutomataCelular
 from .vecindad.i_estrategia_vecindad import IEstrategiaVecindad
 from .frontera.i_condicion_frontera import ICondicionFrontera 
 from .lattice.i_lattice import ILattice 
-from typing import Tuple
+from .lattice.i_lattice_doble_buffer import ILatticeDobleBuffer
+from .instrumentacion.medidor_fases import MedidorFases, MEDIDOR_GLOBAL
+from typing import Tuple, Set, Optional
 
 class JuegoDeLaVida(AutomataCelular):
     """
@@ -15,56 +17,199 @@ class JuegoDeLaVida(AutomataCelular):
     def __init__(self, ocupacion: float, estrategia_vecindad: IEstrategiaVecindad, 
                  condicion_frontera: ICondicionFrontera, 
                  lattice: ILattice,
-                 dimensiones: Tuple[int, int]):
+                 dimensiones: Tuple[int, int],
+                 incremental: bool = False,
+                 medidor: Optional[MedidorFases] = None):
         """
         Constructor que inicializa el Juego de la Vida, pasando todas las 
         abstracciones requeridas a su clase base.
+        
+        Args:
+            incremental: Si es True, cada generación solo reevalúa las células que
+                         cambiaron en la generación anterior y sus vecinos.
+            medidor: Medidor de las fases "conteo_marcado" y "aplicacion" de cada
+                     generación (None = el medidor global, desactivado por defecto).
         """
         super().__init__(ocupacion, estrategia_vecindad, condicion_frontera, lattice, dimensiones)
+        
+        self.incremental = incremental
+        self.medidor = medidor if medidor is not None else MEDIDOR_GLOBAL
+        # Células que cambiaron en la última generación (None = se requiere un barrido completo).
+        self._celulas_cambiadas: Optional[Set[Tuple[int, int]]] = None
+
+    def reiniciar_seguimiento(self):
+        """
+        Descarta el conjunto de células cambiadas, forzando un barrido completo.
+        
+        Debe llamarse si el Lattice se modifica desde fuera del autómata
+        (ej., al cargar un patrón), ya que esos cambios no quedan registrados.
+        """
+        self._celulas_cambiadas = None
+
+    def lattice_modificado(self):
+        """
+        Descarta el seguimiento incremental tras una modificación externa del Lattice.
+        """
+        self.reiniciar_seguimiento()
+        super().lattice_modificado()
 
     def avanzar_generacion(self):
         """
         Implementación de la Regla de Transición Local del Juego de la Vida.
         Calcula el estado futuro de cada célula basándose en los estados actuales.
         """
+        if self.incremental:
+            self._avanzar_incremental()
+        elif isinstance(self.lattice, ILatticeDobleBuffer):
+            self._avanzar_doble_buffer()
+        else:
+            self._avanzar_completo()
+
+    def _avanzar_incremental(self):
+        """
+        Avanza una generación reevaluando solo las células activas.
+        
+        Una célula solo puede cambiar si ella o alguno de sus vecinos cambió en la
+        generación anterior, por lo que el coste es proporcional a la actividad
+        del tablero y no a su área. El resultado es idéntico al barrido completo.
+        """
+        dimensiones = self.lattice.obtener_dimensiones()
+        reticula_estado = self.lattice.obtener_estado()
+        
+        with self.medidor.fase("conteo_marcado"):
+            # 1. Conjunto activo: las células cambiadas más sus vecinos (según la
+            #    Estrategia de Vecindad y la Condición de Frontera inyectadas).
+            if self._celulas_cambiadas is None:
+                candidatas = reticula_estado
+            else:
+                candidatas = set(self._celulas_cambiadas)
+                for celula in self._celulas_cambiadas:
+                    candidatas.update(self.estrategia_vecindad.obtener_vecinos(
+                        celula, dimensiones, self.condicion_frontera
+                    ))
+        
+            # 2. Decide los cambios sin modificar el Lattice (no se necesitan marcas temporales).
+            nacimientos = []
+            muertes = []
+            for celula in candidatas:
+                if celula not in reticula_estado:
+                    continue
+                vecinos = self.estrategia_vecindad.contar_vecinos_vivos(
+                    celula, 
+                    reticula_estado,
+                    dimensiones, 
+                    self.condicion_frontera
+                )
+                estado_actual = reticula_estado[celula]
+                if estado_actual == 0 and vecinos == 3:
+                    nacimientos.append(celula)
+                elif estado_actual == 1 and vecinos not in [2, 3]:
+                    muertes.append(celula)
+
+        with self.medidor.fase("aplicacion"):
+            # 3. Aplica los cambios y los recuerda para la próxima generación.
+            for celula in nacimientos:
+                self.lattice.actualizar_estado(celula, 1)
+            for celula in muertes:
+                self.lattice.actualizar_estado(celula, 0)
+            self._celulas_cambiadas = set(nacimientos)
+            self._celulas_cambiadas.update(muertes)
+
+        # 4. Los mismos cambios actualizan el hash de ciclos y las estadísticas.
+        if self._observando():
+            self._registrar_cambios(
+                [(celula, 0, 1) for celula in nacimientos] + [(celula, 1, 0) for celula in muertes]
+            )
+
+    def _avanzar_doble_buffer(self):
+        """
+        Avanza una generación en una sola pasada sobre un Lattice con doble búfer.
+        
+        Cada célula se lee del búfer actual y su nuevo estado se escribe en el
+        siguiente, por lo que no hacen falta marcas temporales ni una segunda
+        pasada; la generación se publica de golpe al intercambiar los búferes.
+        """
+        dimensiones = self.lattice.obtener_dimensiones()
+        reticula_estado = self.lattice.obtener_estado()
+        siguiente = self.lattice.obtener_estado_siguiente()
+        contar = self.estrategia_vecindad.contar_vecinos_vivos
+        cambios = [] if self._observando() else None
+
+        with self.medidor.fase("conteo_marcado"):
+            nuevos = []
+            for celula, estado_actual in reticula_estado.items():
+                vecinos = contar(celula, reticula_estado, dimensiones, self.condicion_frontera)
+                nuevo_estado = estado_actual
+                # Reproducción (0 -> 1 con 3 vecinos) y muerte por soledad o sobrepoblación.
+                if estado_actual == 0 and vecinos == 3:
+                    nuevo_estado = 1
+                elif estado_actual == 1 and vecinos not in (2, 3):
+                    nuevo_estado = 0
+                nuevos.append(nuevo_estado)
+                if cambios is not None and nuevo_estado != estado_actual:
+                    cambios.append((celula, estado_actual, nuevo_estado))
+
+        with self.medidor.fase("aplicacion"):
+            # Ambos búferes comparten el orden de las claves: el siguiente se rellena en C.
+            siguiente.update(zip(reticula_estado, nuevos))
+            self.lattice.intercambiar()
+
+        if cambios is not None:
+            self._registrar_cambios(cambios)
+
+    def _avanzar_completo(self):
+        """
+        Avanza una generación recorriendo todas las células del Lattice.
+        """
         
         # Obtenemos las propiedades y el estado del Lattice (desde las abstracciones)
         dimensiones = self.lattice.obtener_dimensiones()
         reticula_estado = self.lattice.obtener_estado()
 
-        # Fase 1: Marcar cambios (Usando estados temporales 2 y -1)
-        # Esto asegura que todas las decisiones se tomen en base al estado inicial 
-        # de la generación, evitando conflictos de actualización.
-        for celula in reticula_estado:
+        with self.medidor.fase("conteo_marcado"):
+            # Fase 1: Marcar cambios (Usando estados temporales 2 y -1)
+            # Esto asegura que todas las decisiones se tomen en base al estado inicial 
+            # de la generación, evitando conflictos de actualización.
+            for celula in reticula_estado:
             
-            # Pide a la Estrategia de Vecindad contar los vecinos, usando la Condición de Frontera inyectada.
-            vecinos = self.estrategia_vecindad.contar_vecinos_vivos(
-                celula, 
-                reticula_estado,
-                dimensiones, 
-                self.condicion_frontera
-            )
-            estado_actual = reticula_estado[celula]
+                # Pide a la Estrategia de Vecindad contar los vecinos, usando la Condición de Frontera inyectada.
+                vecinos = self.estrategia_vecindad.contar_vecinos_vivos(
+                    celula, 
+                    reticula_estado,
+                    dimensiones, 
+                    self.condicion_frontera
+                )
+                estado_actual = reticula_estado[celula]
             
-            # Reglas de Conway's Life
-            # 1. Reproducción: Célula muerta (0) con 3 vecinos vivos, NACE (marca temporal 2)
-            if estado_actual == 0 and vecinos == 3:
-                self.lattice.actualizar_estado(celula, 2)
+                # Reglas de Conway's Life
+                # 1. Reproducción: Célula muerta (0) con 3 vecinos vivos, NACE (marca temporal 2)
+                if estado_actual == 0 and vecinos == 3:
+                    self.lattice.actualizar_estado(celula, 2)
             
-            # 2. Supervivencia/Muerte por soledad o sobrepoblación: Célula viva (1)
-            #    con < 2 o > 3 vecinos, MUERE (marca temporal -1)
-            elif estado_actual == 1 and vecinos not in [2, 3]:
-                self.lattice.actualizar_estado(celula, -1)
+                # 2. Supervivencia/Muerte por soledad o sobrepoblación: Célula viva (1)
+                #    con < 2 o > 3 vecinos, MUERE (marca temporal -1)
+                elif estado_actual == 1 and vecinos not in [2, 3]:
+                    self.lattice.actualizar_estado(celula, -1)
 
-        # Fase 2: Realizar cambios (Transición de Estados)
-        # Se recorre nuevamente para aplicar los estados temporales marcados.
-        for celula in reticula_estado:
-            estado = reticula_estado[celula]
+        with self.medidor.fase("aplicacion"):
+            # Fase 2: Realizar cambios (Transición de Estados)
+            # Se recorre nuevamente para aplicar los estados temporales marcados.
+            cambios = [] if self._observando() else None
+            for celula in reticula_estado:
+                estado = reticula_estado[celula]
             
-            # Aplicar Nacimiento: 2 (Nace) -> 1 (Viva)
-            if estado == 2: 
-                self.lattice.actualizar_estado(celula, 1) 
+                # Aplicar Nacimiento: 2 (Nace) -> 1 (Viva)
+                if estado == 2: 
+                    self.lattice.actualizar_estado(celula, 1) 
+                    if cambios is not None:
+                        cambios.append((celula, 0, 1))
             
-            # Aplicar Muerte: -1 (Muere) -> 0 (Muerta)
-            if estado == -1: 
-                self.lattice.actualizar_estado(celula, 0)
\ No newline at end of file
+                # Aplicar Muerte: -1 (Muere) -> 0 (Muerta)
+                if estado == -1: 
+                    self.lattice.actualizar_estado(celula, 0)
+                    if cambios is not None:
+                        cambios.append((celula, 1, 0))
+
+        # Los cambios aplicados actualizan el hash de ciclos y las estadísticas.
+        if cambios is not None:
+            self._registrar_cambios(cambios)
\ No newline at end of file
@@ -0,0 +1,132 @@
+import numpy as np
+from typing import Tuple
+from .automata_celular import AutomataCelular
+from .vecindad.i_estrategia_vecindad import IEstrategiaVecindad
+from .frontera.i_condicion_frontera import ICondicionFrontera
+from .lattice.lattice_bits import LatticeBits
+
+# Filas procesadas por bloque: mantiene los temporales del núcleo dentro de la caché.
+FILAS_POR_BLOQUE = 256
+
+_UNO = np.uint64(1)
+_BIT_ALTO = np.uint64(63)
+
+
+def _mayoria(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """
+    Acarreo de un sumador completo: 1 si al menos dos de los tres bits valen 1.
+    """
+    return (a & b) | (c & (a ^ b))
+
+
+def paso_conway_bits(acolchado: np.ndarray, Y_MAX: int) -> np.ndarray:
+    """
+    Calcula la siguiente generación de un bloque de filas empaquetadas.
+
+    El bloque incluye una fila de halo arriba y otra abajo. En el eje y (dentro de
+    cada fila) el borde es cíclico: el bit Y_MAX - 1 es vecino del bit 0.
+
+    Los vecinos se cuentan en paralelo para 64 células por palabra con sumadores
+    bit a bit: primero se suma cada fila con sus desplazamientos izquierdo y
+    derecho (número de 2 bits), y luego se suman las tres filas (número de 4 bits)
+    que incluye a la propia célula. La regla B3/S23 equivale a: total == 3, o
+    total == 4 y la célula está viva.
+
+    Args:
+        acolchado: Arreglo uint64 (R + 2, W) con el bloque y su halo vertical.
+        Y_MAX: El número de células reales de cada fila.
+
+    Returns:
+        Un arreglo uint64 (R, W) con la siguiente generación del bloque.
+    """
+    desplazamiento_ultimo = np.uint64((Y_MAX - 1) % 64)
+
+    # 1. Vecino izquierdo (y - 1) y derecho (y + 1) de cada bit, con acarreo entre palabras.
+    izquierda = acolchado << _UNO
+    izquierda[:, 1:] |= acolchado[:, :-1] >> _BIT_ALTO
+    izquierda[:, 0] |= (acolchado[:, -1] >> desplazamiento_ultimo) & _UNO
+
+    derecha = acolchado >> _UNO
+    derecha[:, :-1] |= acolchado[:, 1:] << _BIT_ALTO
+    derecha[:, -1] |= (acolchado[:, 0] & _UNO) << desplazamiento_ultimo
+
+    # 2. Suma horizontal de tres bits por fila: (acarreo, suma) en 0..3.
+    suma = izquierda ^ acolchado ^ derecha
+    acarreo = _mayoria(izquierda, acolchado, derecha)
+
+    # 3. Suma vertical de las tres filas: total = S0 + 2*B1 + 4*B2 + 8*B3.
+    su, sm, sd = suma[:-2], suma[1:-1], suma[2:]
+    ku, km, kd = acarreo[:-2], acarreo[1:-1], acarreo[2:]
+    s0 = su ^ sm ^ sd
+    c0 = _mayoria(su, sm, sd)
+    k0 = ku ^ km ^ kd
+    k1 = _mayoria(ku, km, kd)
+    b1 = c0 ^ k0
+    c1 = c0 & k0
+    b2 = k1 ^ c1
+    b3 = k1 & c1
+
+    # 4. Regla: total == 3 (nace o sobrevive con 2) o total == 4 con la célula viva.
+    viva = acolchado[1:-1]
+    siguiente = ~b3 & ((s0 & b1 & ~b2) | (viva & ~s0 & ~b1 & b2))
+
+    # 5. Los bits de relleno de la última palabra deben quedar siempre en 0.
+    if Y_MAX % 64:
+        siguiente[:, -1] &= (_UNO << np.uint64(Y_MAX % 64)) - _UNO
+    return siguiente
+
+
+class JuegoDeLaVidaBits(AutomataCelular):
+    """
+    Implementación del Juego de la Vida sobre un LatticeBits (64 células por palabra).
+
+    Las filas de halo (eje x) las rellena en bloque la Condición de Frontera
+    inyectada ('acolchar_eje'). Dentro de cada fila (eje y) el núcleo bit a bit es
+    cíclico, por lo que el motor exige una frontera equivalente a
+    CondicionFronteraCiclica en ese eje.
+    """
+
+    def __init__(self, ocupacion: float, estrategia_vecindad: IEstrategiaVecindad,
+                 condicion_frontera: ICondicionFrontera,
+                 lattice: LatticeBits,
+                 dimensiones: Tuple[int, int]):
+        """
+        Constructor que inicializa el motor, pasando todas las abstracciones
+        requeridas a su clase base.
+
+        Raises:
+            ValueError: Si la frontera no es cíclica en el eje y.
+        """
+        super().__init__(ocupacion, estrategia_vecindad, condicion_frontera, lattice, dimensiones)
+
+        Y_MAX = dimensiones[1]
+        if (condicion_frontera.obtener_coordenada_real(-1, Y_MAX) != Y_MAX - 1
+                or condicion_frontera.obtener_coordenada_real(Y_MAX, Y_MAX) != 0):
+            raise ValueError("JuegoDeLaVidaBits requiere una condición de frontera cíclica.")
+
+        # Buffer de la siguiente generación, reutilizado entre generaciones.
+        self._siguiente: np.ndarray = np.zeros((0, 0), dtype=np.uint64)
+
+    def avanzar_generacion(self):
+        """
+        Calcula la siguiente generación procesando bloques de filas empaquetadas.
+        """
+        X_MAX, Y_MAX = self.lattice.obtener_dimensiones()
+        palabras = self.lattice.obtener_palabras()
+        frontera = self.condicion_frontera
+
+        # El buffer se recrea solo si cambian las dimensiones.
+        if self._siguiente.shape != palabras.shape:
+            self._siguiente = np.empty_like(palabras)
+
+        for inicio in range(0, X_MAX, FILAS_POR_BLOQUE):
+            fin = min(inicio + FILAS_POR_BLOQUE, X_MAX)
+            # Filas [inicio - 1, fin] con los halos resueltos por la frontera.
+            acolchado = frontera.acolchar_eje(palabras, 0, 1, inicio, fin)
+            self._siguiente[inicio:fin] = paso_conway_bits(acolchado, Y_MAX)
+
+        self._registrar_palabras(palabras, self._siguiente)
+
+        # Intercambio de buffers: el estado anterior se reutiliza en la próxima generación.
+        self.lattice.establecer_palabras(self._siguiente)
+        self._siguiente = palabras
@@ -0,0 +1,106 @@
+from collections import Counter
+from typing import Tuple, Dict, Optional
+from .automata_celular import AutomataCelular
+from .vecindad.i_estrategia_vecindad import IEstrategiaVecindad
+from .frontera.i_condicion_frontera import ICondicionFrontera
+from .lattice.lattice_disperso import LatticeDisperso
+from .reglas.regla_transicion import ReglaTransicion, CONWAY
+from .ciclos.detector_ciclos import DetectorCiclos, MAX_HISTORIAL_POR_DEFECTO
+
+class JuegoDeLaVidaDisperso(AutomataCelular):
+    """
+    Implementación del Autómata Celular que solo visita las células vivas y sus vecinas.
+
+    Trabaja sobre un LatticeDisperso: cada generación cuenta, para cada célula
+    viva, una aportación a cada uno de sus vecinos (según los desplazamientos
+    de la Estrategia de Vecindad inyectada). Las únicas células que pueden estar
+    vivas en la generación siguiente son las que reciben alguna aportación (o
+    las vivas, si la regla permite sobrevivir con 0 vecinos), por lo que el
+    tiempo y la memoria son proporcionales a la población y no al área.
+
+    Con CondicionFronteraIlimitada el plano no tiene bordes; con cualquier otra
+    frontera las coordenadas de los vecinos se ajustan a las dimensiones del Lattice.
+    Admite cualquier regla B/S de dos estados salvo las que contienen B0 (en un
+    plano ilimitado harían nacer infinitas células).
+    """
+
+    def __init__(self, ocupacion: float, estrategia_vecindad: IEstrategiaVecindad,
+                 condicion_frontera: ICondicionFrontera,
+                 lattice: LatticeDisperso,
+                 dimensiones: Tuple[int, int],
+                 regla: Optional[ReglaTransicion] = None):
+        """
+        Constructor que valida la regla e inicializa el Lattice disperso.
+
+        Args:
+            regla: La regla B/S a aplicar (None = Conway, B3/S23).
+
+        Raises:
+            ValueError: Si la regla tiene más de dos estados o contiene B0.
+        """
+        regla = regla if regla is not None else ReglaTransicion.desde_cadena(CONWAY)
+        if regla.estados != 2:
+            raise ValueError("El motor disperso solo admite reglas B/S de dos estados.")
+        if 0 in regla.nacimiento:
+            raise ValueError("El motor disperso no admite reglas con B0.")
+        super().__init__(ocupacion, estrategia_vecindad, condicion_frontera, lattice, dimensiones)
+        self.regla = regla
+        self._desplazamientos = estrategia_vecindad.obtener_desplazamientos()
+
+    def activar_deteccion_ciclos(self, max_historial: int = MAX_HISTORIAL_POR_DEFECTO,
+                                 avance_rapido: bool = True, generacion: int = 0) -> DetectorCiclos:
+        """
+        Activa la detección de ciclos con índices válidos fuera de la ventana (ver AutomataCelular).
+        """
+        detector = DetectorCiclos(self.lattice.obtener_dimensiones(), max_historial, ilimitado=True)
+        detector.reiniciar(self.lattice, generacion)
+        self.detector_ciclos = detector
+        self.avance_rapido = avance_rapido
+        return detector
+
+    def _contar_vecinos(self, vivas: Dict[Tuple[int, int], int]) -> Counter:
+        """
+        Cuenta los vecinos vivos de todas las células con al menos uno.
+
+        Returns:
+            Un Counter célula -> número de vecinos vivos.
+        """
+        desplazamientos = self._desplazamientos
+        if self.condicion_frontera.es_ilimitada():
+            return Counter([(x + dx, y + dy) for x, y in vivas for dx, dy in desplazamientos])
+
+        # Frontera acotada: cada coordenada se ajusta a la retícula con la frontera inyectada.
+        X_MAX, Y_MAX = self.lattice.obtener_dimensiones()
+        ajustar = self.condicion_frontera.obtener_coordenada_real
+        conteo = Counter([(ajustar(x + dx, X_MAX), ajustar(y + dy, Y_MAX))
+                          for x, y in vivas for dx, dy in desplazamientos])
+        # Las vecinas fantasma de una frontera fija (None) nunca nacen.
+        for celula in [celula for celula in conteo if None in celula]:
+            del conteo[celula]
+        return conteo
+
+    def avanzar_generacion(self):
+        """
+        Avanza una generación visitando solo las células vivas y sus vecinas.
+        """
+        vivas = self.lattice.obtener_celulas_vivas()
+        nacimiento = self.regla.nacimiento
+        supervivencia = self.regla.supervivencia
+
+        # 1. Conteo de vecinos por dispersión desde las células vivas.
+        conteo = self._contar_vecinos(vivas)
+
+        # 2. Nueva generación: nacimientos y supervivencias entre las células con vecinos.
+        nuevas = {celula: 1 for celula, vecinos in conteo.items()
+                  if ((vecinos in supervivencia) if celula in vivas else (vecinos in nacimiento))}
+        if 0 in supervivencia:
+            # Las células vivas aisladas no aparecen en el conteo.
+            nuevas.update((celula, 1) for celula in vivas if celula not in conteo)
+
+        # 3. Los cambios actualizan el hash de ciclos y las estadísticas.
+        if self._observando():
+            self._registrar_cambios(
+                [(celula, 0, 1) for celula in nuevas if celula not in vivas]
+                + [(celula, 1, 0) for celula in vivas if celula not in nuevas]
+            )
+        self.lattice.establecer_celulas_vivas(nuevas)
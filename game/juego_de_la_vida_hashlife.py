@@ -0,0 +1,411 @@
+from typing import Tuple, Dict, List, Optional
+from .automata_celular import AutomataCelular
+from .vecindad.i_estrategia_vecindad import IEstrategiaVecindad
+from .frontera.i_condicion_frontera import ICondicionFrontera
+from .lattice.i_lattice import ILattice
+
+# Estimación del coste en memoria de un nodo canónico (objeto, entrada en la
+# tabla de nodos y resultados memorizados). Se usa para traducir el techo de
+# memoria configurado a un número máximo de nodos.
+BYTES_POR_NODO = 300
+
+# Techo de memoria por defecto para la caché de nodos (256 MB).
+MEMORIA_MAXIMA_POR_DEFECTO = 256 * 1024 * 1024
+
+# Desplazamientos de la Vecindad de Moore, la única que soporta este motor.
+_DESPLAZAMIENTOS_MOORE = {(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)}
+
+
+class Nodo:
+    """
+    Nodo de un árbol cuaternario canónico (quadtree) de HashLife.
+
+    Un nodo de nivel k representa un cuadrado de 2^k x 2^k células formado por
+    cuatro hijos de nivel k - 1 (nw, ne, sw, se). Los nodos de nivel 0 son las
+    células individuales. Al ser canónicos (un único objeto por contenido),
+    los resultados memorizados se comparten entre todas las apariciones de
+    un mismo patrón en el espacio y en el tiempo.
+    """
+
+    __slots__ = ("nivel", "nw", "ne", "sw", "se", "poblacion", "resultados")
+
+    def __init__(self, nivel: int, nw: Optional["Nodo"], ne: Optional["Nodo"],
+                 sw: Optional["Nodo"], se: Optional["Nodo"], poblacion: int):
+        self.nivel = nivel
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.poblacion = poblacion
+        # Resultados memorizados: salto j -> centro avanzado 2^j generaciones.
+        self.resultados: Dict[int, "Nodo"] = {}
+
+
+# Las dos hojas canónicas (nivel 0).
+MUERTA = Nodo(0, None, None, None, None, 0)
+VIVA = Nodo(0, None, None, None, None, 1)
+
+
+class _CacheLlena(Exception):
+    """
+    Señal interna: un salto iba a crear más nodos de los que admite el techo de la caché.
+    """
+
+
+class JuegoDeLaVidaHashLife(AutomataCelular):
+    """
+    Motor HashLife del Juego de la Vida para saltar millones de generaciones.
+
+    El estado se representa como un árbol cuaternario canónico cuyos nodos
+    memorizan su futuro, lo que permite avanzar 2^j generaciones de una vez.
+
+    El Lattice toroidal (CondicionFronteraCiclica) se simula de forma exacta
+    aprovechando que un toro es un patrón periódico: si T es el nodo del
+    tablero, el nodo formado por cuatro copias de T contiene en su centro el
+    mismo toro desplazado medio tablero, y su resultado es ese toro avanzado.
+    Por ello las dimensiones deben ser potencias de dos, y cada salto admite
+    como máximo la mitad del lado del tablero (mayor) en generaciones.
+
+    El Lattice inyectado se usa para importar el estado inicial y se sincroniza
+    (exporta) de forma diferida cuando se solicita con 'obtener_lattice()'.
+    """
+
+    def __init__(self, ocupacion: float, estrategia_vecindad: IEstrategiaVecindad,
+                 condicion_frontera: ICondicionFrontera,
+                 lattice: ILattice,
+                 dimensiones: Tuple[int, int],
+                 memoria_maxima: int = MEMORIA_MAXIMA_POR_DEFECTO):
+        """
+        Constructor que inicializa el motor e importa el estado del Lattice.
+
+        Args:
+            memoria_maxima: Techo aproximado (en bytes) de la caché de nodos. Se
+                            comprueba al crear cada nodo durante un salto: al
+                            alcanzarlo se vacía la caché (conservando solo el
+                            estado actual) y el salto se repite desde la raíz.
+
+        Raises:
+            ValueError: Si las dimensiones no son potencias de dos, la frontera
+                        no es cíclica o la vecindad no es la de Moore.
+        """
+        super().__init__(ocupacion, estrategia_vecindad, condicion_frontera, lattice, dimensiones)
+
+        X_MAX, Y_MAX = dimensiones
+        for dimension in dimensiones:
+            if dimension < 1 or dimension & (dimension - 1):
+                raise ValueError("HashLife requiere dimensiones que sean potencias de dos.")
+            if (condicion_frontera.obtener_coordenada_real(-1, dimension) != dimension - 1
+                    or condicion_frontera.obtener_coordenada_real(dimension, dimension) != 0):
+                raise ValueError("HashLife requiere una condición de frontera cíclica.")
+        if set(estrategia_vecindad.obtener_desplazamientos()) != _DESPLAZAMIENTOS_MOORE:
+            raise ValueError("HashLife solo soporta la Vecindad de Moore.")
+
+        self.max_nodos = max(1, memoria_maxima // BYTES_POR_NODO)
+        self.generacion = 0
+
+        self._tabla: Dict[Tuple[Nodo, Nodo, Nodo, Nodo], Nodo] = {}
+        self._vacios: List[Nodo] = [MUERTA]
+        # Techo de nodos vigente durante un salto (None = sin comprobar, p. ej. al vaciar la caché).
+        self._techo: Optional[int] = None
+
+        # El tablero se representa como un cuadrado de lado N (el mayor de los
+        # ejes), repitiendo el toro original si no es cuadrado.
+        self._nivel = max(max(X_MAX, Y_MAX).bit_length() - 1, 2)
+        self._raiz = self.importar_lattice(lattice)
+        self._lattice_sincronizado = True
+
+    # --- Construcción canónica de nodos ------------------------------------------
+
+    def _unir(self, nw: Nodo, ne: Nodo, sw: Nodo, se: Nodo) -> Nodo:
+        """
+        Devuelve el nodo canónico formado por los cuatro hijos dados.
+
+        Raises:
+            _CacheLlena: Si hay un techo vigente y crear el nodo lo superaría.
+        """
+        clave = (nw, ne, sw, se)
+        nodo = self._tabla.get(clave)
+        if nodo is None:
+            if self._techo is not None and len(self._tabla) >= self._techo:
+                raise _CacheLlena()
+            nodo = Nodo(nw.nivel + 1, nw, ne, sw, se,
+                        nw.poblacion + ne.poblacion + sw.poblacion + se.poblacion)
+            self._tabla[clave] = nodo
+        return nodo
+
+    def _vacio(self, nivel: int) -> Nodo:
+        """
+        Devuelve el nodo canónico vacío (sin células vivas) del nivel dado.
+        """
+        while len(self._vacios) <= nivel:
+            anterior = self._vacios[-1]
+            self._vacios.append(self._unir(anterior, anterior, anterior, anterior))
+        return self._vacios[nivel]
+
+    def _centro(self, m: Nodo) -> Nodo:
+        """
+        Devuelve el subnodo central (nivel k - 1) de un nodo de nivel k, sin avanzar.
+        """
+        return self._unir(m.nw.se, m.ne.sw, m.sw.ne, m.se.nw)
+
+    # --- Evolución -----------------------------------------------------------------
+
+    def _vida_4x4(self, m: Nodo) -> Nodo:
+        """
+        Caso base: avanza una generación el centro 2x2 de un nodo de nivel 2 (4x4).
+        """
+        celdas = [[0] * 4 for _ in range(4)]  # celdas[y][x]
+        for qy, fila in ((0, (m.nw, m.ne)), (1, (m.sw, m.se))):
+            for qx, cuadrante in enumerate(fila):
+                for sy, subfila in ((0, (cuadrante.nw, cuadrante.ne)), (1, (cuadrante.sw, cuadrante.se))):
+                    for sx, hoja in enumerate(subfila):
+                        celdas[2 * qy + sy][2 * qx + sx] = hoja.poblacion
+
+        nuevas = []
+        for y in (1, 2):
+            for x in (1, 2):
+                vecinos = sum(celdas[y + dy][x + dx] for dy in (-1, 0, 1) for dx in (-1, 0, 1)) - celdas[y][x]
+                viva = vecinos == 3 or (celdas[y][x] == 1 and vecinos == 2)
+                nuevas.append(VIVA if viva else MUERTA)
+        return self._unir(*nuevas)
+
+    def _sucesor(self, m: Nodo, j: int) -> Nodo:
+        """
+        Devuelve el centro (nivel k - 1) de un nodo de nivel k avanzado 2^j generaciones.
+
+        Requiere 0 <= j <= k - 2. El resultado se memoriza en el propio nodo.
+        """
+        resultado = m.resultados.get(j)
+        if resultado is not None:
+            return resultado
+
+        if m.poblacion == 0:
+            resultado = self._vacio(m.nivel - 1)
+        elif m.nivel == 2:
+            resultado = self._vida_4x4(m)
+        else:
+            nw, ne, sw, se = m.nw, m.ne, m.sw, m.se
+            # Los nueve subnodos (nivel k - 1) solapados, por filas.
+            nueve = (
+                nw, self._unir(nw.ne, ne.nw, nw.se, ne.sw), ne,
+                self._unir(nw.sw, nw.se, sw.nw, sw.ne), self._unir(nw.se, ne.sw, sw.ne, se.nw),
+                self._unir(ne.sw, ne.se, se.nw, se.ne),
+                sw, self._unir(sw.ne, se.nw, sw.se, se.sw), se,
+            )
+            if j == m.nivel - 2:
+                # Velocidad máxima: dos medios saltos de 2^(j-1) generaciones.
+                a = [self._sucesor(n, j - 1) for n in nueve]
+                salto = j - 1
+            else:
+                # Salto menor: el primer tramo no avanza (solo recorta el centro).
+                a = [self._centro(n) for n in nueve]
+                salto = j
+            resultado = self._unir(
+                self._sucesor(self._unir(a[0], a[1], a[3], a[4]), salto),
+                self._sucesor(self._unir(a[1], a[2], a[4], a[5]), salto),
+                self._sucesor(self._unir(a[3], a[4], a[6], a[7]), salto),
+                self._sucesor(self._unir(a[4], a[5], a[7], a[8]), salto),
+            )
+
+        m.resultados[j] = resultado
+        return resultado
+
+    def _saltar(self, j: int, reintentos: int = 1):
+        """
+        Avanza el toro completo 2^j generaciones (0 <= j <= nivel - 1).
+
+        La caché no supera 'max_nodos' durante el salto. Si se llena, se vacía
+        y el salto se repite desde la raíz actual; si vuelve a llenarse con la
+        caché limpia, se divide en dos saltos de 2^(j - 1) generaciones. Solo un
+        salto de una generación cuyo propio estado no cabe en el techo se
+        completa sin él (y la caché se vacía al terminar).
+
+        Args:
+            j: El exponente del salto.
+            reintentos: Repeticiones del salto completo tras vaciar la caché.
+        """
+        try:
+            self._techo = self.max_nodos
+            raiz = self._avanzar_raiz(j)
+        except _CacheLlena:
+            self._techo = None
+            self._vaciar_cache()
+            if reintentos:
+                self._saltar(j, reintentos - 1)
+                return
+            if j > 0:
+                self._saltar(j - 1)
+                self._saltar(j - 1)
+                return
+            raiz = self._avanzar_raiz(j)
+        finally:
+            self._techo = None
+
+        self._raiz = raiz
+        self.generacion += 1 << j
+        self._lattice_sincronizado = False
+        if self._observando():
+            self._registrar_vivas(self.celulas_vivas(), 1 << j)
+
+        if len(self._tabla) > self.max_nodos:
+            self._vaciar_cache()
+
+    def _avanzar_raiz(self, j: int) -> Nodo:
+        """
+        Devuelve la raíz del toro avanzado 2^j generaciones, sin modificar el estado.
+        """
+        raiz = self._raiz
+        # El resultado del mosaico 2x2 es el toro avanzado y desplazado medio
+        # tablero; el centro de un segundo mosaico deshace el desplazamiento.
+        desplazado = self._sucesor(self._unir(raiz, raiz, raiz, raiz), j)
+        return self._centro(self._unir(desplazado, desplazado, desplazado, desplazado))
+
+    def avanzar_generacion(self):
+        """
+        Avanza una única generación.
+        """
+        self.avanzar_generaciones(1)
+
+    def avanzar_generaciones(self, n: int):
+        """
+        Avanza n generaciones combinando saltos de 2^j generaciones.
+
+        Cada salto admite como máximo 2^(nivel - 1) generaciones (la mitad del
+        lado del tablero); los avances mayores se dividen en saltos máximos,
+        que suelen resolverse directamente desde la caché.
+
+        Args:
+            n: El número de generaciones a avanzar (n >= 0).
+        """
+        maximo = self._nivel - 1
+        salto_maximo = 1 << maximo
+        while n >= salto_maximo:
+            self._saltar(maximo)
+            n -= salto_maximo
+        for j in range(maximo - 1, -1, -1):
+            if n >> j & 1:
+                self._saltar(j)
+
+    # --- Caché ---------------------------------------------------------------------
+
+    def nodos_en_cache(self) -> int:
+        """
+        Devuelve el número de nodos canónicos almacenados actualmente.
+        """
+        return len(self._tabla)
+
+    def _vaciar_cache(self):
+        """
+        Política de desalojo: descarta todos los nodos y resultados memorizados,
+        reconstruyendo únicamente los nodos del estado actual.
+        """
+        raiz = self._raiz
+        self._tabla = {}
+        self._vacios = [MUERTA]
+        copias: Dict[int, Nodo] = {}
+
+        def recanonizar(nodo: Nodo) -> Nodo:
+            if nodo.nivel == 0:
+                return nodo
+            copia = copias.get(id(nodo))
+            if copia is None:
+                copia = self._unir(recanonizar(nodo.nw), recanonizar(nodo.ne),
+                                   recanonizar(nodo.sw), recanonizar(nodo.se))
+                copias[id(nodo)] = copia
+            return copia
+
+        self._raiz = recanonizar(raiz)
+
+    # --- Importación y exportación ---------------------------------------------------
+
+    def _construir(self, vivas: List[Tuple[int, int]], x0: int, y0: int, nivel: int) -> Nodo:
+        """
+        Construye el nodo del cuadrado [x0, x0 + 2^nivel) x [y0, y0 + 2^nivel).
+        """
+        if not vivas:
+            return self._vacio(nivel)
+        if nivel == 0:
+            return VIVA
+        mitad = 1 << (nivel - 1)
+        xm, ym = x0 + mitad, y0 + mitad
+        cuadrantes: Tuple[List, List, List, List] = ([], [], [], [])
+        for celula in vivas:
+            cuadrantes[(celula[0] >= xm) + 2 * (celula[1] >= ym)].append(celula)
+        return self._unir(
+            self._construir(cuadrantes[0], x0, y0, nivel - 1),
+            self._construir(cuadrantes[1], xm, y0, nivel - 1),
+            self._construir(cuadrantes[2], x0, ym, nivel - 1),
+            self._construir(cuadrantes[3], xm, ym, nivel - 1),
+        )
+
+    def importar_lattice(self, lattice: ILattice) -> Nodo:
+        """
+        Construye el árbol a partir del estado de un ILattice.
+
+        Args:
+            lattice: El Lattice cuyas dimensiones coinciden con las del motor.
+
+        Returns:
+            El nodo raíz que representa el tablero (repetido hasta ser cuadrado).
+        """
+        X_MAX, Y_MAX = lattice.obtener_dimensiones()
+        lado = 1 << self._nivel
+        vivas = [
+            (x + tx * X_MAX, y + ty * Y_MAX)
+            for (x, y), estado in lattice.obtener_estado().items() if estado == 1
+            for tx in range(lado // X_MAX)
+            for ty in range(lado // Y_MAX)
+        ]
+        return self._construir(vivas, 0, 0, self._nivel)
+
+    def lattice_modificado(self):
+        """
+        Reconstruye el árbol a partir del estado actual del Lattice inyectado.
+        """
+        self._raiz = self.importar_lattice(self.lattice)
+        self._lattice_sincronizado = True
+        super().lattice_modificado()
+
+    def celulas_vivas(self) -> List[Tuple[int, int]]:
+        """
+        Devuelve las coordenadas de las células vivas dentro de las dimensiones del Lattice.
+        """
+        X_MAX, Y_MAX = self.lattice.obtener_dimensiones()
+        vivas: List[Tuple[int, int]] = []
+        pendientes = [(self._raiz, 0, 0)]
+        while pendientes:
+            nodo, x0, y0 = pendientes.pop()
+            if nodo.poblacion == 0 or x0 >= X_MAX or y0 >= Y_MAX:
+                continue
+            if nodo.nivel == 0:
+                vivas.append((x0, y0))
+                continue
+            mitad = 1 << (nodo.nivel - 1)
+            pendientes.extend(((nodo.nw, x0, y0), (nodo.ne, x0 + mitad, y0),
+                               (nodo.sw, x0, y0 + mitad), (nodo.se, x0 + mitad, y0 + mitad)))
+        return vivas
+
+    def exportar_lattice(self, lattice: ILattice):
+        """
+        Escribe el estado actual en un ILattice de las mismas dimensiones.
+
+        Args:
+            lattice: El Lattice de destino.
+        """
+        vivas = set(self.celulas_vivas())
+        for celula, estado in list(lattice.obtener_estado().items()):
+            nuevo = 1 if celula in vivas else 0
+            if estado != nuevo:
+                lattice.actualizar_estado(celula, nuevo)
+
+    def obtener_lattice(self) -> ILattice:
+        """
+        Devuelve el Lattice inyectado, sincronizado con el estado del árbol.
+
+        Returns:
+            La instancia de ILattice inyectada.
+        """
+        if not self._lattice_sincronizado:
+            self.exportar_lattice(self.lattice)
+            self._lattice_sincronizado = True
+        return self.lattice
@@ -0,0 +1,118 @@
+import numpy as np
+from typing import Tuple, Optional
+from .automata_celular import AutomataCelular
+from .vecindad.i_estrategia_vecindad import IEstrategiaVecindad
+from .frontera.i_condicion_frontera import ICondicionFrontera
+from .lattice.lattice_mapeado import LatticeMapeado
+from .juego_de_la_vida_bits import paso_conway_bits, FILAS_POR_BLOQUE
+
+# Tamaño aproximado de cada franja residente (hay tres a la vez: anterior, actual y siguiente).
+BYTES_POR_FRANJA = 32 * 1024 * 1024
+
+
+class JuegoDeLaVidaMapeado(AutomataCelular):
+    """
+    Implementación del Juego de la Vida fuera de memoria sobre un LatticeMapeado.
+
+    Cada generación recorre el archivo actual de principio a fin en franjas
+    horizontales de filas empaquetadas. Solo tres franjas están copiadas en
+    memoria a la vez (la anterior, la actual y la siguiente, leída por
+    adelantado): la actual se calcula con el mismo núcleo bit a bit que
+    JuegoDeLaVidaBits ('paso_conway_bits'), tomando la fila de halo superior
+    de la franja anterior y la inferior de la siguiente, y el resultado se
+    escribe en el segundo archivo. Al terminar, los archivos se intercambian.
+
+    Las lecturas y escrituras son secuenciales, por lo que el rendimiento en
+    tableros mayores que la RAM queda limitado por el ancho de banda del disco.
+    Las filas de halo de los bordes superior e inferior se obtienen de la
+    Condición de Frontera inyectada; dentro de cada fila el núcleo es cíclico.
+    """
+
+    def __init__(self, ocupacion: float, estrategia_vecindad: IEstrategiaVecindad,
+                 condicion_frontera: ICondicionFrontera,
+                 lattice: LatticeMapeado,
+                 dimensiones: Tuple[int, int],
+                 filas_por_franja: Optional[int] = None):
+        """
+        Constructor que inicializa el motor, pasando todas las abstracciones
+        requeridas a su clase base.
+
+        Args:
+            filas_por_franja: Filas de cada franja (None = las que caben en BYTES_POR_FRANJA).
+
+        Raises:
+            ValueError: Si la frontera no es cíclica en el eje y.
+        """
+        super().__init__(ocupacion, estrategia_vecindad, condicion_frontera, lattice, dimensiones)
+
+        X_MAX, Y_MAX = dimensiones
+        if (condicion_frontera.obtener_coordenada_real(-1, Y_MAX) != Y_MAX - 1
+                or condicion_frontera.obtener_coordenada_real(Y_MAX, Y_MAX) != 0):
+            raise ValueError("JuegoDeLaVidaMapeado requiere una condición de frontera cíclica.")
+
+        if filas_por_franja is None:
+            bytes_por_fila = lattice.obtener_palabras().shape[1] * 8
+            filas_por_franja = BYTES_POR_FRANJA // max(bytes_por_fila, 1)
+        self.filas_por_franja = max(1, min(filas_por_franja, X_MAX))
+
+    def _leer_franja(self, palabras: np.ndarray, indice: int, X_MAX: int) -> Optional[np.ndarray]:
+        """
+        Copia la franja número 'indice' del archivo en un buffer con una fila de halo arriba y abajo.
+
+        Returns:
+            El buffer (R + 2, W) con la franja en las filas 1..R (los halos se rellenan
+            después), o None si la franja está fuera del tablero.
+        """
+        inicio = indice * self.filas_por_franja
+        if inicio >= X_MAX:
+            return None
+        fin = min(inicio + self.filas_por_franja, X_MAX)
+        franja = np.empty((fin - inicio + 2, palabras.shape[1]), dtype=np.uint64)
+        franja[1:-1] = palabras[inicio:fin]
+        return franja
+
+    def avanzar_generacion(self):
+        """
+        Calcula la siguiente generación recorriendo el archivo actual por franjas.
+        """
+        X_MAX, Y_MAX = self.lattice.obtener_dimensiones()
+        palabras = self.lattice.obtener_palabras()
+        destino = self.lattice.obtener_palabras_siguiente()
+        frontera = self.condicion_frontera
+        franjas = -(-X_MAX // self.filas_por_franja)
+
+        # Filas de halo de los bordes superior e inferior (según la Condición de Frontera):
+        # la primera y la última fila acolchadas, leyendo solo unas pocas filas del archivo.
+        halo_superior = frontera.acolchar_eje(palabras, 0, 1, 0, 1)[0]
+        halo_inferior = frontera.acolchar_eje(palabras, 0, 1, X_MAX - 1, X_MAX)[-1]
+
+        anterior = None
+        actual = self._leer_franja(palabras, 0, X_MAX)
+        for indice in range(franjas):
+            # Lectura adelantada de la franja siguiente (la tercera franja residente).
+            siguiente = self._leer_franja(palabras, indice + 1, X_MAX)
+            actual[0] = anterior[-2] if anterior is not None else halo_superior
+            actual[-1] = siguiente[1] if siguiente is not None else halo_inferior
+
+            # La franja se calcula en bloques que caben en la caché, como en JuegoDeLaVidaBits.
+            inicio = indice * self.filas_por_franja
+            filas = actual.shape[0] - 2
+            nueva = np.empty((filas, actual.shape[1]), dtype=np.uint64)
+            for desde in range(0, filas, FILAS_POR_BLOQUE):
+                hasta = min(desde + FILAS_POR_BLOQUE, filas)
+                nueva[desde:hasta] = paso_conway_bits(actual[desde:hasta + 2], Y_MAX)
+            destino[inicio:inicio + filas] = nueva
+            if self._observando():
+                self._acumular_palabras(actual[1:-1], nueva, inicio)
+
+            anterior, actual = actual, siguiente
+
+        self._cerrar_generacion()
+        self.lattice.intercambiar()
+
+    def cerrar(self):
+        """
+        Sincroniza el archivo actual con el disco y libera los mapeos.
+        """
+        super().cerrar()
+        self.lattice.cerrar()
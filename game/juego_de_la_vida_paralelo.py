@@ -0,0 +1,170 @@
+import os
+import weakref
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Tuple, List, Optional
+import numpy as np
+from .automata_celular import AutomataCelular
+from .vecindad.i_estrategia_vecindad import IEstrategiaVecindad
+from .frontera.i_condicion_frontera import ICondicionFrontera
+from .lattice.lattice_numpy import LatticeNumpy
+from .juego_de_la_vida_vectorizado import contar_vecinos_acolchado, aplicar_regla_conway
+
+# Estado de cada proceso trabajador (se asigna una única vez en '_iniciar_trabajador').
+_TRABAJADOR = {}
+
+
+def _iniciar_trabajador(nombres: Tuple[str, str], dimensiones: Tuple[int, int],
+                        frontera: ICondicionFrontera, desplazamientos: List[Tuple[int, int]]):
+    """
+    Inicializador del proceso trabajador: se conecta a los dos buffers compartidos.
+    """
+    memorias = [shared_memory.SharedMemory(name=nombre) for nombre in nombres]
+    _TRABAJADOR["memorias"] = memorias
+    _TRABAJADOR["buffers"] = [np.ndarray(dimensiones, dtype=np.uint8, buffer=m.buf) for m in memorias]
+    _TRABAJADOR["frontera"] = frontera
+    _TRABAJADOR["desplazamientos"] = desplazamientos
+
+
+def _avanzar_franja(buffers: List[np.ndarray], actual: int, inicio: int, fin: int,
+                    frontera: ICondicionFrontera, desplazamientos: List[Tuple[int, int]]):
+    """
+    Calcula la siguiente generación de las filas [inicio, fin) del buffer actual.
+
+    Las filas de halo (inicio - 1 y fin) se leen directamente de la memoria
+    compartida, donde las dejaron las franjas vecinas en la generación anterior;
+    en los bordes del tablero las rellena la Condición de Frontera.
+    """
+    estado = buffers[actual]
+    acolchado = frontera.acolchar(estado, 1, filas=(inicio, fin))
+    conteo = contar_vecinos_acolchado(acolchado, desplazamientos)
+    buffers[1 - actual][inicio:fin] = aplicar_regla_conway(estado[inicio:fin], conteo)
+
+
+def _tarea_trabajador(tarea: Tuple[int, int, int]):
+    """
+    Punto de entrada de cada tarea del pool: (buffer actual, fila inicial, fila final).
+    """
+    actual, inicio, fin = tarea
+    _avanzar_franja(_TRABAJADOR["buffers"], actual, inicio, fin,
+                    _TRABAJADOR["frontera"], _TRABAJADOR["desplazamientos"])
+
+
+def _liberar(pool, memorias: List[shared_memory.SharedMemory]):
+    """
+    Termina el pool y libera los segmentos de memoria compartida.
+    """
+    if pool is not None:
+        pool.terminate()
+        pool.join()
+    for memoria in memorias:
+        memoria.close()
+        memoria.unlink()
+
+
+class JuegoDeLaVidaParalelo(AutomataCelular):
+    """
+    Implementación multiproceso del Juego de la Vida sobre un LatticeNumpy.
+
+    La retícula se divide en franjas de filas que residen en memoria compartida
+    (dos buffers: generación actual y siguiente). En cada generación un pool de
+    procesos avanza todas las franjas en paralelo; cada franja lee su halo de
+    una célula directamente de las franjas vecinas, y los bordes del tablero se
+    rellenan en bloque con la Condición de Frontera inyectada. El resultado
+    es idéntico al de JuegoDeLaVidaVectorizado.
+
+    Los recursos (procesos y memoria compartida) se liberan con 'cerrar()' o al
+    usar la instancia como gestor de contexto.
+    """
+
+    def __init__(self, ocupacion: float, estrategia_vecindad: IEstrategiaVecindad,
+                 condicion_frontera: ICondicionFrontera,
+                 lattice: LatticeNumpy,
+                 dimensiones: Tuple[int, int],
+                 procesos: Optional[int] = None):
+        """
+        Constructor que inicializa el motor y traslada el Lattice a memoria compartida.
+
+        Args:
+            procesos: Número de procesos trabajadores (por defecto, os.cpu_count()).
+                      Con 1 proceso las franjas se calculan en el proceso actual.
+        """
+        super().__init__(ocupacion, estrategia_vecindad, condicion_frontera, lattice, dimensiones)
+
+        X_MAX, Y_MAX = dimensiones
+        self.procesos = max(1, min(procesos or os.cpu_count() or 1, X_MAX))
+        self._desplazamientos = estrategia_vecindad.obtener_desplazamientos()
+
+        # Franjas de filas contiguas de tamaño similar (una por proceso).
+        limites = np.linspace(0, X_MAX, self.procesos + 1).astype(int)
+        self._franjas = [(int(a), int(b)) for a, b in zip(limites[:-1], limites[1:]) if b > a]
+
+        # Dos buffers en memoria compartida; el Lattice apunta siempre al actual.
+        tamano = max(1, X_MAX * Y_MAX)
+        self._memorias = [shared_memory.SharedMemory(create=True, size=tamano) for _ in range(2)]
+        self._buffers = [np.ndarray(dimensiones, dtype=np.uint8, buffer=m.buf) for m in self._memorias]
+        self._actual = 0
+        self._buffers[0][...] = self.lattice.obtener_arreglo()
+        self.lattice.establecer_arreglo(self._buffers[0])
+
+        self._pool = None
+        self._finalizador = weakref.finalize(self, _liberar, None, self._memorias)
+
+    def _obtener_pool(self):
+        """
+        Crea el pool de procesos la primera vez que se necesita.
+        """
+        if self._pool is None:
+            nombres = (self._memorias[0].name, self._memorias[1].name)
+            self._pool = multiprocessing.Pool(
+                self.procesos,
+                initializer=_iniciar_trabajador,
+                initargs=(nombres, self.lattice.obtener_dimensiones(),
+                          self.condicion_frontera, self._desplazamientos)
+            )
+            self._finalizador.detach()
+            self._finalizador = weakref.finalize(self, _liberar, self._pool, self._memorias)
+        return self._pool
+
+    def avanzar_generacion(self):
+        """
+        Avanza una generación calculando todas las franjas en paralelo.
+        """
+        # Si el Lattice recibió un arreglo nuevo desde fuera, se copia a memoria compartida.
+        arreglo = self.lattice.obtener_arreglo()
+        if arreglo is not self._buffers[self._actual]:
+            self._buffers[self._actual][...] = arreglo
+
+        if self.procesos == 1:
+            for inicio, fin in self._franjas:
+                _avanzar_franja(self._buffers, self._actual, inicio, fin,
+                                self.condicion_frontera, self._desplazamientos)
+        else:
+            # 'map' actúa como barrera: todas las franjas terminan antes del intercambio.
+            tareas = [(self._actual, inicio, fin) for inicio, fin in self._franjas]
+            self._obtener_pool().map(_tarea_trabajador, tareas)
+
+        # Intercambio de buffers: la generación nueva pasa a ser la actual.
+        self._actual = 1 - self._actual
+        self.lattice.establecer_arreglo(self._buffers[self._actual])
+        self._registrar_arreglos(self._buffers[1 - self._actual], self._buffers[self._actual])
+
+    def cerrar(self):
+        """
+        Termina los procesos trabajadores y libera la memoria compartida.
+
+        El Lattice conserva una copia privada del último estado.
+        """
+        super().cerrar()
+        if not self._buffers:
+            return
+        self.lattice.establecer_arreglo(self._buffers[self._actual].copy())
+        self._buffers = []
+        self._pool = None
+        self._finalizador()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
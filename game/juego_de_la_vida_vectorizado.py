@@ -0,0 +1,90 @@
+import numpy as np
+from typing import Tuple, List
+from .automata_celular import AutomataCelular
+from .vecindad.i_estrategia_vecindad import IEstrategiaVecindad
+from .frontera.i_condicion_frontera import ICondicionFrontera
+from .lattice.lattice_numpy import LatticeNumpy
+
+
+def contar_vecinos_acolchado(acolchado: np.ndarray, desplazamientos: List[Tuple[int, int]],
+                             halo: int = 1) -> np.ndarray:
+    """
+    Cuenta los vecinos vivos de todas las células de un arreglo con halo.
+
+    Los dos últimos ejes del arreglo son (x, y); cualquier eje anterior se
+    procesa en bloque (ej., varias retículas apiladas).
+
+    Args:
+        acolchado: El estado con 'halo' células fantasma en cada borde.
+        desplazamientos: Los desplazamientos (dx, dy) de la vecindad (|dx|, |dy| <= halo).
+        halo: El ancho del halo (el radio de la vecindad).
+
+    Returns:
+        Un arreglo con el número de vecinos vivos de cada célula interior (uint8
+        si caben, uint16 si la vecindad tiene más de 255 desplazamientos).
+    """
+    X_MAX = acolchado.shape[-2] - 2 * halo
+    Y_MAX = acolchado.shape[-1] - 2 * halo
+    tipo = np.uint8 if len(desplazamientos) <= np.iinfo(np.uint8).max else np.uint16
+    conteo = np.zeros(acolchado.shape[:-2] + (X_MAX, Y_MAX), dtype=tipo)
+
+    # Cada desplazamiento es una 'rebanada' del arreglo: sumar las rebanadas
+    # equivale a contar los vecinos de todas las células a la vez.
+    for dx, dy in desplazamientos:
+        conteo += acolchado[..., halo + dx:halo + dx + X_MAX, halo + dy:halo + dy + Y_MAX]
+    return conteo
+
+
+def aplicar_regla_conway(estado: np.ndarray, conteo: np.ndarray) -> np.ndarray:
+    """
+    Aplica la Regla de Conway (B3/S23) a todo el arreglo de una vez.
+
+    Args:
+        estado: El estado actual (0 o 1) de cada célula.
+        conteo: El número de vecinos vivos de cada célula.
+
+    Returns:
+        El estado de la siguiente generación como arreglo uint8.
+    """
+    # Nace con 3 vecinos; sobrevive con 2 si ya estaba viva.
+    siguiente = (conteo == 3) | ((conteo == 2) & (estado == 1))
+    return siguiente.view(np.uint8)
+
+
+class JuegoDeLaVidaVectorizado(AutomataCelular):
+    """
+    Implementación vectorizada del Juego de la Vida sobre un LatticeNumpy.
+
+    En lugar de recorrer célula por célula, calcula los conteos de vecinos de toda
+    la retícula mediante sumas de rebanadas del arreglo y aplica la regla de Conway
+    con operaciones booleanas. El halo lo construye en bloque la Condición de
+    Frontera inyectada ('acolchar'), por lo que el resultado coincide con el de
+    JuegoDeLaVida bajo la misma frontera.
+    """
+
+    def __init__(self, ocupacion: float, estrategia_vecindad: IEstrategiaVecindad,
+                 condicion_frontera: ICondicionFrontera,
+                 lattice: LatticeNumpy,
+                 dimensiones: Tuple[int, int]):
+        """
+        Constructor que inicializa el motor, pasando todas las abstracciones
+        requeridas a su clase base.
+        """
+        super().__init__(ocupacion, estrategia_vecindad, condicion_frontera, lattice, dimensiones)
+
+    def avanzar_generacion(self):
+        """
+        Calcula la siguiente generación de toda la retícula en operaciones de arreglo.
+        """
+        arreglo = self.lattice.obtener_arreglo()
+
+        # 1. Construye el arreglo con halo según la Condición de Frontera.
+        acolchado = self.condicion_frontera.acolchar(arreglo)
+
+        # 2. Cuenta los vecinos de todas las células a la vez.
+        conteo = contar_vecinos_acolchado(acolchado, self.estrategia_vecindad.obtener_desplazamientos())
+
+        # 3. Aplica la regla y publica la nueva generación en el Lattice.
+        siguiente = aplicar_regla_conway(arreglo, conteo)
+        self.lattice.establecer_arreglo(siguiente)
+        self._registrar_arreglos(arreglo, siguiente)
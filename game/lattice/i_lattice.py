@@ -49,4 +49,17 @@ class ILattice(ABC):
             celula: La coordenada (x, y) de la célula a actualizar.
             nuevo_estado: El nuevo estado (valor) a asignar.
         """
+        pass
+
+    @abstractmethod
+    def obtener_instantanea(self) -> Dict[Tuple[int, int], Any]:
+        """
+        Devuelve una copia inmutable del estado actual (coordenada -> estado).
+        
+        A diferencia de 'obtener_estado()', el resultado no cambia cuando el
+        Lattice avanza, por lo que puede entregarse a otro hilo (ej., la Vista).
+        
+        Returns:
+            Un objeto de solo lectura con interfaz de diccionario.
+        """
         pass
\ No newline at end of file
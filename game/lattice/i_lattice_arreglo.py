@@ -0,0 +1,31 @@
+from abc import abstractmethod
+from typing import Any
+from .i_lattice import ILattice
+
+class ILatticeArreglo(ILattice):
+    """
+    Interfaz para los Lattices que almacenan su estado en un arreglo denso (X_MAX, Y_MAX).
+    
+    Extiende ILattice con el acceso en bloque que necesitan los motores
+    vectorizados, sin que estos dependan de una implementación concreta.
+    """
+    
+    @abstractmethod
+    def obtener_arreglo(self) -> Any:
+        """
+        Devuelve el arreglo (X_MAX, Y_MAX) que almacena el estado.
+        
+        Returns:
+            El arreglo interno (sin copia).
+        """
+        pass
+    
+    @abstractmethod
+    def establecer_arreglo(self, arreglo: Any):
+        """
+        Reemplaza el estado completo por un nuevo arreglo de la misma forma.
+        
+        Args:
+            arreglo: El nuevo estado con forma (X_MAX, Y_MAX).
+        """
+        pass
@@ -0,0 +1,35 @@
+from abc import abstractmethod
+from typing import Tuple, Dict, Any
+from .i_lattice import ILattice
+
+class ILatticeDobleBuffer(ILattice):
+    """
+    Interfaz para los Lattices con doble búfer: uno con la generación actual y otro
+    donde el motor escribe la siguiente.
+
+    El motor lee solo de 'obtener_estado()', escribe cada célula en
+    'obtener_estado_siguiente()' y publica el resultado con 'intercambiar()',
+    que solo cambia qué búfer es el actual. No hacen falta estados temporales
+    ni una segunda pasada, y 'obtener_instantanea()' puede entregar la última
+    generación completa sin copiarla.
+    """
+
+    @abstractmethod
+    def obtener_estado_siguiente(self) -> Dict[Tuple[int, int], Any]:
+        """
+        Devuelve el búfer donde se escribe la siguiente generación.
+
+        Su contenido es indefinido (puede ser el de una generación antigua o estar
+        vacío): el motor debe escribir todas las células antes de 'intercambiar()'.
+
+        Returns:
+            Un diccionario escribible (coordenada -> estado).
+        """
+        pass
+
+    @abstractmethod
+    def intercambiar(self):
+        """
+        Publica el búfer siguiente como generación actual.
+        """
+        pass
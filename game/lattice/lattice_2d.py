@@ -1,7 +1,11 @@
 import random
-from typing import Tuple, Dict, Any
+from types import MappingProxyType
+from typing import Tuple, Dict, Any, Optional
 from .i_lattice import ILattice 
 
+# Filas pedidas al generador del estado inicial en cada bloque.
+FILAS_POR_BLOQUE_INICIALIZACION = 256
+
 class Lattice2d(ILattice):
     """
     Implementación concreta de ILattice para una retícula bidimensional.
@@ -11,10 +15,16 @@ class Lattice2d(ILattice):
     son el estado de la célula.
     """
 
-    def __init__(self):
+    def __init__(self, semilla: Optional[int] = None, generador: Optional[Any] = None):
         """
         Constructor que inicializa el estado interno del lattice.
+        
+        Args:
+            semilla: Semilla del generador aleatorio (None = no reproducible).
+            generador: Un IGeneradorEstadoInicial (None = sorteo con 'random', sin NumPy).
         """
+        self._generador = random.Random(semilla)
+        self._generador_inicial = generador
         self._dimensiones: Tuple[int, int] = (0, 0)
         self._estado: Dict[Tuple[int, int], Any] = {}
         
@@ -29,11 +39,20 @@ class Lattice2d(ILattice):
         self._dimensiones = dimensiones
         X_MAX, Y_MAX = dimensiones
         
+        if self._generador_inicial is not None:
+            # Estado generado por bloques de filas (arreglos NumPy) y volcado al diccionario.
+            for inicio in range(0, X_MAX, FILAS_POR_BLOQUE_INICIALIZACION):
+                fin = min(inicio + FILAS_POR_BLOQUE_INICIALIZACION, X_MAX)
+                filas = self._generador_inicial.generar_filas(inicio, fin, dimensiones, ocupacion_inicial)
+                for x, fila in enumerate(filas.tolist(), start=inicio):
+                    self._estado.update(zip([(x, y) for y in range(Y_MAX)], fila))
+            return
+        
         # Generación aleatoria del estado inicial de cada célula.
         for x in range(X_MAX):
             for y in range(Y_MAX):
                 # Asigna 1 (vivo) o 0 (muerto) según la probabilidad de ocupación.
-                inicial = 1 if random.random() < ocupacion_inicial else 0
+                inicial = 1 if self._generador.random() < ocupacion_inicial else 0
                 self._estado[(x, y)] = inicial
 
     def obtener_dimensiones(self) -> Tuple[int, int]:
@@ -62,4 +81,13 @@ class Lattice2d(ILattice):
             celula: La coordenada (x, y) de la célula a actualizar.
             nuevo_estado: El nuevo valor de estado (ej., 0, 1, 2, -1).
         """
-        self._estado[celula] = nuevo_estado
\ No newline at end of file
+        self._estado[celula] = nuevo_estado
+
+    def obtener_instantanea(self) -> Dict[Tuple[int, int], Any]:
+        """
+        Devuelve una copia inmutable del estado actual.
+        
+        Returns:
+            Una vista de solo lectura (MappingProxyType) sobre una copia del diccionario.
+        """
+        return MappingProxyType(dict(self._estado))
\ No newline at end of file
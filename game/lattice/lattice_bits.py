@@ -0,0 +1,223 @@
+import numpy as np
+from typing import Tuple, Dict, Any, Optional
+from .i_lattice import ILattice
+from .vista_estado import VistaEstado
+from ..inicializacion.i_generador_estado_inicial import IGeneradorEstadoInicial
+from ..inicializacion.generador_aleatorio import GeneradorAleatorio
+
+# Número de células almacenadas en cada palabra de máquina.
+BITS_POR_PALABRA = 64
+
+# Filas generadas por bloque durante la inicialización aleatoria (limita la memoria temporal).
+FILAS_POR_BLOQUE_INICIALIZACION = 512
+
+
+def empaquetar_filas(filas: np.ndarray, palabras_por_fila: int) -> np.ndarray:
+    """
+    Empaqueta un arreglo booleano/uint8 (R, Y_MAX) en palabras uint64 (R, W).
+
+    La célula y de una fila ocupa el bit (y % 64) de la palabra (y // 64).
+
+    Args:
+        filas: El estado de R filas completas (0 o 1 por célula).
+        palabras_por_fila: El número de palabras W de cada fila empaquetada.
+
+    Returns:
+        Un arreglo uint64 con forma (R, W); los bits de relleno quedan en 0.
+    """
+    octetos = np.packbits(filas.astype(bool, copy=False), axis=1, bitorder="little")
+    relleno = palabras_por_fila * 8 - octetos.shape[1]
+    if relleno:
+        octetos = np.pad(octetos, ((0, 0), (0, relleno)))
+    return np.ascontiguousarray(octetos).view("<u8").astype(np.uint64, copy=False)
+
+
+def desempaquetar_filas(palabras: np.ndarray, Y_MAX: int) -> np.ndarray:
+    """
+    Operación inversa de 'empaquetar_filas'.
+
+    Args:
+        palabras: Un arreglo uint64 con forma (R, W).
+        Y_MAX: El número de células reales de cada fila.
+
+    Returns:
+        Un arreglo uint8 con forma (R, Y_MAX).
+    """
+    octetos = np.ascontiguousarray(palabras.astype("<u8", copy=False)).view(np.uint8)
+    return np.unpackbits(octetos, axis=1, count=Y_MAX, bitorder="little")
+
+
+def extraer_celulas(palabras: np.ndarray, filas: np.ndarray, columnas: np.ndarray) -> np.ndarray:
+    """
+    Lee las células del cruce de las filas y columnas dadas sin desempaquetar filas completas.
+
+    Solo se leen las palabras que contienen las células pedidas: el coste
+    depende del tamaño del resultado y no del de las filas (con palabras
+    mapeadas en memoria, solo se tocan esas páginas del archivo).
+
+    Args:
+        palabras: Un arreglo uint64 con forma (R, W).
+        filas: Índices de fila (x).
+        columnas: Índices de columna (y).
+
+    Returns:
+        Un arreglo uint8 con forma (len(filas), len(columnas)).
+    """
+    columnas = np.asarray(columnas, dtype=np.intp)
+    seleccion = palabras[np.ix_(np.asarray(filas, dtype=np.intp), columnas >> 6)]
+    return ((seleccion >> (columnas & 63).astype(np.uint64)) & np.uint64(1)).astype(np.uint8)
+
+
+class LatticeBits(ILattice):
+    """
+    Implementación concreta de ILattice con el estado empaquetado a nivel de bit.
+
+    Cada fila x del Lattice se guarda como W = ceil(Y_MAX / 64) palabras uint64, es
+    decir, 64 células por palabra de máquina. Un tablero de 20000x20000 ocupa
+    unos 50 MB. Esta representación la aprovecha JuegoDeLaVidaBits, que calcula
+    la siguiente generación con lógica de sumadores bit a bit sobre palabras completas.
+    """
+
+    def __init__(self, semilla: Optional[int] = None,
+                 generador: Optional[IGeneradorEstadoInicial] = None):
+        """
+        Constructor que inicializa el estado interno del lattice.
+
+        Args:
+            semilla: Semilla del generador aleatorio (None = no reproducible).
+            generador: Generador del estado inicial (None = GeneradorAleatorio con 'semilla').
+        """
+        self._generador = generador if generador is not None else GeneradorAleatorio(semilla)
+        self._dimensiones: Tuple[int, int] = (0, 0)
+        self._palabras: np.ndarray = np.zeros((0, 0), dtype=np.uint64)
+
+    def inicializar(self, dimensiones: Tuple[int, int], ocupacion_inicial: float):
+        """
+        Inicializa el lattice con sus dimensiones y el estado del generador.
+
+        La generación se hace por bloques de filas para no materializar nunca
+        el tablero completo a razón de un byte (o más) por célula.
+
+        Args:
+            dimensiones: La tupla (X_MAX, Y_MAX) que define el tamaño del lattice.
+            ocupacion_inicial: La probabilidad (0.0 a 1.0) de que una célula esté viva (1).
+        """
+        self._dimensiones = dimensiones
+        X_MAX, Y_MAX = dimensiones
+        palabras_por_fila = -(-Y_MAX // BITS_POR_PALABRA)
+        self._palabras = self._reservar_palabras((X_MAX, palabras_por_fila))
+        if ocupacion_inicial <= 0 and isinstance(self._generador, GeneradorAleatorio):
+            # Tablero vacío (ej., antes de restaurar un estado guardado): no hay nada que sortear.
+            return
+
+        for inicio in range(0, X_MAX, FILAS_POR_BLOQUE_INICIALIZACION):
+            fin = min(inicio + FILAS_POR_BLOQUE_INICIALIZACION, X_MAX)
+            bloque = self._generador.generar_filas(inicio, fin, dimensiones, ocupacion_inicial)
+            self._palabras[inicio:fin] = empaquetar_filas(bloque, palabras_por_fila)
+
+    def _reservar_palabras(self, forma: Tuple[int, int]) -> np.ndarray:
+        """
+        Reserva el almacenamiento (a cero) de las palabras con forma (X_MAX, W).
+
+        Las subclases lo sobrescriben para guardar el estado en otro medio (ej., un archivo mapeado).
+        """
+        return np.zeros(forma, dtype=np.uint64)
+
+    def obtener_dimensiones(self) -> Tuple[int, int]:
+        """
+        Devuelve las dimensiones (X_MAX, Y_MAX) del Lattice.
+
+        Returns:
+            Una tupla con las dimensiones del lattice.
+        """
+        return self._dimensiones
+
+    def obtener_estado(self) -> Dict[Tuple[int, int], Any]:
+        """
+        Devuelve una vista de solo lectura (coordenada -> estado) sobre los bits.
+
+        Returns:
+            Un objeto con interfaz de diccionario que lee directamente de las palabras.
+        """
+        return VistaEstado(self._dimensiones, self._leer, self.a_arreglo,
+                           lambda filas, columnas: extraer_celulas(self._palabras, filas, columnas))
+
+    def obtener_instantanea(self) -> Dict[Tuple[int, int], Any]:
+        """
+        Devuelve una copia inmutable del estado actual.
+
+        Returns:
+            Una VistaEstado sobre una copia de las palabras marcada como no escribible.
+        """
+        copia = self._palabras.copy()
+        copia.setflags(write=False)
+        Y_MAX = self._dimensiones[1]
+        return VistaEstado(
+            self._dimensiones,
+            lambda x, y: int(copia[x, y >> 6] >> np.uint64(y & 63)) & 1,
+            lambda: desempaquetar_filas(copia, Y_MAX),
+            lambda filas, columnas: extraer_celulas(copia, filas, columnas)
+        )
+
+    def _leer(self, x: int, y: int) -> int:
+        """
+        Devuelve el bit correspondiente a la célula (x, y).
+        """
+        return int(self._palabras[x, y >> 6] >> np.uint64(y & 63)) & 1
+
+    def actualizar_estado(self, celula: Tuple[int, int], nuevo_estado: Any):
+        """
+        Asigna un nuevo estado a una célula específica.
+
+        Args:
+            celula: La coordenada (x, y) de la célula a actualizar.
+            nuevo_estado: El nuevo valor de estado (0 o 1; cualquier valor distinto de 0 es vivo).
+        """
+        x, y = celula
+        bit = np.uint64(1) << np.uint64(y & 63)
+        if nuevo_estado:
+            self._palabras[x, y >> 6] |= bit
+        else:
+            self._palabras[x, y >> 6] &= ~bit
+
+    def obtener_palabras(self) -> np.ndarray:
+        """
+        Devuelve el arreglo uint64 (X_MAX, W) que almacena el estado empaquetado.
+
+        Returns:
+            El arreglo interno (sin copia).
+        """
+        return self._palabras
+
+    def establecer_palabras(self, palabras: np.ndarray):
+        """
+        Reemplaza el estado completo por un nuevo arreglo empaquetado.
+
+        Args:
+            palabras: El nuevo estado con forma (X_MAX, W).
+
+        Raises:
+            ValueError: Si la forma del arreglo no coincide con las dimensiones.
+        """
+        if palabras.shape != self._palabras.shape:
+            raise ValueError(
+                f"Forma {palabras.shape} incompatible con la forma empaquetada {self._palabras.shape}."
+            )
+        self._palabras = palabras
+
+    def a_arreglo(self) -> np.ndarray:
+        """
+        Devuelve una copia desempaquetada del estado como arreglo uint8 (X_MAX, Y_MAX).
+        """
+        return desempaquetar_filas(self._palabras, self._dimensiones[1])
+
+    def desde_arreglo(self, arreglo: np.ndarray):
+        """
+        Carga el estado desde un arreglo (X_MAX, Y_MAX) de ceros y unos.
+
+        Args:
+            arreglo: El estado desempaquetado a cargar.
+        """
+        self._dimensiones = (arreglo.shape[0], arreglo.shape[1])
+        palabras_por_fila = -(-arreglo.shape[1] // BITS_POR_PALABRA)
+        self._palabras = empaquetar_filas(arreglo, palabras_por_fila)
@@ -0,0 +1,209 @@
+import random
+from typing import Tuple, Dict, Any, Optional
+from .i_lattice import ILattice
+from .vista_estado import VistaEstado
+
+# Filas pedidas al generador del estado inicial en cada bloque.
+FILAS_POR_BLOQUE_INICIALIZACION = 256
+
+class LatticeDisperso(ILattice):
+    """
+    Implementación concreta de ILattice que almacena solo las células no muertas.
+
+    El estado es un diccionario (x, y) -> estado con una entrada por célula viva,
+    de modo que la memoria es proporcional a la población y no al área. Las
+    coordenadas son absolutas y no están limitadas: con CondicionFronteraIlimitada
+    un planeador puede alejarse sin fin del tablero inicial.
+
+    Las dimensiones describen una ventana (X_MAX, Y_MAX) con su esquina en
+    'origen'. Los métodos de ILattice ('obtener_estado', 'actualizar_estado',
+    'obtener_instantanea') trabajan en coordenadas de la ventana, de modo que
+    PygameView, la persistencia y el resto de consumidores ven una retícula
+    normal de X_MAX x Y_MAX; los motores dispersos usan 'obtener_celulas_vivas'.
+    """
+
+    def __init__(self, semilla: Optional[int] = None, generador: Optional[Any] = None):
+        """
+        Constructor que inicializa el estado interno del lattice.
+
+        Args:
+            semilla: Semilla del generador aleatorio (None = no reproducible).
+            generador: Un IGeneradorEstadoInicial (None = sorteo con 'random', sin NumPy).
+        """
+        self._generador = random.Random(semilla)
+        self._generador_inicial = generador
+        self._dimensiones: Tuple[int, int] = (0, 0)
+        self._origen: Tuple[int, int] = (0, 0)
+        self._vivas: Dict[Tuple[int, int], int] = {}
+
+    def inicializar(self, dimensiones: Tuple[int, int], ocupacion_inicial: float):
+        """
+        Fija la ventana y siembra el estado inicial dentro de ella.
+
+        Args:
+            dimensiones: La tupla (X_MAX, Y_MAX) de la ventana (y de la zona sembrada).
+            ocupacion_inicial: La probabilidad (0.0 a 1.0) de que una célula esté viva (1).
+        """
+        self._dimensiones = dimensiones
+        self._origen = (0, 0)
+        self._vivas = {}
+        X_MAX, Y_MAX = dimensiones
+
+        if self._generador_inicial is not None:
+            # Solo se conservan las células no muertas de cada bloque de filas.
+            for inicio in range(0, X_MAX, FILAS_POR_BLOQUE_INICIALIZACION):
+                fin = min(inicio + FILAS_POR_BLOQUE_INICIALIZACION, X_MAX)
+                filas = self._generador_inicial.generar_filas(inicio, fin, dimensiones, ocupacion_inicial)
+                xs, ys = filas.nonzero()
+                self._vivas.update(zip(zip((xs + inicio).tolist(), ys.tolist()), filas[xs, ys].tolist()))
+            return
+
+        if ocupacion_inicial <= 0:
+            return
+        for x in range(X_MAX):
+            for y in range(Y_MAX):
+                if self._generador.random() < ocupacion_inicial:
+                    self._vivas[(x, y)] = 1
+
+    def obtener_dimensiones(self) -> Tuple[int, int]:
+        """
+        Devuelve las dimensiones (X_MAX, Y_MAX) de la ventana.
+
+        Returns:
+            Una tupla con las dimensiones de la ventana.
+        """
+        return self._dimensiones
+
+    def _vista(self, vivas: Dict[Tuple[int, int], int]) -> VistaEstado:
+        """
+        Crea una VistaEstado de la ventana actual sobre el diccionario dado.
+        """
+        ox, oy = self._origen
+        obtener = vivas.get
+        return VistaEstado(self._dimensiones, lambda x, y: obtener((ox + x, oy + y), 0),
+                           lambda: self._ventana_como_arreglo(vivas, (ox, oy)),
+                           lambda filas, columnas: self._region_como_arreglo(vivas, (ox, oy), filas, columnas))
+
+    def _ventana_como_arreglo(self, vivas: Dict[Tuple[int, int], int], origen: Tuple[int, int]) -> Any:
+        """
+        Vuelca las células de la ventana en un arreglo uint8 (X_MAX, Y_MAX).
+
+        Solo se recorren las células vivas, no toda la ventana.
+        """
+        import numpy as np  # Importación diferida: solo la necesitan los consumidores en bloque.
+        X_MAX, Y_MAX = self._dimensiones
+        ox, oy = origen
+        arreglo = np.zeros((X_MAX, Y_MAX), dtype=np.uint8)
+        for (x, y), estado in vivas.items():
+            x -= ox
+            y -= oy
+            if 0 <= x < X_MAX and 0 <= y < Y_MAX:
+                arreglo[x, y] = estado
+        return arreglo
+
+    def _region_como_arreglo(self, vivas: Dict[Tuple[int, int], int], origen: Tuple[int, int],
+                             filas: Any, columnas: Any) -> Any:
+        """
+        Vuelca las células del cruce de 'filas' y 'columnas' (de la ventana) en un arreglo uint8.
+
+        Igual que '_ventana_como_arreglo', solo se recorren las células vivas.
+        """
+        import numpy as np
+        # Se trabaja con las filas y columnas distintas (ordenadas) y al final se repiten las pedidas.
+        filas, orden_filas = np.unique(np.asarray(filas, dtype=np.intp), return_inverse=True)
+        columnas, orden_columnas = np.unique(np.asarray(columnas, dtype=np.intp), return_inverse=True)
+        region = np.zeros((len(filas), len(columnas)), dtype=np.uint8)
+        if vivas and len(filas) and len(columnas):
+            ox, oy = origen
+            coordenadas = np.array(list(vivas.keys()), dtype=np.intp)
+            estados = np.fromiter(vivas.values(), dtype=np.uint8, count=len(vivas))
+            xs, ys = coordenadas[:, 0] - ox, coordenadas[:, 1] - oy
+            i = np.searchsorted(filas, xs).clip(0, len(filas) - 1)
+            j = np.searchsorted(columnas, ys).clip(0, len(columnas) - 1)
+            dentro = (filas[i] == xs) & (columnas[j] == ys)
+            region[i[dentro], j[dentro]] = estados[dentro]
+        return region[np.ix_(orden_filas.ravel(), orden_columnas.ravel())]
+
+    def obtener_estado(self) -> Dict[Tuple[int, int], Any]:
+        """
+        Devuelve una vista de solo lectura (coordenada de la ventana -> estado).
+
+        Returns:
+            Un objeto con interfaz de diccionario que lee directamente de las células vivas.
+        """
+        return self._vista(self._vivas)
+
+    def actualizar_estado(self, celula: Tuple[int, int], nuevo_estado: Any):
+        """
+        Asigna un nuevo estado a una célula de la ventana (0 la elimina del almacenamiento).
+
+        Args:
+            celula: La coordenada (x, y) relativa al origen de la ventana.
+            nuevo_estado: El nuevo valor de estado.
+        """
+        absoluta = (self._origen[0] + celula[0], self._origen[1] + celula[1])
+        if nuevo_estado:
+            self._vivas[absoluta] = nuevo_estado
+        else:
+            self._vivas.pop(absoluta, None)
+
+    def obtener_instantanea(self) -> Dict[Tuple[int, int], Any]:
+        """
+        Devuelve una copia inmutable de la ventana actual.
+
+        Returns:
+            Una VistaEstado sobre una copia de las células vivas (coste proporcional a la población).
+        """
+        return self._vista(dict(self._vivas))
+
+    def obtener_celulas_vivas(self) -> Dict[Tuple[int, int], int]:
+        """
+        Devuelve el diccionario (x, y) -> estado de las células no muertas, en coordenadas absolutas.
+
+        Returns:
+            El diccionario interno (sin copia).
+        """
+        return self._vivas
+
+    def establecer_celulas_vivas(self, vivas: Dict[Tuple[int, int], int]):
+        """
+        Reemplaza todas las células no muertas (coordenadas absolutas).
+
+        Args:
+            vivas: El nuevo diccionario (x, y) -> estado; no debe contener estados 0.
+        """
+        self._vivas = vivas
+
+    def obtener_poblacion(self) -> int:
+        """
+        Devuelve el número de células no muertas (dentro y fuera de la ventana).
+        """
+        return len(self._vivas)
+
+    def obtener_origen(self) -> Tuple[int, int]:
+        """
+        Devuelve la coordenada absoluta de la esquina (0, 0) de la ventana.
+        """
+        return self._origen
+
+    def mover_ventana(self, origen: Tuple[int, int]):
+        """
+        Desplaza la ventana sin modificar las células.
+
+        Args:
+            origen: La nueva coordenada absoluta de la esquina de la ventana.
+        """
+        self._origen = (int(origen[0]), int(origen[1]))
+
+    def caja_envolvente(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Devuelve el rectángulo que contiene todas las células vivas.
+
+        Returns:
+            La tupla (x_min, y_min, x_max, y_max) inclusiva, o None si no hay células vivas.
+        """
+        if not self._vivas:
+            return None
+        xs = [x for x, _ in self._vivas]
+        ys = [y for _, y in self._vivas]
+        return (min(xs), min(ys), max(xs), max(ys))
@@ -0,0 +1,102 @@
+import threading
+from types import MappingProxyType
+from typing import Tuple, Dict, Any, Optional
+from .lattice_2d import Lattice2d
+from .i_lattice_doble_buffer import ILatticeDobleBuffer
+
+class LatticeDobleBuffer(Lattice2d, ILatticeDobleBuffer):
+    """
+    Implementación de ILatticeDobleBuffer sobre dos diccionarios (coordenada -> estado).
+
+    El estado inicial y el acceso por célula son los de Lattice2d; además
+    guarda un segundo diccionario para la siguiente generación, y
+    'intercambiar()' solo intercambia las referencias.
+
+    Las instantáneas no copian nada: 'obtener_instantanea()' devuelve una vista
+    de solo lectura sobre el búfer actual y lo marca como publicado. Un búfer
+    publicado no vuelve a escribirse: en el siguiente intercambio se descarta
+    (el motor recibirá uno nuevo) y, si se modifica una célula desde fuera del
+    motor, antes se copia. Así otro hilo (la Vista, un colector de
+    estadísticas) puede leer la última generación completa mientras el motor
+    calcula la siguiente. El cerrojo solo protege la entrega y el intercambio
+    de referencias: el motor nunca espera a los lectores durante el cálculo.
+    """
+
+    def __init__(self, semilla: Optional[int] = None, generador: Optional[Any] = None):
+        """
+        Constructor que inicializa los dos búferes.
+
+        Args:
+            semilla: Semilla del generador aleatorio (None = no reproducible).
+            generador: Un IGeneradorEstadoInicial (None = sorteo con 'random', sin NumPy).
+        """
+        super().__init__(semilla, generador)
+        self._siguiente: Optional[Dict[Tuple[int, int], Any]] = None
+        self._publicado = False
+        self._cerrojo = threading.Lock()
+
+    def inicializar(self, dimensiones: Tuple[int, int], ocupacion_inicial: float):
+        """
+        Inicializa el búfer actual como Lattice2d y descarta el siguiente.
+
+        Args:
+            dimensiones: La tupla (X_MAX, Y_MAX) que define el tamaño del lattice.
+            ocupacion_inicial: La probabilidad (0.0 a 1.0) de que una célula esté viva (1).
+        """
+        with self._cerrojo:
+            self._estado = {}
+            self._siguiente = None
+            self._publicado = False
+        super().inicializar(dimensiones, ocupacion_inicial)
+
+    def actualizar_estado(self, celula: Tuple[int, int], nuevo_estado: Any):
+        """
+        Asigna un nuevo estado a una célula del búfer actual (copiándolo si está publicado).
+
+        Args:
+            celula: La coordenada (x, y) de la célula a actualizar.
+            nuevo_estado: El nuevo valor de estado.
+        """
+        with self._cerrojo:
+            if self._publicado:
+                self._estado = dict(self._estado)
+                self._publicado = False
+            self._estado[celula] = nuevo_estado
+
+    def obtener_estado_siguiente(self) -> Dict[Tuple[int, int], Any]:
+        """
+        Devuelve el búfer de la siguiente generación (uno nuevo si el anterior fue publicado).
+
+        Returns:
+            Un diccionario escribible; su contenido previo debe sobrescribirse entero.
+        """
+        if self._siguiente is None:
+            self._siguiente = {}
+        return self._siguiente
+
+    def intercambiar(self):
+        """
+        Convierte el búfer siguiente en el actual; el actual se reutiliza solo si no se publicó.
+
+        Raises:
+            RuntimeError: Si no se pidió antes el búfer siguiente.
+        """
+        if self._siguiente is None:
+            raise RuntimeError("No hay una generación siguiente que publicar.")
+        with self._cerrojo:
+            anterior = self._estado
+            self._estado = self._siguiente
+            self._siguiente = None if self._publicado else anterior
+            self._publicado = False
+
+    def obtener_instantanea(self) -> Dict[Tuple[int, int], Any]:
+        """
+        Devuelve la última generación completa sin copiarla.
+
+        Returns:
+            Una vista de solo lectura (MappingProxyType) sobre el búfer actual,
+            que ya no volverá a modificarse.
+        """
+        with self._cerrojo:
+            self._publicado = True
+            return MappingProxyType(self._estado)
@@ -0,0 +1,250 @@
+import mmap
+import os
+import tempfile
+import numpy as np
+from typing import Tuple, Dict, Optional, Any
+from .lattice_bits import LatticeBits, empaquetar_filas, desempaquetar_filas, extraer_celulas
+from .vista_estado import VistaEstado
+from ..inicializacion.i_generador_estado_inicial import IGeneradorEstadoInicial
+from ..persistencia.instantanea_binaria import (CabeceraInstantanea, escribir_cabecera, leer_cabecera,
+                                                 FRONTERA_POR_DEFECTO)
+from ..reglas.regla_transicion import CONWAY
+
+# Filas copiadas por bloque al volcar un estado completo sobre el archivo mapeado.
+FILAS_POR_BLOQUE_COPIA = 1024
+
+# Sufijo del segundo archivo (el que recibe la siguiente generación).
+SUFIJO_SIGUIENTE = ".siguiente"
+
+# Palabras (8 bytes cada una) que una instantánea copia como mucho; si la región
+# pedida es mayor, la instantánea lee directamente del archivo actual.
+PALABRAS_MAXIMAS_INSTANTANEA = 1 << 20
+
+
+class LatticeMapeado(LatticeBits):
+    """
+    LatticeBits cuyo estado vive en un archivo mapeado en memoria, no en la RAM.
+
+    Permite tableros mayores que la memoria disponible: el sistema operativo
+    carga y descarga las páginas del archivo según se recorren. Se usan dos
+    archivos con el formato de las instantáneas binarias (cabecera + palabras
+    empaquetadas): el actual y el que recibe la siguiente generación. Tras cada
+    generación se intercambian, de modo que el archivo actual es en todo momento
+    una instantánea válida que se puede cargar con 'cargar_instantanea'.
+
+    Sin ruta se usan archivos temporales que se borran al cerrar el Lattice.
+    """
+
+    def __init__(self, ruta: Optional[str] = None, semilla: Optional[int] = None,
+                 generador: Optional[IGeneradorEstadoInicial] = None, regla: str = CONWAY):
+        """
+        Constructor que fija los archivos del lattice (se crean al inicializar).
+
+        Args:
+            ruta: El archivo del estado actual (None = temporal); el segundo archivo
+                  es la misma ruta con el sufijo SUFIJO_SIGUIENTE.
+            semilla: Semilla del generador aleatorio (None = no reproducible).
+            generador: Generador del estado inicial (None = GeneradorAleatorio con 'semilla').
+            regla: La regla guardada en la cabecera de los archivos.
+        """
+        super().__init__(semilla, generador)
+        self._temporal = ruta is None
+        if ruta is None:
+            descriptor, ruta = tempfile.mkstemp(suffix=".life")
+            os.close(descriptor)
+        self.ruta = ruta
+        self.ruta_siguiente = ruta + SUFIJO_SIGUIENTE
+        self.regla = regla
+        self.generacion = 0
+        self._desplazamiento = 0
+        self._palabras_siguiente: Optional[np.memmap] = None
+        self._region_instantanea: Optional[Tuple[int, int, int, int]] = None
+
+    @classmethod
+    def abrir(cls, ruta: str) -> "LatticeMapeado":
+        """
+        Abre una instantánea binaria existente como Lattice mapeado (sin copiarla a memoria).
+
+        Args:
+            ruta: La instantánea que pasa a ser el archivo actual (se modificará al avanzar).
+
+        Returns:
+            El Lattice ya inicializado con las dimensiones, la generación y la regla del archivo.
+        """
+        with open(ruta, "rb") as archivo:
+            cabecera, _ = leer_cabecera(archivo)
+        lattice = cls(ruta, regla=cabecera.regla)
+        lattice._dimensiones = cabecera.dimensiones
+        lattice.generacion = cabecera.generacion
+        lattice._palabras = lattice._mapear(ruta, (cabecera.dimensiones[0], cabecera.palabras_por_fila),
+                                            crear=False)
+        lattice._palabras_siguiente = lattice._mapear(lattice.ruta_siguiente, lattice._palabras.shape)
+        return lattice
+
+    def _reservar_palabras(self, forma: Tuple[int, int]) -> np.ndarray:
+        """
+        Crea (a cero) los dos archivos y devuelve el mapeo del actual.
+        """
+        self.generacion = 0
+        self._palabras_siguiente = self._mapear(self.ruta_siguiente, forma)
+        return self._mapear(self.ruta, forma)
+
+    def _mapear(self, ruta: str, forma: Tuple[int, int], crear: bool = True) -> np.memmap:
+        """
+        Mapea (creándolo si se pide) un archivo de instantánea con las palabras (X_MAX, W).
+
+        El archivo nuevo se extiende con 'truncate', de modo que los datos a cero
+        no se escriben en disco hasta que se usan (archivo disperso).
+        """
+        if crear:
+            cabecera = CabeceraInstantanea((forma[0], self._dimensiones[1]), self.generacion,
+                                           self.regla, FRONTERA_POR_DEFECTO)
+            with open(ruta, "wb") as archivo:
+                self._desplazamiento = escribir_cabecera(archivo, cabecera)
+                archivo.truncate(self._desplazamiento + forma[0] * forma[1] * 8)
+        else:
+            with open(ruta, "rb") as archivo:
+                _, self._desplazamiento = leer_cabecera(archivo)
+        palabras = np.memmap(ruta, dtype="<u8", mode="r+", offset=self._desplazamiento, shape=forma)
+        # El motor recorre el archivo de principio a fin: se pide lectura anticipada al sistema.
+        if hasattr(palabras, "_mmap") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            palabras._mmap.madvise(mmap.MADV_SEQUENTIAL)
+        return palabras
+
+    def obtener_palabras_siguiente(self) -> np.memmap:
+        """
+        Devuelve el mapeo del archivo que recibe la siguiente generación.
+        """
+        return self._palabras_siguiente
+
+    def intercambiar(self):
+        """
+        Convierte el archivo de la siguiente generación en el actual (y viceversa).
+
+        La generación avanza en uno y se anota en la cabecera del nuevo archivo actual.
+        """
+        self._palabras, self._palabras_siguiente = self._palabras_siguiente, self._palabras
+        self.ruta, self.ruta_siguiente = self.ruta_siguiente, self.ruta
+        self.generacion += 1
+        cabecera = CabeceraInstantanea(self._dimensiones, self.generacion, self.regla, FRONTERA_POR_DEFECTO)
+        with open(self.ruta, "r+b") as archivo:
+            escribir_cabecera(archivo, cabecera)
+
+    def establecer_palabras(self, palabras: np.ndarray):
+        """
+        Copia un estado empaquetado completo sobre el archivo actual, por bloques de filas.
+
+        Args:
+            palabras: El nuevo estado con forma (X_MAX, W).
+
+        Raises:
+            ValueError: Si la forma del arreglo no coincide con las dimensiones.
+        """
+        if palabras.shape != self._palabras.shape:
+            raise ValueError(
+                f"Forma {palabras.shape} incompatible con la forma empaquetada {self._palabras.shape}."
+            )
+        for inicio in range(0, palabras.shape[0], FILAS_POR_BLOQUE_COPIA):
+            fin = min(inicio + FILAS_POR_BLOQUE_COPIA, palabras.shape[0])
+            self._palabras[inicio:fin] = palabras[inicio:fin]
+
+    def desde_arreglo(self, arreglo: Any):
+        """
+        Carga el estado desde un arreglo (X_MAX, Y_MAX), empaquetándolo sobre el archivo actual por bloques de filas.
+
+        Las dimensiones de un Lattice mapeado se fijan al crear sus archivos, así
+        que el arreglo debe tener las mismas.
+
+        Args:
+            arreglo: El estado desempaquetado a cargar.
+
+        Raises:
+            ValueError: Si la forma del arreglo no coincide con las dimensiones.
+        """
+        if tuple(arreglo.shape) != tuple(self._dimensiones):
+            raise ValueError(f"Forma {arreglo.shape} incompatible con las dimensiones {self._dimensiones}.")
+        palabras_por_fila = self._palabras.shape[1]
+        for inicio in range(0, arreglo.shape[0], FILAS_POR_BLOQUE_COPIA):
+            fin = min(inicio + FILAS_POR_BLOQUE_COPIA, arreglo.shape[0])
+            self._palabras[inicio:fin] = empaquetar_filas(arreglo[inicio:fin], palabras_por_fila)
+
+    def establecer_region_instantanea(self, region: Optional[Tuple[int, int, int, int]]):
+        """
+        Fija las células que copian las instantáneas (ej., la zona visible de la Vista).
+
+        Args:
+            region: La tupla (x_min, y_min, x_max, y_max) inclusiva (None = todo el Lattice).
+        """
+        self._region_instantanea = region
+
+    def obtener_instantanea(self) -> Dict[Tuple[int, int], Any]:
+        """
+        Devuelve una instantánea que solo copia las palabras de la región fijada.
+
+        Copiar el archivo entero en cada cuadro leería todo el tablero del disco
+        aunque la Vista solo muestre una parte. Se copian las filas y palabras de
+        la región (ver 'establecer_region_instantanea') si no superan
+        PALABRAS_MAXIMAS_INSTANTANEA; el resto de células se leen del archivo
+        actual al consultarlas, así que fuera de la región la instantánea puede
+        reflejar una generación posterior.
+
+        Returns:
+            Una VistaEstado sobre la copia de la región y el archivo actual.
+        """
+        X_MAX, Y_MAX = self._dimensiones
+        x_min, y_min, x_max, y_max = self._region_instantanea or (0, 0, X_MAX - 1, Y_MAX - 1)
+        x_min, x_max = max(0, x_min), min(X_MAX - 1, x_max)
+        palabra_min, palabra_max = max(0, y_min) >> 6, (min(Y_MAX - 1, y_max) >> 6) + 1
+        if (x_max - x_min + 1) * (palabra_max - palabra_min) > PALABRAS_MAXIMAS_INSTANTANEA:
+            x_max, palabra_max = x_min - 1, palabra_min
+        copia = np.array(self._palabras[x_min:x_max + 1, palabra_min:palabra_max])
+        copia.setflags(write=False)
+        y_base = palabra_min << 6
+
+        def leer(x: int, y: int) -> int:
+            if x_min <= x <= x_max and palabra_min <= y >> 6 < palabra_max:
+                y -= y_base
+                return int(copia[x - x_min, y >> 6] >> np.uint64(y & 63)) & 1
+            return self._leer(x, y)
+
+        def leer_region(filas: Any, columnas: Any) -> np.ndarray:
+            filas = np.asarray(filas, dtype=np.intp)
+            columnas = np.asarray(columnas, dtype=np.intp)
+            en_filas = (filas >= x_min) & (filas <= x_max)
+            en_columnas = (columnas >> 6 >= palabra_min) & (columnas >> 6 < palabra_max)
+            if en_filas.all() and en_columnas.all():
+                return extraer_celulas(copia, filas - x_min, columnas - y_base)
+            region = extraer_celulas(self._palabras, filas, columnas)
+            region[np.ix_(en_filas, en_columnas)] = extraer_celulas(copia, filas[en_filas] - x_min,
+                                                                    columnas[en_columnas] - y_base)
+            return region
+
+        def a_arreglo() -> np.ndarray:
+            arreglo = desempaquetar_filas(self._palabras, Y_MAX)
+            if copia.size:
+                ancho = min(Y_MAX, palabra_max << 6) - y_base
+                arreglo[x_min:x_max + 1, y_base:y_base + ancho] = desempaquetar_filas(copia, ancho)
+            return arreglo
+
+        return VistaEstado(self._dimensiones, leer, a_arreglo, leer_region)
+
+    def sincronizar(self):
+        """
+        Escribe en disco las páginas modificadas del archivo actual.
+        """
+        if isinstance(self._palabras, np.memmap):
+            self._palabras.flush()
+
+    def cerrar(self):
+        """
+        Sincroniza y libera los mapeos; los archivos temporales se borran.
+
+        El archivo actual (si no es temporal) queda como instantánea de la última generación.
+        """
+        self.sincronizar()
+        self._palabras = np.zeros((0, 0), dtype=np.uint64)
+        self._palabras_siguiente = None
+        if self._temporal:
+            for ruta in (self.ruta, self.ruta_siguiente):
+                if os.path.exists(ruta):
+                    os.remove(ruta)
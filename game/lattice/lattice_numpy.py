@@ -0,0 +1,124 @@
+import numpy as np
+from typing import Tuple, Dict, Any, Optional
+from .i_lattice_arreglo import ILatticeArreglo
+from .vista_estado import VistaEstado
+from ..inicializacion.i_generador_estado_inicial import IGeneradorEstadoInicial
+from ..inicializacion.generador_aleatorio import GeneradorAleatorio
+
+# Filas pedidas al generador del estado inicial en cada bloque (limita la memoria temporal).
+FILAS_POR_BLOQUE_INICIALIZACION = 512
+
+class LatticeNumpy(ILatticeArreglo):
+    """
+    Implementación concreta de ILatticeArreglo respaldada por un arreglo NumPy denso.
+
+    El estado se guarda en un arreglo contiguo de tipo uint8 con forma (X_MAX, Y_MAX),
+    de modo que la célula (x, y) corresponde a 'arreglo[x, y]'. Esta representación
+    permite que los motores vectorizados (ej., JuegoDeLaVidaVectorizado) procesen
+    toda la retícula en unas pocas operaciones de arreglo.
+
+    Nota: uint8 no admite el estado temporal -1 que usa JuegoDeLaVida; este Lattice
+    está pensado para los motores que calculan la generación completa de una vez.
+    """
+
+    def __init__(self, semilla: Optional[int] = None,
+                 generador: Optional[IGeneradorEstadoInicial] = None):
+        """
+        Constructor que inicializa el estado interno del lattice.
+
+        Args:
+            semilla: Semilla del generador aleatorio (None = no reproducible).
+            generador: Generador del estado inicial (None = GeneradorAleatorio con 'semilla').
+        """
+        self._generador = generador if generador is not None else GeneradorAleatorio(semilla)
+        self._dimensiones: Tuple[int, int] = (0, 0)
+        self._arreglo: np.ndarray = np.zeros((0, 0), dtype=np.uint8)
+
+    def inicializar(self, dimensiones: Tuple[int, int], ocupacion_inicial: float):
+        """
+        Inicializa el lattice con sus dimensiones y el estado del generador.
+
+        El arreglo final se reserva una sola vez y se rellena por bloques de
+        filas, de modo que la memoria temporal no depende del tamaño del tablero.
+
+        Args:
+            dimensiones: La tupla (X_MAX, Y_MAX) que define el tamaño del lattice.
+            ocupacion_inicial: La probabilidad (0.0 a 1.0) de que una célula esté viva (1).
+        """
+        self._dimensiones = dimensiones
+        self._arreglo = np.zeros(dimensiones, dtype=np.uint8)
+        if ocupacion_inicial <= 0 and isinstance(self._generador, GeneradorAleatorio):
+            # Tablero vacío (ej., antes de restaurar un estado guardado): no hay nada que sortear.
+            return
+
+        X_MAX = dimensiones[0]
+        for inicio in range(0, X_MAX, FILAS_POR_BLOQUE_INICIALIZACION):
+            fin = min(inicio + FILAS_POR_BLOQUE_INICIALIZACION, X_MAX)
+            self._arreglo[inicio:fin] = self._generador.generar_filas(inicio, fin, dimensiones, ocupacion_inicial)
+
+    def obtener_dimensiones(self) -> Tuple[int, int]:
+        """
+        Devuelve las dimensiones (X_MAX, Y_MAX) del Lattice.
+
+        Returns:
+            Una tupla con las dimensiones del lattice.
+        """
+        return self._dimensiones
+
+    def obtener_estado(self) -> Dict[Tuple[int, int], Any]:
+        """
+        Devuelve una vista de solo lectura (coordenada -> estado) sobre el arreglo.
+
+        Returns:
+            Un objeto con interfaz de diccionario que lee directamente del arreglo.
+        """
+        return VistaEstado(self._dimensiones, lambda x, y: int(self._arreglo[x, y]),
+                           lambda: self._arreglo,
+                           lambda filas, columnas: self._arreglo[np.ix_(filas, columnas)])
+
+    def obtener_instantanea(self) -> Dict[Tuple[int, int], Any]:
+        """
+        Devuelve una copia inmutable del estado actual.
+
+        Returns:
+            Una VistaEstado sobre una copia del arreglo marcada como no escribible.
+        """
+        copia = self._arreglo.copy()
+        copia.setflags(write=False)
+        return VistaEstado(self._dimensiones, lambda x, y: int(copia[x, y]), lambda: copia,
+                           lambda filas, columnas: copia[np.ix_(filas, columnas)])
+
+    def actualizar_estado(self, celula: Tuple[int, int], nuevo_estado: Any):
+        """
+        Asigna un nuevo estado a una célula específica.
+
+        Args:
+            celula: La coordenada (x, y) de la célula a actualizar.
+            nuevo_estado: El nuevo valor de estado (0 a 255).
+        """
+        self._arreglo[celula] = nuevo_estado
+
+    def obtener_arreglo(self) -> np.ndarray:
+        """
+        Devuelve el arreglo uint8 (X_MAX, Y_MAX) que almacena el estado.
+
+        Returns:
+            El arreglo interno (sin copia).
+        """
+        return self._arreglo
+
+    def establecer_arreglo(self, arreglo: np.ndarray):
+        """
+        Reemplaza el estado completo por un nuevo arreglo de la misma forma.
+
+        Args:
+            arreglo: El nuevo estado con forma (X_MAX, Y_MAX).
+
+        Raises:
+            ValueError: Si la forma del arreglo no coincide con las dimensiones.
+        """
+        if arreglo.shape != tuple(self._dimensiones):
+            raise ValueError(
+                f"Forma {arreglo.shape} incompatible con las dimensiones {self._dimensiones}."
+            )
+        self._arreglo = np.ascontiguousarray(arreglo, dtype=np.uint8)
@@ -0,0 +1,95 @@
+from collections.abc import Mapping
+from typing import Tuple, Callable, Iterator, Optional, Any
+
+class VistaEstado(Mapping):
+    """
+    Vista de solo lectura con forma de diccionario sobre un Lattice no basado en dict.
+
+    Permite que las implementaciones de ILattice que almacenan el estado en
+    arreglos (ej., LatticeNumpy) sigan cumpliendo el contrato de 'obtener_estado()',
+    de modo que los consumidores existentes (VecindadMoore, PygameView) puedan
+    leer las células por coordenada (x, y) sin conocer el almacenamiento real.
+    """
+
+    def __init__(self, dimensiones: Tuple[int, int], leer: Callable[[int, int], int],
+                 a_arreglo: Optional[Callable[[], Any]] = None,
+                 leer_region: Optional[Callable[[Any, Any], Any]] = None):
+        """
+        Constructor que recibe las dimensiones y la función de lectura del Lattice.
+
+        Args:
+            dimensiones: La tupla (X_MAX, Y_MAX) del Lattice representado.
+            leer: Función que devuelve el estado de la célula (x, y) como entero.
+            a_arreglo: Función opcional que devuelve todo el estado como arreglo
+                       (X_MAX, Y_MAX), para consumidores que procesan en bloque.
+            leer_region: Función opcional (filas, columnas) -> arreglo que lee solo las
+                         células pedidas (ver 'leer_region').
+        """
+        self._dimensiones = dimensiones
+        self._leer = leer
+        self._a_arreglo = a_arreglo
+        self._leer_region = leer_region
+
+    def __getitem__(self, celula: Tuple[int, int]) -> int:
+        """
+        Devuelve el estado de la célula, o lanza KeyError si está fuera del Lattice.
+
+        Args:
+            celula: La coordenada (x, y) a consultar.
+
+        Returns:
+            El estado de la célula como entero de Python.
+        """
+        x, y = celula
+        X_MAX, Y_MAX = self._dimensiones
+        if not (0 <= x < X_MAX and 0 <= y < Y_MAX):
+            raise KeyError(celula)
+        return self._leer(x, y)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        """
+        Recorre las coordenadas en el mismo orden que Lattice2d (x exterior, y interior).
+        """
+        X_MAX, Y_MAX = self._dimensiones
+        for x in range(X_MAX):
+            for y in range(Y_MAX):
+                yield (x, y)
+
+    def __len__(self) -> int:
+        """
+        Devuelve el número total de células del Lattice.
+        """
+        X_MAX, Y_MAX = self._dimensiones
+        return X_MAX * Y_MAX
+
+    def a_arreglo(self) -> Any:
+        """
+        Devuelve el estado completo como arreglo (X_MAX, Y_MAX), sin recorrer célula a célula.
+
+        Raises:
+            NotImplementedError: Si el Lattice no proporcionó un acceso en bloque.
+        """
+        if self._a_arreglo is None:
+            raise NotImplementedError("Este Lattice no ofrece acceso en bloque a su estado.")
+        return self._a_arreglo()
+
+    def leer_region(self, filas: Any, columnas: Any) -> Any:
+        """
+        Devuelve el estado de las células en el cruce de las filas y columnas dadas.
+
+        Es el acceso de los consumidores que solo necesitan una parte del tablero
+        (ej., la zona visible de PygameView, o una muestra de ella): con un
+        lector propio, el coste depende del número de células pedidas y no del
+        tamaño del Lattice. Sin él, se recorta 'a_arreglo()'.
+
+        Args:
+            filas: Arreglo de índices x (dentro del Lattice).
+            columnas: Arreglo de índices y (dentro del Lattice).
+
+        Returns:
+            Un arreglo uint8 con forma (len(filas), len(columnas)).
+        """
+        if self._leer_region is not None:
+            return self._leer_region(filas, columnas)
+        import numpy as np  # Importación diferida: solo la necesitan los consumidores en bloque.
+        return np.asarray(self.a_arreglo(), dtype=np.uint8)[np.ix_(filas, columnas)]
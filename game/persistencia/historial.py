@@ -0,0 +1,175 @@
+import os
+import numpy as np
+from typing import Tuple, Optional
+from ..lattice.i_lattice import ILattice
+from ..reglas.regla_transicion import CONWAY
+from .instantanea_binaria import (CabeceraInstantanea, escribir_cabecera, leer_cabecera,
+                                  palabras_de_lattice, validar_regla_empaquetable,
+                                  FRONTERA_POR_DEFECTO)
+
+# Identificador de los archivos de historial (8 bytes al inicio del archivo).
+MAGIA_HISTORIAL = b"LIFEHST1"
+
+
+def _tipo_registro(cabecera: CabeceraInstantanea) -> np.dtype:
+    """
+    Devuelve el tipo estructurado de un registro: generación + palabras empaquetadas.
+    """
+    forma = (cabecera.dimensiones[0], cabecera.palabras_por_fila)
+    return np.dtype([("generacion", "<u8"), ("palabras", "<u8", forma)])
+
+
+class EscritorHistorial:
+    """
+    Añade instantáneas empaquetadas a un único archivo de historial cada N generaciones.
+
+    El archivo tiene una cabecera (la de las instantáneas, con la generación a 0)
+    seguida de registros de tamaño fijo: la generación (uint64) y el estado con
+    la disposición de LatticeBits. Al tener tamaño fijo, LectorHistorial accede
+    a cualquier registro directamente desde un mapeo en memoria.
+
+    Si el archivo ya existe con las mismas dimensiones, los registros nuevos se
+    añaden al final (un registro incompleto, por ejemplo tras una interrupción,
+    se descarta antes de continuar).
+    """
+
+    def __init__(self, ruta: str, dimensiones: Tuple[int, int], cada: int = 1,
+                 regla: str = CONWAY, frontera: str = FRONTERA_POR_DEFECTO):
+        """
+        Constructor que abre (o crea) el archivo de historial.
+
+        Args:
+            ruta: La ruta del archivo de historial.
+            dimensiones: La tupla (X_MAX, Y_MAX) de los Lattices a registrar.
+            cada: Intervalo de generaciones entre registros (N >= 1).
+            regla: La regla en notación B/S (o B/S/C).
+            frontera: El nombre de la Condición de Frontera usada.
+
+        Raises:
+            ValueError: Si 'cada' < 1, la regla tiene más de dos estados o el
+                        archivo existente no es compatible.
+        """
+        if cada < 1:
+            raise ValueError("El intervalo entre registros debe ser al menos 1.")
+        validar_regla_empaquetable(regla)
+        self.ruta = ruta
+        self.cada = cada
+        self.cabecera = CabeceraInstantanea(dimensiones, 0, regla, frontera)
+        self._tamano_registro = _tipo_registro(self.cabecera).itemsize
+
+        if os.path.exists(ruta) and os.path.getsize(ruta) > 0:
+            with open(ruta, "rb") as archivo:
+                existente, desplazamiento = leer_cabecera(archivo, MAGIA_HISTORIAL)
+            if existente.dimensiones != self.cabecera.dimensiones:
+                raise ValueError(f"El historial {ruta} tiene dimensiones {existente.dimensiones}.")
+            completos = (os.path.getsize(ruta) - desplazamiento) // self._tamano_registro
+            self._archivo = open(ruta, "r+b")
+            self._archivo.truncate(desplazamiento + completos * self._tamano_registro)
+            self._archivo.seek(0, os.SEEK_END)
+        else:
+            self._archivo = open(ruta, "wb")
+            escribir_cabecera(self._archivo, self.cabecera, MAGIA_HISTORIAL)
+
+    def registrar(self, generacion: int, lattice: ILattice, forzar: bool = False) -> bool:
+        """
+        Añade el estado del Lattice si la generación es múltiplo del intervalo.
+
+        Args:
+            generacion: La generación actual.
+            lattice: El Lattice cuyo estado se registra.
+            forzar: Si es True, registra aunque la generación no sea múltiplo del intervalo.
+
+        Returns:
+            True si se escribió un registro.
+
+        Raises:
+            ValueError: Si las dimensiones del Lattice no coinciden con las del historial.
+        """
+        if not forzar and generacion % self.cada:
+            return False
+        if tuple(lattice.obtener_dimensiones()) != self.cabecera.dimensiones:
+            raise ValueError("Las dimensiones del Lattice no coinciden con las del historial.")
+        self._archivo.write(np.uint64(generacion).astype("<u8").tobytes())
+        self._archivo.write(np.ascontiguousarray(palabras_de_lattice(lattice), dtype="<u8").tobytes())
+        return True
+
+    def cerrar(self):
+        """
+        Vacía los búferes y cierra el archivo (idempotente).
+        """
+        if not self._archivo.closed:
+            self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+class LectorHistorial:
+    """
+    Acceso aleatorio, mapeado en memoria, a los registros de un archivo de historial.
+    """
+
+    def __init__(self, ruta: str):
+        """
+        Constructor que lee la cabecera y mapea los registros completos.
+
+        Args:
+            ruta: La ruta del archivo de historial.
+
+        Raises:
+            ValueError: Si el archivo no es un historial válido.
+        """
+        with open(ruta, "rb") as archivo:
+            self.cabecera, desplazamiento = leer_cabecera(archivo, MAGIA_HISTORIAL)
+        tipo = _tipo_registro(self.cabecera)
+        completos = (os.path.getsize(ruta) - desplazamiento) // tipo.itemsize
+        self._registros: Optional[np.ndarray] = None
+        if completos:
+            self._registros = np.memmap(ruta, dtype=tipo, mode="r", offset=desplazamiento, shape=(completos,))
+
+    def __len__(self) -> int:
+        """
+        Devuelve el número de registros completos del historial.
+        """
+        return 0 if self._registros is None else self._registros.shape[0]
+
+    def generaciones(self) -> np.ndarray:
+        """
+        Devuelve la generación de cada registro, en orden de escritura.
+        """
+        if self._registros is None:
+            return np.zeros(0, dtype=np.uint64)
+        return np.asarray(self._registros["generacion"])
+
+    def __getitem__(self, indice: int) -> Tuple[int, np.ndarray]:
+        """
+        Devuelve el registro 'indice' como (generación, palabras uint64 (X_MAX, W)).
+
+        Las palabras son una vista de solo lectura sobre el archivo; se pueden
+        pasar a 'restaurar_en_lattice' o a 'desempaquetar_filas'.
+        """
+        if self._registros is None:
+            raise IndexError(indice)
+        registro = self._registros[indice]
+        return int(registro["generacion"]), registro["palabras"]
+
+    def buscar(self, generacion: int) -> Tuple[int, np.ndarray]:
+        """
+        Devuelve el último registro con generación menor o igual a la pedida.
+
+        Args:
+            generacion: La generación buscada.
+
+        Returns:
+            La tupla (generación registrada, palabras).
+
+        Raises:
+            KeyError: Si no hay ningún registro anterior o igual a esa generación.
+        """
+        posicion = int(np.searchsorted(self.generaciones(), generacion, side="right")) - 1
+        if posicion < 0:
+            raise KeyError(generacion)
+        return self[posicion]
@@ -0,0 +1,277 @@
+import struct
+import numpy as np
+from typing import Tuple, BinaryIO
+from ..lattice.i_lattice import ILattice
+from ..lattice.i_lattice_arreglo import ILatticeArreglo
+from ..lattice.lattice_bits import LatticeBits, BITS_POR_PALABRA, empaquetar_filas, desempaquetar_filas
+from ..reglas.regla_transicion import ReglaTransicion, CONWAY
+
+# Identificador de los archivos de instantánea (8 bytes al inicio del archivo).
+MAGIA_INSTANTANEA = b"LIFESNP1"
+
+# Versión del formato binario (cabecera + palabras empaquetadas).
+VERSION_FORMATO = 1
+
+# Los datos empiezan en un múltiplo de este tamaño (alineados para el mapeo en memoria).
+ALINEACION_DATOS = 64
+
+# Nombre de la frontera guardado por defecto en la cabecera.
+FRONTERA_POR_DEFECTO = "CondicionFronteraCiclica"
+
+# Parte fija de la cabecera: magia, versión, tamaño de la cabecera, X_MAX, Y_MAX,
+# generación y longitudes (en bytes UTF-8) de la regla y de la frontera.
+_CABECERA_FIJA = struct.Struct("<8sHHIIQHH")
+
+# Filas empaquetadas por bloque al guardar un Lattice no empaquetado.
+FILAS_POR_BLOQUE_GUARDADO = 1024
+
+
+class CabeceraInstantanea:
+    """
+    Metadatos de una instantánea: dimensiones, generación, regla y frontera.
+
+    El estado se guarda a continuación de la cabecera con la misma disposición
+    que LatticeBits: X_MAX filas de W = ceil(Y_MAX / 64) palabras uint64 en
+    little-endian, donde la célula (x, y) es el bit (y % 64) de la palabra
+    (x, y // 64). Solo se guarda si cada célula está viva (estado 1) o no, por
+    lo que el formato no admite reglas de más de dos estados ("Generations").
+    """
+
+    def __init__(self, dimensiones: Tuple[int, int], generacion: int = 0,
+                 regla: str = CONWAY, frontera: str = FRONTERA_POR_DEFECTO):
+        """
+        Constructor que recibe los metadatos de la instantánea.
+
+        Args:
+            dimensiones: La tupla (X_MAX, Y_MAX) del Lattice guardado.
+            generacion: La generación a la que corresponde el estado.
+            regla: La regla en notación B/S (o B/S/C).
+            frontera: El nombre de la Condición de Frontera usada.
+        """
+        self.dimensiones = (int(dimensiones[0]), int(dimensiones[1]))
+        self.generacion = int(generacion)
+        self.regla = regla
+        self.frontera = frontera
+
+    @property
+    def palabras_por_fila(self) -> int:
+        """
+        Devuelve el número W de palabras uint64 de cada fila empaquetada.
+        """
+        return -(-self.dimensiones[1] // BITS_POR_PALABRA)
+
+    def __repr__(self) -> str:
+        return (f"CabeceraInstantanea(dimensiones={self.dimensiones}, generacion={self.generacion}, "
+                f"regla={self.regla!r}, frontera={self.frontera!r})")
+
+
+def escribir_cabecera(archivo: BinaryIO, cabecera: CabeceraInstantanea, magia: bytes = MAGIA_INSTANTANEA) -> int:
+    """
+    Escribe la cabecera (rellenada hasta ALINEACION_DATOS) en la posición actual del archivo.
+
+    Args:
+        archivo: El archivo binario abierto para escritura.
+        cabecera: Los metadatos a escribir.
+        magia: El identificador de 8 bytes del tipo de archivo.
+
+    Returns:
+        El tamaño total en bytes de la cabecera escrita (desplazamiento de los datos).
+    """
+    regla = cabecera.regla.encode("utf-8")
+    frontera = cabecera.frontera.encode("utf-8")
+    tamano = _CABECERA_FIJA.size + len(regla) + len(frontera)
+    tamano += -tamano % ALINEACION_DATOS
+    X_MAX, Y_MAX = cabecera.dimensiones
+    archivo.write(_CABECERA_FIJA.pack(magia, VERSION_FORMATO, tamano, X_MAX, Y_MAX,
+                                      cabecera.generacion, len(regla), len(frontera)))
+    archivo.write(regla + frontera)
+    archivo.write(b"\0" * (tamano - _CABECERA_FIJA.size - len(regla) - len(frontera)))
+    return tamano
+
+
+def leer_cabecera(archivo: BinaryIO, magia: bytes = MAGIA_INSTANTANEA) -> Tuple[CabeceraInstantanea, int]:
+    """
+    Lee la cabecera desde la posición actual del archivo.
+
+    Args:
+        archivo: El archivo binario abierto para lectura.
+        magia: El identificador de 8 bytes esperado.
+
+    Returns:
+        La cabecera y el desplazamiento en bytes en el que empiezan los datos.
+
+    Raises:
+        ValueError: Si el archivo no tiene el formato o la versión esperados.
+    """
+    fija = archivo.read(_CABECERA_FIJA.size)
+    if len(fija) < _CABECERA_FIJA.size:
+        raise ValueError("Archivo truncado: cabecera incompleta.")
+    magia_leida, version, tamano, X_MAX, Y_MAX, generacion, largo_regla, largo_frontera = _CABECERA_FIJA.unpack(fija)
+    if magia_leida != magia:
+        raise ValueError(f"Formato desconocido: se esperaba {magia!r} y se encontró {magia_leida!r}.")
+    if version != VERSION_FORMATO:
+        raise ValueError(f"Versión de formato no soportada: {version}.")
+    textos = archivo.read(largo_regla + largo_frontera)
+    regla = textos[:largo_regla].decode("utf-8")
+    frontera = textos[largo_regla:].decode("utf-8")
+    return CabeceraInstantanea((X_MAX, Y_MAX), generacion, regla, frontera), tamano
+
+
+def validar_regla_empaquetable(regla: str):
+    """
+    Comprueba que el estado de una regla cabe en un bit por célula.
+
+    Args:
+        regla: La regla en notación B/S, B/S/C o "Larger than Life".
+
+    Raises:
+        ValueError: Si la regla no es válida o tiene más de dos estados (los
+                    estados de muerte de una regla "Generations" se perderían).
+    """
+    from ..reglas.regla_larger_than_life import ReglaLargerThanLife, es_regla_larger_than_life
+    if es_regla_larger_than_life(regla):
+        estados = ReglaLargerThanLife.desde_cadena(regla).regla.estados
+    else:
+        estados = ReglaTransicion.desde_cadena(regla).estados
+    if estados > 2:
+        raise ValueError(f"La regla {regla!r} tiene {estados} estados: las instantáneas binarias "
+                         f"guardan un bit por célula (solo reglas de dos estados).")
+
+
+def palabras_de_lattice(lattice: ILattice) -> np.ndarray:
+    """
+    Devuelve el estado de cualquier ILattice empaquetado como palabras uint64 (X_MAX, W).
+
+    Usa directamente las palabras de un LatticeBits (sin copia) y empaqueta por
+    bloques de filas el resto de Lattices. Solo el estado 1 se considera vivo.
+
+    Args:
+        lattice: El Lattice a empaquetar.
+
+    Returns:
+        Un arreglo uint64 con forma (X_MAX, W).
+    """
+    if isinstance(lattice, LatticeBits):
+        return lattice.obtener_palabras()
+
+    X_MAX, Y_MAX = lattice.obtener_dimensiones()
+    palabras_por_fila = -(-Y_MAX // BITS_POR_PALABRA)
+    if isinstance(lattice, ILatticeArreglo):
+        arreglo = lattice.obtener_arreglo()
+    else:
+        estado = lattice.obtener_estado()
+        if hasattr(estado, "a_arreglo"):
+            arreglo = estado.a_arreglo()
+        else:
+            # Lattice tipo dict: los valores están en el orden x exterior, y interior.
+            arreglo = np.fromiter((valor == 1 for valor in estado.values()),
+                                  dtype=bool, count=X_MAX * Y_MAX).reshape(X_MAX, Y_MAX)
+
+    palabras = np.empty((X_MAX, palabras_por_fila), dtype=np.uint64)
+    for inicio in range(0, X_MAX, FILAS_POR_BLOQUE_GUARDADO):
+        fin = min(inicio + FILAS_POR_BLOQUE_GUARDADO, X_MAX)
+        palabras[inicio:fin] = empaquetar_filas(arreglo[inicio:fin] == 1, palabras_por_fila)
+    return palabras
+
+
+def restaurar_en_lattice(lattice: ILattice, palabras: np.ndarray):
+    """
+    Copia un estado empaquetado en un ILattice ya inicializado con las mismas dimensiones.
+
+    Un LatticeBits adopta las palabras tal cual (incluso si están mapeadas en
+    memoria); un Lattice en arreglo recibe el arreglo desempaquetado, y el resto
+    se actualiza célula a célula solo donde el estado difiere.
+
+    Args:
+        lattice: El Lattice de destino.
+        palabras: El estado empaquetado con forma (X_MAX, W).
+
+    Raises:
+        ValueError: Si la forma del estado no coincide con las dimensiones del Lattice.
+    """
+    X_MAX, Y_MAX = lattice.obtener_dimensiones()
+    if palabras.shape != (X_MAX, -(-Y_MAX // BITS_POR_PALABRA)):
+        raise ValueError(f"El estado empaquetado {palabras.shape} no corresponde a un Lattice {X_MAX}x{Y_MAX}.")
+
+    if isinstance(lattice, LatticeBits):
+        lattice.establecer_palabras(palabras)
+    elif isinstance(lattice, ILatticeArreglo):
+        lattice.establecer_arreglo(desempaquetar_filas(palabras, Y_MAX))
+    else:
+        arreglo = desempaquetar_filas(palabras, Y_MAX)
+        estado = lattice.obtener_estado()
+        for x in range(X_MAX):
+            fila = arreglo[x].tolist()
+            for y in range(Y_MAX):
+                if estado[(x, y)] != fila[y]:
+                    lattice.actualizar_estado((x, y), fila[y])
+
+
+def guardar_instantanea(ruta: str, lattice: ILattice, generacion: int = 0,
+                        regla: str = CONWAY, frontera: str = FRONTERA_POR_DEFECTO) -> CabeceraInstantanea:
+    """
+    Guarda el estado de un Lattice en una instantánea binaria empaquetada a nivel de bit.
+
+    Args:
+        ruta: La ruta del archivo de salida.
+        lattice: El Lattice a guardar.
+        generacion: La generación a la que corresponde el estado.
+        regla: La regla en notación B/S (o B/S/C).
+        frontera: El nombre de la Condición de Frontera usada.
+
+    Returns:
+        La cabecera escrita.
+
+    Raises:
+        ValueError: Si la regla tiene más de dos estados (ver 'validar_regla_empaquetable').
+    """
+    validar_regla_empaquetable(regla)
+    cabecera = CabeceraInstantanea(lattice.obtener_dimensiones(), generacion, regla, frontera)
+    palabras = palabras_de_lattice(lattice)
+    with open(ruta, "wb") as archivo:
+        escribir_cabecera(archivo, cabecera)
+        archivo.write(np.ascontiguousarray(palabras, dtype="<u8").tobytes())
+    return cabecera
+
+
+def cargar_instantanea(ruta: str, mapear: bool = True) -> Tuple[CabeceraInstantanea, np.ndarray]:
+    """
+    Carga una instantánea binaria sin interpretar su contenido célula a célula.
+
+    Con 'mapear' las palabras se mapean en memoria en modo copia-en-escritura:
+    la carga es prácticamente instantánea incluso para tableros enormes (las
+    páginas se leen del disco a medida que se usan) y las modificaciones
+    posteriores nunca alteran el archivo.
+
+    Args:
+        ruta: La ruta de la instantánea.
+        mapear: Si es False, las palabras se leen completas a memoria.
+
+    Returns:
+        La cabecera y el arreglo de palabras uint64 (X_MAX, W).
+
+    Raises:
+        ValueError: Si el archivo no es una instantánea válida o está truncado.
+    """
+    with open(ruta, "rb") as archivo:
+        cabecera, desplazamiento = leer_cabecera(archivo)
+    forma = (cabecera.dimensiones[0], cabecera.palabras_por_fila)
+    if mapear and forma[0] * forma[1] > 0:
+        try:
+            palabras = np.memmap(ruta, dtype="<u8", mode="c", offset=desplazamiento, shape=forma)
+        except ValueError as error:
+            raise ValueError(f"Instantánea truncada: {ruta}.") from error
+    else:
+        palabras = np.fromfile(ruta, dtype="<u8", count=forma[0] * forma[1], offset=desplazamiento)
+        if palabras.size != forma[0] * forma[1]:
+            raise ValueError(f"Instantánea truncada: {ruta}.")
+        palabras = palabras.reshape(forma)
+    return cabecera, palabras
+
+
+def es_instantanea(ruta: str) -> bool:
+    """
+    Indica si el archivo empieza con el identificador de una instantánea binaria.
+    """
+    with open(ruta, "rb") as archivo:
+        return archivo.read(len(MAGIA_INSTANTANEA)) == MAGIA_INSTANTANEA
@@ -0,0 +1,257 @@
+import re
+from typing import Tuple, Dict, List, Optional
+from ..lattice.i_lattice import ILattice
+
+# Longitud máxima de las líneas del cuerpo RLE al exportar (recomendación del formato).
+ANCHO_LINEA_RLE = 70
+
+# Línea de cabecera: "x = m, y = n[, rule = B3/S23]".
+_PATRON_CABECERA = re.compile(
+    r"^\s*x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)\s*(?:,\s*rule\s*=\s*([^\s,]+))?", re.IGNORECASE
+)
+
+# Un elemento del cuerpo: repeticiones opcionales y un símbolo de estado o fin de línea.
+_PATRON_ELEMENTO = re.compile(r"(\d*)([bo$.A-X]|[p-y][A-X])")
+
+
+def _estado_de_simbolo(simbolo: str) -> int:
+    """
+    Traduce un símbolo RLE al estado de la célula.
+
+    'b' y '.' son células muertas, 'o' es una célula viva y 'A'..'X' (con prefijo
+    opcional 'p'..'y' para estados mayores que 24) son los estados 1..255 de las
+    reglas multiestado.
+    """
+    if simbolo in ("b", "."):
+        return 0
+    if simbolo == "o":
+        return 1
+    if len(simbolo) == 2:
+        return (ord(simbolo[0]) - ord("p") + 1) * 24 + ord(simbolo[1]) - ord("A") + 1
+    return ord(simbolo) - ord("A") + 1
+
+
+def _simbolo_de_estado(estado: int, multiestado: bool) -> str:
+    """
+    Operación inversa de '_estado_de_simbolo'.
+    """
+    if not multiestado:
+        return "o" if estado else "b"
+    if estado == 0:
+        return "."
+    prefijo, indice = divmod(estado - 1, 24)
+    return (chr(ord("p") + prefijo - 1) if prefijo else "") + chr(ord("A") + indice)
+
+
+class PatronRLE:
+    """
+    Patrón leído de (o preparado para) un archivo en formato RLE de Life.
+
+    Las coordenadas siguen la convención del resto del proyecto: x es la columna
+    y y la fila, con el origen en la esquina superior izquierda del patrón.
+    """
+
+    def __init__(self, dimensiones: Tuple[int, int], celulas: Dict[Tuple[int, int], int],
+                 regla: Optional[str] = None, nombre: Optional[str] = None,
+                 comentarios: Optional[List[str]] = None):
+        """
+        Constructor que recibe el contenido del patrón.
+
+        Args:
+            dimensiones: El tamaño (ancho, alto) del patrón.
+            celulas: Las células no muertas del patrón (coordenada -> estado).
+            regla: La regla declarada en la cabecera (None si no se indicó).
+            nombre: El nombre del patrón (línea '#N').
+            comentarios: Las líneas de comentario ('#C' / '#c').
+        """
+        self.dimensiones = dimensiones
+        self.celulas = celulas
+        self.regla = regla
+        self.nombre = nombre
+        self.comentarios = comentarios if comentarios is not None else []
+
+    def __repr__(self) -> str:
+        return (f"PatronRLE(dimensiones={self.dimensiones}, celulas={len(self.celulas)}, "
+                f"regla={self.regla!r}, nombre={self.nombre!r})")
+
+
+def leer_rle(texto: str) -> PatronRLE:
+    """
+    Interpreta un patrón en formato RLE.
+
+    Args:
+        texto: El contenido completo del archivo RLE.
+
+    Returns:
+        El patrón leído.
+
+    Raises:
+        ValueError: Si falta la cabecera o el cuerpo contiene símbolos no válidos.
+    """
+    lineas = texto.splitlines()
+    nombre: Optional[str] = None
+    comentarios: List[str] = []
+
+    # 1. Comentarios ('#...') y cabecera.
+    indice = 0
+    cabecera = None
+    while indice < len(lineas):
+        linea = lineas[indice].strip()
+        indice += 1
+        if not linea:
+            continue
+        if linea.startswith("#"):
+            if linea[1:2] == "N":
+                nombre = linea[2:].strip()
+            elif linea[1:2] in ("C", "c"):
+                comentarios.append(linea[2:].strip())
+            continue
+        cabecera = _PATRON_CABECERA.match(linea)
+        if cabecera is None:
+            raise ValueError(f"Cabecera RLE no válida: {linea!r}.")
+        break
+    if cabecera is None:
+        raise ValueError("El texto no contiene una cabecera RLE ('x = ..., y = ...').")
+    ancho, alto = int(cabecera.group(1)), int(cabecera.group(2))
+    regla = cabecera.group(3)
+
+    # 2. Cuerpo: elementos "<n><símbolo>" hasta '!'.
+    cuerpo = "".join(lineas[indice:]).split("!", 1)[0]
+    cuerpo = re.sub(r"\s+", "", cuerpo)
+    celulas: Dict[Tuple[int, int], int] = {}
+    x = y = 0
+    posicion = 0
+    while posicion < len(cuerpo):
+        elemento = _PATRON_ELEMENTO.match(cuerpo, posicion)
+        if elemento is None:
+            raise ValueError(f"Símbolo RLE no válido en la posición {posicion}: {cuerpo[posicion]!r}.")
+        posicion = elemento.end()
+        repeticiones = int(elemento.group(1) or "1")
+        simbolo = elemento.group(2)
+        if simbolo == "$":
+            x, y = 0, y + repeticiones
+            continue
+        estado = _estado_de_simbolo(simbolo)
+        if estado:
+            for desplazamiento in range(repeticiones):
+                celulas[(x + desplazamiento, y)] = estado
+        x += repeticiones
+
+    return PatronRLE((ancho, alto), celulas, regla, nombre, comentarios)
+
+
+def escribir_rle(lattice: ILattice, regla: Optional[str] = None, nombre: Optional[str] = None) -> str:
+    """
+    Codifica el estado de un Lattice en formato RLE.
+
+    Las filas terminan en la última célula no muerta y las filas vacías
+    consecutivas se agrupan en un único "n$". Si hay estados mayores que 1
+    se usan los símbolos multiestado ('.', 'A'..'X').
+
+    Args:
+        lattice: El Lattice a exportar.
+        regla: La regla a declarar en la cabecera (opcional).
+        nombre: El nombre del patrón (línea '#N', opcional).
+
+    Returns:
+        El texto RLE completo (terminado en salto de línea).
+    """
+    X_MAX, Y_MAX = lattice.obtener_dimensiones()
+    estado = lattice.obtener_estado()
+    filas = [[estado[(x, y)] for x in range(X_MAX)] for y in range(Y_MAX)]
+    multiestado = any(valor > 1 for fila in filas for valor in fila)
+
+    # 1. Elementos "<n><símbolo>" de cada fila, sin las células muertas finales.
+    elementos: List[str] = []
+    filas_pendientes = 0
+    for fila in filas:
+        while fila and fila[-1] == 0:
+            fila.pop()
+        if not fila:
+            filas_pendientes += 1
+            continue
+        if elementos:
+            elementos.append(f"{filas_pendientes + 1 if filas_pendientes else ''}$")
+        elif filas_pendientes:
+            elementos.append(f"{filas_pendientes}$")
+        filas_pendientes = 0
+        inicio = 0
+        while inicio < len(fila):
+            fin = inicio
+            while fin < len(fila) and fila[fin] == fila[inicio]:
+                fin += 1
+            repeticiones = fin - inicio
+            elementos.append(f"{repeticiones if repeticiones > 1 else ''}"
+                             f"{_simbolo_de_estado(fila[inicio], multiestado)}")
+            inicio = fin
+    elementos.append("!")
+
+    # 2. Cabecera y cuerpo partido en líneas de como máximo ANCHO_LINEA_RLE caracteres.
+    lineas = [f"#N {nombre}"] if nombre else []
+    lineas.append(f"x = {X_MAX}, y = {Y_MAX}" + (f", rule = {regla}" if regla else ""))
+    actual = ""
+    for elemento in elementos:
+        if len(actual) + len(elemento) > ANCHO_LINEA_RLE:
+            lineas.append(actual)
+            actual = ""
+        actual += elemento
+    lineas.append(actual)
+    return "\n".join(lineas) + "\n"
+
+
+def colocar_patron(lattice: ILattice, patron: PatronRLE, origen: Tuple[int, int] = (0, 0)):
+    """
+    Escribe un patrón en un Lattice ya inicializado, a partir de la coordenada 'origen'.
+
+    Las células del rectángulo del patrón toman el estado del patrón (las que
+    no figuran en él quedan muertas); el resto del Lattice no se modifica.
+
+    Args:
+        lattice: El Lattice de destino.
+        patron: El patrón a colocar.
+        origen: La coordenada (x, y) de la esquina superior izquierda del patrón.
+
+    Raises:
+        ValueError: Si el patrón no cabe en el Lattice a partir del origen.
+    """
+    X_MAX, Y_MAX = lattice.obtener_dimensiones()
+    ox, oy = origen
+    ancho, alto = patron.dimensiones
+    if ox < 0 or oy < 0 or ox + ancho > X_MAX or oy + alto > Y_MAX:
+        raise ValueError(f"El patrón {ancho}x{alto} no cabe en el Lattice {X_MAX}x{Y_MAX} desde {origen}.")
+
+    estado = lattice.obtener_estado()
+    for x in range(ancho):
+        for y in range(alto):
+            celula = (ox + x, oy + y)
+            nuevo = patron.celulas.get((x, y), 0)
+            if estado[celula] != nuevo:
+                lattice.actualizar_estado(celula, nuevo)
+
+
+def cargar_rle(ruta: str) -> PatronRLE:
+    """
+    Lee un patrón desde un archivo RLE.
+
+    Args:
+        ruta: La ruta del archivo.
+
+    Returns:
+        El patrón leído.
+    """
+    with open(ruta, "r", encoding="utf-8") as archivo:
+        return leer_rle(archivo.read())
+
+
+def guardar_rle(ruta: str, lattice: ILattice, regla: Optional[str] = None, nombre: Optional[str] = None):
+    """
+    Guarda el estado de un Lattice en un archivo RLE.
+
+    Args:
+        ruta: La ruta del archivo de salida.
+        lattice: El Lattice a exportar.
+        regla: La regla a declarar en la cabecera (opcional).
+        nombre: El nombre del patrón (opcional).
+    """
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write(escribir_rle(lattice, regla, nombre))
@@ -0,0 +1,140 @@
+from typing import List, Any
+from .regla_transicion import ReglaTransicion
+
+# Reglas "Larger than Life" conocidas, en la notación de Golly.
+BOSCO = "R5,C0,M1,S34..58,B34..45,NM"
+MAYORIA = "R4,C0,M1,S41..81,B41..81,NM"
+
+# Vecindades de la notación (N...) y su nombre en el ensamblador.
+VECINDADES_LTL = {"M": "moore", "N": "von_neumann", "H": "hexagonal"}
+
+
+def es_regla_larger_than_life(cadena: str) -> bool:
+    """
+    Indica si la cadena está en notación "Larger than Life" (ej., "R5,C0,M1,S34..58,B34..45,NM").
+    """
+    texto = cadena.strip().upper()
+    return texto.startswith("R") and "," in texto
+
+
+class ReglaLargerThanLife:
+    """
+    Regla "Larger than Life" (LtL): una regla totalista sobre una vecindad de radio r.
+
+    La parte totalista es una ReglaTransicion normal (los intervalos de
+    nacimiento y supervivencia pueden llegar a (2r + 1)² vecinos); el resto de
+    la notación describe la Estrategia de Vecindad: su forma (N), su radio (R)
+    y si la célula central se cuenta a sí misma (M).
+    """
+
+    def __init__(self, regla: ReglaTransicion, radio: int, vecindad: str = "moore",
+                 incluir_centro: bool = False):
+        """
+        Constructor que recibe la regla totalista y la descripción de la vecindad.
+
+        Args:
+            regla: La ReglaTransicion con los conjuntos de nacimiento y supervivencia.
+            radio: El radio r de la vecindad.
+            vecindad: "moore", "von_neumann" o "hexagonal".
+            incluir_centro: Si la célula central cuenta como su propia vecina.
+        """
+        self.regla = regla
+        self.radio = radio
+        self.vecindad = vecindad
+        self.incluir_centro = incluir_centro
+
+    @classmethod
+    def desde_cadena(cls, cadena: str) -> "ReglaLargerThanLife":
+        """
+        Interpreta una regla en la notación de Golly: "Rr,Cc,Mm,Sa..b,Bc..d,Nx".
+
+        Las listas S y B admiten varios valores o intervalos separados por comas
+        (ej., "S2..3,5,7..9"). C0 y C2 son reglas de dos estados; Cn (n > 2) es
+        una regla "Generations". N es M (Moore), N (von Neumann) o H (hexagonal).
+
+        Args:
+            cadena: El texto de la regla.
+
+        Returns:
+            La ReglaLargerThanLife correspondiente.
+
+        Raises:
+            ValueError: Si la cadena no es una regla válida.
+        """
+        radio, estados, centro, vecindad = None, 2, False, "moore"
+        nacimiento: List[int] = []
+        supervivencia: List[int] = []
+        lista = None
+        try:
+            for parte in cadena.strip().upper().replace(" ", "").split(","):
+                if parte[:1].isdigit():
+                    if lista is None:
+                        raise ValueError
+                    lista.extend(cls._intervalo(parte))
+                    continue
+                lista = None
+                clave, valor = parte[:1], parte[1:]
+                if clave == "R":
+                    radio = int(valor)
+                elif clave == "C":
+                    estados = max(2, int(valor))
+                elif clave == "M":
+                    centro = int(valor) == 1
+                elif clave == "S":
+                    lista = supervivencia
+                    lista.extend(cls._intervalo(valor) if valor else [])
+                elif clave == "B":
+                    lista = nacimiento
+                    lista.extend(cls._intervalo(valor) if valor else [])
+                elif clave == "N":
+                    vecindad = VECINDADES_LTL[valor]
+                else:
+                    raise ValueError
+        except (ValueError, KeyError, IndexError):
+            raise ValueError(f"Regla Larger than Life no válida: {cadena!r}.") from None
+        if radio is None or radio < 1:
+            raise ValueError(f"Regla Larger than Life no válida (falta el radio): {cadena!r}.")
+        return cls(ReglaTransicion(nacimiento, supervivencia, estados), radio, vecindad, centro)
+
+    @staticmethod
+    def _intervalo(texto: str) -> List[int]:
+        """
+        Convierte "a..b" (o "a") en la lista de enteros correspondiente.
+        """
+        if ".." in texto:
+            inicio, fin = texto.split("..")
+            return list(range(int(inicio), int(fin) + 1))
+        return [int(texto)]
+
+    def crear_vecindad(self) -> Any:
+        """
+        Crea la Estrategia de Vecindad descrita por la regla.
+
+        Returns:
+            Una VecindadMooreRadio, VecindadVonNeumann o VecindadHexagonal.
+        """
+        from ..vecindad.vecindad_moore_radio import VecindadMooreRadio
+        from ..vecindad.vecindad_von_neumann import VecindadVonNeumann
+        from ..vecindad.vecindad_hexagonal import VecindadHexagonal
+        clases = {"moore": VecindadMooreRadio, "von_neumann": VecindadVonNeumann,
+                  "hexagonal": VecindadHexagonal}
+        return clases[self.vecindad](self.radio, self.incluir_centro)
+
+    def __str__(self) -> str:
+        """
+        Devuelve la regla en la notación de Golly.
+        """
+        def intervalos(valores) -> str:
+            partes, ordenados = [], sorted(valores)
+            i = 0
+            while i < len(ordenados):
+                j = i
+                while j + 1 < len(ordenados) and ordenados[j + 1] == ordenados[j] + 1:
+                    j += 1
+                partes.append(str(ordenados[i]) if i == j else f"{ordenados[i]}..{ordenados[j]}")
+                i = j + 1
+            return ",".join(partes)
+        letra = {nombre: clave for clave, nombre in VECINDADES_LTL.items()}[self.vecindad]
+        estados = self.regla.estados if self.regla.estados > 2 else 0
+        return (f"R{self.radio},C{estados},M{int(self.incluir_centro)},"
+                f"S{intervalos(self.regla.supervivencia)},B{intervalos(self.regla.nacimiento)},N{letra}")
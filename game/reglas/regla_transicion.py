@@ -0,0 +1,167 @@
+from typing import Iterable, List, Dict, FrozenSet, Any
+
+# Reglas conocidas en notación B/S (y B/S/C para las reglas "Generations").
+CONWAY = "B3/S23"
+HIGHLIFE = "B36/S23"
+DIA_Y_NOCHE = "B3678/S34678"
+CEREBRO_DE_BRIAN = "B2/S/C3"
+
+# Máximo número de estados: los Lattices en arreglo, la tabla compilada y la Vista guardan cada estado en un uint8.
+MAX_ESTADOS = 256
+
+
+class ReglaTransicion:
+    """
+    Regla de Transición Local totalista compilada en una tabla de búsqueda.
+
+    Cubre las reglas "Life-like" (B/S, dos estados) y su extensión "Generations"
+    (B/S/C, C estados): el estado 0 es una célula muerta, el estado 1 una viva y
+    los estados 2..C-1 son células "moribundas" que envejecen hasta volver a 0.
+    Solo las células en estado 1 cuentan como vecinas vivas.
+
+    La regla se compila en una tabla indexada por (estado, número de vecinos),
+    de modo que aplicar cualquier regla cuesta una única búsqueda por célula
+    (o una única operación de indexado sobre un arreglo completo).
+    """
+
+    def __init__(self, nacimiento: Iterable[int], supervivencia: Iterable[int], estados: int = 2):
+        """
+        Constructor que recibe los conjuntos de la regla.
+
+        Args:
+            nacimiento: Número de vecinos vivos con los que nace una célula muerta.
+            supervivencia: Número de vecinos vivos con los que sobrevive una célula viva.
+            estados: Número total de estados (2 = Life-like; >2 = Generations).
+
+        Raises:
+            ValueError: Si los conjuntos contienen valores negativos o el número de
+                        estados no está entre 2 y MAX_ESTADOS.
+        """
+        self.nacimiento: FrozenSet[int] = frozenset(nacimiento)
+        self.supervivencia: FrozenSet[int] = frozenset(supervivencia)
+        self.estados = estados
+        if estados < 2:
+            raise ValueError("Una regla necesita al menos 2 estados.")
+        if estados > MAX_ESTADOS:
+            raise ValueError(f"Una regla admite como mucho {MAX_ESTADOS} estados (recibidos {estados}).")
+        if any(n < 0 for n in self.nacimiento | self.supervivencia):
+            raise ValueError("Los números de vecinos no pueden ser negativos.")
+        self._tablas: Dict[int, List[List[int]]] = {}
+        self._tablas_arreglo: Dict[int, Any] = {}
+
+    @classmethod
+    def desde_cadena(cls, cadena: str) -> "ReglaTransicion":
+        """
+        Interpreta una regla en notación de texto.
+
+        Formatos admitidos (sin distinguir mayúsculas):
+            "B3/S23", "S23/B3"      -> Life-like con prefijos.
+            "B2/S/C3", "B2/S/3"     -> Generations con prefijos.
+            "23/3", "345/2/4"       -> Notación clásica S/B y S/B/C.
+
+        Args:
+            cadena: El texto de la regla.
+
+        Returns:
+            La ReglaTransicion correspondiente.
+
+        Raises:
+            ValueError: Si la cadena no es una regla válida.
+        """
+        partes = cadena.strip().upper().replace(" ", "").split("/")
+        if not 2 <= len(partes) <= 3:
+            raise ValueError(f"Regla no válida: {cadena!r}.")
+
+        def digitos(texto: str) -> List[int]:
+            if not texto.isdigit() and texto != "":
+                raise ValueError(f"Regla no válida: {cadena!r}.")
+            return [int(d) for d in texto]
+
+        estados = 2
+        if any(parte[:1] in ("B", "S") for parte in partes):
+            nacimiento = supervivencia = None
+            for parte in partes:
+                if parte.startswith("B"):
+                    nacimiento = digitos(parte[1:])
+                elif parte.startswith("S"):
+                    supervivencia = digitos(parte[1:])
+                elif parte.startswith("C") or parte.isdigit():
+                    estados = int(parte.lstrip("C") or "2")
+                else:
+                    raise ValueError(f"Regla no válida: {cadena!r}.")
+            if nacimiento is None or supervivencia is None:
+                raise ValueError(f"Regla no válida: {cadena!r}.")
+        else:
+            supervivencia = digitos(partes[0])
+            nacimiento = digitos(partes[1])
+            if len(partes) == 3:
+                estados = int(partes[2] or "2")
+        return cls(nacimiento, supervivencia, estados)
+
+    def transicion(self, estado: int, vecinos: int) -> int:
+        """
+        Calcula el estado siguiente de una célula (sin tabla; usado para compilarla).
+
+        Args:
+            estado: El estado actual de la célula (0..estados-1).
+            vecinos: El número de vecinos en estado 1.
+
+        Returns:
+            El estado de la célula en la siguiente generación.
+        """
+        if estado == 0:
+            return 1 if vecinos in self.nacimiento else 0
+        if estado == 1 and vecinos in self.supervivencia:
+            return 1
+        # Envejecimiento: 1 -> 2 -> ... -> estados-1 -> 0 (con 2 estados, 1 -> 0).
+        return (estado + 1) % self.estados
+
+    def tabla(self, max_vecinos: int) -> List[List[int]]:
+        """
+        Devuelve (y memoriza) la tabla de transición tabla[estado][vecinos].
+
+        Args:
+            max_vecinos: El número máximo de vecinos de la vecindad usada.
+
+        Returns:
+            Una lista de listas con 'estados' filas y max_vecinos + 1 columnas.
+        """
+        tabla = self._tablas.get(max_vecinos)
+        if tabla is None:
+            tabla = [[self.transicion(estado, vecinos) for vecinos in range(max_vecinos + 1)]
+                     for estado in range(self.estados)]
+            self._tablas[max_vecinos] = tabla
+        return tabla
+
+    def tabla_arreglo(self, max_vecinos: int) -> Any:
+        """
+        Devuelve la tabla de transición como arreglo NumPy uint8 (estados, max_vecinos + 1).
+
+        Permite aplicar la regla a un Lattice en arreglo con una sola operación:
+        'siguiente = tabla[estado, conteo]'.
+        """
+        tabla = self._tablas_arreglo.get(max_vecinos)
+        if tabla is None:
+            import numpy as np  # Importación diferida: solo la necesitan los Lattices en arreglo.
+            tabla = np.array(self.tabla(max_vecinos), dtype=np.uint8)
+            self._tablas_arreglo[max_vecinos] = tabla
+        return tabla
+
+    def __str__(self) -> str:
+        """
+        Devuelve la regla en notación B/S (o B/S/C si tiene más de 2 estados).
+        """
+        texto = "B" + "".join(map(str, sorted(self.nacimiento))) + "/S" + "".join(map(str, sorted(self.supervivencia)))
+        if self.estados > 2:
+            texto += f"/C{self.estados}"
+        return texto
+
+    def __repr__(self) -> str:
+        return f"ReglaTransicion.desde_cadena({str(self)!r})"
+
+    def __eq__(self, otra: object) -> bool:
+        return (isinstance(otra, ReglaTransicion) and self.nacimiento == otra.nacimiento
+                and self.supervivencia == otra.supervivencia and self.estados == otra.estados)
+
+    def __hash__(self) -> int:
+        return hash((self.nacimiento, self.supervivencia, self.estados))
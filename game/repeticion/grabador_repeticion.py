@@ -0,0 +1,454 @@
+import numpy as np
+from collections import deque, OrderedDict
+from typing import Tuple, Iterable, Optional, Any, List
+
+# Memoria máxima por defecto del historial (deltas, cuadros clave y estado presente), en bytes.
+MEMORIA_MAXIMA_POR_DEFECTO = 256 * 1024 * 1024
+
+# Generaciones máximas entre dos cuadros clave. Se guarda uno antes si los deltas
+# acumulados desde el último ya ocupan tanto como un cuadro clave.
+GENERACIONES_ENTRE_CLAVES = 64
+
+# Clave lineal (int64) de una célula de LatticeDisperso: x * 2^32 + (y + 2^31), para
+# coordenadas absolutas en [-2^31, 2^31) por eje.
+_DESPLAZAMIENTO_DISPERSO = 1 << 31
+_ZANCADA_DISPERSA = 1 << 32
+
+
+class GrabadorRepeticion:
+    """
+    Historial de repetición ("viaje en el tiempo") de un AutomataCelular.
+
+    Es un observador más de cada generación, como DetectorCiclos y
+    ColectorEstadisticas: el motor le entrega lo que ya calculó (los cambios,
+    los arreglos o las palabras de dos generaciones) y el grabador guarda solo
+    el delta. Cada delta es el XOR entre dos generaciones consecutivas (índices
+    de las células o palabras que cambiaron y su XOR), de modo que el mismo
+    delta sirve para avanzar y para retroceder.
+
+    Cada cierto número de generaciones se guarda además un cuadro clave (el
+    estado completo). Para ir a una generación retenida se parte del punto
+    conocido más cercano (un cuadro clave, el presente o la posición actual
+    del cursor) y se aplican los deltas intermedios, hacia delante o hacia
+    atrás: el coste es proporcional a esa distancia y no a la edad de la
+    generación.
+
+    El historial es un búfer circular acotado por memoria: al superar
+    'memoria_maxima' se descartan las generaciones más antiguas. Si el motor
+    avanza después de retroceder, el futuro descartado se sustituye por la
+    nueva rama.
+
+    El estado se representa según el Lattice: palabras uint64 (LatticeBits y
+    LatticeMapeado), claves de las células vivas (LatticeDisperso, plano
+    ilimitado) o un arreglo uint8 de estados (el resto, incluidas las reglas
+    de varios estados).
+    """
+
+    def __init__(self, automata: Any, memoria_maxima: int = MEMORIA_MAXIMA_POR_DEFECTO,
+                 generaciones_entre_claves: int = GENERACIONES_ENTRE_CLAVES):
+        """
+        Constructor que recibe el autómata a grabar y los límites del historial.
+
+        Args:
+            automata: El AutomataCelular cuyo Lattice se restaura al moverse por el historial.
+            memoria_maxima: Bytes máximos del historial (como mínimo se conserva el presente).
+            generaciones_entre_claves: Generaciones máximas entre dos cuadros clave (>= 1).
+
+        Raises:
+            ValueError: Si 'generaciones_entre_claves' < 1.
+        """
+        if generaciones_entre_claves < 1:
+            raise ValueError("Debe haber al menos una generación entre cuadros clave.")
+        from ..lattice.lattice_bits import LatticeBits
+        from ..lattice.lattice_disperso import LatticeDisperso
+        self.automata = automata
+        self.memoria_maxima = memoria_maxima
+        self.generaciones_entre_claves = generaciones_entre_claves
+        lattice = automata.lattice
+        self.modo = ("palabras" if isinstance(lattice, LatticeBits)
+                     else "disperso" if isinstance(lattice, LatticeDisperso) else "celulas")
+        self.dimensiones = tuple(lattice.obtener_dimensiones())
+
+        self._generaciones: deque = deque()        # Generación de cada estado retenido (el más antiguo primero)
+        self._deltas: deque = deque()              # Delta del estado anterior a cada estado (None en el primero)
+        self._claves: OrderedDict = OrderedDict()  # Posición absoluta -> cuadro clave
+        self._base = 0                             # Posición absoluta del estado más antiguo
+        self._presente: Any = None                 # Estado de la última generación grabada
+        self._cursor: Optional[int] = None         # Posición mostrada, si no es el presente
+        self._estado_cursor: Any = None            # Estado de esa posición
+        self._bytes_deltas = 0
+        self._desde_clave = 0                      # Bytes de los deltas desde el último cuadro clave
+        self._bloques: List[Tuple[Any, Any]] = []  # Partes de una generación entregada por bloques
+        self._restaurando = False
+
+    # --- Consulta ---------------------------------------------------------------------
+
+    @property
+    def generacion(self) -> int:
+        """
+        La generación que muestra ahora el Lattice (la del cursor, o la última grabada).
+        """
+        posicion = self._cursor if self._cursor is not None else self._base + len(self._generaciones) - 1
+        return self._generaciones[posicion - self._base]
+
+    @property
+    def en_presente(self) -> bool:
+        """
+        Indica si el Lattice muestra la última generación grabada.
+        """
+        return self._cursor is None
+
+    def generaciones_retenidas(self) -> Tuple[int, int]:
+        """
+        Devuelve la generación más antigua y la más reciente del historial.
+        """
+        return self._generaciones[0], self._generaciones[-1]
+
+    def memoria_usada(self) -> int:
+        """
+        Devuelve los bytes ocupados por el historial (deltas, cuadros clave y estados completos).
+        """
+        completos = sum(clave.nbytes for clave in self._claves.values()) + self._presente.nbytes
+        if self._estado_cursor is not None:
+            completos += self._estado_cursor.nbytes
+        return self._bytes_deltas + completos
+
+    # --- Grabación (llamada por el motor en cada generación) ----------------------------
+
+    def reiniciar(self, lattice: Any, generacion: int = 0):
+        """
+        Descarta el historial y empieza a grabar desde el estado actual del Lattice.
+
+        Args:
+            lattice: El Lattice con el estado de partida.
+            generacion: La generación que corresponde a ese estado.
+        """
+        self._presente = self._leer_estado(lattice)
+        self._generaciones = deque([generacion])
+        self._deltas = deque([None])
+        self._claves = OrderedDict(((0, self._presente.copy()),))
+        self._base = 0
+        self._cursor = None
+        self._estado_cursor = None
+        self._bytes_deltas = 0
+        self._desde_clave = 0
+        self._bloques = []
+
+    def lattice_modificado(self):
+        """
+        El Lattice cambió desde fuera del motor (ej., al colocar un patrón): se graba desde cero.
+
+        Los cambios hechos por el propio grabador al restaurar una generación se ignoran.
+        """
+        if not self._restaurando:
+            self.reiniciar(self.automata.obtener_lattice(), self.generacion)
+
+    def registrar_cambios(self, cambios: Iterable[Tuple[Tuple[int, int], int, int]]):
+        """
+        Cierra una generación a partir de la lista de células que cambiaron.
+
+        Args:
+            cambios: Tuplas (célula, estado anterior, estado nuevo).
+        """
+        cambios = list(cambios)
+        if self.modo == "disperso":
+            claves = np.fromiter((x * _ZANCADA_DISPERSA + y + _DESPLAZAMIENTO_DISPERSO
+                                  for (x, y), _, _ in cambios), dtype=np.int64, count=len(cambios))
+            self._cerrar((np.unique(claves), None))
+            return
+        Y_MAX = self.dimensiones[1]
+        indices = np.fromiter((x * Y_MAX + y for (x, y), _, _ in cambios), dtype=np.int64, count=len(cambios))
+        valores = np.fromiter((anterior ^ nuevo for _, anterior, nuevo in cambios),
+                              dtype=np.uint8, count=len(cambios))
+        self._cerrar((self._indices(indices), valores))
+
+    def registrar_arreglos(self, anterior: Any, nuevo: Any):
+        """
+        Cierra una generación comparando los arreglos (X_MAX, Y_MAX) de dos generaciones.
+        """
+        anterior = anterior.reshape(-1)
+        nuevo = nuevo.reshape(-1)
+        indices = np.flatnonzero(anterior != nuevo)
+        self._cerrar((self._indices(indices), anterior[indices] ^ nuevo[indices]))
+
+    def registrar_palabras(self, anterior: Any, nuevo: Any):
+        """
+        Cierra una generación comparando dos estados empaquetados (X_MAX, W).
+        """
+        diferencia = (anterior ^ nuevo).reshape(-1)
+        indices = np.flatnonzero(diferencia)
+        self._cerrar((self._indices(indices), diferencia[indices]))
+
+    def acumular_palabras(self, anterior: Any, nuevo: Any, fila_inicial: int):
+        """
+        Añade un bloque de filas empaquetadas de la generación en curso, sin cerrarla.
+        """
+        diferencia = (anterior ^ nuevo).reshape(-1)
+        indices = np.flatnonzero(diferencia)
+        self._bloques.append((indices + fila_inicial * anterior.shape[1], diferencia[indices]))
+
+    def cerrar_generacion(self):
+        """
+        Cierra una generación entregada por bloques ('acumular_palabras').
+        """
+        bloques, self._bloques = self._bloques, []
+        if not bloques:
+            self._cerrar((self._indices(np.empty(0, dtype=np.int64)), np.empty(0, dtype=np.uint64)))
+            return
+        self._cerrar((self._indices(np.concatenate([indices for indices, _ in bloques])),
+                      np.concatenate([valores for _, valores in bloques])))
+
+    def registrar_vivas(self, vivas: Iterable[Tuple[int, int]], generaciones: int = 1):
+        """
+        Cierra un avance de una o varias generaciones a partir de las células vivas.
+
+        Con saltos de varias generaciones (HashLife) solo se retienen los estados
+        entre saltos.
+        """
+        nuevo = np.zeros_like(self._presente)
+        Y_MAX = self.dimensiones[1]
+        vivas = list(vivas)
+        nuevo[np.fromiter((x * Y_MAX + y for x, y in vivas), dtype=np.int64, count=len(vivas))] = 1
+        self._cerrar_desde_estado(nuevo, generaciones)
+
+    def saltar(self, generaciones: int):
+        """
+        Avanza el contador sin cambiar el estado (periodos completos de un ciclo ya detectado).
+        """
+        if generaciones:
+            self._cerrar(self._delta_vacio(), generaciones)
+
+    # --- Movimiento por el historial ----------------------------------------------------
+
+    def ir_a(self, generacion: int) -> int:
+        """
+        Restaura en el Lattice la generación retenida más reciente que no supera la pedida.
+
+        Las generaciones fuera del historial se limitan a la más antigua o a la
+        más reciente. El motor puede seguir avanzando desde ahí (una nueva rama).
+
+        Args:
+            generacion: La generación a mostrar.
+
+        Returns:
+            La generación restaurada.
+        """
+        import bisect
+        posicion = self._base + max(0, bisect.bisect_right(self._generaciones, generacion) - 1)
+        return self._mover(posicion)
+
+    def retroceder(self, pasos: int = 1) -> int:
+        """
+        Restaura la generación retenida 'pasos' posiciones antes de la actual.
+
+        Returns:
+            La generación restaurada.
+        """
+        return self._mover(self._posicion_actual() - pasos)
+
+    def avanzar(self, pasos: int = 1) -> int:
+        """
+        Restaura la generación retenida 'pasos' posiciones después de la actual (sin pasar del presente).
+
+        Returns:
+            La generación restaurada.
+        """
+        return self._mover(self._posicion_actual() + pasos)
+
+    def volver_al_presente(self) -> int:
+        """
+        Restaura la última generación grabada.
+
+        Returns:
+            Esa generación.
+        """
+        return self._mover(self._base + len(self._generaciones) - 1)
+
+    # --- Implementación --------------------------------------------------------------
+
+    def _posicion_actual(self) -> int:
+        """
+        Devuelve la posición absoluta del estado que muestra el Lattice.
+        """
+        return self._cursor if self._cursor is not None else self._base + len(self._generaciones) - 1
+
+    def _indices(self, indices: Any) -> Any:
+        """
+        Reduce los índices de un delta a int32 si caben (la mitad de memoria).
+        """
+        return indices.astype(np.int32) if self._presente.size < 2 ** 31 else indices.astype(np.int64)
+
+    def _delta_vacio(self) -> Tuple[Any, Any]:
+        """
+        Devuelve un delta sin cambios.
+        """
+        if self.modo == "disperso":
+            return np.empty(0, dtype=np.int64), None
+        return self._indices(np.empty(0, dtype=np.int64)), np.empty(0, dtype=self._presente.dtype)
+
+    @staticmethod
+    def _tamano(delta: Tuple[Any, Any]) -> int:
+        """
+        Devuelve los bytes que ocupa un delta.
+        """
+        return delta[0].nbytes + (delta[1].nbytes if delta[1] is not None else 0)
+
+    def _aplicar(self, estado: Any, delta: Tuple[Any, Any]) -> Any:
+        """
+        Aplica un delta (XOR) a un estado; el mismo delta avanza o retrocede una generación.
+
+        Returns:
+            El estado resultante (el mismo arreglo, salvo en modo disperso).
+        """
+        indices, valores = delta
+        if valores is None:
+            return np.setxor1d(estado, indices, assume_unique=True)
+        estado[indices] ^= valores
+        return estado
+
+    def _leer_estado(self, lattice: Any) -> Any:
+        """
+        Lee el estado completo del Lattice en la representación del grabador (arreglo plano).
+        """
+        if self.modo == "palabras":
+            return np.array(lattice.obtener_palabras(), dtype=np.uint64).reshape(-1)
+        if self.modo == "disperso":
+            claves = [x * _ZANCADA_DISPERSA + y + _DESPLAZAMIENTO_DISPERSO
+                      for x, y in lattice.obtener_celulas_vivas()]
+            return np.unique(np.array(claves, dtype=np.int64))
+        estado = lattice.obtener_estado()
+        if hasattr(estado, "a_arreglo"):
+            return np.array(estado.a_arreglo(), dtype=np.uint8).reshape(-1)
+        arreglo = np.zeros(self.dimensiones, dtype=np.uint8)
+        for (x, y), valor in estado.items():
+            arreglo[x, y] = valor
+        return arreglo.reshape(-1)
+
+    def _cerrar_desde_estado(self, nuevo: Any, generaciones: int):
+        """
+        Cierra un avance a partir del estado completo nuevo (el delta es su XOR con el presente).
+        """
+        if self._cursor is not None:
+            self._descartar_futuro()
+        diferencia = self._presente ^ nuevo
+        indices = np.flatnonzero(diferencia)
+        self._cerrar((self._indices(indices), diferencia[indices]), generaciones)
+
+    def _cerrar(self, delta: Tuple[Any, Any], generaciones: int = 1):
+        """
+        Añade una generación al historial: aplica el delta al presente y, si toca, guarda un cuadro clave.
+        """
+        if self._cursor is not None:
+            self._descartar_futuro()
+        self._presente = self._aplicar(self._presente, delta)
+        self._generaciones.append(self._generaciones[-1] + generaciones)
+        self._deltas.append(delta)
+        tamano = self._tamano(delta)
+        self._bytes_deltas += tamano
+        self._desde_clave += tamano
+
+        posicion = self._base + len(self._generaciones) - 1
+        ultima_clave = next(reversed(self._claves)) if self._claves else self._base
+        if (posicion - ultima_clave >= self.generaciones_entre_claves
+                or self._desde_clave >= self._presente.nbytes):
+            self._claves[posicion] = self._presente.copy()
+            self._desde_clave = 0
+        self._recortar()
+
+    def _descartar_futuro(self):
+        """
+        El motor avanzó desde una generación pasada: se descartan las posteriores al cursor.
+        """
+        cursor = self._cursor
+        while self._base + len(self._generaciones) - 1 > cursor:
+            self._generaciones.pop()
+            self._bytes_deltas -= self._tamano(self._deltas.pop())
+        for posicion in [posicion for posicion in self._claves if posicion > cursor]:
+            del self._claves[posicion]
+        self._presente = self._estado_cursor
+        self._cursor = None
+        self._estado_cursor = None
+        self._desde_clave = 0
+
+    def _recortar(self):
+        """
+        Descarta las generaciones más antiguas mientras el historial supere la memoria máxima.
+        """
+        while len(self._generaciones) > 1 and self.memoria_usada() > self.memoria_maxima:
+            self._generaciones.popleft()
+            self._deltas.popleft()
+            self._claves.pop(self._base, None)
+            self._base += 1
+            # El nuevo estado más antiguo ya no necesita el delta que lo unía al descartado.
+            self._bytes_deltas -= self._tamano(self._deltas[0])
+            self._deltas[0] = None
+
+    def _mover(self, posicion: int) -> int:
+        """
+        Reconstruye el estado de una posición desde el punto conocido más cercano y lo restaura.
+        """
+        ultima = self._base + len(self._generaciones) - 1
+        posicion = min(max(posicion, self._base), ultima)
+        actual = self._posicion_actual()
+        if posicion == actual:
+            return self.generacion
+
+        # Punto de partida: un cuadro clave, el presente o el propio cursor (el más cercano).
+        candidatos = [(abs(clave - posicion), clave, False) for clave in self._claves]
+        candidatos.append((ultima - posicion, ultima, False))
+        if self._cursor is not None:
+            candidatos.append((abs(self._cursor - posicion), self._cursor, True))
+        _, origen, es_cursor = min(candidatos)
+        if es_cursor:
+            estado = self._estado_cursor.copy()
+        elif origen == ultima:
+            estado = self._presente.copy()
+        else:
+            estado = self._claves[origen].copy()
+        # Hacia delante se aplica el delta de cada posición nueva; hacia atrás, el de la que se deja.
+        if posicion > origen:
+            recorrido = range(origen + 1, posicion + 1)
+        else:
+            recorrido = range(origen, posicion, -1)
+        for p in recorrido:
+            estado = self._aplicar(estado, self._deltas[p - self._base])
+
+        anterior = self._estado_cursor if self._cursor is not None else self._presente
+        if posicion == ultima:
+            self._cursor, self._estado_cursor = None, None
+            estado = self._presente
+        else:
+            self._cursor, self._estado_cursor = posicion, estado
+        self._restaurar(anterior, estado)
+        return self.generacion
+
+    def _restaurar(self, anterior: Any, estado: Any):
+        """
+        Escribe un estado en el Lattice del autómata y le avisa del cambio (sin reiniciar el historial).
+        """
+        automata = self.automata
+        lattice = automata.obtener_lattice()
+        if self.modo == "palabras":
+            lattice.establecer_palabras(estado.reshape(lattice.obtener_palabras().shape).copy())
+        elif self.modo == "disperso":
+            filas, columnas = np.divmod(estado, _ZANCADA_DISPERSA)
+            lattice.establecer_celulas_vivas(dict.fromkeys(
+                zip(filas.tolist(), (columnas - _DESPLAZAMIENTO_DISPERSO).tolist()), 1))
+        elif hasattr(lattice, "establecer_arreglo"):
+            lattice.establecer_arreglo(estado.reshape(self.dimensiones).copy())
+        else:
+            # Lattice tipo dict: solo se escriben las células que difieren.
+            Y_MAX = self.dimensiones[1]
+            for indice in np.flatnonzero(anterior != estado).tolist():
+                lattice.actualizar_estado((indice // Y_MAX, indice % Y_MAX), int(estado[indice]))
+
+        # Los demás observadores siguen desde la generación restaurada.
+        generacion = self.generacion
+        for observador in (automata.detector_ciclos, automata.estadisticas):
+            if observador is not None:
+                observador.generacion = generacion
+        self._restaurando = True
+        try:
+            automata.lattice_modificado()
+        finally:
+            self._restaurando = False
@@ -1,4 +1,4 @@
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, List
 from abc import ABC, abstractmethod
 
 class IEstrategiaVecindad(ABC):
@@ -25,4 +25,59 @@ class IEstrategiaVecindad(ABC):
         Raises:
             NotImplementedError: Si el método no es implementado por una subclase.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def obtener_desplazamientos(self) -> List[Tuple[int, int]]:
+        """
+        Método abstracto que devuelve los desplazamientos (dx, dy) que definen la vecindad.
+        
+        Permite a los motores vectorizados construir el conteo de vecinos sobre
+        arreglos completos sin conocer la forma concreta de la vecindad.
+        
+        Returns:
+            La lista de desplazamientos relativos a la célula central.
+            
+        Raises:
+            NotImplementedError: Si el método no es implementado por una subclase.
+        """
+        pass
+
+    @abstractmethod
+    def obtener_vecinos(self, celula: Tuple[int, int], dimensiones: Tuple[int, int], frontera: Any) -> List[Tuple[int, int]]:
+        """
+        Método abstracto que devuelve las coordenadas reales de los vecinos de una célula.
+        
+        Args:
+            celula: La coordenada (x, y) de la célula central.
+            dimensiones: Las dimensiones máximas del Lattice (X_MAX, Y_MAX).
+            frontera: Un objeto que implementa la ICondicionFrontera.
+            
+        Returns:
+            La lista de coordenadas de los vecinos, ya ajustadas por la frontera.
+            
+        Raises:
+            NotImplementedError: Si el método no es implementado por una subclase.
+        """
+        pass
+
+    def contar_vecinos_arreglo(self, vivas: Any, frontera: Any) -> Any:
+        """
+        Cuenta los vecinos vivos de todas las células de un arreglo a la vez.
+        
+        La implementación por defecto se basa en 'obtener_desplazamientos()' y
+        construye el halo con la Condición de Frontera; las estrategias con
+        muchos vecinos la sobrescriben para reutilizar cálculos entre generaciones.
+        
+        Args:
+            vivas: Arreglo (X_MAX, Y_MAX) con 1 en las células vivas y 0 en el resto.
+            frontera: Un objeto que implementa la ICondicionFrontera.
+            
+        Returns:
+            Un arreglo de enteros (X_MAX, Y_MAX) con el número de vecinos vivos.
+        """
+        # Importación diferida: NumPy solo es necesario para el conteo en bloque.
+        from .conteo_segmentos import contar_vecinos_arreglo, segmentos_de_desplazamientos
+        desplazamientos = self.obtener_desplazamientos()
+        return contar_vecinos_arreglo(vivas, frontera, desplazamientos,
+                                      segmentos_de_desplazamientos(desplazamientos))
@@ -0,0 +1,119 @@
+from array import array
+from collections import OrderedDict
+from typing import Tuple, List, Any, Optional
+
+# Número máximo de tablas conservadas en la caché (una por combinación de
+# dimensiones, vecindad y frontera). Al cambiar las dimensiones se construye
+# una tabla nueva y las más antiguas se descartan.
+MAX_TABLAS_EN_CACHE = 4
+
+
+class TablaVecindad:
+    """
+    Tabla precalculada de índices de vecinos para unas dimensiones, una vecindad
+    y una condición de frontera concretas.
+
+    Cada célula (x, y) tiene el índice lineal i = x * Y_MAX + y. La tabla plana
+    'indices' (un array('i') compacto, 4 bytes por vecino) guarda, para cada
+    célula i, los índices lineales de sus k vecinos en las posiciones
+    [i * k, (i + 1) * k); -1 marca una vecina fantasma de una frontera fija
+    (siempre muerta). 'celulas' traduce cada índice lineal a su coordenada y
+    termina en None, de modo que celulas[-1] nunca está viva en ningún Lattice.
+    La Condición de Frontera solo se consulta al construir la tabla (una vez
+    por eje y desplazamiento), nunca durante el conteo.
+    """
+
+    def __init__(self, dimensiones: Tuple[int, int], desplazamientos: List[Tuple[int, int]], frontera: Any):
+        """
+        Construye la tabla de índices de vecinos.
+
+        Args:
+            dimensiones: Las dimensiones máximas del Lattice (X_MAX, Y_MAX).
+            desplazamientos: Los desplazamientos (dx, dy) de la vecindad.
+            frontera: La instancia de ICondicionFrontera para el manejo de bordes.
+        """
+        self.dimensiones = dimensiones
+        self.tipo_frontera = type(frontera)
+        self.num_vecinos = len(desplazamientos)
+        X_MAX, Y_MAX = dimensiones
+
+        # 1. La frontera se resuelve por eje: X_MAX + Y_MAX llamadas por desplazamiento.
+        filas = {dx: [frontera.obtener_coordenada_real(x + dx, X_MAX) for x in range(X_MAX)]
+                 for dx in {dx for dx, _ in desplazamientos}}
+        columnas = {dy: [frontera.obtener_coordenada_real(y + dy, Y_MAX) for y in range(Y_MAX)]
+                    for dy in {dy for _, dy in desplazamientos}}
+
+        # 2. Tabla plana de índices lineales de vecinos (-1 = vecina fantasma), fila a fila
+        #    para no materializar nunca una lista de enteros de todo el tablero.
+        self.indices = array("i")
+        for x in range(X_MAX):
+            bases = [-1 if filas[dx][x] is None else filas[dx][x] * Y_MAX for dx, _ in desplazamientos]
+            columnas_fila = [columnas[dy] for _, dy in desplazamientos]
+            self.indices.extend(
+                -1 if base < 0 or columna[y] is None else base + columna[y]
+                for y in range(Y_MAX)
+                for base, columna in zip(bases, columnas_fila)
+            )
+
+        # 3. Coordenada de cada índice lineal (las tuplas comparten los objetos int),
+        #    más el centinela None al que apunta el índice -1.
+        ys = list(range(Y_MAX))
+        self.celulas: List[Optional[Tuple[int, int]]] = [(x, y) for x in range(X_MAX) for y in ys]
+        self.celulas.append(None)
+
+    def indices_de(self, celula: Tuple[int, int]) -> "array":
+        """
+        Devuelve los índices lineales de los k vecinos de una célula (-1 = vecina fantasma).
+
+        Args:
+            celula: La coordenada (x, y) de la célula central.
+
+        Returns:
+            Un array('i') de k índices, que se traducen a coordenadas con 'celulas'.
+        """
+        k = self.num_vecinos
+        inicio = (celula[0] * self.dimensiones[1] + celula[1]) * k
+        return self.indices[inicio:inicio + k]
+
+    def vecinos_de(self, celula: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """
+        Devuelve las coordenadas de los vecinos de una célula.
+
+        Args:
+            celula: La coordenada (x, y) de la célula central.
+
+        Returns:
+            Una lista con las coordenadas de los vecinos (k, salvo junto a una frontera fija).
+        """
+        celulas = self.celulas
+        return [celulas[j] for j in self.indices_de(celula) if j >= 0]
+
+
+_CACHE: "OrderedDict[tuple, TablaVecindad]" = OrderedDict()
+
+
+def obtener_tabla_vecindad(dimensiones: Tuple[int, int], desplazamientos: List[Tuple[int, int]],
+                           frontera: Any) -> TablaVecindad:
+    """
+    Devuelve la tabla de vecindad memorizada para la combinación dada, creándola si no existe.
+
+    Las condiciones de frontera no tienen estado, por lo que la clave usa su tipo.
+
+    Args:
+        dimensiones: Las dimensiones máximas del Lattice (X_MAX, Y_MAX).
+        desplazamientos: Los desplazamientos (dx, dy) de la vecindad.
+        frontera: La instancia de ICondicionFrontera para el manejo de bordes.
+
+    Returns:
+        La TablaVecindad correspondiente.
+    """
+    clave = (tuple(dimensiones), tuple(desplazamientos), type(frontera))
+    tabla = _CACHE.get(clave)
+    if tabla is None:
+        tabla = TablaVecindad(dimensiones, desplazamientos, frontera)
+        _CACHE[clave] = tabla
+        while len(_CACHE) > MAX_TABLAS_EN_CACHE:
+            _CACHE.popitem(last=False)
+    else:
+        _CACHE.move_to_end(clave)
+    return tabla
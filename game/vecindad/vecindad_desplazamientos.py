@@ -0,0 +1,106 @@
+from typing import Tuple, Dict, Any, List, Optional
+from .i_estrategia_vecindad import IEstrategiaVecindad
+from .tabla_vecindad import TablaVecindad, obtener_tabla_vecindad
+from ..frontera.i_condicion_frontera import ICondicionFrontera
+
+# Por encima de este número de vecinos no se construye la TablaVecindad por célula
+# (ocuparía k referencias por célula): el conteo por célula resuelve la frontera al vuelo.
+MAX_VECINOS_CON_TABLA = 24
+
+class VecindadDesplazamientos(IEstrategiaVecindad):
+    """
+    Estrategia de Vecindad definida por una lista de desplazamientos (dx, dy) de cualquier radio.
+
+    Es la base de las vecindades de "Larger than Life" (Moore de radio r, von
+    Neumann y hexagonal). El conteo por célula (Lattices tipo dict) recorre los
+    desplazamientos; el conteo en bloque (Lattices en arreglo) usa sumas
+    acumuladas a lo largo de los bordes de la vecindad, con un coste por célula
+    que no depende del radio (ver conteo_segmentos).
+    """
+
+    def __init__(self, desplazamientos: List[Tuple[int, int]]):
+        """
+        Constructor que recibe los desplazamientos de la vecindad.
+
+        Args:
+            desplazamientos: Los desplazamientos (dx, dy); (0, 0) significa que la célula
+                             se cuenta a sí misma.
+
+        Raises:
+            ValueError: Si la lista está vacía o tiene desplazamientos repetidos.
+        """
+        if not desplazamientos or len(set(desplazamientos)) != len(desplazamientos):
+            raise ValueError("La vecindad necesita desplazamientos distintos y al menos uno.")
+        self._desplazamientos = list(desplazamientos)
+        self.radio = max(max(abs(dx), abs(dy)) for dx, dy in desplazamientos)
+        self._tabla: Optional[TablaVecindad] = None
+        self._segmentos: Any = False  # False = aún sin calcular (None = vecindad no segmentable).
+
+    def _obtener_tabla(self, dimensiones: Tuple[int, int], frontera: ICondicionFrontera) -> TablaVecindad:
+        """
+        Devuelve la tabla para las dimensiones y la frontera dadas (igual que VecindadMoore).
+        """
+        tabla = self._tabla
+        if tabla is None or tabla.dimensiones != dimensiones or tabla.tipo_frontera is not type(frontera):
+            tabla = obtener_tabla_vecindad(dimensiones, self._desplazamientos, frontera)
+            self._tabla = tabla
+        return tabla
+
+    def contar_vecinos_vivos(self, celula: Tuple[int, int], lattice: Dict[Tuple[int, int], Any], dimensiones: Tuple[int, int], frontera: ICondicionFrontera) -> int:
+        """
+        Cuenta el número de vecinos vivos (estado 1) de una célula dada.
+
+        Args:
+            celula: La coordenada (x, y) de la célula central.
+            lattice: El diccionario con el estado actual de todas las células.
+            dimensiones: Las dimensiones máximas del lattice (X_MAX, Y_MAX).
+            frontera: La instancia de ICondicionFrontera para el manejo de bordes.
+
+        Returns:
+            El número total de vecinos vivos.
+        """
+        obtener = lattice.get
+        return sum(1 for vecino in self.obtener_vecinos(celula, dimensiones, frontera) if obtener(vecino) == 1)
+
+    def obtener_desplazamientos(self) -> List[Tuple[int, int]]:
+        """
+        Devuelve los desplazamientos (dx, dy) de la vecindad.
+        """
+        return list(self._desplazamientos)
+
+    def obtener_vecinos(self, celula: Tuple[int, int], dimensiones: Tuple[int, int], frontera: ICondicionFrontera) -> List[Tuple[int, int]]:
+        """
+        Devuelve las coordenadas reales de los vecinos de una célula.
+
+        Args:
+            celula: La coordenada (x, y) de la célula central.
+            dimensiones: Las dimensiones máximas del lattice (X_MAX, Y_MAX).
+            frontera: La instancia de ICondicionFrontera para el manejo de bordes.
+
+        Returns:
+            La lista de coordenadas (nx, ny) de los vecinos.
+        """
+        if len(self._desplazamientos) <= MAX_VECINOS_CON_TABLA:
+            return self._obtener_tabla(dimensiones, frontera).vecinos_de(celula)
+        x, y = celula
+        X_MAX, Y_MAX = dimensiones
+        real = frontera.obtener_coordenada_real
+        vecinos = [(real(x + dx, X_MAX), real(y + dy, Y_MAX)) for dx, dy in self._desplazamientos]
+        # Las vecinas fantasma de una frontera fija (None) están siempre muertas.
+        return [vecino for vecino in vecinos if None not in vecino]
+
+    def contar_vecinos_arreglo(self, vivas: Any, frontera: ICondicionFrontera) -> Any:
+        """
+        Cuenta los vecinos vivos de todas las células en bloque.
+
+        Args:
+            vivas: Arreglo (X_MAX, Y_MAX) con 1 en las células vivas y 0 en el resto.
+            frontera: La instancia de ICondicionFrontera con la que se construye el halo.
+
+        Returns:
+            Un arreglo de enteros (X_MAX, Y_MAX) con el número de vecinos vivos.
+        """
+        from .conteo_segmentos import contar_vecinos_arreglo, segmentos_de_desplazamientos
+        if self._segmentos is False:
+            self._segmentos = segmentos_de_desplazamientos(self._desplazamientos)
+        return contar_vecinos_arreglo(vivas, frontera, self._desplazamientos, self._segmentos)
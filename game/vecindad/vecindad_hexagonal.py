@@ -0,0 +1,29 @@
+from .vecindad_desplazamientos import VecindadDesplazamientos
+
+class VecindadHexagonal(VecindadDesplazamientos):
+    """
+    Vecindad hexagonal de radio r sobre la retícula cuadrada (coordenadas axiales).
+
+    Cada fila x de la retícula se interpreta desplazada media célula respecto a
+    la anterior, de modo que los 6 vecinos de (x, y) son los de Moore salvo
+    (x - 1, y - 1) y (x + 1, y + 1). Con radio r son las células con
+    |dx| <= r, |dy| <= r y |dx + dy| <= r.
+    """
+
+    def __init__(self, radio: int = 1, incluir_centro: bool = False):
+        """
+        Constructor que genera los desplazamientos del hexágono.
+
+        Args:
+            radio: El radio r de la vecindad (r >= 1).
+            incluir_centro: Si la célula central cuenta como su propia vecina.
+
+        Raises:
+            ValueError: Si el radio no es positivo.
+        """
+        if radio < 1:
+            raise ValueError("El radio de la vecindad debe ser al menos 1.")
+        super().__init__([(dx, dy)
+                          for dx in range(-radio, radio + 1)
+                          for dy in range(-radio, radio + 1)
+                          if abs(dx + dy) <= radio and (incluir_centro or (dx, dy) != (0, 0))])
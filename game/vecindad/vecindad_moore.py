@@ -1,16 +1,47 @@
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, List, Optional
 from .i_estrategia_vecindad import IEstrategiaVecindad
+from .tabla_vecindad import TablaVecindad, obtener_tabla_vecindad
 from ..frontera.i_condicion_frontera import ICondicionFrontera 
 
+# Lista de las 8 direcciones (deltas) para la Vecindad de Moore
+DELTAS_MOORE = [(-1, -1), (-1, 0), (-1, 1),
+                ( 0, -1),          ( 0, 1),
+                ( 1, -1), ( 1, 0), ( 1, 1)]
+
+# Estados que cuentan como "vivos": 1 (vivo) o -1 (marcado para morir; solo aparece
+# en JuegoDeLaVida sobre Lattices sin doble búfer).
+_ESTADOS_VIVOS = frozenset((1, -1))
+
 class VecindadMoore(IEstrategiaVecindad):
     """
     Implementación concreta de IEstrategiaVecindad utilizando la Vecindad de Moore.
     
     Esta estrategia considera las 8 células adyacentes a una célula central.
     Delega el manejo de coordenadas fuera de límite (bordes) a la interfaz 
-    ICondicionFrontera inyectada.
+    ICondicionFrontera inyectada, pero solo al construir la TablaVecindad
+    (una vez por combinación de dimensiones y frontera); el conteo por célula
+    usa la tabla precalculada.
     """
 
+    def __init__(self):
+        """
+        Constructor que inicializa la referencia a la tabla de vecindad en uso.
+        """
+        self._tabla: Optional[TablaVecindad] = None
+
+    def _obtener_tabla(self, dimensiones: Tuple[int, int], frontera: ICondicionFrontera) -> TablaVecindad:
+        """
+        Devuelve la tabla para las dimensiones y la frontera dadas.
+        
+        Si cambian las dimensiones (o el tipo de frontera) la tabla actual se
+        invalida y se obtiene otra de la caché de tablas.
+        """
+        tabla = self._tabla
+        if tabla is None or tabla.dimensiones != dimensiones or tabla.tipo_frontera is not type(frontera):
+            tabla = obtener_tabla_vecindad(dimensiones, DELTAS_MOORE, frontera)
+            self._tabla = tabla
+        return tabla
+
     def contar_vecinos_vivos(self, celula: Tuple[int, int], lattice: Dict[Tuple[int, int], Any], dimensiones: Tuple[int, int], frontera: ICondicionFrontera) -> int:
         """
         Cuenta el número de vecinos "vivos" para una célula dada.
@@ -25,26 +56,40 @@ class VecindadMoore(IEstrategiaVecindad):
             El número total de vecinos vivos (estado 1 o -1).
         """
         puntaje = 0
-        x, y = celula
-        X_MAX, Y_MAX = dimensiones
+        obtener = lattice.get
+        tabla = self._obtener_tabla(dimensiones, frontera)
+        celulas = tabla.celulas
+        k = tabla.num_vecinos
+        inicio = (celula[0] * dimensiones[1] + celula[1]) * k
         
-        # Lista de las 8 direcciones (deltas) para la Vecindad de Moore
-        deltas = [(-1, -1), (-1, 0), (-1, 1),
-                  ( 0, -1),          ( 0, 1),
-                  ( 1, -1), ( 1, 0), ( 1, 1)]
-
-        for dx, dy in deltas:
-            # 1. Aplicar la Condición de Frontera para obtener la coordenada real.
-            #    Esto es clave: la VecindadMoore no sabe cómo manejar el borde, 
-            #    solo pide la coordenada "real" a la implementación de Frontera.
-            nx = frontera.obtener_coordenada_real(x + dx, X_MAX)
-            ny = frontera.obtener_coordenada_real(y + dy, Y_MAX)
-            
-            vecino = (nx, ny)
-
-            # 2. Revisa el estado del vecino en el Lattice.
-            #    Se cuenta como "vivo" si su estado es 1 (vivo) o -1 (marcado para morir).
-            if lattice.get(vecino) in [1, -1]: 
+        # Las coordenadas de los vecinos ya están resueltas por la Condición de
+        # Frontera en la tabla precalculada: no hay llamadas a la frontera aquí.
+        # Una vecina fantasma (-1) es celulas[-1] = None, que nunca está viva.
+        for j in tabla.indices[inicio:inicio + k]:
+            if obtener(celulas[j]) in _ESTADOS_VIVOS: 
                 puntaje += 1
 
-        return puntaje
\ No newline at end of file
+        return puntaje
+
+    def obtener_desplazamientos(self) -> List[Tuple[int, int]]:
+        """
+        Devuelve las 8 direcciones (deltas) de la Vecindad de Moore.
+        
+        Returns:
+            La lista de desplazamientos (dx, dy) de las 8 células adyacentes.
+        """
+        return list(DELTAS_MOORE)
+
+    def obtener_vecinos(self, celula: Tuple[int, int], dimensiones: Tuple[int, int], frontera: ICondicionFrontera) -> List[Tuple[int, int]]:
+        """
+        Devuelve las coordenadas reales de las 8 células adyacentes.
+        
+        Args:
+            celula: La coordenada (x, y) de la célula central.
+            dimensiones: Las dimensiones máximas del lattice (X_MAX, Y_MAX).
+            frontera: La instancia de ICondicionFrontera para el manejo de bordes.
+            
+        Returns:
+            La lista de coordenadas (nx, ny) de los vecinos.
+        """
+        return self._obtener_tabla(dimensiones, frontera).vecinos_de(celula)
@@ -0,0 +1,27 @@
+from .vecindad_desplazamientos import VecindadDesplazamientos
+
+class VecindadMooreRadio(VecindadDesplazamientos):
+    """
+    Vecindad de Moore de radio r: el cuadrado (2r + 1) x (2r + 1) centrado en la célula.
+
+    Con r = 1 son las 8 células de VecindadMoore. El conteo en bloque es una
+    tabla de sumas acumuladas (imagen integral): cuatro lecturas por célula.
+    """
+
+    def __init__(self, radio: int = 1, incluir_centro: bool = False):
+        """
+        Constructor que genera los desplazamientos del cuadrado.
+
+        Args:
+            radio: El radio r de la vecindad (r >= 1).
+            incluir_centro: Si la célula central cuenta como su propia vecina (M1 en "Larger than Life").
+
+        Raises:
+            ValueError: Si el radio no es positivo.
+        """
+        if radio < 1:
+            raise ValueError("El radio de la vecindad debe ser al menos 1.")
+        super().__init__([(dx, dy)
+                          for dx in range(-radio, radio + 1)
+                          for dy in range(-radio, radio + 1)
+                          if incluir_centro or (dx, dy) != (0, 0)])
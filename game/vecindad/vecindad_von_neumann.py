@@ -0,0 +1,27 @@
+from .vecindad_desplazamientos import VecindadDesplazamientos
+
+class VecindadVonNeumann(VecindadDesplazamientos):
+    """
+    Vecindad de von Neumann de radio r: las células a distancia Manhattan |dx| + |dy| <= r.
+
+    Con r = 1 son las 4 células ortogonales. El conteo en bloque suma los
+    prefijos por filas a lo largo de las dos diagonales del rombo.
+    """
+
+    def __init__(self, radio: int = 1, incluir_centro: bool = False):
+        """
+        Constructor que genera los desplazamientos del rombo.
+
+        Args:
+            radio: El radio r de la vecindad (r >= 1).
+            incluir_centro: Si la célula central cuenta como su propia vecina.
+
+        Raises:
+            ValueError: Si el radio no es positivo.
+        """
+        if radio < 1:
+            raise ValueError("El radio de la vecindad debe ser al menos 1.")
+        super().__init__([(dx, dy)
+                          for dx in range(-radio, radio + 1)
+                          for dy in range(-radio, radio + 1)
+                          if abs(dx) + abs(dy) <= radio and (incluir_centro or (dx, dy) != (0, 0))])
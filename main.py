@@ -1,4 +1,5 @@
 import sys
+import config
 from aplicacion_simulacion import AplicacionSimulacion
 from ejecutor_hilo import EjecutorSimulacion
 
@@ -17,7 +18,11 @@ def iniciar_aplicacion():
     # 2. Crea el objeto EjecutorSimulacion (el hilo de ejecución).
     #    Se inyecta la instancia de 'aplicacion' para que el hilo pueda acceder 
     #    a su lógica de Modelo y Vista.
-    program_thread = EjecutorSimulacion(aplicacion)
+    program_thread = EjecutorSimulacion(
+        aplicacion,
+        config.TAMANO_COLA_CUADROS,
+        config.GENERACIONES_POR_SEGUNDO
+    )
     
     # 3. Inicia la ejecución del hilo.
     #    El método run() de EjecutorSimulacion comenzará a ejecutarse en paralelo.
@@ -27,6 +32,10 @@ def iniciar_aplicacion():
     #    El método join() detiene la ejecución del hilo principal (main) hasta 
     #    que el 'program_thread' haya finalizado (p.ej., cuando se cierra la ventana).
     program_thread.join()
+    
+    # 5. Si el Modelo falló (el hilo ya mostró la excepción), termina con error.
+    if program_thread.hilo_modelo.error is not None:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,116 @@
+"""
+Cliente mínimo del ServidorEstado: reconstruye el estado a partir de los deltas.
+
+USO:
+    python -m red.cliente_estado --puerto 8765 [-n GENERACIONES]
+    python -m red.cliente_estado --unix /tmp/vida.sock
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Tuple, Optional, Any
+
+# Permite ejecutar el módulo desde cualquier directorio.
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+from red.protocolo_deltas import DecodificadorDeltas, CABECERA_MENSAJE, MAGIA_FLUJO
+from game.lattice.lattice_bits import desempaquetar_filas
+
+
+class ClienteEstado:
+    """
+    Cliente asyncio que recibe los mensajes de un ServidorEstado y mantiene el estado al día.
+    """
+
+    def __init__(self):
+        self.decodificador = DecodificadorDeltas()
+        self.bytes_recibidos = 0
+        self.mensajes = 0
+        self._lector: Optional[asyncio.StreamReader] = None
+        self._escritor: Optional[asyncio.StreamWriter] = None
+
+    async def conectar(self, puerto: Optional[int] = None, ruta_unix: Optional[str] = None,
+                       host: str = "127.0.0.1"):
+        """
+        Abre la conexión (TCP o socket Unix) y comprueba el identificador del flujo.
+
+        Raises:
+            ValueError: Si el servidor no envía el identificador esperado.
+        """
+        if ruta_unix:
+            self._lector, self._escritor = await asyncio.open_unix_connection(ruta_unix)
+        else:
+            self._lector, self._escritor = await asyncio.open_connection(host, puerto)
+        magia = await self._lector.readexactly(len(MAGIA_FLUJO))
+        if magia != MAGIA_FLUJO:
+            raise ValueError(f"Flujo desconocido: {magia!r}.")
+
+    async def recibir(self) -> Tuple[int, Any]:
+        """
+        Lee mensajes hasta que el estado avanza a una nueva generación.
+
+        Returns:
+            La generación y sus palabras uint64 (X_MAX, W) reconstruidas.
+
+        Raises:
+            asyncio.IncompleteReadError: Si el servidor cierra la conexión.
+        """
+        while True:
+            cabecera = CABECERA_MENSAJE.unpack(await self._lector.readexactly(CABECERA_MENSAJE.size))
+            carga = await self._lector.readexactly(cabecera[-1])
+            self.bytes_recibidos += CABECERA_MENSAJE.size + len(carga)
+            self.mensajes += 1
+            if self.decodificador.aplicar(cabecera, carga):
+                return self.decodificador.generacion, self.decodificador.palabras
+
+    def a_arreglo(self) -> Any:
+        """
+        Devuelve el estado reconstruido como arreglo uint8 (X_MAX, Y_MAX).
+        """
+        return desempaquetar_filas(self.decodificador.palabras, self.decodificador.dimensiones[1])
+
+    async def cerrar(self):
+        """
+        Cierra la conexión.
+        """
+        if self._escritor is not None:
+            self._escritor.close()
+            await self._escritor.wait_closed()
+
+
+async def _principal(opciones: argparse.Namespace):
+    """
+    Recibe generaciones e imprime su población y los bytes recibidos.
+    """
+    cliente = ClienteEstado()
+    await cliente.conectar(opciones.puerto, opciones.unix)
+    inicio = time.perf_counter()
+    recibidas = 0
+    try:
+        while opciones.generaciones is None or recibidas < opciones.generaciones:
+            generacion, palabras = await cliente.recibir()
+            recibidas += 1
+            poblacion = int(cliente.a_arreglo().sum())
+            print(f"Generación {generacion} | Población: {poblacion} | "
+                  f"Bytes/mensaje: {cliente.bytes_recibidos / cliente.mensajes:.0f}")
+    except asyncio.IncompleteReadError:
+        print("El servidor cerró la conexión.")
+    finally:
+        await cliente.cerrar()
+    tiempo = time.perf_counter() - inicio
+    print(f"Recibidas: {recibidas} generaciones en {tiempo:.2f} s | Bytes: {cliente.bytes_recibidos}")
+
+
+if __name__ == "__main__":
+    analizador = argparse.ArgumentParser(description="Visor de texto de un ServidorEstado.")
+    analizador.add_argument("--puerto", type=int, default=None)
+    analizador.add_argument("--unix", default=None, help="Ruta del socket Unix del servidor.")
+    analizador.add_argument("-n", "--generaciones", type=int, default=None)
+    opciones = analizador.parse_args()
+    if opciones.puerto is None and opciones.unix is None:
+        analizador.error("se requiere --puerto o --unix.")
+    asyncio.run(_principal(opciones))
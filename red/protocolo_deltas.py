@@ -0,0 +1,136 @@
+import struct
+import zlib
+import numpy as np
+from typing import Tuple, Optional
+
+# Identificador del flujo (se envía una vez al aceptar la conexión).
+MAGIA_FLUJO = b"LIFESTR1"
+
+# Tipos de mensaje.
+TIPO_CLAVE = 1   # Cuadro clave: todas las palabras empaquetadas (comprimidas).
+TIPO_DELTA = 2   # Delta: XOR con el cuadro de la generación 'base' (comprimido).
+
+# Cabecera de cada mensaje: tipo, generación, generación base (solo deltas),
+# X_MAX, Y_MAX y longitud de la carga comprimida.
+CABECERA_MENSAJE = struct.Struct("<BQQIII")
+
+# Nivel de zlib: los deltas son casi todo ceros, un nivel bajo ya comprime mucho y es rápido.
+NIVEL_COMPRESION = 1
+
+
+def codificar_mensaje(tipo: int, generacion: int, base: int, dimensiones: Tuple[int, int],
+                      palabras: np.ndarray) -> bytes:
+    """
+    Empaqueta un cuadro (clave o delta) como mensaje listo para enviar.
+
+    Args:
+        tipo: TIPO_CLAVE o TIPO_DELTA.
+        generacion: La generación del cuadro.
+        base: La generación de referencia del delta (igual a 'generacion' en un cuadro clave).
+        dimensiones: La tupla (X_MAX, Y_MAX) del Lattice.
+        palabras: Las palabras uint64 (X_MAX, W) del cuadro o del XOR con la base.
+
+    Returns:
+        La cabecera seguida de la carga comprimida con zlib.
+    """
+    carga = zlib.compress(np.ascontiguousarray(palabras, dtype="<u8").tobytes(), NIVEL_COMPRESION)
+    return CABECERA_MENSAJE.pack(tipo, generacion, base, dimensiones[0], dimensiones[1], len(carga)) + carga
+
+
+class CodificadorDeltas:
+    """
+    Convierte la secuencia de cuadros de un Lattice en mensajes clave y delta.
+
+    Cada cuadro se codifica como el XOR de sus filas empaquetadas con las del
+    cuadro anterior: en una generación típica casi todas las palabras son 0 y
+    zlib las reduce a unos pocos bytes. Los cuadros clave (el estado completo)
+    se generan solo cuando se piden y se reutilizan para todos los clientes.
+    """
+
+    def __init__(self, dimensiones: Tuple[int, int]):
+        """
+        Constructor que recibe las dimensiones del Lattice.
+
+        Args:
+            dimensiones: La tupla (X_MAX, Y_MAX).
+        """
+        self.dimensiones = dimensiones
+        self.generacion: Optional[int] = None
+        self._palabras: Optional[np.ndarray] = None
+        self._clave: Optional[bytes] = None
+        self._delta: Optional[bytes] = None
+
+    def nuevo_cuadro(self, palabras: np.ndarray, generacion: int):
+        """
+        Registra el cuadro de una nueva generación (el delta se calcula aquí, una sola vez).
+
+        Args:
+            palabras: Las palabras uint64 (X_MAX, W) de la generación (el codificador se queda con ellas).
+            generacion: La generación del cuadro.
+        """
+        anterior, base = self._palabras, self.generacion
+        self._palabras, self.generacion = palabras, generacion
+        self._clave = None
+        self._delta = None
+        if anterior is not None and anterior.shape == palabras.shape:
+            self._delta = codificar_mensaje(TIPO_DELTA, generacion, base, self.dimensiones, anterior ^ palabras)
+
+    def clave(self) -> bytes:
+        """
+        Devuelve el cuadro clave de la generación actual (calculado la primera vez que se pide).
+        """
+        if self._clave is None:
+            self._clave = codificar_mensaje(TIPO_CLAVE, self.generacion, self.generacion,
+                                            self.dimensiones, self._palabras)
+        return self._clave
+
+    def delta(self) -> Optional[bytes]:
+        """
+        Devuelve el delta respecto al cuadro anterior (None si es el primer cuadro).
+        """
+        return self._delta
+
+
+class DecodificadorDeltas:
+    """
+    Reconstruye el estado a partir de los mensajes de un CodificadorDeltas.
+
+    Los deltas solo se aplican si su generación base coincide con la del estado
+    reconstruido; si no (ej., tras perder mensajes) se ignoran hasta el
+    siguiente cuadro clave.
+    """
+
+    def __init__(self):
+        self.generacion: Optional[int] = None
+        self.dimensiones: Optional[Tuple[int, int]] = None
+        self.palabras: Optional[np.ndarray] = None
+
+    def aplicar(self, cabecera: Tuple[int, int, int, int, int, int], carga: bytes) -> bool:
+        """
+        Aplica un mensaje ya leído.
+
+        Args:
+            cabecera: La cabecera desempaquetada (tipo, generación, base, X_MAX, Y_MAX, longitud).
+            carga: La carga comprimida.
+
+        Returns:
+            True si el estado avanzó a la generación del mensaje.
+
+        Raises:
+            ValueError: Si el tipo de mensaje no es conocido.
+        """
+        tipo, generacion, base, X_MAX, Y_MAX, _ = cabecera
+        palabras_por_fila = -(-Y_MAX // 64)
+        if tipo == TIPO_CLAVE:
+            datos = np.frombuffer(zlib.decompress(carga), dtype="<u8").reshape(X_MAX, palabras_por_fila)
+            self.palabras = datos.astype(np.uint64)
+        elif tipo == TIPO_DELTA:
+            if self.palabras is None or self.generacion != base:
+                return False
+            datos = np.frombuffer(zlib.decompress(carga), dtype="<u8").reshape(X_MAX, palabras_por_fila)
+            self.palabras ^= datos.astype(np.uint64, copy=False)
+        else:
+            raise ValueError(f"Tipo de mensaje desconocido: {tipo}.")
+        self.generacion = generacion
+        self.dimensiones = (X_MAX, Y_MAX)
+        return True
@@ -0,0 +1,304 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Tuple, Optional, Deque, Set, Any
+from .protocolo_deltas import CodificadorDeltas, MAGIA_FLUJO
+
+# Generaciones entre cuadros clave periódicos (también para los clientes al día).
+GENERACIONES_POR_CLAVE = 100
+
+# Mensajes pendientes por cliente antes de considerarlo lento y saltarle cuadros.
+MAX_PENDIENTES_POR_CLIENTE = 4
+
+# Generaciones publicadas que pueden esperar a ser codificadas; si el codificador
+# no da abasto, se omiten las más antiguas (para todos los clientes).
+MAX_GENERACIONES_POR_CODIFICAR = 64
+
+
+def crear_servidor(direccion: str, dimensiones: Tuple[int, int]) -> "ServidorEstado":
+    """
+    Crea (sin iniciarlo) un servidor a partir de una dirección en texto.
+
+    Args:
+        direccion: Un número de puerto en localhost (ej., "8765") o "unix:RUTA".
+        dimensiones: La tupla (X_MAX, Y_MAX) del Lattice publicado.
+
+    Returns:
+        El ServidorEstado configurado.
+
+    Raises:
+        ValueError: Si la dirección no es un puerto ni una ruta "unix:".
+    """
+    if direccion.startswith("unix:"):
+        return ServidorEstado(dimensiones, ruta_unix=direccion[len("unix:"):])
+    if not direccion.isdigit():
+        raise ValueError(f"Dirección no válida: {direccion!r} (use un puerto o 'unix:RUTA').")
+    return ServidorEstado(dimensiones, puerto=int(direccion))
+
+
+class _Cliente:
+    """
+    Estado de un cliente conectado: su cola de mensajes pendientes y sus contadores.
+    """
+
+    def __init__(self, escritor: asyncio.StreamWriter):
+        self.escritor = escritor
+        self.tarea: Optional[asyncio.Task] = None
+        self.pendientes: Deque[bytes] = deque()
+        self.hay_mensajes = asyncio.Event()
+        self.necesita_clave = True
+        self.enviados = 0
+        self.saltados = 0
+        self.bytes_enviados = 0
+
+
+class ServidorEstado:
+    """
+    Servidor asyncio que publica cada generación a varios visores como delta comprimido.
+
+    Corre en su propio hilo con su propio bucle de eventos: el hilo del Modelo
+    solo llama a 'publicar()', que copia las palabras empaquetadas y delega el
+    resto (XOR con el cuadro anterior, compresión y envío) al hilo del servidor.
+    Así la velocidad del Modelo no depende del número ni de la velocidad de los
+    visores.
+
+    Cada generación publicada se codifica y se encola para todos los clientes.
+    Contrapresión por cliente: si un cliente acumula más de 'max_pendientes'
+    mensajes sin enviar, se descartan y se le envía el siguiente cuadro clave,
+    de modo que un visor lento salta cuadros pero nunca reconstruye un estado
+    incorrecto, y los demás siguen recibiendo todas las generaciones. Además se
+    envía un cuadro clave a todos cada 'cada_clave' generaciones.
+
+    Solo si el propio codificador se queda atrás (más de 'max_por_codificar'
+    generaciones publicadas sin codificar) se omiten generaciones para todos.
+
+    Solo escucha en localhost (o en un socket Unix): no hay autenticación.
+    """
+
+    def __init__(self, dimensiones: Tuple[int, int], puerto: int = 0, ruta_unix: Optional[str] = None,
+                 cada_clave: int = GENERACIONES_POR_CLAVE,
+                 max_pendientes: int = MAX_PENDIENTES_POR_CLIENTE,
+                 max_por_codificar: int = MAX_GENERACIONES_POR_CODIFICAR):
+        """
+        Constructor que configura el servidor (no empieza a escuchar hasta 'iniciar()').
+
+        Args:
+            dimensiones: La tupla (X_MAX, Y_MAX) del Lattice publicado.
+            puerto: Puerto TCP en 127.0.0.1 (0 = uno libre, ver 'direccion').
+            ruta_unix: Ruta de un socket Unix (si se indica, no se usa TCP).
+            cada_clave: Generaciones entre cuadros clave periódicos.
+            max_pendientes: Mensajes pendientes por cliente antes de saltarle cuadros.
+            max_por_codificar: Generaciones publicadas pendientes de codificar antes de omitir las más antiguas.
+        """
+        self.dimensiones = dimensiones
+        self.puerto = puerto
+        self.ruta_unix = ruta_unix
+        self.cada_clave = max(1, cada_clave)
+        self.max_pendientes = max(1, max_pendientes)
+        self.max_por_codificar = max(1, max_por_codificar)
+        self.direccion: Any = None
+
+        self._codificador = CodificadorDeltas(dimensiones)
+        self._clientes: Set[_Cliente] = set()
+        self._bucle: Optional[asyncio.AbstractEventLoop] = None
+        self._servidor: Optional[asyncio.AbstractServer] = None
+        self._hilo: Optional[threading.Thread] = None
+        self._listo = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._cerrojo = threading.Lock()
+        self._por_difundir: Deque[Tuple[Any, int]] = deque()
+
+        # Estadísticas (las escribe el hilo del servidor, salvo 'generaciones_omitidas').
+        self.generaciones = 0
+        self.bytes_deltas = 0
+        self.generaciones_en_deltas = 0  # Generaciones que cubren los deltas (generación - base).
+        self.bytes_claves = 0
+        self.cuadros_saltados = 0
+        self.generaciones_omitidas = 0  # Publicadas pero descartadas antes de codificarse.
+
+    # --- Ciclo de vida ----------------------------------------------------------------
+
+    def iniciar(self) -> "ServidorEstado":
+        """
+        Arranca el hilo del servidor y espera a que esté escuchando.
+
+        Returns:
+            El propio servidor (con 'direccion' ya resuelta).
+
+        Raises:
+            OSError: Si no se pudo abrir el socket.
+        """
+        self._hilo = threading.Thread(target=self._ejecutar, name="ServidorEstado", daemon=True)
+        self._hilo.start()
+        self._listo.wait()
+        if self._error is not None:
+            raise self._error
+        return self
+
+    def _ejecutar(self):
+        """
+        Cuerpo del hilo del servidor: crea el bucle de eventos y lo mantiene vivo.
+        """
+        self._bucle = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._bucle)
+        try:
+            self._bucle.run_until_complete(self._abrir())
+        except OSError as error:
+            self._error = error
+            self._listo.set()
+            return
+        self._listo.set()
+        self._bucle.run_forever()
+        self._bucle.close()
+
+    async def _abrir(self):
+        """
+        Abre el socket de escucha (Unix o TCP en localhost).
+        """
+        if self.ruta_unix:
+            self._servidor = await asyncio.start_unix_server(self._atender, path=self.ruta_unix)
+            self.direccion = self.ruta_unix
+        else:
+            self._servidor = await asyncio.start_server(self._atender, "127.0.0.1", self.puerto)
+            self.direccion = self._servidor.sockets[0].getsockname()[:2]
+
+    def detener(self):
+        """
+        Cierra el servidor y las conexiones de todos los clientes.
+        """
+        if self._bucle is None or not self._bucle.is_running():
+            return
+        asyncio.run_coroutine_threadsafe(self._cerrar(), self._bucle).result()
+        self._bucle.call_soon_threadsafe(self._bucle.stop)
+        self._hilo.join()
+
+    async def _cerrar(self):
+        """
+        Deja de aceptar conexiones y cierra las existentes.
+        """
+        self._servidor.close()
+        tareas = [cliente.tarea for cliente in self._clientes if cliente.tarea is not None]
+        for tarea in tareas:
+            tarea.cancel()
+        await asyncio.gather(*tareas, return_exceptions=True)
+        await self._servidor.wait_closed()
+
+    # --- Publicación (hilo del Modelo) ----------------------------------------------------
+
+    def publicar(self, palabras: Any, generacion: int):
+        """
+        Publica el estado empaquetado de una generación (llamado desde el hilo del Modelo).
+
+        Args:
+            palabras: Las palabras uint64 (X_MAX, W) del estado; se copian antes de volver.
+            generacion: La generación publicada.
+        """
+        if self._bucle is None or not self._bucle.is_running():
+            return
+        # Si el codificador no da abasto se descarta la generación más antigua
+        # (el delta siguiente se calcula contra la última codificada).
+        with self._cerrojo:
+            programada = bool(self._por_difundir)
+            if len(self._por_difundir) >= self.max_por_codificar:
+                self._por_difundir.popleft()
+                self.generaciones_omitidas += 1
+            self._por_difundir.append((palabras.copy(), generacion))
+        if not programada:
+            self._bucle.call_soon_threadsafe(self._difundir_pendiente)
+
+    # --- Hilo del servidor --------------------------------------------------------------
+
+    def _difundir_pendiente(self):
+        """
+        Difunde la generación publicada más antigua.
+
+        Se difunde una generación por llamada y la siguiente se vuelve a programar
+        al final de la cola del bucle, después de las tareas de los clientes que
+        acaba de despertar: así los clientes al día vacían sus colas entre una
+        generación y otra y solo se saltan cuadros a los lentos.
+        """
+        with self._cerrojo:
+            palabras, generacion = self._por_difundir.popleft()
+            quedan = bool(self._por_difundir)
+        self._difundir(palabras, generacion)
+        if quedan:
+            self._bucle.call_soon(self._difundir_pendiente)
+
+    def _difundir(self, palabras: Any, generacion: int):
+        """
+        Codifica la generación una sola vez y la encola para cada cliente.
+        """
+        codificador = self._codificador
+        base = codificador.generacion
+        codificador.nuevo_cuadro(palabras, generacion)
+        self.generaciones += 1
+        delta = codificador.delta()
+        if delta is not None:
+            self.bytes_deltas += len(delta)
+            self.generaciones_en_deltas += generacion - base
+        clave_periodica = delta is None or generacion % self.cada_clave == 0
+        clave_enviada = False
+
+        for cliente in self._clientes:
+            if len(cliente.pendientes) >= self.max_pendientes:
+                # Cliente lento: se descartan sus mensajes y se resincroniza con un cuadro clave.
+                cliente.saltados += len(cliente.pendientes)
+                self.cuadros_saltados += len(cliente.pendientes)
+                cliente.pendientes.clear()
+                cliente.necesita_clave = True
+            if cliente.necesita_clave or clave_periodica:
+                mensaje = codificador.clave()
+                cliente.necesita_clave = False
+                clave_enviada = True
+            else:
+                mensaje = delta
+            cliente.pendientes.append(mensaje)
+            cliente.hay_mensajes.set()
+        if clave_enviada:
+            self.bytes_claves += len(codificador.clave())
+
+    async def _atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """
+        Atiende a un cliente: le envía sus mensajes pendientes en orden hasta que se desconecta.
+        """
+        cliente = _Cliente(escritor)
+        cliente.tarea = asyncio.current_task()
+        self._clientes.add(cliente)
+        try:
+            escritor.write(MAGIA_FLUJO)
+            while True:
+                await cliente.hay_mensajes.wait()
+                cliente.hay_mensajes.clear()
+                while cliente.pendientes:
+                    mensaje = cliente.pendientes.popleft()
+                    escritor.write(mensaje)
+                    cliente.enviados += 1
+                    cliente.bytes_enviados += len(mensaje)
+                    # 'drain' espera solo si el búfer del socket está lleno (cliente lento).
+                    await escritor.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._clientes.discard(cliente)
+            escritor.close()
+
+    # --- Estadísticas -------------------------------------------------------------------
+
+    def estadisticas(self) -> dict:
+        """
+        Devuelve los contadores del servidor.
+
+        Returns:
+            Un diccionario con clientes conectados, generaciones difundidas, bytes de
+            deltas por generación avanzada (un delta que salta generaciones omitidas
+            cuenta todas las que cubre), bytes en cuadros clave, cuadros saltados por contrapresión
+            y generaciones omitidas porque el Modelo publicaba más rápido de lo que se codificaba.
+        """
+        return {
+            "clientes": len(self._clientes),
+            "generaciones": self.generaciones,
+            "bytes_por_generacion": self.bytes_deltas / max(self.generaciones_en_deltas, 1),
+            "bytes_claves": self.bytes_claves,
+            "cuadros_saltados": self.cuadros_saltados,
+            "generaciones_omitidas": self.generaciones_omitidas,
+        }
@@ -0,0 +1,346 @@
+import argparse
+import sys
+import time
+from typing import Tuple, Optional
+
+import config
+from ensamblador import construir_automata, MOTORES, VECINDADES, FRONTERAS
+from game.lattice.i_lattice import ILattice
+from game.automata_celular import AutomataCelular
+from game.instrumentacion.medidor_fases import MEDIDOR_GLOBAL
+
+def escribir_estado_texto(lattice: ILattice, ruta: str):
+    """
+    Escribe el estado del Lattice en formato de texto plano de Life ('.cells').
+    
+    Cada línea corresponde a una fila y (de 0 a Y_MAX - 1) y cada carácter a una
+    columna x: 'O' para una célula viva y '.' para una muerta.
+    
+    Args:
+        lattice: El Lattice a guardar.
+        ruta: La ruta del archivo de salida.
+    """
+    X_MAX, Y_MAX = lattice.obtener_dimensiones()
+    estado = lattice.obtener_estado()
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write(f"!Name: {config.TITLE} {config.VERSION}\n")
+        for y in range(Y_MAX):
+            archivo.write("".join("O" if estado[(x, y)] == 1 else "." for x in range(X_MAX)))
+            archivo.write("\n")
+
+def leer_regiones(texto: str) -> Tuple[int, int]:
+    """
+    Convierte "FILASxCOLUMNAS" (ej., "8x8") en la tupla de regiones de las estadísticas.
+    """
+    try:
+        filas, columnas = (int(parte) for parte in texto.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"rejilla no válida: {texto!r} (use FILASxCOLUMNAS).") from None
+    if filas < 1 or columnas < 1:
+        raise argparse.ArgumentTypeError("la rejilla necesita al menos una región por eje.")
+    return filas, columnas
+
+def analizar_argumentos(argumentos: list) -> argparse.Namespace:
+    """
+    Procesa los argumentos de línea de comandos del ejecutor sin interfaz.
+    
+    Args:
+        argumentos: La lista de argumentos (sin el nombre del programa).
+        
+    Returns:
+        El espacio de nombres con los argumentos validados.
+    """
+    analizador = argparse.ArgumentParser(
+        description="Ejecuta el Juego de la Vida sin interfaz gráfica y sin límite de FPS."
+    )
+    analizador.add_argument("celdas_x", type=int, nargs="?", default=None,
+                            help="Ancho del Lattice en células (opcional con --cargar).")
+    analizador.add_argument("celdas_y", type=int, nargs="?", default=None,
+                            help="Alto del Lattice en células (opcional con --cargar).")
+    analizador.add_argument("-n", "--generaciones", type=int, default=100,
+                            help="Número de generaciones a simular (por defecto: 100).")
+    analizador.add_argument("-s", "--semilla", type=int, default=None,
+                            help="Semilla del estado inicial aleatorio.")
+    analizador.add_argument("-o", "--ocupacion", type=float, default=config.OCCUPANCY,
+                            help=f"Ocupación inicial (por defecto: {config.OCCUPANCY}).")
+    analizador.add_argument("-m", "--motor", choices=MOTORES, default=config.MOTOR,
+                            help=f"Motor de simulación (por defecto: {config.MOTOR}).")
+    analizador.add_argument("-p", "--procesos", type=int, default=config.PROCESOS,
+                            help="Procesos del motor 'paralelo' (por defecto: todos los núcleos).")
+    analizador.add_argument("-r", "--regla", default=None,
+                            help=f"Regla B/S, B/S/C o 'Larger than Life' (ej., R5,C0,M1,S34..58,B34..45,NM) "
+                                 f"de los motores 'regla*' (por defecto: la de la instantánea cargada "
+                                 f"o {config.REGLA}).")
+    analizador.add_argument("--vecindad", choices=VECINDADES, default=config.VECINDAD,
+                            help=f"Vecindad de los motores 'regla*' (por defecto: {config.VECINDAD}).")
+    analizador.add_argument("--radio", type=int, default=config.RADIO_VECINDAD,
+                            help=f"Radio de la vecindad (por defecto: {config.RADIO_VECINDAD}).")
+    analizador.add_argument("--frontera", choices=FRONTERAS, default=config.FRONTERA,
+                            help="Condición de Frontera (por defecto: cíclica; ilimitada con 'disperso').")
+    analizador.add_argument("--archivo-mapeo", default=None,
+                            help="Archivo del estado del motor 'mapeado' (por defecto: temporal). Al "
+                                 "terminar contiene la instantánea de la última generación.")
+    analizador.add_argument("--cargar", default=None,
+                            help="Estado inicial: instantánea binaria o patrón RLE (colocado en el origen).")
+    analizador.add_argument("--mapa-densidad", default=None,
+                            help="Mapa 2D de ocupación por zonas (.npy o texto), estirado sobre el Lattice.")
+    analizador.add_argument("--sembrar", default=None,
+                            help="Patrón RLE a sembrar centrado (sobre el mapa de densidad, si lo hay).")
+    analizador.add_argument("--repetir", action="store_true",
+                            help="Repite el patrón de --sembrar en mosaico por todo el tablero.")
+    analizador.add_argument("--salida", default=None,
+                            help="Archivo donde guardar el estado final (formato texto '.cells').")
+    analizador.add_argument("--instantanea", default=None,
+                            help="Archivo donde guardar el estado final (instantánea binaria).")
+    analizador.add_argument("--rle", default=None,
+                            help="Archivo donde guardar el estado final (formato RLE).")
+    analizador.add_argument("--historial", default=None,
+                            help="Archivo al que añadir una instantánea cada --cada generaciones.")
+    analizador.add_argument("--cada", type=int, default=10,
+                            help="Intervalo de generaciones del historial (por defecto: 10).")
+    analizador.add_argument("--ciclos", choices=("no", "detener", "saltar"), default="no",
+                            help="Detección de ciclos: 'detener' termina al estabilizarse el tablero; "
+                                 "'saltar' omite los periodos completos restantes (por defecto: no).")
+    analizador.add_argument("--estadisticas", default=None,
+                            help="Archivo CSV con una fila por generación: población, nacimientos, "
+                                 "muertes, caja de las células vivas y densidad por regiones.")
+    analizador.add_argument("--regiones", type=leer_regiones, default=config.REGIONES_ESTADISTICAS,
+                            help="Rejilla de densidad de --estadisticas, como FILASxCOLUMNAS "
+                                 "(por defecto: {}x{}).".format(*config.REGIONES_ESTADISTICAS))
+    analizador.add_argument("--servir", default=None,
+                            help="Publica cada generación a visores remotos: un puerto en localhost "
+                                 "o 'unix:RUTA' (ver red/cliente_estado.py).")
+    analizador.add_argument("--metricas", default=None,
+                            help="Mide cada generación por fases y guarda el resumen en este archivo "
+                                 "(JSON Lines, o texto de Prometheus si termina en '.prom').")
+    opciones = analizador.parse_args(argumentos)
+    if opciones.cargar is None and (opciones.celdas_x is None or opciones.celdas_y is None):
+        analizador.error("se requieren celdas_x y celdas_y (o un estado inicial con --cargar).")
+    if opciones.cada < 1:
+        analizador.error("--cada debe ser al menos 1.")
+    return opciones
+
+def cargar_estado_inicial(automata: AutomataCelular, ruta: str) -> int:
+    """
+    Sustituye el estado inicial del autómata por el de una instantánea o un patrón RLE.
+    
+    Args:
+        automata: El autómata (ya construido con las dimensiones del estado a cargar).
+        ruta: La instantánea binaria o el archivo RLE.
+        
+    Returns:
+        La generación del estado cargado (0 para un patrón RLE).
+    """
+    # Importación diferida: las instantáneas binarias requieren NumPy.
+    from game.persistencia.rle import cargar_rle, colocar_patron
+    from game.persistencia.instantanea_binaria import es_instantanea, cargar_instantanea, restaurar_en_lattice
+    
+    if es_instantanea(ruta):
+        cabecera, palabras = cargar_instantanea(ruta)
+        restaurar_en_lattice(automata.obtener_lattice(), palabras)
+        generacion = cabecera.generacion
+    else:
+        colocar_patron(automata.obtener_lattice(), cargar_rle(ruta))
+        generacion = 0
+    automata.lattice_modificado()
+    return generacion
+
+def construir_generador(opciones: argparse.Namespace):
+    """
+    Crea el generador del estado inicial según las opciones (aleatorio, mapa de densidad o patrón).
+    
+    Args:
+        opciones: Los argumentos ya validados.
+        
+    Returns:
+        El IGeneradorEstadoInicial (su atributo 'semilla', si lo tiene, permite reproducir la ejecución).
+    """
+    # Importación diferida: los generadores requieren NumPy.
+    from game.inicializacion.generador_aleatorio import GeneradorAleatorio
+    
+    generador = GeneradorAleatorio(opciones.semilla)
+    if opciones.mapa_densidad:
+        import numpy as np
+        from game.inicializacion.generador_mapa_densidad import GeneradorMapaDensidad
+        ruta = opciones.mapa_densidad
+        mapa = np.load(ruta) if ruta.endswith(".npy") else np.loadtxt(ruta, ndmin=2)
+        generador = GeneradorMapaDensidad(mapa, opciones.semilla)
+    if opciones.sembrar:
+        from game.persistencia.rle import cargar_rle
+        from game.inicializacion.generador_patron import GeneradorPatron
+        fondo = generador if opciones.mapa_densidad else None
+        generador = GeneradorPatron(cargar_rle(opciones.sembrar), repetir=opciones.repetir, fondo=fondo)
+    return generador
+
+def describir_estado_inicial(ruta: str) -> Tuple[Tuple[int, int], Optional[str]]:
+    """
+    Devuelve las dimensiones y la regla declaradas en una instantánea o un patrón RLE.
+    """
+    from game.persistencia.rle import cargar_rle
+    from game.persistencia.instantanea_binaria import es_instantanea, cargar_instantanea
+    
+    if es_instantanea(ruta):
+        cabecera, _ = cargar_instantanea(ruta)
+        return cabecera.dimensiones, cabecera.regla
+    patron = cargar_rle(ruta)
+    return patron.dimensiones, patron.regla
+
+def ejecutar(argumentos: list) -> dict:
+    """
+    Construye el autómata, simula las generaciones pedidas e informa del rendimiento.
+    
+    Args:
+        argumentos: La lista de argumentos (sin el nombre del programa).
+        
+    Returns:
+        Un diccionario con las métricas de la ejecución.
+    """
+    opciones = analizar_argumentos(argumentos)
+    regla = opciones.regla
+    if opciones.cargar:
+        dimensiones_cargadas, regla_cargada = describir_estado_inicial(opciones.cargar)
+        regla = regla or regla_cargada
+    dimensiones = (opciones.celdas_x, opciones.celdas_y)
+    if opciones.celdas_x is None or opciones.celdas_y is None:
+        dimensiones = dimensiones_cargadas
+    regla = regla or config.REGLA
+    if opciones.instantanea or opciones.historial:
+        # Se comprueba antes de simular: el formato binario solo guarda reglas de dos estados.
+        from game.persistencia.instantanea_binaria import validar_regla_empaquetable
+        try:
+            validar_regla_empaquetable(regla)
+        except ValueError as error:
+            sys.exit(f"Error: {error}")
+    
+    if opciones.metricas:
+        MEDIDOR_GLOBAL.activar()
+    
+    # 1. Ensamblaje idéntico al de la aplicación gráfica (sin Pygame).
+    #    Si se carga un estado, el tablero parte vacío en lugar de aleatorio.
+    generador = None if opciones.cargar else construir_generador(opciones)
+    inicio_ensamblaje = time.perf_counter()
+    automata = construir_automata(dimensiones, 0.0 if opciones.cargar else opciones.ocupacion,
+                                  opciones.motor, semilla=opciones.semilla,
+                                  procesos=opciones.procesos, regla=regla, generador=generador,
+                                  archivo_mapeo=opciones.archivo_mapeo,
+                                  vecindad=opciones.vecindad, radio=opciones.radio,
+                                  frontera=opciones.frontera)
+    tiempo_inicio = time.perf_counter() - inicio_ensamblaje
+    historial = None
+    servidor = None
+    try:
+        generacion = cargar_estado_inicial(automata, opciones.cargar) if opciones.cargar else 0
+        generacion_inicial = generacion
+        detector = None
+        if opciones.ciclos != "no":
+            detector = automata.activar_deteccion_ciclos(avance_rapido=opciones.ciclos == "saltar",
+                                                         generacion=generacion)
+        colector = None
+        if opciones.estadisticas:
+            colector = automata.activar_estadisticas(opciones.estadisticas, opciones.regiones, generacion)
+        if opciones.historial:
+            from game.persistencia.historial import EscritorHistorial
+            historial = EscritorHistorial(opciones.historial, dimensiones, opciones.cada, regla,
+                                          type(automata.condicion_frontera).__name__)
+            historial.registrar(generacion, automata.obtener_lattice())
+        if opciones.servir:
+            from red.servidor_estado import crear_servidor
+            from game.persistencia.instantanea_binaria import palabras_de_lattice
+            servidor = crear_servidor(opciones.servir, dimensiones).iniciar()
+            print(f"Servidor de estado escuchando en: {servidor.direccion}")
+            servidor.publicar(palabras_de_lattice(automata.obtener_lattice()), generacion)
+        
+        # 2. Simulación sin límite de FPS (en tramos hasta el siguiente registro del historial).
+        inicio = time.perf_counter()
+        restantes = opciones.generaciones
+        while restantes > 0:
+            paso = min(restantes, opciones.cada - generacion % opciones.cada) if historial else restantes
+            if opciones.ciclos == "detener" or servidor:
+                paso = 1
+            if MEDIDOR_GLOBAL.activo and opciones.ciclos != "saltar":
+                # Con instrumentación cada generación se mide por separado.
+                for _ in range(paso):
+                    with MEDIDOR_GLOBAL.fase("avanzar_generacion"):
+                        automata.avanzar_generacion()
+            else:
+                automata.avanzar_generaciones(paso)
+            generacion += paso
+            restantes -= paso
+            if historial:
+                historial.registrar(generacion, automata.obtener_lattice())
+            if servidor:
+                servidor.publicar(palabras_de_lattice(automata.obtener_lattice()), generacion)
+            if opciones.ciclos == "detener" and detector.ciclo is not None:
+                break
+        tiempo = time.perf_counter() - inicio
+        
+        # 3. Métricas de rendimiento.
+        simuladas = generacion - generacion_inicial
+        celdas = dimensiones[0] * dimensiones[1]
+        metricas = {
+            "motor": opciones.motor,
+            "generaciones": simuladas,
+            "generacion_final": generacion,
+            "tiempo_s": tiempo,
+            "generaciones_por_s": simuladas / tiempo if tiempo > 0 else float("inf"),
+            "celdas_por_s": celdas * simuladas / tiempo if tiempo > 0 else float("inf"),
+            "tiempo_inicio_s": tiempo_inicio,
+        }
+        semilla = getattr(generador, "semilla", None)
+        if semilla is None and generador is not None:
+            semilla = getattr(getattr(generador, "fondo", None), "semilla", None)
+        if semilla is not None:
+            metricas["semilla"] = semilla
+        if detector is not None and detector.ciclo is not None:
+            metricas["ciclo_inicio"] = detector.ciclo.inicio
+            metricas["ciclo_periodo"] = detector.ciclo.periodo
+        print(f"Motor: {metricas['motor']} | Lattice: {dimensiones[0]}x{dimensiones[1]} | "
+              f"Generaciones: {metricas['generaciones']}")
+        print(f"Tiempo: {metricas['tiempo_s']:.3f} s | "
+              f"Generaciones/s: {metricas['generaciones_por_s']:.2f} | "
+              f"Células/s: {metricas['celdas_por_s']:.3e}")
+        print(f"Inicialización: {tiempo_inicio:.3f} s"
+              + (f" | Semilla: {metricas['semilla']}" if "semilla" in metricas else ""))
+        if servidor:
+            estadisticas = servidor.estadisticas()
+            metricas["bytes_por_generacion"] = estadisticas["bytes_por_generacion"]
+            metricas["cuadros_saltados"] = estadisticas["cuadros_saltados"]
+            print(f"Servidor: {estadisticas['clientes']} clientes | "
+                  f"Bytes/generación: {estadisticas['bytes_por_generacion']:.0f} | "
+                  f"Cuadros saltados: {estadisticas['cuadros_saltados']} | "
+                  f"Generaciones omitidas: {estadisticas['generaciones_omitidas']}")
+        if colector is not None:
+            metricas["poblacion_final"] = colector.poblacion
+            print(f"Población final: {colector.poblacion} | Caja: {colector.caja} | "
+                  f"Estadísticas guardadas en: {opciones.estadisticas}")
+        if "ciclo_periodo" in metricas:
+            print(f"Ciclo detectado: periodo {metricas['ciclo_periodo']} "
+                  f"desde la generación {metricas['ciclo_inicio']}")
+        
+        # 4. Estado final (opcional).
+        if opciones.salida:
+            escribir_estado_texto(automata.obtener_lattice(), opciones.salida)
+            print(f"Estado final guardado en: {opciones.salida}")
+        if opciones.instantanea:
+            from game.persistencia.instantanea_binaria import guardar_instantanea
+            guardar_instantanea(opciones.instantanea, automata.obtener_lattice(), generacion, regla,
+                                type(automata.condicion_frontera).__name__)
+            print(f"Instantánea final guardada en: {opciones.instantanea}")
+        if opciones.metricas:
+            MEDIDOR_GLOBAL.guardar(opciones.metricas, {"motor": opciones.motor})
+            print(f"Métricas por fase guardadas en: {opciones.metricas}")
+        if opciones.rle:
+            from game.persistencia.rle import guardar_rle
+            guardar_rle(opciones.rle, automata.obtener_lattice(), regla)
+            print(f"Estado final (RLE) guardado en: {opciones.rle}")
+        return metricas
+    finally:
+        if servidor:
+            servidor.detener()
+        if historial:
+            historial.cerrar()
+        automata.cerrar()
+
+if __name__ == "__main__":
+    # Código que se ejecuta cuando el script es invocado directamente.
+    ejecutar(sys.argv[1:])
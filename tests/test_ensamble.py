@@ -0,0 +1,24 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from game.ensamble import EnsambleAutomatas
+from game.frontera.frontera_ciclica import CondicionFronteraCiclica
+from game.reglas.regla_transicion import ReglaTransicion
+from game.vecindad.vecindad_moore_radio import VecindadMooreRadio
+
+
+def test_ensamble_con_radio_2_coincide_con_cada_miembro():
+    vecindad = VecindadMooreRadio(2)
+    frontera = CondicionFronteraCiclica()
+    regla = ReglaTransicion.desde_cadena("B6789/S5678910")
+    ensamble = EnsambleAutomatas((24, 20), [1, 2, 3], 0.4, vecindad, frontera, regla)
+    estados = ensamble.obtener_estados().copy()
+
+    ensamble.simular(3)
+
+    tabla = regla.tabla_arreglo(len(vecindad.obtener_desplazamientos()))
+    for _ in range(3):
+        estados = np.stack([tabla[estado, vecindad.contar_vecinos_arreglo(estado, frontera)]
+                            for estado in estados])
+    assert np.array_equal(ensamble.obtener_estados(), estados)
@@ -0,0 +1,18 @@
+from ensamblador import construir_automata
+
+
+def test_hashlife_cuenta_nacimientos_y_muertes_de_una_generacion():
+    hashlife = construir_automata((64, 64), 0.3, "hashlife", semilla=5)
+    referencia = construir_automata((64, 64), 0.3, "diccionario", semilla=5)
+    try:
+        colector, esperado = hashlife.activar_estadisticas(), referencia.activar_estadisticas()
+        for _ in range(3):
+            hashlife.avanzar_generacion()
+            referencia.avanzar_generacion()
+            assert colector.fila()[:4] == esperado.fila()[:4]
+        # Un salto de varias generaciones no conoce los nacimientos ni las muertes.
+        hashlife.avanzar_generaciones(8)
+        assert (colector.nacimientos, colector.muertes) == (-1, -1)
+    finally:
+        hashlife.cerrar()
+        referencia.cerrar()
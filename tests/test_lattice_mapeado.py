@@ -0,0 +1,24 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from game.lattice.lattice_mapeado import LatticeMapeado
+
+
+def test_instantanea_conserva_la_region_copiada():
+    lattice = LatticeMapeado(semilla=3)
+    lattice.inicializar((100, 150), 0.4)
+    try:
+        original = lattice.a_arreglo()
+        lattice.establecer_region_instantanea((10, 70, 40, 100))
+        instantanea = lattice.obtener_instantanea()
+        lattice.establecer_palabras(np.zeros_like(lattice.obtener_palabras()))
+
+        # Se copian palabras completas: las columnas 64..127 de las filas 10..40.
+        region = instantanea.leer_region(np.arange(10, 41), np.arange(64, 128))
+        assert np.array_equal(region, original[10:41, 64:128])
+        assert instantanea[(20, 80)] == original[20, 80]
+        # Fuera de la región se lee el archivo actual.
+        assert not instantanea.a_arreglo()[50:].any()
+    finally:
+        lattice.cerrar()
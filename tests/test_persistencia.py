@@ -0,0 +1,45 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ensamblador import construir_automata
+from game.lattice.lattice_2d import Lattice2d
+from game.lattice.lattice_numpy import LatticeNumpy
+from game.persistencia.instantanea_binaria import guardar_instantanea, cargar_instantanea, restaurar_en_lattice
+from game.persistencia.rle import escribir_rle, leer_rle, colocar_patron
+
+
+def _estado(lattice):
+    return dict(lattice.obtener_estado())
+
+
+def test_rle_ida_y_vuelta():
+    origen = Lattice2d(7)
+    origen.inicializar((30, 20), 0.3)
+    destino = Lattice2d(8)
+    destino.inicializar((30, 20), 0.6)
+
+    colocar_patron(destino, leer_rle(escribir_rle(origen, "B3/S23")))
+
+    assert _estado(destino) == _estado(origen)
+
+
+def test_instantanea_restaurada_sigue_la_misma_evolucion(tmp_path):
+    ruta = str(tmp_path / "estado.life")
+    original = construir_automata((40, 70), 0.3, "vectorizado", semilla=2)
+    restaurado = construir_automata((40, 70), 0.0, "vectorizado", semilla=3)
+    try:
+        original.avanzar_generaciones(5)
+        guardar_instantanea(ruta, original.obtener_lattice(), generacion=5)
+        cabecera, palabras = cargar_instantanea(ruta)
+        restaurar_en_lattice(restaurado.obtener_lattice(), palabras)
+        restaurado.lattice_modificado()
+        assert cabecera.generacion == 5
+
+        original.avanzar_generaciones(4)
+        restaurado.avanzar_generaciones(4)
+        assert np.array_equal(restaurado.obtener_lattice().obtener_arreglo(),
+                              original.obtener_lattice().obtener_arreglo())
+    finally:
+        original.cerrar()
+        restaurado.cerrar()
@@ -0,0 +1,40 @@
+import os
+import random
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+np = pytest.importorskip("numpy")
+
+from view.pygame_view import PygameView
+
+
+def _tablero(dimensiones, semilla):
+    generador = random.Random(semilla)
+    return {(x, y): int(generador.random() < 0.3)
+            for x in range(dimensiones[0]) for y in range(dimensiones[1])}
+
+
+@pytest.mark.parametrize("zoom, desplazamiento", [(0, (3.3, 2.7)), (-1, (5.3, 7.9)), (1, (0.6, 11.45))])
+def test_regiones_sucias_igualan_redibujado_completo(zoom, desplazamiento):
+    dimensiones = (120, 90)
+    vista = PygameView("test", "0", (3, 3), 60, {0: (0, 0, 0), 1: (255, 255, 255)}, max_window=(150, 120))
+    vista.init(dimensiones)
+    vista.zoom(zoom - vista.zoom_level)
+    vista.pan(*desplazamiento)
+
+    tablero = _tablero(dimensiones, 1)
+    vista.draw_board(tablero)
+    # Pocas células cambiadas: el segundo cuadro se dibuja por regiones sucias.
+    for celda in list(tablero)[::997]:
+        tablero[celda] = 1 - tablero[celda]
+    vista.draw_board(tablero)
+    sucio = pygame.surfarray.array3d(vista.screen)
+
+    vista._previous = None
+    vista.draw_board(tablero)
+    completo = pygame.surfarray.array3d(vista.screen)
+    pygame.quit()
+
+    assert np.array_equal(sucio, completo)
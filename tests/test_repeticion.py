@@ -0,0 +1,26 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ensamblador import construir_automata
+
+
+def test_ir_a_restaura_cada_generacion_y_permite_seguir():
+    automata = construir_automata((32, 48), 0.35, "vectorizado", semilla=4)
+    try:
+        repeticion = automata.activar_repeticion(generaciones_entre_claves=8)
+        estados = [automata.obtener_lattice().obtener_arreglo().copy()]
+        for _ in range(30):
+            automata.avanzar_generacion()
+            estados.append(automata.obtener_lattice().obtener_arreglo().copy())
+
+        for generacion in (0, 7, 8, 9, 23, 30, 12):
+            assert repeticion.ir_a(generacion) == generacion
+            assert np.array_equal(automata.obtener_lattice().obtener_arreglo(), estados[generacion])
+
+        # Desde una generación pasada la simulación sigue igual que la primera vez.
+        repeticion.ir_a(10)
+        automata.avanzar_generaciones(5)
+        assert np.array_equal(automata.obtener_lattice().obtener_arreglo(), estados[15])
+    finally:
+        automata.cerrar()
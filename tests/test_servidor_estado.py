@@ -0,0 +1,54 @@
+import asyncio
+import socket
+import threading
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from red.cliente_estado import ClienteEstado
+from red.servidor_estado import ServidorEstado
+
+
+def test_cliente_lento_no_hace_saltar_cuadros_a_los_demas():
+    dimensiones = (512, 512)
+    generaciones = 300
+    generador = np.random.default_rng(1)
+    cuadros = [generador.integers(0, 2 ** 63, size=(512, 8), dtype=np.uint64) for _ in range(generaciones)]
+    servidor = ServidorEstado(dimensiones, max_pendientes=4, max_por_codificar=generaciones).iniciar()
+
+    # Cliente lento: se conecta con un búfer de recepción mínimo y nunca lee.
+    lento = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    lento.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    lento.connect(servidor.direccion)
+
+    def publicar():
+        for generacion, palabras in enumerate(cuadros, start=1):
+            servidor.publicar(palabras, generacion)
+
+    async def principal():
+        cliente = ClienteEstado()
+        await cliente.conectar(servidor.direccion[1])
+        while servidor.estadisticas()["clientes"] < 2:
+            await asyncio.sleep(0.01)
+        hilo = threading.Thread(target=publicar)
+        hilo.start()
+        recibidas = []
+        while not recibidas or recibidas[-1] < generaciones:
+            generacion, palabras = await asyncio.wait_for(cliente.recibir(), 10)
+            recibidas.append(generacion)
+        hilo.join()
+        await cliente.cerrar()
+        return recibidas, palabras.copy()
+
+    try:
+        recibidas, palabras = asyncio.run(principal())
+        estadisticas = servidor.estadisticas()
+    finally:
+        lento.close()
+        servidor.detener()
+
+    assert recibidas == list(range(1, generaciones + 1))
+    assert np.array_equal(palabras, cuadros[-1])
+    assert estadisticas["cuadros_saltados"] > 0
+    assert estadisticas["generaciones_omitidas"] == 0
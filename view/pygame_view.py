@@ -1,6 +1,43 @@
+import itertools
+import math
+import time
 import pygame
 from pygame.locals import *
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, List, Optional
+from game.instrumentacion.medidor_fases import MedidorFases, MEDIDOR_GLOBAL
+
+# NumPy es opcional: sin él solo está disponible el dibujado por regiones sucias.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Fracción de células cambiadas a partir de la cual es más barato redibujar el
+# tablero completo con un único volcado de arreglo que rellenar cada célula.
+FRACCION_MAXIMA_SUCIAS = 0.02
+
+# Segundos entre renderizados del texto del panel de métricas (el panel se vuelca en cada cuadro).
+OVERLAY_REFRESH_S = 0.5
+
+# Niveles de zoom por encima del tamaño de célula configurado (cada nivel duplica el tamaño).
+MAX_ZOOM_LEVEL = 4
+
+# Fracción de la ventana que se desplaza el visor con cada pulsación de las flechas.
+PAN_FRACTION = 0.125
+
+# Nivel de detalle: con menos de un píxel por célula, cada píxel resume un bloque de
+# células leyendo como mucho LOD_SAMPLES x LOD_SAMPLES de ellas, y nunca más de
+# LOD_SAMPLE_BUDGET células por cuadro. Así el coste de dibujar depende de la
+# ventana y no del tablero (en ventanas grandes, cada bloque se resume con menos muestras).
+LOD_SAMPLES = 4
+LOD_SAMPLE_BUDGET = 1 << 20
+
+# Agregaciones de un bloque de células: "max" (el estado mayor, ej., vivo si hay
+# alguna viva) o "density" (fracción de células no muertas, en una rampa de color).
+LOD_MODES = ("max", "density")
+
+# Generaciones que salta la repetición con [ y ] (las teclas , y . avanzan de una en una).
+REPLAY_JUMP = 50
 
 class PygameView:
     """
@@ -10,9 +47,21 @@ class PygameView:
     directamente con la librería Pygame para:
     1. Mostrar el estado del Modelo (tablero/Lattice).
     2. Recibir las acciones básicas del usuario (ej., cerrar la ventana).
+
+    La ventana es un visor sobre el tablero: se desplaza con las flechas o
+    arrastrando con el ratón, se acerca y aleja con +/- o la rueda (Inicio
+    vuelve a mostrar el tablero entero) y solo se leen y dibujan las células
+    visibles. Por debajo de un píxel por célula se dibuja un resumen de cada
+    bloque de células (L alterna entre máximo y densidad).
+
+    Las teclas de la repetición no tocan el Modelo: se guardan como órdenes
+    ("pause", "step", "oldest", "present") que el Controlador recoge con
+    'take_commands()' y aplica en el hilo del Modelo.
     """
     
-    def __init__(self, title: str, version: str, cell_dimensions: Tuple[int, int], framerate: int, colors: Dict[int, Tuple[int, int, int]]):
+    def __init__(self, title: str, version: str, cell_dimensions: Tuple[int, int], framerate: int, colors: Dict[int, Tuple[int, int, int]],
+                 meter: Optional[MedidorFases] = None, show_overlay: bool = False,
+                 max_window: Optional[Tuple[int, int]] = None, lod_mode: str = "max"):
         """
         Constructor que recibe todas las configuraciones visuales desde config.py y las almacena.
         
@@ -22,7 +71,18 @@ class PygameView:
             cell_dimensions: Ancho y alto de cada célula en píxeles.
             framerate: Tasa de cuadros por segundo (FPS).
             colors: Diccionario de mapeo de estados del Modelo a colores RGB.
+            meter: Medidor de las fases "draw_board", "tick" y "handle_input"
+                   (None = el medidor global, desactivado por defecto).
+            show_overlay: Si es True, muestra las métricas por fase sobre el tablero (F3 lo alterna).
+            max_window: Tamaño máximo (ancho, alto) de la ventana en píxeles; los tableros
+                        mayores se recorren con el visor (None = sin límite).
+            lod_mode: Agregación por bloques al alejar el zoom ("max" o "density").
+
+        Raises:
+            ValueError: Si 'lod_mode' no es una agregación conocida.
         """
+        if lod_mode not in LOD_MODES:
+            raise ValueError(f"Agregación desconocida: {lod_mode!r}. Opciones: {', '.join(LOD_MODES)}.")
         self.title = title
         self.version = version
         self.cell_dimensions = cell_dimensions
@@ -32,7 +92,42 @@ class PygameView:
         self.screen = None  # Surface principal (la ventana)
         self.bg = None      # Surface de fondo para dibujar (evita parpadeo)
         self.clock = None   # Objeto Clock para control de FPS
+        
+        self.board_dimensions = (0, 0)  # Dimensiones del tablero en células
+        self._previous = None           # Estado dibujado en el cuadro anterior
+        self._state_colors = self._build_state_colors(colors)  # Color de cada estado 0..255
+        self._palette = None            # Tabla estado -> color para el volcado en bloque
+        self._density_palette = None    # Rampa de color de la agregación por densidad (0..255)
+        self._small = None              # Surface de 8 bits, 1 píxel por bloque visible (volcado en bloque)
 
+        self.max_window = max_window
+        self.lod_mode = lod_mode
+        self.zoom_level = 0             # 0 = 'cell_dimensions'; cada nivel duplica (o divide) el tamaño
+        self.min_zoom_level = 0         # Nivel con el que cabe el tablero entero (se calcula en 'init')
+        self._origin = [0.0, 0.0]       # Célula en la esquina superior izquierda del visor
+        self._view_key = None           # Visor del cuadro anterior (si cambia, redibujado completo)
+        self._last_board = None         # Último tablero dibujado (para redibujar al mover el visor)
+        self.redraw_pending = False     # El visor cambió y hay que redibujar el último tablero
+        self._commands = []             # Órdenes de repetición pendientes para el Controlador
+
+        self.meter = meter if meter is not None else MEDIDOR_GLOBAL
+        self.show_overlay = show_overlay
+        self._font = None               # Fuente del panel de métricas (se crea al mostrarlo)
+        self._overlay = None            # Panel de métricas ya renderizado
+        self._overlay_time = 0.0        # Momento del último renderizado del panel
+
+        
+    @staticmethod
+    def _build_state_colors(colors: Dict[int, Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+        """
+        Construye la lista de colores de los estados 0..255.
+        
+        Los estados sin color configurado (ej., las células "moribundas" 2, 3, ...
+        de las reglas Generations) usan el color del estado 1 atenuado.
+        """
+        alive = colors.get(1, (255, 255, 255))
+        return [colors.get(state, tuple(channel // max(state, 1) for channel in alive))
+                for state in range(256)]
         
     def init(self, board_dimensions: Tuple[int, int]):
         """
@@ -42,51 +137,494 @@ class PygameView:
             board_dimensions: Dimensiones del tablero en número de células (X, Y).
         """
         pygame.init()
+        self.board_dimensions = tuple(board_dimensions)
+        self._previous = None
+        self._last_board = None
 
-        # Calcula las dimensiones de la ventana en píxeles
-        dimensions = (board_dimensions[0] * self.cell_dimensions[0],
-                      board_dimensions[1] * self.cell_dimensions[1])
+        # Calcula las dimensiones de la ventana en píxeles (limitadas por 'max_window')
+        dimensions = (board_dimensions[0] * self.cell_dimensions[0], board_dimensions[1] * self.cell_dimensions[1])
+        if self.max_window is not None:
+            dimensions = (min(dimensions[0], self.max_window[0]), min(dimensions[1], self.max_window[1]))
         
         self.screen = pygame.display.set_mode(dimensions)
         pygame.display.set_caption(self.title + " " + self.version)
         self.bg = self.screen.convert() # Surface de dibujo
         self.clock = pygame.time.Clock() # Objeto para controlar el FPS
         
+        if np is not None:
+            # Paleta: fila 'estado' = color RGB de ese estado.
+            self._palette = np.array(self._state_colors, dtype=np.uint8)
+            dead = np.array(self._state_colors[0], dtype=np.float64)
+            alive = np.array(self._state_colors[1], dtype=np.float64)
+            ramp = np.linspace(0.0, 1.0, 256)[:, None]
+            self._density_palette = np.rint(dead + (alive - dead) * ramp).astype(np.uint8)
+
+        # Zoom inicial: el mayor nivel (sin acercar) con el que cabe el tablero entero.
+        self.min_zoom_level = self._fit_zoom_level()
+        self.reset_view()
+
+    def _fit_zoom_level(self) -> int:
+        """
+        Devuelve el mayor nivel de zoom (<= 0) con el que el tablero entero cabe en la ventana.
+
+        Sin NumPy no hay agregación por bloques: el nivel mínimo es el de 1 píxel por célula.
+        """
+        width, height = self.screen.get_size()
+        level = 0
+        while (self.board_dimensions[0] * self._cell_pixels(level)[0] > width
+               or self.board_dimensions[1] * self._cell_pixels(level)[1] > height):
+            if np is None and min(self._cell_pixels(level - 1)) < 1:
+                break
+            level -= 1
+        return level
+
+    def _cell_pixels(self, level: Optional[int] = None) -> Tuple[float, float]:
+        """
+        Devuelve el tamaño (ancho, alto) en píxeles de una célula con el nivel de zoom dado.
+        """
+        factor = 2.0 ** (self.zoom_level if level is None else level)
+        return self.cell_dimensions[0] * factor, self.cell_dimensions[1] * factor
+
+    def _block(self) -> Tuple[int, int]:
+        """
+        Devuelve cuántas células (por eje) resume cada bloque dibujado: 1 con un píxel o más por célula.
+        """
+        return tuple(max(1, math.ceil(1.0 / size - 1e-9)) for size in self._cell_pixels())
+
+    def _visible_cells(self) -> Tuple[float, float]:
+        """
+        Devuelve cuántas células (por eje) caben en la ventana con el zoom actual.
+        """
+        return tuple(window / size for window, size in zip(self.screen.get_size(), self._cell_pixels()))
+
+    def _clamp_origin(self):
+        """
+        Mantiene el visor dentro del tablero (o en su esquina, si el tablero cabe entero).
+        """
+        for axis, visible in enumerate(self._visible_cells()):
+            limit = max(0.0, self.board_dimensions[axis] - visible)
+            self._origin[axis] = min(max(self._origin[axis], 0.0), limit)
+        self.redraw_pending = self._last_board is not None
+
+    def visible_region(self) -> Tuple[int, int, int, int]:
+        """
+        Devuelve las células que abarca el visor.
+
+        Returns:
+            La tupla (x_min, y_min, x_max, y_max) inclusiva, recortada al tablero.
+        """
+        block = self._block()
+        bounds = []
+        for axis, visible in enumerate(self._visible_cells()):
+            start = int(self._origin[axis]) // block[axis] * block[axis]
+            bounds.append((start, min(math.ceil(self._origin[axis] + visible), self.board_dimensions[axis]) - 1))
+        return bounds[0][0], bounds[1][0], bounds[0][1], bounds[1][1]
+
+    def reset_view(self):
+        """
+        Muestra el tablero entero (o lo más alejado posible) desde su esquina.
+        """
+        self.zoom_level = self.min_zoom_level
+        self._origin = [0.0, 0.0]
+        self._clamp_origin()
+
+    def pan(self, dx: float, dy: float):
+        """
+        Desplaza el visor.
+
+        Args:
+            dx: Desplazamiento horizontal, en células.
+            dy: Desplazamiento vertical, en células.
+        """
+        self._origin[0] += dx
+        self._origin[1] += dy
+        self._clamp_origin()
+
+    def zoom(self, steps: int, anchor: Optional[Tuple[int, int]] = None):
+        """
+        Acerca (steps > 0) o aleja (steps < 0) el zoom manteniendo fija la célula bajo 'anchor'.
+
+        Args:
+            steps: Número de niveles (cada nivel duplica o divide por dos el tamaño de las células).
+            anchor: Posición (x, y) en píxeles que no se mueve (None = centro de la ventana).
+        """
+        level = min(max(self.zoom_level + steps, self.min_zoom_level), MAX_ZOOM_LEVEL)
+        if level == self.zoom_level:
+            return
+        if anchor is None:
+            anchor = (self.screen.get_width() // 2, self.screen.get_height() // 2)
+        before = self._cell_pixels()
+        self.zoom_level = level
+        after = self._cell_pixels()
+        for axis in (0, 1):
+            self._origin[axis] += anchor[axis] / before[axis] - anchor[axis] / after[axis]
+        self._clamp_origin()
+
+    def toggle_lod_mode(self):
+        """
+        Alterna la agregación de los bloques de células entre máximo y densidad.
+        """
+        self.lod_mode = LOD_MODES[(LOD_MODES.index(self.lod_mode) + 1) % len(LOD_MODES)]
+        self.redraw_pending = self._last_board is not None
+        
     def tick(self):
         """
         Controla el tiempo. Llama al método tick() del clock para pausar la 
         ejecución hasta alcanzar el framerate deseado.
         """
-        self.clock.tick(self.framerate)
+        with self.meter.fase("tick"):
+            self.clock.tick(self.framerate)
 
     def draw_board(self, board: Dict[Tuple[int, int], Any]):
         """
-        Renderiza el estado actual del tablero/Lattice en la ventana.
+        Renderiza la zona visible del tablero/Lattice en la ventana.
+        
+        Solo se leen las células visibles (con 'leer_region()' si el tablero lo
+        ofrece); al alejar el zoom, cada píxel resume un bloque de células
+        (ver LOD_SAMPLES). Solo se redibujan las células que cambiaron desde el cuadro anterior,
+        actualizando únicamente sus rectángulos en pantalla. Si la fracción de
+        células cambiadas supera FRACCION_MAXIMA_SUCIAS (o es el primer cuadro),
+        resulta más barato convertir la zona visible en un arreglo de píxeles,
+        ampliar cada célula (o bloque) a su tamaño en pantalla y volcarlo con una sola copia.
         
         Args:
             board: Un diccionario que representa el estado del Lattice (coordenadas: estado).
         """
-        for cell in board:
-            # Calcula el rectángulo (posición y tamaño) de la célula a dibujar
-            rectangle = (cell[0] * self.cell_dimensions[0], cell[1] * self.cell_dimensions[1],
-                         self.cell_dimensions[0], self.cell_dimensions[1])
-                         
-            # Dibuja la célula rellenando el rectángulo con el color mapeado al estado.
-            self.bg.fill(self.colors[board[cell]], rectangle)
+        with self.meter.fase("draw_board"):
+            self._last_board = board
+            self.redraw_pending = False
+            self._draw_board(board)
+            if self.show_overlay:
+                self._draw_overlay()
+
+    def redraw(self):
+        """
+        Vuelve a dibujar el último tablero (ej., tras mover el visor sin una generación nueva).
+        """
+        if self._last_board is not None:
+            self.draw_board(self._last_board)
+
+    def _draw_board(self, board: Dict[Tuple[int, int], Any]):
+        """
+        Elige entre el dibujado por regiones sucias y el volcado completo (ver 'draw_board').
+        """
+        if np is None:
+            self._draw_board_dict(board)
+            return
 
-        # Copia la surface de dibujo (bg) a la surface principal (screen)
+        block = self._block()
+        # El origen se alinea a los bloques para que desplazarse no cambie cómo se agrupan las células.
+        origin = tuple(int(self._origin[axis]) // block[axis] * block[axis] for axis in (0, 1))
+        current = self._read_visible(board, origin, block)
+        previous = self._previous
+        self._previous = current
+        view_key = (origin, self.zoom_level, self.lod_mode, self._screen_offset())
+        changed_view = view_key != self._view_key
+        self._view_key = view_key
+        
+        if previous is None or changed_view or previous.shape != current.shape:
+            self._draw_full(current)
+            return
+        
+        xs, ys = np.nonzero(current != previous)
+        if xs.size > FRACCION_MAXIMA_SUCIAS * current.size:
+            self._draw_full(current)
+        else:
+            self._draw_dirty(zip(xs.tolist(), ys.tolist()), current[xs, ys].tolist())
+
+    def _read_visible(self, board: Dict[Tuple[int, int], Any], origin: Tuple[int, int],
+                      block: Tuple[int, int]) -> "np.ndarray":
+        """
+        Lee la zona visible y la resume por bloques: un arreglo (bloques x, bloques y) de índices de color.
+        
+        De cada bloque se leen como mucho LOD_SAMPLES muestras por eje (repartidas
+        por el bloque), y menos si la ventana entera superaría LOD_SAMPLE_BUDGET.
+        Con un píxel o más por célula, cada bloque es una célula y se lee entera.
+        """
+        visible = self._visible_cells()
+        counts = [max(1, min(math.ceil((visible[axis] + block[axis]) / block[axis]),
+                             math.ceil((self.board_dimensions[axis] - origin[axis]) / block[axis])))
+                  for axis in (0, 1)]
+        budget = max(1, int(math.sqrt(LOD_SAMPLE_BUDGET / (counts[0] * counts[1]))))
+        indices = []
+        for axis in (0, 1):
+            samples = min(block[axis], LOD_SAMPLES, budget)
+            offsets = np.arange(samples) * block[axis] // samples
+            axis_indices = origin[axis] + (np.arange(counts[axis])[:, None] * block[axis] + offsets).ravel()
+            # El último bloque puede salirse del tablero: repite su última célula real.
+            indices.append((np.minimum(axis_indices, self.board_dimensions[axis] - 1), samples))
+        (rows, row_samples), (columns, column_samples) = indices
+
+        if hasattr(board, "leer_region"):
+            region = np.asarray(board.leer_region(rows, columns), dtype=np.uint8)
+        else:
+            region = self._board_to_array(board)[np.ix_(rows, columns)]
+        if row_samples * column_samples == 1:
+            if self._active_palette() is self._density_palette:
+                return np.where(region != 0, np.uint8(255), np.uint8(0))
+            return region
+        blocks = region.reshape(counts[0], row_samples, counts[1], column_samples)
+        if self._active_palette() is self._density_palette:
+            density = np.count_nonzero(blocks, axis=(1, 3)) * (255.0 / (row_samples * column_samples))
+            return np.rint(density).astype(np.uint8)
+        return blocks.max(axis=(1, 3))
+
+    def _tile_pixels(self) -> Tuple[float, float]:
+        """
+        Devuelve el tamaño (ancho, alto) en píxeles de cada bloque dibujado.
+        """
+        block = self._block()
+        size = self._cell_pixels()
+        return size[0] * block[0], size[1] * block[1]
+
+    def _active_palette(self) -> "np.ndarray":
+        """
+        Devuelve la paleta de los índices producidos por '_read_visible'.
+        """
+        if self.lod_mode == "density" and self._block() != (1, 1):
+            return self._density_palette
+        return self._palette
+
+    def _screen_offset(self) -> Tuple[float, float]:
+        """
+        Devuelve la posición en píxeles del primer bloque dibujado (el origen alineado a los bloques).
+
+        El bloque i de un eje ocupa los píxeles [floor(offset + i * size), floor(offset + (i + 1) * size)):
+        el volcado completo ('_tile_edges') y las regiones sucias ('_tile_rect') usan la misma regla.
+        """
+        block = self._block()
+        size = self._cell_pixels()
+        return tuple(-(self._origin[axis] - int(self._origin[axis]) // block[axis] * block[axis]) * size[axis]
+                     for axis in (0, 1))
+
+    def _board_to_array(self, board: Dict[Tuple[int, int], Any]) -> "np.ndarray":
+        """
+        Convierte el estado del tablero en un arreglo (X, Y) de estados.
+        
+        Las vistas de Lattices en arreglo ofrecen 'a_arreglo()'; para un diccionario
+        se vuelcan claves y valores en bloque, sin bucles de Python por célula.
+        """
+        if hasattr(board, "a_arreglo"):
+            return np.asarray(board.a_arreglo(), dtype=np.uint8)
+        count = len(board)
+        coords = np.fromiter(itertools.chain.from_iterable(board.keys()), dtype=np.intp, count=2 * count)
+        values = np.fromiter(board.values(), dtype=np.int16, count=count)
+        array = np.zeros(self.board_dimensions, dtype=np.uint8)
+        array[coords[0::2], coords[1::2]] = values
+        return array
+
+    def _tile_rect(self, tile: Tuple[int, int], offset: Tuple[float, float],
+                   size: Tuple[float, float]) -> "pygame.Rect":
+        """
+        Calcula el rectángulo en píxeles del bloque (i, j) de la zona visible, recortado a la ventana.
+        """
+        left = math.floor(offset[0] + tile[0] * size[0])
+        top = math.floor(offset[1] + tile[1] * size[1])
+        right = math.floor(offset[0] + (tile[0] + 1) * size[0])
+        bottom = math.floor(offset[1] + (tile[1] + 1) * size[1])
+        return pygame.Rect(left, top, max(1, right - left), max(1, bottom - top)).clip(self.screen.get_rect())
+
+    def _cell_rect(self, cell: Tuple[int, int]) -> "pygame.Rect":
+        """
+        Calcula el rectángulo (posición y tamaño) en píxeles de una célula con el visor actual.
+        """
+        size = self._cell_pixels()
+        return self._tile_rect((cell[0] - self._origin[0], cell[1] - self._origin[1]), (0.0, 0.0), size)
+
+    def _draw_dirty(self, tiles, indices: List[int]):
+        """
+        Rellena solo los bloques cambiados y actualiza únicamente sus rectángulos.
+        """
+        palette = self._active_palette()
+        offset, size = self._screen_offset(), self._tile_pixels()
+        rectangles = []
+        for tile, index in zip(tiles, indices):
+            rectangle = self._tile_rect(tile, offset, size)
+            self.screen.fill(tuple(palette[index].tolist()), rectangle)
+            rectangles.append(rectangle)
+        if rectangles:
+            pygame.display.update(rectangles)
+
+    @staticmethod
+    def _tile_edges(count: int, offset: float, size: float, limit: int) -> "np.ndarray":
+        """
+        Devuelve los bordes en píxeles (recortados a [0, limit]) de 'count' bloques de un eje.
+        """
+        edges = np.floor(offset + np.arange(count + 1) * size).astype(np.intp)
+        return np.clip(edges, 0, limit)
+
+    def _draw_full(self, current: "np.ndarray"):
+        """
+        Dibuja la zona visible con un único volcado: índices -> bloques de píxeles -> blit con paleta.
+        """
+        offset, size = self._screen_offset(), self._tile_pixels()
+        width, height = self.screen.get_size()
+        columns = self._tile_edges(current.shape[0], offset[0], size[0], width)
+        rows = self._tile_edges(current.shape[1], offset[1], size[1], height)
+        # Cada bloque se repite tantos píxeles como mide en pantalla (los mismos bordes que '_tile_rect').
+        pixels = np.repeat(np.repeat(current, np.diff(columns), axis=0), np.diff(rows), axis=1)
+
+        # Dibuja en la surface de dibujo (bg) y la copia a la surface principal (screen)
+        self.bg.fill(self._state_colors[0])
+        if pixels.size:
+            # Surface de 8 bits con paleta: se vuelcan los índices tal cual, sin expandirlos a RGB.
+            if self._small is None or self._small.get_size() != pixels.shape:
+                self._small = pygame.Surface(pixels.shape, 0, 8)
+            self._small.set_palette([tuple(color) for color in self._active_palette().tolist()])
+            pygame.surfarray.blit_array(self._small, pixels)
+            self.bg.blit(self._small, (int(columns[0]), int(rows[0])))
         self.screen.blit(self.bg, (0, 0))
         # Actualiza el contenido visible de la ventana
         pygame.display.flip()
 
+    def _draw_board_dict(self, board: Dict[Tuple[int, int], Any]):
+        """
+        Dibujado sin NumPy: compara con el cuadro anterior célula a célula y
+        rellena solo las cambiadas (o todas, en el primer cuadro o si el visor cambió).
+        """
+        previous = self._previous
+        self._previous = dict(board)
+        view_key = (tuple(self._origin), self.zoom_level)
+        if previous is None or view_key != self._view_key:
+            self.bg.fill(self._state_colors[0])
+            changed = list(board)
+        else:
+            changed = [cell for cell, state in board.items() if previous.get(cell) != state]
+        self._view_key = view_key
+        
+        rectangles = []
+        for cell in changed:
+            rectangle = self._cell_rect(cell)
+            if not rectangle.width or not rectangle.height:
+                continue  # Fuera del visor
+            self.bg.fill(self._state_colors[board[cell]], rectangle)
+            rectangles.append(rectangle)
+        
+        if len(changed) > FRACCION_MAXIMA_SUCIAS * len(board):
+            self.screen.blit(self.bg, (0, 0))
+            pygame.display.flip()
+        elif rectangles:
+            for rectangle in rectangles:
+                self.screen.blit(self.bg, rectangle, rectangle)
+            pygame.display.update(rectangles)
+
     def handle_input(self) -> bool:
         """
         Procesa eventos de usuario de bajo nivel (ej., teclado, ratón, cierre de ventana).
+
+        Controles del visor: flechas o arrastrar con el botón izquierdo (desplazar),
+        +/- o la rueda del ratón (zoom), Inicio (tablero entero) y L (agregación
+        por bloques). Si el visor cambia, 'redraw_pending' pide redibujar el último tablero.
+
+        Controles de la repetición: Espacio (pausa), , y . (una generación atrás o
+        adelante), [ y ] (REPLAY_JUMP generaciones), Retroceso (la generación más
+        antigua guardada) y Fin (volver al presente). Se recogen con 'take_commands()'.
         
         Returns:
             True si se detecta el evento QUIT (cerrar ventana), False en caso contrario.
         """
-        for e in pygame.event.get():
-            if e.type == QUIT:
-                return True # Indica al Controlador que debe salir del bucle
-        return False # Continúa la simulación
\ No newline at end of file
+        with self.meter.fase("handle_input"):
+            for e in pygame.event.get():
+                if e.type == QUIT:
+                    return True # Indica al Controlador que debe salir del bucle
+                if e.type == KEYDOWN:
+                    self._handle_key(e.key)
+                elif e.type == MOUSEWHEEL:
+                    self.zoom(1 if e.y > 0 else -1, pygame.mouse.get_pos())
+                elif e.type == MOUSEMOTION and e.buttons[0]:
+                    size = self._cell_pixels()
+                    self.pan(-e.rel[0] / size[0], -e.rel[1] / size[1])
+        return False # Continúa la simulación
+
+    def _handle_key(self, key: int):
+        """
+        Aplica una tecla de los controles de la Vista (panel de métricas y visor)
+        o guarda la orden de repetición correspondiente.
+        """
+        visible = self._visible_cells()
+        steps = {K_LEFT: (-1, 0), K_RIGHT: (1, 0), K_UP: (0, -1), K_DOWN: (0, 1)}
+        replay_steps = {K_COMMA: -1, K_PERIOD: 1, K_LEFTBRACKET: -REPLAY_JUMP, K_RIGHTBRACKET: REPLAY_JUMP}
+        if key == K_F3:
+            self.toggle_overlay()
+        elif key in steps:
+            dx, dy = steps[key]
+            self.pan(dx * max(1.0, visible[0] * PAN_FRACTION), dy * max(1.0, visible[1] * PAN_FRACTION))
+        elif key in (K_PLUS, K_EQUALS, K_KP_PLUS):
+            self.zoom(1)
+        elif key in (K_MINUS, K_KP_MINUS):
+            self.zoom(-1)
+        elif key == K_HOME:
+            self.reset_view()
+        elif key == K_l:
+            self.toggle_lod_mode()
+        elif key == K_SPACE:
+            self._commands.append(("pause", 0))
+        elif key in replay_steps:
+            self._commands.append(("step", replay_steps[key]))
+        elif key == K_BACKSPACE:
+            self._commands.append(("oldest", 0))
+        elif key == K_END:
+            self._commands.append(("present", 0))
+
+    def take_commands(self) -> List[Tuple[str, int]]:
+        """
+        Devuelve (y vacía) las órdenes de repetición pulsadas desde la última llamada.
+
+        Returns:
+            Lista de pares (orden, generaciones): ("pause", 0), ("step", n) con n
+            negativo hacia atrás, ("oldest", 0) o ("present", 0).
+        """
+        commands, self._commands = self._commands, []
+        return commands
+
+    def toggle_overlay(self):
+        """
+        Muestra u oculta el panel de métricas por fase.
+        
+        Al mostrarlo se activa el medidor (sin mediciones el panel estaría vacío);
+        al ocultarlo se fuerza un redibujado completo para limpiar su área.
+        """
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay:
+            self.meter.activar()
+        else:
+            self._overlay = None
+            self._previous = None
+
+    def _render_overlay(self) -> "pygame.Surface":
+        """
+        Renderiza el panel: una línea por fase con su conteo, p50, p99 y total.
+        
+        El panel solo crece (nunca encoge), de modo que al redibujarlo cubre por
+        completo el anterior sin dejar restos sobre el tablero.
+        """
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+        lines = ["fase                 n   p50 ms   p99 ms   total s"]
+        for name, data in self.meter.resumen().items():
+            lines.append(f"{name[:14]:<14} {data['conteo']:>7} {data['p50_s'] * 1e3:>8.2f} "
+                         f"{data['p99_s'] * 1e3:>8.2f} {data['total_s']:>9.2f}")
+        rendered = [self._font.render(line, True, self._state_colors[1]) for line in lines]
+        width = max(text.get_width() for text in rendered) + 8
+        height = sum(text.get_height() for text in rendered) + 8
+        if self._overlay is not None:
+            width = max(width, self._overlay.get_width())
+            height = max(height, self._overlay.get_height())
+        panel = pygame.Surface((width, height))
+        panel.fill(self._state_colors[0])
+        y = 4
+        for text in rendered:
+            panel.blit(text, (4, y))
+            y += text.get_height()
+        return panel
+
+    def _draw_overlay(self):
+        """
+        Dibuja el panel de métricas en la esquina superior izquierda de la ventana.
+        """
+        now = time.perf_counter()
+        if self._overlay is None or now - self._overlay_time >= OVERLAY_REFRESH_S:
+            self._overlay = self._render_overlay()
+            self._overlay_time = now
+        rectangle = self.screen.blit(self._overlay, (0, 0))
+        pygame.display.update(rectangle)
\ No newline at end of file